@@ -1,4 +1,9 @@
-CREATE OR REPLACE VIEW gold.mart_priority_drivers AS
+-- Priority drivers mart.
+-- gold.v_priority_drivers_compute holds the ranking logic; gold.mart_priority_drivers
+-- is a plain table refreshed per reference period by gold.refresh_mart_priority_drivers
+-- (called from dbt_build), so QG endpoints read precomputed, indexed rows.
+
+CREATE OR REPLACE VIEW gold.v_priority_drivers_compute AS
 WITH score_cfg AS (
     SELECT
         cfg.score_version,
@@ -193,3 +198,191 @@ SELECT
     s.indicator_weight,
     s.weighted_magnitude
 FROM scored s;
+
+-- Legacy installs created gold.mart_priority_drivers as a view; dependent views
+-- (007_data_coverage_scorecard.sql) are recreated after this script by init_db.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'gold'
+          AND c.relname = 'mart_priority_drivers'
+          AND c.relkind = 'v'
+    ) THEN
+        DROP VIEW gold.mart_priority_drivers CASCADE;
+    END IF;
+END;
+$$;
+
+CREATE TABLE IF NOT EXISTS gold.mart_priority_drivers (
+    reference_period TEXT NOT NULL,
+    territory_id TEXT NOT NULL,
+    territory_name TEXT NOT NULL,
+    territory_level TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    indicator_code TEXT NOT NULL,
+    indicator_name TEXT NOT NULL,
+    value DOUBLE PRECISION NOT NULL,
+    unit TEXT NULL,
+    source TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL,
+    driver_rank INTEGER NOT NULL,
+    driver_total INTEGER NOT NULL,
+    driver_magnitude DOUBLE PRECISION NOT NULL,
+    priority_score DOUBLE PRECISION NOT NULL,
+    priority_status TEXT NOT NULL,
+    driver_percentile DOUBLE PRECISION NOT NULL,
+    scoring_method TEXT NOT NULL,
+    refreshed_at_utc TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    score_version TEXT NOT NULL,
+    config_version TEXT NOT NULL,
+    critical_threshold DOUBLE PRECISION NOT NULL,
+    attention_threshold DOUBLE PRECISION NOT NULL,
+    domain_weight DOUBLE PRECISION NOT NULL,
+    indicator_weight DOUBLE PRECISION NOT NULL,
+    weighted_magnitude DOUBLE PRECISION NOT NULL,
+    coverage_covered_territories INTEGER NOT NULL DEFAULT 0,
+    coverage_total_territories INTEGER NOT NULL DEFAULT 0,
+    coverage_pct DOUBLE PRECISION NOT NULL DEFAULT 0.0
+);
+
+CREATE INDEX IF NOT EXISTS idx_mart_priority_drivers_rank
+    ON gold.mart_priority_drivers (reference_period, territory_level, domain, driver_rank);
+
+CREATE INDEX IF NOT EXISTS idx_mart_priority_drivers_territory
+    ON gold.mart_priority_drivers (territory_id, reference_period);
+
+CREATE INDEX IF NOT EXISTS idx_mart_priority_drivers_refreshed
+    ON gold.mart_priority_drivers (refreshed_at_utc DESC);
+
+-- dbt_build detects touched reference periods through fact_indicator.updated_at.
+CREATE INDEX IF NOT EXISTS idx_fact_indicator_updated_at
+    ON silver.fact_indicator (updated_at);
+
+-- Replaces the rows of the given reference periods (all periods when NULL) and
+-- returns the number of rows written. Ranking windows are partitioned by
+-- reference_period, so the period filter is pushed into the compute view.
+CREATE OR REPLACE FUNCTION gold.refresh_mart_priority_drivers(p_periods TEXT[] DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_rows INTEGER;
+BEGIN
+    DELETE FROM gold.mart_priority_drivers mpd
+    WHERE p_periods IS NULL OR mpd.reference_period = ANY(p_periods);
+
+    INSERT INTO gold.mart_priority_drivers (
+        reference_period,
+        territory_id,
+        territory_name,
+        territory_level,
+        domain,
+        indicator_code,
+        indicator_name,
+        value,
+        unit,
+        source,
+        dataset,
+        updated_at,
+        driver_rank,
+        driver_total,
+        driver_magnitude,
+        priority_score,
+        priority_status,
+        driver_percentile,
+        scoring_method,
+        refreshed_at_utc,
+        score_version,
+        config_version,
+        critical_threshold,
+        attention_threshold,
+        domain_weight,
+        indicator_weight,
+        weighted_magnitude,
+        coverage_covered_territories,
+        coverage_total_territories,
+        coverage_pct
+    )
+    WITH computed AS (
+        SELECT c.*
+        FROM gold.v_priority_drivers_compute c
+        WHERE p_periods IS NULL OR c.reference_period = ANY(p_periods)
+    ),
+    territory_totals AS (
+        SELECT
+            dt.level::text AS territory_level,
+            COUNT(*)::int AS total_territories
+        FROM silver.dim_territory dt
+        GROUP BY dt.level::text
+    ),
+    domain_coverage AS (
+        SELECT
+            c.reference_period,
+            c.territory_level,
+            c.domain,
+            COUNT(DISTINCT c.territory_id)::int AS covered_territories
+        FROM computed c
+        GROUP BY c.reference_period, c.territory_level, c.domain
+    )
+    SELECT
+        c.reference_period,
+        c.territory_id,
+        c.territory_name,
+        c.territory_level,
+        c.domain,
+        c.indicator_code,
+        c.indicator_name,
+        c.value,
+        c.unit,
+        c.source,
+        c.dataset,
+        c.updated_at,
+        c.driver_rank,
+        c.driver_total,
+        c.driver_magnitude,
+        c.priority_score,
+        c.priority_status,
+        c.driver_percentile,
+        c.scoring_method,
+        NOW(),
+        c.score_version,
+        c.config_version,
+        c.critical_threshold,
+        c.attention_threshold,
+        c.domain_weight,
+        c.indicator_weight,
+        c.weighted_magnitude,
+        COALESCE(dc.covered_territories, 0),
+        COALESCE(tt.total_territories, 0),
+        CASE
+            WHEN COALESCE(tt.total_territories, 0) = 0 THEN 0.0
+            ELSE ROUND(
+                (COALESCE(dc.covered_territories, 0)::numeric / tt.total_territories::numeric) * 100,
+                2
+            )::double precision
+        END
+    FROM computed c
+    LEFT JOIN domain_coverage dc
+        ON dc.reference_period = c.reference_period
+       AND dc.territory_level = c.territory_level
+       AND dc.domain = c.domain
+    LEFT JOIN territory_totals tt
+        ON tt.territory_level = c.territory_level;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$;
+
+-- Populate on first install; later refreshes are incremental through dbt_build.
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM gold.mart_priority_drivers LIMIT 1) THEN
+        PERFORM gold.refresh_mart_priority_drivers(NULL);
+    END IF;
+END;
+$$;
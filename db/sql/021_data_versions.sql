@@ -0,0 +1,11 @@
+CREATE TABLE IF NOT EXISTS ops.data_versions (
+    domain TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 1 CHECK (version >= 1),
+    last_job_name TEXT NULL,
+    last_run_id UUID NULL,
+    updated_at_utc TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO ops.data_versions (domain)
+VALUES ('territory'), ('electorate'), ('indicators'), ('urban'), ('marts')
+ON CONFLICT (domain) DO NOTHING;
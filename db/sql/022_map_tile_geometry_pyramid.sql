@@ -0,0 +1,67 @@
+-- Per-zoom-band territory geometries for MVT tiles: validated, transformed to
+-- EPSG:3857 and simplified once at load time so the tile query only clips and
+-- encodes. Bands must match _ZOOM_TOLERANCE_METERS in src/app/api/routes_map.py.
+CREATE TABLE IF NOT EXISTS map.tile_zoom_bands (
+    max_zoom INTEGER PRIMARY KEY,
+    tolerance_meters DOUBLE PRECISION NOT NULL CHECK (tolerance_meters >= 0)
+);
+
+INSERT INTO map.tile_zoom_bands (max_zoom, tolerance_meters)
+VALUES
+    (5, 20000.0),
+    (9, 5000.0),
+    (12, 1500.0),
+    (15, 400.0),
+    (99, 100.0)
+ON CONFLICT (max_zoom) DO UPDATE
+SET tolerance_meters = EXCLUDED.tolerance_meters;
+
+CREATE TABLE IF NOT EXISTS map.territory_tile_geometry (
+    territory_id UUID NOT NULL,
+    territory_level TEXT NOT NULL,
+    max_zoom INTEGER NOT NULL,
+    geom_3857 geometry(Geometry, 3857) NOT NULL,
+    PRIMARY KEY (territory_level, max_zoom, territory_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_territory_tile_geometry_geom_gist
+    ON map.territory_tile_geometry USING GIST (geom_3857);
+
+CREATE OR REPLACE FUNCTION map.refresh_territory_tile_geometry()
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    DELETE FROM map.territory_tile_geometry;
+
+    INSERT INTO map.territory_tile_geometry (
+        territory_id,
+        territory_level,
+        max_zoom,
+        geom_3857
+    )
+    SELECT
+        prepared.territory_id,
+        prepared.territory_level,
+        band.max_zoom,
+        ST_SimplifyPreserveTopology(prepared.geom_3857, band.tolerance_meters)
+    FROM (
+        SELECT
+            dt.territory_id,
+            dt.level::text AS territory_level,
+            ST_Transform(
+                CASE WHEN ST_IsValid(dt.geometry) THEN dt.geometry ELSE ST_MakeValid(dt.geometry) END,
+                3857
+            ) AS geom_3857
+        FROM silver.dim_territory dt
+        WHERE dt.level::text IN ('municipality', 'district', 'census_sector')
+          AND dt.geometry IS NOT NULL
+    ) AS prepared
+    CROSS JOIN map.tile_zoom_bands band
+    WHERE NOT ST_IsEmpty(prepared.geom_3857);
+
+    ANALYZE map.territory_tile_geometry;
+END;
+$$;
+
+SELECT map.refresh_territory_tile_geometry();
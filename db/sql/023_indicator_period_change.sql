@@ -0,0 +1,157 @@
+-- Year-over-year indicator change table.
+-- gold.indicator_period_change stores, per territory/indicator/reference period, the
+-- delta against the previous year, the percentage change and the trend class used by
+-- the QG priority list and insight highlights. It is refreshed by dbt_build only for
+-- the yearly reference periods touched since the last refresh - updated fact rows or a
+-- row count that no longer matches silver, e.g. after deletions - and the year after
+-- each of them, whose baseline changed (a full refresh when silver.dim_territory
+-- changed), so API reads are indexed lookups instead of a scan
+-- of the previous year in silver.fact_indicator.
+--
+-- Trend rule: 'up'/'down' at +/-2% of the previous value, 'stable' otherwise or when
+-- there is no previous value (or it is zero).
+
+CREATE TABLE IF NOT EXISTS gold.indicator_period_change (
+    territory_id TEXT NOT NULL,
+    territory_level TEXT NOT NULL,
+    indicator_code TEXT NOT NULL,
+    reference_period TEXT NOT NULL,
+    previous_period TEXT NOT NULL,
+    value DOUBLE PRECISION NOT NULL,
+    previous_value DOUBLE PRECISION NULL,
+    delta DOUBLE PRECISION NULL,
+    pct_change DOUBLE PRECISION NULL,
+    trend TEXT NOT NULL CHECK (trend IN ('up', 'down', 'stable')),
+    updated_at TIMESTAMPTZ NOT NULL,
+    refreshed_at_utc TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (territory_id, indicator_code, reference_period)
+);
+
+CREATE INDEX IF NOT EXISTS idx_indicator_period_change_period
+    ON gold.indicator_period_change (reference_period, territory_level, indicator_code);
+
+CREATE INDEX IF NOT EXISTS idx_indicator_period_change_refreshed
+    ON gold.indicator_period_change (refreshed_at_utc DESC);
+
+-- Replaces the rows of the given reference periods and of the following year of
+-- each one (all periods when NULL) and returns the number of rows written. Only
+-- yearly (YYYY) reference periods have a previous period.
+CREATE OR REPLACE FUNCTION gold.refresh_indicator_period_change(p_periods TEXT[] DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_periods TEXT[];
+    v_baseline_periods TEXT[];
+    v_rows INTEGER;
+BEGIN
+    IF p_periods IS NOT NULL THEN
+        SELECT ARRAY_AGG(DISTINCT target.period)
+        INTO v_periods
+        FROM (
+            SELECT p AS period FROM UNNEST(p_periods) AS p
+            UNION
+            SELECT (p::int + 1)::text FROM UNNEST(p_periods) AS p WHERE p ~ '^[0-9]{4}$'
+        ) AS target;
+
+        SELECT ARRAY_AGG((p::int - 1)::text)
+        INTO v_baseline_periods
+        FROM UNNEST(v_periods) AS p
+        WHERE p ~ '^[0-9]{4}$';
+    END IF;
+
+    DELETE FROM gold.indicator_period_change ipc
+    WHERE v_periods IS NULL OR ipc.reference_period = ANY(v_periods);
+
+    INSERT INTO gold.indicator_period_change (
+        territory_id,
+        territory_level,
+        indicator_code,
+        reference_period,
+        previous_period,
+        value,
+        previous_value,
+        delta,
+        pct_change,
+        trend,
+        updated_at,
+        refreshed_at_utc
+    )
+    WITH latest AS (
+        SELECT DISTINCT ON (fi.territory_id, fi.indicator_code, fi.reference_period)
+            fi.territory_id::text AS territory_id,
+            dt.level::text AS territory_level,
+            fi.indicator_code,
+            fi.reference_period,
+            fi.value::double precision AS value,
+            fi.updated_at
+        FROM silver.fact_indicator fi
+        JOIN silver.dim_territory dt ON dt.territory_id = fi.territory_id
+        WHERE fi.value IS NOT NULL
+          AND fi.reference_period ~ '^[0-9]{4}$'
+          AND (
+              v_periods IS NULL
+              OR fi.reference_period = ANY(v_periods)
+              OR fi.reference_period = ANY(v_baseline_periods)
+          )
+        ORDER BY
+            fi.territory_id,
+            fi.indicator_code,
+            fi.reference_period,
+            fi.updated_at DESC,
+            ABS(fi.value) DESC
+    ),
+    paired AS (
+        SELECT
+            cur.*,
+            (cur.reference_period::int - 1)::text AS previous_period,
+            prev.value AS previous_value
+        FROM latest cur
+        LEFT JOIN latest prev
+            ON prev.territory_id = cur.territory_id
+           AND prev.indicator_code = cur.indicator_code
+           AND prev.reference_period = (cur.reference_period::int - 1)::text
+        WHERE v_periods IS NULL OR cur.reference_period = ANY(v_periods)
+    ),
+    measured AS (
+        SELECT
+            p.*,
+            p.value - p.previous_value AS delta,
+            CASE
+                WHEN p.previous_value IS NULL OR p.previous_value = 0 THEN NULL
+                ELSE ((p.value - p.previous_value) / ABS(p.previous_value)) * 100
+            END AS pct_change
+        FROM paired p
+    )
+    SELECT
+        m.territory_id,
+        m.territory_level,
+        m.indicator_code,
+        m.reference_period,
+        m.previous_period,
+        m.value,
+        m.previous_value,
+        m.delta,
+        m.pct_change,
+        CASE
+            WHEN m.pct_change >= 2 THEN 'up'
+            WHEN m.pct_change <= -2 THEN 'down'
+            ELSE 'stable'
+        END,
+        m.updated_at,
+        NOW()
+    FROM measured m;
+
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$;
+
+-- Populate on first install; later refreshes are incremental through dbt_build.
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM gold.indicator_period_change LIMIT 1) THEN
+        PERFORM gold.refresh_indicator_period_change(NULL);
+    END IF;
+END;
+$$;
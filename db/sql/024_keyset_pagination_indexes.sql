@@ -0,0 +1,20 @@
+-- Keyset (cursor) pagination for list endpoints.
+-- Each index matches the ORDER BY of its endpoint including the unique tiebreaker,
+-- so a continuation cursor seeks straight to the next page instead of scanning and
+-- discarding every earlier row as LIMIT/OFFSET does.
+
+-- /v1/indicators: ORDER BY reference_period DESC, indicator_code, fact_id
+CREATE INDEX IF NOT EXISTS idx_fact_indicator_keyset
+    ON silver.fact_indicator (reference_period DESC, indicator_code, fact_id);
+
+-- /v1/ops/pipeline-runs: ORDER BY started_at_utc DESC, run_id DESC
+CREATE INDEX IF NOT EXISTS idx_pipeline_runs_keyset
+    ON ops.pipeline_runs (started_at_utc DESC, run_id DESC);
+
+-- /v1/ops/pipeline-checks: ORDER BY created_at_utc DESC, check_id DESC
+CREATE INDEX IF NOT EXISTS idx_pipeline_checks_keyset
+    ON ops.pipeline_checks (created_at_utc DESC, check_id DESC);
+
+-- /v1/ops/frontend-events: ORDER BY event_timestamp_utc DESC, event_id DESC
+CREATE INDEX IF NOT EXISTS idx_frontend_events_keyset
+    ON ops.frontend_events (event_timestamp_utc DESC, event_id DESC);
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if SRC_PATH.exists():
+    src_str = str(SRC_PATH)
+    if src_str not in sys.path:
+        sys.path.insert(0, src_str)
+
+from app.api.territory_levels import normalize_level  # noqa: E402
+from app.db import get_engine  # noqa: E402
+from app.fact_export import (  # noqa: E402
+    DEFAULT_EXPORT_BATCH_SIZE,
+    EXPORT_DATASETS,
+    EXPORT_FORMATS,
+    FactExportStream,
+)
+
+_TAIL_READ_BYTES = 1 << 16
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Stream a silver fact table to NDJSON, CSV or Parquet through a server-side "
+            "cursor (constant memory)."
+        )
+    )
+    parser.add_argument("dataset", choices=sorted(EXPORT_DATASETS), help="Fact table to export.")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--output", required=True, help="Output file path.")
+    parser.add_argument(
+        "--filter",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Filter as in the list API (e.g. period=2024, level=municipio). Repeatable.",
+    )
+    parser.add_argument("--after", default=None, help="Start after this fact_id.")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum rows to export.")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_EXPORT_BATCH_SIZE,
+        help=f"Rows fetched per cursor round trip (default: {DEFAULT_EXPORT_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Append to an interrupted NDJSON/CSV output, after its last complete row.",
+    )
+    return parser.parse_args(argv)
+
+
+def _parse_filters(raw_filters: list[str]) -> dict[str, str]:
+    filters: dict[str, str] = {}
+    for raw in raw_filters:
+        name, sep, value = raw.partition("=")
+        if not sep or not name.strip():
+            raise SystemExit(f"Invalid --filter '{raw}'. Expected NAME=VALUE.")
+        filters[name.strip()] = value.strip()
+    if "level" in filters:
+        filters["level"] = str(normalize_level(filters["level"]))
+    return filters
+
+
+def _last_exported_fact_id(path: Path, export_format: str) -> str | None:
+    """Drop a trailing partial line from ``path`` and return the fact_id of its last row."""
+    with path.open("rb+") as handle:
+        size = handle.seek(0, io.SEEK_END)
+        handle.seek(max(0, size - _TAIL_READ_BYTES))
+        tail = handle.read()
+        complete_end = tail.rfind(b"\n") + 1
+        if complete_end < len(tail):
+            handle.truncate(size - (len(tail) - complete_end))
+        lines = [line for line in tail[:complete_end].decode("utf-8").splitlines() if line]
+    if not lines:
+        return None
+    last_line = lines[-1]
+    if export_format == "ndjson":
+        return str(json.loads(last_line)["fact_id"])
+    # fact_id is the first CSV column; a lone header line means no rows yet.
+    first_cell = next(csv.reader([last_line]))[0]
+    return None if first_cell == "fact_id" else first_cell
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    dataset = EXPORT_DATASETS[args.dataset]
+    filters = _parse_filters(args.filter)
+    out_path = Path(args.output)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    after = args.after
+    append = False
+    if args.resume and out_path.exists() and out_path.stat().st_size > 0:
+        if args.format == "parquet":
+            raise SystemExit("--resume is supported for ndjson and csv outputs only.")
+        after = _last_exported_fact_id(out_path, args.format) or after
+        append = True
+
+    stream = FactExportStream(
+        get_engine().connect(),
+        dataset,
+        export_format=args.format,
+        filters=filters,
+        after=after,
+        limit=args.limit,
+        batch_size=args.batch_size,
+        csv_header=not append,
+    )
+    with out_path.open("ab" if append else "wb") as handle:
+        for chunk in stream:
+            handle.write(chunk)
+
+    print(
+        f"Exported {dataset.table}: rows={stream.rows_written} format={args.format} "
+        f"after={after or '-'} file={out_path.as_posix()}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,279 @@
+"""
+Offline pre-seeding of MVT tiles into per-layer MBTiles archives.
+
+Walks the municipality bbox for every tile layer over a zoom range, renders the
+tiles with a worker pool and writes them to ``DATA_ROOT/cache/tile_archives``,
+where ``GET /v1/map/tiles/{layer}/{z}/{x}/{y}.mvt`` serves them directly while
+the archive matches the current tile data version.
+
+Usage:
+    python scripts/seed_map_tiles.py [--layers territory_district,urban_roads]
+        [--min-zoom 8] [--max-zoom 14] [--workers 4] [--ignore-layer-zoom] [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import text
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if SRC_PATH.exists():
+    src_str = str(SRC_PATH)
+    if src_str not in sys.path:
+        sys.path.insert(0, src_str)
+
+from app.api.routes_map import _LAYER_INDEX, _LAYER_TO_LEVEL, render_mvt_tile  # noqa: E402
+from app.db import session_scope  # noqa: E402
+from app.settings import Settings, get_settings  # noqa: E402
+from app.tile_archive import MBTilesWriter, archive_path  # noqa: E402
+from app.tile_cache import read_tile_data_version  # noqa: E402
+
+_MAX_MERCATOR_LAT = 85.0511287798
+_CHUNK_SIZE = 64
+
+TileKey = tuple[int, int, int]
+RenderChunk = Callable[[str, list[TileKey]], list[tuple[TileKey, bytes]]]
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-seed MVT tiles into MBTiles archives.")
+    parser.add_argument(
+        "--layers",
+        default="",
+        help="Comma-separated layer ids (default: every tile layer).",
+    )
+    parser.add_argument("--min-zoom", type=int, default=8, help="Lowest zoom to seed (default: 8).")
+    parser.add_argument(
+        "--max-zoom",
+        type=int,
+        default=14,
+        help="Highest zoom to seed (default: 14).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent render workers; bounded by the DB pool size (default: 4).",
+    )
+    parser.add_argument(
+        "--ignore-layer-zoom",
+        action="store_true",
+        help="Seed the full zoom range even outside each layer's zoom_min/zoom_max.",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only plan tiles; render nothing.")
+    parser.add_argument(
+        "--output-json",
+        default=None,
+        help="Optional path to persist the seeding report as JSON.",
+    )
+    return parser.parse_args(argv)
+
+
+def _lonlat_to_tile(lon: float, lat: float, z: int) -> tuple[int, int]:
+    n = 1 << z
+    clamped_lat = max(-_MAX_MERCATOR_LAT, min(_MAX_MERCATOR_LAT, lat))
+    lat_rad = math.radians(clamped_lat)
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def _tile_range_for_bbox(
+    bbox: tuple[float, float, float, float],
+    z: int,
+) -> tuple[int, int, int, int]:
+    minx, miny, maxx, maxy = bbox
+    x_min, y_min = _lonlat_to_tile(minx, maxy, z)
+    x_max, y_max = _lonlat_to_tile(maxx, miny, z)
+    return x_min, x_max, y_min, y_max
+
+
+def _layer_zooms(layer: str, min_zoom: int, max_zoom: int, *, ignore_layer_zoom: bool) -> list[int]:
+    low, high = min_zoom, max_zoom
+    item = _LAYER_INDEX.get(layer)
+    if item is not None and not ignore_layer_zoom:
+        low = max(low, item.zoom_min)
+        if item.zoom_max is not None:
+            high = min(high, item.zoom_max)
+    return list(range(low, high + 1))
+
+
+def _plan_tiles(bbox: tuple[float, float, float, float], zooms: list[int]) -> Iterator[TileKey]:
+    for z in zooms:
+        x_min, x_max, y_min, y_max = _tile_range_for_bbox(bbox, z)
+        for x in range(x_min, x_max + 1):
+            for y in range(y_min, y_max + 1):
+                yield z, x, y
+
+
+def _chunks(tiles: list[TileKey], size: int = _CHUNK_SIZE) -> Iterator[list[TileKey]]:
+    for start in range(0, len(tiles), size):
+        yield tiles[start : start + size]
+
+
+def _resolve_municipality_bbox(settings: Settings) -> tuple[float, float, float, float]:
+    with session_scope(settings) as session:
+        row = session.execute(
+            text(
+                """
+                SELECT
+                    ST_XMin(ext) AS minx,
+                    ST_YMin(ext) AS miny,
+                    ST_XMax(ext) AS maxx,
+                    ST_YMax(ext) AS maxy
+                FROM (
+                    SELECT ST_Extent(ST_Transform(geometry, 4326)) AS ext
+                    FROM silver.dim_territory
+                    WHERE level::text = 'municipality'
+                      AND municipality_ibge_code = :municipality_ibge_code
+                      AND geometry IS NOT NULL
+                ) extent
+                """
+            ),
+            {"municipality_ibge_code": settings.municipality_ibge_code},
+        ).mappings().first()
+    if row is None or row["minx"] is None:
+        raise RuntimeError(
+            "Municipality geometry not found. Run ibge_geometries_fetch before seeding tiles."
+        )
+    return float(row["minx"]), float(row["miny"]), float(row["maxx"]), float(row["maxy"])
+
+
+def _render_chunk_from_db(settings: Settings) -> RenderChunk:
+    def _render(layer: str, tiles: list[TileKey]) -> list[tuple[TileKey, bytes]]:
+        with session_scope(settings) as session:
+            return [(tile, render_mvt_tile(session, layer, *tile)) for tile in tiles]
+
+    return _render
+
+
+def seed_layer(
+    *,
+    layer: str,
+    tiles: list[TileKey],
+    output_path: Path,
+    data_version: str,
+    bbox: tuple[float, float, float, float],
+    render_chunk: RenderChunk,
+    workers: int,
+) -> dict[str, Any]:
+    zooms = sorted({z for z, _x, _y in tiles})
+    metadata = {
+        "name": layer,
+        "format": "pbf",
+        "type": "overlay",
+        "bounds": ",".join(f"{value:.6f}" for value in bbox),
+        "minzoom": str(zooms[0]) if zooms else "0",
+        "maxzoom": str(zooms[-1]) if zooms else "0",
+        "data_version": data_version,
+        "generated_at_utc": datetime.now(tz=UTC).isoformat(),
+    }
+    started_at = time.perf_counter()
+    empty_tiles = 0
+    total_bytes = 0
+    with MBTilesWriter(output_path, metadata=metadata) as writer:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [pool.submit(render_chunk, layer, chunk) for chunk in _chunks(tiles)]
+            for future in as_completed(futures):
+                for (z, x, y), content in future.result():
+                    writer.write(z, x, y, content)
+                    total_bytes += len(content)
+                    if not content:
+                        empty_tiles += 1
+    elapsed = time.perf_counter() - started_at
+    return {
+        "layer": layer,
+        "zooms": zooms,
+        "tiles": len(tiles),
+        "empty_tiles": empty_tiles,
+        "bytes": total_bytes,
+        "elapsed_seconds": round(elapsed, 3),
+        "tiles_per_second": round(len(tiles) / elapsed, 1) if elapsed > 0 else 0.0,
+        "archive": output_path.as_posix(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    settings = get_settings()
+    requested = [token.strip() for token in str(args.layers).split(",") if token.strip()]
+    layers = requested or list(_LAYER_TO_LEVEL)
+    unknown = [layer for layer in layers if layer not in _LAYER_TO_LEVEL]
+    if unknown:
+        print(f"ERROR: Unknown tile layers: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    if args.min_zoom < 0 or args.max_zoom < args.min_zoom:
+        print("ERROR: Invalid zoom range.", file=sys.stderr)
+        return 2
+
+    bbox = _resolve_municipality_bbox(settings)
+    data_version = read_tile_data_version(settings.tile_cache_root)
+    workers = max(1, min(int(args.workers), 10))
+    render_chunk = _render_chunk_from_db(settings)
+
+    started_at = time.perf_counter()
+    results: list[dict[str, Any]] = []
+    for layer in layers:
+        zooms = _layer_zooms(
+            layer,
+            args.min_zoom,
+            args.max_zoom,
+            ignore_layer_zoom=bool(args.ignore_layer_zoom),
+        )
+        tiles = list(_plan_tiles(bbox, zooms))
+        if args.dry_run or not tiles:
+            results.append({"layer": layer, "zooms": zooms, "tiles": len(tiles), "skipped": True})
+            continue
+        result = seed_layer(
+            layer=layer,
+            tiles=tiles,
+            output_path=archive_path(settings.tile_archive_root, layer),
+            data_version=data_version,
+            bbox=bbox,
+            render_chunk=render_chunk,
+            workers=workers,
+        )
+        results.append(result)
+        print(
+            f"{layer:<30} tiles={result['tiles']:>6} empty={result['empty_tiles']:>6} "
+            f"{result['tiles_per_second']:>8.1f} tiles/s"
+        )
+
+    elapsed = time.perf_counter() - started_at
+    total_tiles = sum(int(item["tiles"]) for item in results if not item.get("skipped"))
+    report = {
+        "generated_at_utc": datetime.now(tz=UTC).isoformat(),
+        "municipality_ibge_code": settings.municipality_ibge_code,
+        "bbox": list(bbox),
+        "data_version": data_version,
+        "workers": workers,
+        "dry_run": bool(args.dry_run),
+        "total_tiles": total_tiles,
+        "elapsed_seconds": round(elapsed, 3),
+        "tiles_per_second": round(total_tiles / elapsed, 1) if elapsed > 0 else 0.0,
+        "layers": results,
+    }
+    print(
+        f"Tile seeding finished: tiles={total_tiles} "
+        f"tiles_per_second={report['tiles_per_second']} data_version={data_version}"
+    )
+    if args.output_json:
+        out_path = Path(args.output_json)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,16 +2,33 @@
 
 Adds Cache-Control and ETag headers to cacheable GET responses.
 This addresses item A07 of the traceability matrix.
+
+Data-backed routes get ETags derived from ``ops.data_versions`` (see
+``app.data_version``), so ``If-None-Match`` is answered with 304 before the
+endpoint runs and their bodies stream through untouched. Executive
+QG/territory/electorate reads are additionally served from the server-side
+``QueryResultCache`` (see ``app.query_cache``). Remaining routes (catalog and
+operational metadata) keep a weak ETag computed from the response body.
+
+Implemented as a pure ASGI middleware so large GeoJSON bodies are never
+re-buffered by a ``BaseHTTPMiddleware`` wrapper.
 """
 
 from __future__ import annotations
 
 import hashlib
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response as StarletteResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.data_version import (
+    DATA_DOMAINS,
+    data_version_etag,
+    data_version_token,
+    get_data_version_tracker,
+)
+from app.query_cache import QueryResultCache, get_query_cache, result_cache_key
 
 # Paths eligible for caching with their max-age in seconds.
 _CACHE_RULES: list[tuple[str, int]] = [
@@ -31,6 +48,29 @@ _CACHE_RULES: list[tuple[str, int]] = [
     ("/v1/electorate/", 600),            # 10 min
 ]
 
+# Data domains each data-backed path depends on. Paths not listed here fall back
+# to body-hash ETags (their payload also depends on operational state).
+_DATA_VERSION_RULES: list[tuple[str, tuple[str, ...]]] = [
+    ("/v1/kpis/overview", DATA_DOMAINS),
+    ("/v1/mobility/access", DATA_DOMAINS),
+    ("/v1/environment/risk", DATA_DOMAINS),
+    ("/v1/priority/", DATA_DOMAINS),
+    ("/v1/insights/highlights", DATA_DOMAINS),
+    ("/v1/geo/choropleth", DATA_DOMAINS),
+    ("/v1/map/environment/risk", DATA_DOMAINS),
+    ("/v1/territory/", DATA_DOMAINS),
+    ("/v1/electorate/", ("territory", "electorate", "marts")),
+]
+
+# Paths whose response bodies are also kept in the server-side result cache.
+_RESULT_CACHE_PREFIXES: tuple[str, ...] = (
+    "/v1/kpis/overview",
+    "/v1/priority/",
+    "/v1/insights/highlights",
+    "/v1/territory/",
+    "/v1/electorate/",
+)
+
 
 def _match_cache_rule(path: str) -> int | None:
     """Return max-age if path matches a cache rule, else None."""
@@ -40,56 +80,208 @@ def _match_cache_rule(path: str) -> int | None:
     return None
 
 
+def _match_data_domains(path: str) -> tuple[str, ...] | None:
+    for prefix, domains in _DATA_VERSION_RULES:
+        if path.startswith(prefix):
+            return domains
+    return None
+
+
+def _is_result_cacheable(path: str) -> bool:
+    return path.startswith(_RESULT_CACHE_PREFIXES)
+
+
 def _compute_etag(body: bytes) -> str:
     """Compute a weak ETag from the response body."""
     digest = hashlib.md5(body, usedforsecurity=False).hexdigest()[:16]
     return f'W/"{digest}"'
 
 
-class CacheHeaderMiddleware(BaseHTTPMiddleware):
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _resolve_versions(
+    domains: tuple[str, ...],
+    result_cache: QueryResultCache | None,
+) -> tuple[str | None, str | None]:
+    """Return (route data token, result-cache storage version); blocking, run in a thread."""
+    versions = get_data_version_tracker().snapshot()
+    if versions is None:
+        return None, None
+    storage_version = result_cache.current_version() if result_cache is not None else None
+    return data_version_token(versions, domains), storage_version
+
+
+class CacheHeaderMiddleware:
     """Injects Cache-Control and ETag headers for cacheable GET endpoints."""
 
-    async def dispatch(
-        self, request: Request, call_next: Callable
-    ) -> StarletteResponse:
-        if request.method != "GET":
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        max_age = _match_cache_rule(request.url.path)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+        max_age = _match_cache_rule(path)
         if max_age is None:
-            return await call_next(request)
-
-        response: StarletteResponse = await call_next(request)
-
-        if response.status_code != 200:
-            return response
-
-        # Collect the streaming body to compute ETag.
-        body_chunks: list[bytes] = []
-        async for chunk in response.body_iterator:
-            body_chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
-        body = b"".join(body_chunks)
-
-        etag = _compute_etag(body)
-
-        # Support conditional requests (If-None-Match).
-        if_none_match = request.headers.get("if-none-match")
-        if if_none_match and if_none_match == etag:
-            return Response(
-                status_code=304,
-                headers={
-                    "ETag": etag,
-                    "Cache-Control": f"public, max-age={max_age}",
-                },
-            )
-
-        return Response(
-            content=body,
-            status_code=response.status_code,
-            headers={
-                **dict(response.headers),
-                "Cache-Control": f"public, max-age={max_age}",
-                "ETag": etag,
-            },
-            media_type=response.media_type,
+            await self.app(scope, receive, send)
+            return
+
+        cache_control = f"public, max-age={max_age}"
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        domains = _match_data_domains(path)
+        if domains is None:
+            await self._send_with_body_etag(scope, receive, send, cache_control, if_none_match)
+            return
+
+        result_cache = get_query_cache() if _is_result_cacheable(path) else None
+        token, storage_version = await run_in_threadpool(
+            _resolve_versions, domains, result_cache
         )
+        if token is None:
+            await self._send_with_body_etag(scope, receive, send, cache_control, if_none_match)
+            return
+
+        params = QueryParams(scope.get("query_string", b"")).multi_items()
+        etag = data_version_etag(path, params, token)
+        if _etag_matches(if_none_match, etag):
+            await _send_not_modified(send, etag=etag, cache_control=cache_control)
+            return
+
+        cache_key: str | None = None
+        result_cache_status: str | None = None
+        if result_cache is not None:
+            result_cache_status = "bypass"
+        if result_cache is not None and storage_version is not None:
+            cache_key = result_cache_key(path, params, token)
+            cached = result_cache.get(cache_key, version=storage_version)
+            if cached is not None:
+                await _send_body(
+                    send,
+                    body=cached.body,
+                    headers=[
+                        (b"content-type", cached.media_type.encode("latin-1")),
+                        (b"content-length", str(len(cached.body)).encode("latin-1")),
+                    ],
+                    etag=etag,
+                    cache_control=cache_control,
+                    result_cache_status=f"hit-{cached.source}",
+                )
+                return
+            result_cache_status = "miss"
+
+        status_code = 0
+        media_type = ""
+        chunks: list[bytes] = []
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code, media_type
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if status_code == 200:
+                    headers = MutableHeaders(scope=message)
+                    headers["Cache-Control"] = cache_control
+                    headers["ETag"] = etag
+                    if result_cache_status:
+                        headers["X-Query-Cache"] = result_cache_status
+                    media_type = headers.get("content-type", "")
+            elif (
+                message["type"] == "http.response.body"
+                and status_code == 200
+                and cache_key is not None
+            ):
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    result_cache.put(
+                        cache_key,
+                        b"".join(chunks),
+                        media_type=media_type,
+                        version=storage_version,
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    async def _send_with_body_etag(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        cache_control: str,
+        if_none_match: str | None,
+    ) -> None:
+        """Buffer a 200 body to derive its ETag; other statuses stream through."""
+        start_message: Message | None = None
+        chunks: list[bytes] = []
+
+        async def buffer_body(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                    return
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = _compute_etag(body)
+            if _etag_matches(if_none_match, etag):
+                await _send_not_modified(send, etag=etag, cache_control=cache_control)
+                return
+            headers = MutableHeaders(scope=start_message)
+            headers["Cache-Control"] = cache_control
+            headers["ETag"] = etag
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body, "more_body": False})
+
+        await self.app(scope, receive, buffer_body)
+
+
+async def _send_not_modified(send: Send, *, etag: str, cache_control: str) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [
+                (b"etag", etag.encode("latin-1")),
+                (b"cache-control", cache_control.encode("latin-1")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def _send_body(
+    send: Send,
+    *,
+    body: bytes,
+    headers: list[tuple[bytes, bytes]],
+    etag: str,
+    cache_control: str,
+    result_cache_status: str,
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                *headers,
+                (b"cache-control", cache_control.encode("latin-1")),
+                (b"etag", etag.encode("latin-1")),
+                (b"x-query-cache", result_cache_status.encode("latin-1")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body, "more_body": False})
@@ -0,0 +1,314 @@
+"""Compact geometry encodings for the map endpoints that return territory polygons.
+
+``geometry_json_sql`` renders ``ST_AsGeoJSON`` with a bounded number of decimal
+digits and, when a zoom level is given, reads the pre-simplified geometry of the
+matching zoom band from ``map.territory_tile_geometry``
+(db/sql/022_map_tile_geometry_pyramid.sql) instead of the full-resolution polygon.
+
+``build_topology`` turns the resulting GeoJSON geometries into a quantized
+TopoJSON topology: coordinates are snapped to an integer grid, rings are cut at
+the points where neighbouring territories stop sharing a border and each shared
+border is stored once as a delta-encoded arc referenced by both territories.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import pairwise
+from typing import Any
+
+GEOMETRY_FORMATS = ("geojson", "topojson")
+GEOMETRY_FORMAT_PATTERN = "^(geojson|topojson)$"
+# 6 decimal digits is ~0.1 m at the equator, well below screen resolution at any zoom.
+DEFAULT_GEOMETRY_PRECISION = 6
+MAX_GEOMETRY_PRECISION = 15
+DEFAULT_TOPOLOGY_QUANTIZATION = 100_000
+TOPOLOGY_OBJECT_NAME = "territories"
+
+# Levels with rows in map.territory_tile_geometry.
+_SIMPLIFIED_GEOMETRY_LEVELS = frozenset({"municipality", "district", "census_sector"})
+
+Point = tuple[int, int]
+
+
+def geometry_json_sql(
+    *,
+    alias: str = "dt",
+    level: str | None,
+    zoom: int | None,
+    column: str = "geometry",
+) -> str:
+    """``ST_AsGeoJSON`` select item bound to ``:geometry_precision`` (and ``:zoom``).
+
+    ``::json`` instead of ``::jsonb`` skips re-parsing the text into the binary
+    jsonb representation that is thrown away as soon as the row is sent.
+    """
+    geometry = f"{alias}.geometry"
+    if zoom is not None and level in _SIMPLIFIED_GEOMETRY_LEVELS:
+        geometry = f"""COALESCE(
+                        (
+                            SELECT ST_Transform(ttg.geom_3857, 4326)
+                            FROM map.territory_tile_geometry ttg
+                            WHERE ttg.territory_level = {alias}.level::text
+                              AND ttg.territory_id = {alias}.territory_id
+                              AND ttg.max_zoom = (
+                                  SELECT MIN(band.max_zoom)
+                                  FROM map.tile_zoom_bands band
+                                  WHERE band.max_zoom > :zoom
+                              )
+                        ),
+                        {alias}.geometry
+                    )"""
+    return f"ST_AsGeoJSON({geometry}, :geometry_precision)::json AS {column}"
+
+
+def _iter_positions(geometry: Mapping[str, Any] | None) -> Iterable[Sequence[float]]:
+    if not geometry:
+        return
+    geometry_type = geometry.get("type")
+    if geometry_type == "GeometryCollection":
+        for child in geometry.get("geometries") or []:
+            yield from _iter_positions(child)
+        return
+    coordinates = geometry.get("coordinates")
+    depth = {"Point": 0, "MultiPoint": 1, "LineString": 1, "MultiLineString": 2, "Polygon": 2}
+    stack: list[tuple[Any, int]] = [(coordinates, depth.get(str(geometry_type), 3))]
+    while stack:
+        node, level = stack.pop()
+        if not node:
+            continue
+        if level == 0:
+            yield node
+        else:
+            stack.extend((child, level - 1) for child in node)
+
+
+class _Quantizer:
+    def __init__(self, bbox: tuple[float, float, float, float], quantization: int) -> None:
+        x0, y0, x1, y1 = bbox
+        self.x0 = x0
+        self.y0 = y0
+        self.kx = (quantization - 1) / (x1 - x0) if x1 > x0 else 1.0
+        self.ky = (quantization - 1) / (y1 - y0) if y1 > y0 else 1.0
+
+    @property
+    def transform(self) -> dict[str, list[float]]:
+        return {"scale": [1 / self.kx, 1 / self.ky], "translate": [self.x0, self.y0]}
+
+    def point(self, position: Sequence[float]) -> Point:
+        return (
+            int(round((float(position[0]) - self.x0) * self.kx)),
+            int(round((float(position[1]) - self.y0) * self.ky)),
+        )
+
+    def line(self, positions: Sequence[Sequence[float]]) -> list[Point]:
+        points: list[Point] = []
+        for position in positions:
+            point = self.point(position)
+            if not points or points[-1] != point:
+                points.append(point)
+        return points
+
+
+class _ArcIndex:
+    """Cuts lines and rings at junctions and stores each distinct arc once."""
+
+    def __init__(self) -> None:
+        self.arcs: list[list[Point]] = []
+        self._index: dict[tuple[Point, ...], int] = {}
+        self._neighbours: dict[Point, frozenset[Point]] = {}
+        self.junctions: set[Point] = set()
+
+    def _visit(self, point: Point, previous: Point, following: Point) -> None:
+        pair = frozenset((previous, following))
+        seen = self._neighbours.setdefault(point, pair)
+        if seen != pair:
+            self.junctions.add(point)
+
+    def register_line(self, points: list[Point]) -> None:
+        self.junctions.add(points[0])
+        self.junctions.add(points[-1])
+        for i in range(1, len(points) - 1):
+            self._visit(points[i], points[i - 1], points[i + 1])
+
+    def register_ring(self, points: list[Point]) -> None:
+        size = len(points)
+        for i, point in enumerate(points):
+            self._visit(point, points[i - 1], points[(i + 1) % size])
+
+    def _arc_ref(self, arc: list[Point]) -> int:
+        key = tuple(arc)
+        found = self._index.get(key)
+        if found is not None:
+            return found
+        found = self._index.get(key[::-1])
+        if found is not None:
+            return ~found
+        self._index[key] = len(self.arcs)
+        self.arcs.append(arc)
+        return len(self.arcs) - 1
+
+    def _cut(self, points: list[Point], cut_at: list[int]) -> list[int]:
+        refs: list[int] = []
+        for start, end in pairwise(cut_at):
+            refs.append(self._arc_ref(points[start : end + 1]))
+        return refs
+
+    def line_arcs(self, points: list[Point]) -> list[int]:
+        cut_at = [i for i, point in enumerate(points) if point in self.junctions]
+        return self._cut(points, cut_at)
+
+    def ring_arcs(self, points: list[Point]) -> list[int]:
+        junction_at = [i for i, point in enumerate(points) if point in self.junctions]
+        # Without junctions the whole ring is one arc; starting it at its smallest
+        # point makes the same ring of two territories (e.g. an enclave) share it.
+        start = junction_at[0] if junction_at else points.index(min(points))
+        rotated = points[start:] + points[:start]
+        rotated.append(rotated[0])
+        cut_at = [i - start for i in junction_at] or [0]
+        cut_at.append(len(points))
+        return self._cut(rotated, cut_at)
+
+
+def _quantized_rings(quantizer: _Quantizer, polygon: Sequence[Any]) -> list[list[Point]]:
+    rings: list[list[Point]] = []
+    for position_ring in polygon or []:
+        ring = quantizer.line(position_ring)
+        if len(ring) > 1 and ring[0] == ring[-1]:
+            ring.pop()
+        if len(ring) < 2:
+            if not rings:
+                # Collapsed exterior ring: the whole polygon vanishes at this grid.
+                return []
+            continue
+        rings.append(ring)
+    return rings
+
+
+def _quantize_geometry(quantizer: _Quantizer, geometry: Mapping[str, Any] | None) -> dict[str, Any]:
+    if not geometry:
+        return {"type": None}
+    geometry_type = geometry.get("type")
+    coordinates = geometry.get("coordinates") or []
+    if not coordinates and geometry_type != "GeometryCollection":
+        return {"type": None}
+    if geometry_type == "Point":
+        return {"type": "Point", "coordinates": list(quantizer.point(coordinates))}
+    if geometry_type == "MultiPoint":
+        return {
+            "type": "MultiPoint",
+            "coordinates": [list(quantizer.point(position)) for position in coordinates],
+        }
+    if geometry_type == "LineString":
+        return {"type": "LineString", "lines": [quantizer.line(coordinates)]}
+    if geometry_type == "MultiLineString":
+        return {"type": "MultiLineString", "lines": [quantizer.line(line) for line in coordinates]}
+    if geometry_type == "Polygon":
+        return {"type": "Polygon", "polygons": [_quantized_rings(quantizer, coordinates)]}
+    if geometry_type == "MultiPolygon":
+        return {
+            "type": "MultiPolygon",
+            "polygons": [_quantized_rings(quantizer, polygon) for polygon in coordinates],
+        }
+    if geometry_type == "GeometryCollection":
+        return {
+            "type": "GeometryCollection",
+            "geometries": [
+                _quantize_geometry(quantizer, child) for child in geometry.get("geometries") or []
+            ],
+        }
+    return {"type": None}
+
+
+def _register(arc_index: _ArcIndex, quantized: dict[str, Any]) -> None:
+    for child in quantized.get("geometries", []):
+        _register(arc_index, child)
+    for line in quantized.get("lines", []):
+        if line:
+            arc_index.register_line(line if len(line) > 1 else line * 2)
+    for polygon in quantized.get("polygons", []):
+        for ring in polygon:
+            arc_index.register_ring(ring)
+
+
+def _to_topology_geometry(arc_index: _ArcIndex, quantized: dict[str, Any]) -> dict[str, Any]:
+    geometry_type = quantized["type"]
+    if geometry_type == "GeometryCollection":
+        return {
+            "type": "GeometryCollection",
+            "geometries": [
+                _to_topology_geometry(arc_index, child) for child in quantized["geometries"]
+            ],
+        }
+    if "lines" in quantized:
+        lines = [
+            arc_index.line_arcs(line if len(line) > 1 else line * 2)
+            for line in quantized["lines"]
+            if line
+        ]
+        if not lines:
+            return {"type": None}
+        if geometry_type == "LineString":
+            return {"type": "LineString", "arcs": lines[0]}
+        return {"type": "MultiLineString", "arcs": lines}
+    if "polygons" in quantized:
+        polygons = [
+            [arc_index.ring_arcs(ring) for ring in polygon]
+            for polygon in quantized["polygons"]
+            if polygon
+        ]
+        if not polygons:
+            return {"type": None}
+        if geometry_type == "Polygon":
+            return {"type": "Polygon", "arcs": polygons[0]}
+        return {"type": "MultiPolygon", "arcs": polygons}
+    return dict(quantized)
+
+
+def _delta_encode(arc: list[Point]) -> list[list[int]]:
+    encoded = [[arc[0][0], arc[0][1]]]
+    for (x0, y0), (x1, y1) in pairwise(arc):
+        encoded.append([x1 - x0, y1 - y0])
+    return encoded
+
+
+def build_topology(
+    features: Iterable[tuple[str, Mapping[str, Any] | None]],
+    *,
+    quantization: int = DEFAULT_TOPOLOGY_QUANTIZATION,
+    object_name: str = TOPOLOGY_OBJECT_NAME,
+) -> dict[str, Any]:
+    """Quantized TopoJSON topology for ``(id, GeoJSON geometry)`` pairs.
+
+    Geometries keep their input order and carry the feature id, so clients join
+    them back to the response items by ``territory_id``.
+    """
+    collected = list(features)
+    xs: list[float] = []
+    ys: list[float] = []
+    for _feature_id, geometry in collected:
+        for position in _iter_positions(geometry):
+            xs.append(float(position[0]))
+            ys.append(float(position[1]))
+    bbox = (min(xs), min(ys), max(xs), max(ys)) if xs else (0.0, 0.0, 0.0, 0.0)
+
+    quantizer = _Quantizer(bbox, quantization)
+    quantized = [
+        (feature_id, _quantize_geometry(quantizer, geometry)) for feature_id, geometry in collected
+    ]
+    arc_index = _ArcIndex()
+    for _feature_id, geometry in quantized:
+        _register(arc_index, geometry)
+
+    geometries = []
+    for feature_id, geometry in quantized:
+        topology_geometry = _to_topology_geometry(arc_index, geometry)
+        topology_geometry["id"] = feature_id
+        geometries.append(topology_geometry)
+
+    return {
+        "type": "Topology",
+        "bbox": list(bbox),
+        "transform": quantizer.transform,
+        "objects": {object_name: {"type": "GeometryCollection", "geometries": geometries}},
+        "arcs": [_delta_encode(arc) for arc in arc_index.arcs],
+    }
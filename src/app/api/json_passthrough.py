@@ -0,0 +1,62 @@
+"""Pass-through JSON rendering for geometry-heavy collection endpoints.
+
+Postgres already produces GeoJSON as text. Instead of decoding every row into a
+dict, validating it into a Pydantic item and serializing it back, these helpers
+let the database aggregate the item list (``json_agg(to_json(row))``) and splice
+that text verbatim into the response body. The route's ``response_model`` still
+documents the payload; it is just not used to build it.
+
+The row SELECT must therefore emit exactly the item fields, already in their
+final JSON form (external level names, ``NULL`` coalesced where the model had a
+default, geometry as ``::json``).
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+EMPTY_GEOMETRY_JSON_SQL = """'{"type": "GeometryCollection", "geometries": []}'::json"""
+
+
+def json_items_sql(select_sql: str, *, order_by: str) -> str:
+    """Wrap ``select_sql`` so it returns one row: the item count and the items as JSON text.
+
+    ``order_by`` refers to output columns of ``select_sql`` (aliased ``features``);
+    ``json_agg`` does not promise to keep the subquery order otherwise.
+    """
+    return f"""
+        SELECT
+            COUNT(*)::int AS item_count,
+            COALESCE(
+                json_agg(to_json(features) ORDER BY {order_by}),
+                '[]'::json
+            )::text AS items_json
+        FROM (
+            {select_sql}
+        ) AS features
+    """
+
+
+def fetch_json_items(
+    db: Session,
+    select_sql: str,
+    params: Mapping[str, Any],
+    *,
+    order_by: str,
+) -> tuple[int, str]:
+    row = db.execute(text(json_items_sql(select_sql, order_by=order_by)), params).mappings().one()
+    return int(row["item_count"] or 0), str(row["items_json"] or "[]")
+
+
+def json_passthrough_response(envelope: Mapping[str, Any], items_json: str) -> Response:
+    """JSON response of ``envelope`` plus an ``items`` key holding pre-rendered JSON."""
+    head = json.dumps(jsonable_encoder(envelope), ensure_ascii=False, separators=(",", ":"))
+    separator = "," if len(head) > 2 else ""
+    body = f'{head[:-1]}{separator}"items":{items_json}}}'
+    return Response(content=body.encode("utf-8"), media_type="application/json")
@@ -13,8 +13,10 @@ from app.api.error_handlers import (
     unhandled_exception_handler,
     validation_exception_handler,
 )
+from app.api.perf_middleware import PerfMetricsMiddleware
 from app.api.routes_elections import router as elections_router
 from app.api.routes_electorate import router as electorate_router
+from app.api.routes_exports import router as exports_router
 from app.api.routes_geo import router as geo_router
 from app.api.routes_indicators import router as indicators_router
 from app.api.routes_map import router as map_router
@@ -39,6 +41,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.perf_metrics_enabled:
+    app.add_middleware(PerfMetricsMiddleware)
 app.add_middleware(CacheHeaderMiddleware)
 api_v1_router = APIRouter(prefix=settings.api_version_prefix)
 api_v1_router.include_router(territories_router)
@@ -51,6 +55,7 @@ api_v1_router.include_router(territory_layers_router)
 api_v1_router.include_router(ops_router)
 api_v1_router.include_router(qg_router)
 api_v1_router.include_router(social_router)
+api_v1_router.include_router(exports_router)
 app.include_router(api_v1_router)
 
 app.add_exception_handler(HTTPException, http_exception_handler)
@@ -0,0 +1,209 @@
+"""Vectorized peer-similarity engine for the territory peers endpoints.
+
+Indicator scores of every territory of a level are packed into a dense
+territory x indicator matrix (``NaN`` where a territory has no score). Peers of a
+territory are then ranked with masked NumPy operations: the similarity of each
+candidate is ``100 - mean absolute error`` over the indicators both share, as in
+the original rule-based implementation.
+
+Matrices are cached per (level, period, data version) so repeated peer lookups
+for the same level do not re-run the scoring query nor rebuild the matrix.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from app.data_version import DATA_DOMAINS, data_version_token, get_data_version_tracker
+from app.single_flight import SingleFlight
+
+_MATRIX_CACHE_MAX_ITEMS = 16
+
+
+@dataclass(frozen=True)
+class PeerMatch:
+    territory_id: str
+    territory_name: str
+    territory_level: str
+    similarity_score: float
+    shared_indicators: int
+    avg_score: float
+
+
+@dataclass(frozen=True)
+class PeerResult:
+    territory_id: str
+    items: list[PeerMatch]
+    updated_at: datetime | None
+
+
+@dataclass(frozen=True)
+class PeerMatrix:
+    territory_ids: list[str]
+    territory_names: list[str]
+    territory_levels: list[str]
+    indicator_codes: list[str]
+    scores: np.ndarray
+    present: np.ndarray
+    # Descending-name tiebreak rank, precomputed once for np.lexsort.
+    name_rank: np.ndarray
+    updated_at: list[datetime | None]
+    index: dict[str, int]
+
+    def __contains__(self, territory_id: object) -> bool:
+        return territory_id in self.index
+
+    def top_peers(self, territory_id: str, *, limit: int) -> PeerResult:
+        """Rank peers by (shared indicators, similarity, name), all descending."""
+        row = self.index[territory_id]
+        shared = self.present & self.present[row]
+        shared_counts = shared.sum(axis=1)
+        shared_counts[row] = 0
+        candidates = np.flatnonzero(shared_counts > 0)
+        if candidates.size == 0:
+            return PeerResult(territory_id=territory_id, items=[], updated_at=None)
+
+        counts = shared_counts[candidates]
+        candidate_scores = self.scores[candidates]
+        candidate_shared = shared[candidates]
+        abs_error = np.where(candidate_shared, np.abs(candidate_scores - self.scores[row]), 0.0)
+        similarity = np.round(np.maximum(0.0, 100.0 - abs_error.sum(axis=1) / counts), 2)
+        shared_sum = np.where(candidate_shared, candidate_scores, 0.0).sum(axis=1)
+        avg_score = np.round(shared_sum / counts, 2)
+
+        order = np.lexsort((-self.name_rank[candidates], -similarity, -counts))[:limit]
+        items = [
+            PeerMatch(
+                territory_id=self.territory_ids[candidates[pos]],
+                territory_name=self.territory_names[candidates[pos]],
+                territory_level=self.territory_levels[candidates[pos]],
+                similarity_score=float(similarity[pos]),
+                shared_indicators=int(counts[pos]),
+                avg_score=float(avg_score[pos]),
+            )
+            for pos in order
+        ]
+        updated_at = max(
+            (self.updated_at[idx] for idx in candidates if self.updated_at[idx] is not None),
+            default=None,
+        )
+        return PeerResult(territory_id=territory_id, items=items, updated_at=updated_at)
+
+    def top_peers_many(self, territory_ids: Iterable[str], *, limit: int) -> list[PeerResult]:
+        """Peers for several territories; ids missing from the matrix are skipped."""
+        return [
+            self.top_peers(territory_id, limit=limit)
+            for territory_id in territory_ids
+            if territory_id in self.index
+        ]
+
+
+def build_peer_matrix(rows: Iterable[dict[str, Any]]) -> PeerMatrix:
+    """Build the matrix from ``_fetch_territory_indicator_scores`` rows."""
+    index: dict[str, int] = {}
+    indicator_index: dict[str, int] = {}
+    names: list[str] = []
+    levels: list[str] = []
+    updated_at: list[datetime | None] = []
+    cells: list[tuple[int, int, float]] = []
+
+    for row in rows:
+        territory_id = str(row["territory_id"])
+        position = index.get(territory_id)
+        if position is None:
+            position = index[territory_id] = len(names)
+            names.append(str(row["territory_name"]))
+            levels.append(str(row["territory_level"]))
+            updated_at.append(None)
+        code = str(row["indicator_code"])
+        column = indicator_index.setdefault(code, len(indicator_index))
+        cells.append((position, column, float(row["score"])))
+        row_updated_at = row.get("updated_at")
+        if row_updated_at is not None and (
+            updated_at[position] is None or row_updated_at > updated_at[position]
+        ):
+            updated_at[position] = row_updated_at
+
+    scores = np.full((len(names), len(indicator_index)), np.nan, dtype=np.float64)
+    if cells:
+        positions, columns, values = zip(*cells, strict=True)
+        scores[list(positions), list(columns)] = values
+
+    name_rank = np.empty(len(names), dtype=np.int64)
+    name_rank[sorted(range(len(names)), key=names.__getitem__)] = np.arange(len(names))
+    return PeerMatrix(
+        territory_ids=list(index),
+        territory_names=names,
+        territory_levels=levels,
+        indicator_codes=list(indicator_index),
+        scores=scores,
+        present=~np.isnan(scores),
+        name_rank=name_rank,
+        updated_at=updated_at,
+        index=index,
+    )
+
+
+class PeerMatrixCache:
+    def __init__(self, *, max_items: int = _MATRIX_CACHE_MAX_ITEMS) -> None:
+        self.max_items = max(1, max_items)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str | None, str], PeerMatrix] = OrderedDict()
+        self._builds = SingleFlight("peer_matrix")
+
+    def get_or_build(
+        self,
+        *,
+        level: str,
+        period: str | None,
+        data_version: str | None,
+        load_rows: Callable[[], list[dict[str, Any]]],
+    ) -> PeerMatrix:
+        """Return the cached matrix; without a data version it is rebuilt every time."""
+        if data_version is None:
+            return build_peer_matrix(load_rows())
+        key = (level, period, data_version)
+        with self._lock:
+            matrix = self._entries.get(key)
+            if matrix is not None:
+                self._entries.move_to_end(key)
+                return matrix
+
+        def _build() -> PeerMatrix:
+            built = build_peer_matrix(load_rows())
+            with self._lock:
+                self._entries[key] = built
+                while len(self._entries) > self.max_items:
+                    self._entries.popitem(last=False)
+            return built
+
+        return self._builds.do(key, _build)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_PEER_MATRIX_CACHE = PeerMatrixCache()
+
+
+def get_peer_matrix(
+    *,
+    level: str,
+    period: str | None,
+    load_rows: Callable[[], list[dict[str, Any]]],
+) -> PeerMatrix:
+    versions = get_data_version_tracker().snapshot()
+    data_version = data_version_token(versions, DATA_DOMAINS) if versions is not None else None
+    return _PEER_MATRIX_CACHE.get_or_build(
+        level=level,
+        period=period,
+        data_version=data_version,
+        load_rows=load_rows,
+    )
@@ -0,0 +1,64 @@
+"""Per-route request latency recorded into ``app.perf_metrics``.
+
+Requests are labelled with the matched route template (``/v1/territory/{territory_id}/peers``),
+not the raw path, so label cardinality stays bounded. The middleware sits inside
+``CacheHeaderMiddleware``: 304s and result-cache hits answered there never reach
+routing and are not counted, so the histograms describe the work the endpoints do.
+
+Pure ASGI, like ``cache_middleware``, so streamed bodies are not re-buffered; the
+timer stops when the last body chunk has been sent.
+"""
+
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.perf_metrics import UNMATCHED_ROUTE, get_perf_registry
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    path_regex = getattr(route, "path_regex", None)
+    if not isinstance(template, str):
+        return UNMATCHED_ROUTE
+    # ``route.path`` is relative to the router it was declared on; routers included
+    # with a prefix (``/v1``) are matched in place, so the prefix is the part of
+    # the request path in front of the suffix the route itself matched.
+    path: str = scope["path"]
+    if path_regex is not None and not path_regex.match(path):
+        for index, char in enumerate(path):
+            if char == "/" and index and path_regex.match(path[index:]):
+                return path[:index] + template
+    return template
+
+
+class PerfMetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            get_perf_registry().observe_request(
+                scope["method"],
+                _route_template(scope),
+                status_code,
+                (time.perf_counter() - started) * 1000,
+            )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.api.territory_levels import normalize_level
+from app.db import get_engine
+from app.fact_export import (
+    DEFAULT_EXPORT_BATCH_SIZE,
+    EXPORT_DATASETS,
+    EXPORT_FORMAT_PATTERN,
+    FactExportStream,
+)
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+@router.get("/{name}")
+def export_silver_facts(
+    name: str,
+    format: str = Query(default="ndjson", pattern=EXPORT_FORMAT_PATTERN),
+    territory_id: str | None = Query(default=None),
+    level: str | None = Query(default=None),
+    indicator_code: str | None = Query(default=None),
+    period: str | None = Query(default=None),
+    source: str | None = Query(default=None),
+    dataset: str | None = Query(default=None),
+    year: int | None = Query(default=None),
+    office: str | None = Query(default=None),
+    round: int | None = Query(default=None),
+    after: str | None = Query(default=None, description="Resume after this fact_id."),
+    limit: int | None = Query(default=None, ge=1, description="Rows in this chunk."),
+) -> StreamingResponse:
+    export_dataset = EXPORT_DATASETS.get(name)
+    if export_dataset is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown export '{name}'. Expected one of {sorted(EXPORT_DATASETS)}.",
+        )
+
+    raw_filters: dict[str, Any] = {
+        "territory_id": territory_id,
+        "level": normalize_level(level),
+        "indicator_code": indicator_code,
+        "period": period,
+        "source": source,
+        "dataset": dataset,
+        "year": year,
+        "office": office,
+        "round": round,
+    }
+    filters = {key: value for key, value in raw_filters.items() if value is not None}
+
+    try:
+        connection = get_engine().connect()
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=503, detail="Database unavailable for export.") from exc
+    try:
+        stream = FactExportStream(
+            connection,
+            export_dataset,
+            export_format=format,
+            filters=filters,
+            after=after,
+            limit=limit,
+            batch_size=DEFAULT_EXPORT_BATCH_SIZE,
+        )
+    except ValueError as exc:
+        connection.close()
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except SQLAlchemyError as exc:
+        raise HTTPException(status_code=503, detail="Export query failed.") from exc
+
+    return StreamingResponse(
+        stream,
+        media_type=stream.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{format}"',
+            "X-Export-Resume-Key": "fact_id",
+        },
+    )
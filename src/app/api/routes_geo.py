@@ -1,26 +1,58 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.geo_encoding import (
+    DEFAULT_GEOMETRY_PRECISION,
+    DEFAULT_TOPOLOGY_QUANTIZATION,
+    GEOMETRY_FORMAT_PATTERN,
+    MAX_GEOMETRY_PRECISION,
+    build_topology,
+    geometry_json_sql,
+)
 from app.api.territory_levels import normalize_level, to_external_level
-from app.api.utils import normalize_pagination
-from app.schemas.responses import PaginatedResponse
+from app.api.utils import (
+    TOTAL_MODE_PATTERN,
+    count_rows,
+    decode_cursor,
+    next_page_cursor,
+    normalize_pagination,
+    resolve_total_mode,
+)
+from app.schemas.responses import ChoroplethResponse
 
 router = APIRouter(prefix="/geo", tags=["geo"])
 
+_CHOROPLETH_CURSOR = "choropleth"
+_CHOROPLETH_FROM_WHERE = """
+            FROM silver.fact_indicator fi
+            JOIN silver.dim_territory dt ON dt.territory_id = fi.territory_id
+            WHERE fi.indicator_code = :metric
+              AND fi.reference_period = :period
+              AND dt.level::text = :level
+"""
+
 
-@router.get("/choropleth", response_model=PaginatedResponse)
+@router.get("/choropleth", response_model=ChoroplethResponse)
 def get_choropleth(
     metric: str = Query(...),
     period: str = Query(...),
     level: str = Query(default="municipio"),
     page: int = Query(default=1),
     page_size: int = Query(default=100),
+    cursor: str | None = Query(default=None),
+    total_mode: str | None = Query(default=None, pattern=TOTAL_MODE_PATTERN),
+    format: str = Query(default="geojson", pattern=GEOMETRY_FORMAT_PATTERN),
+    precision: int = Query(default=DEFAULT_GEOMETRY_PRECISION, ge=0, le=MAX_GEOMETRY_PRECISION),
+    zoom: int | None = Query(default=None, ge=0, le=22),
+    quantization: int = Query(default=DEFAULT_TOPOLOGY_QUANTIZATION, ge=1_000, le=10_000_000),
     db: Session = Depends(get_db),
-) -> PaginatedResponse:
+) -> ChoroplethResponse:
     level_en = normalize_level(level)
     if level_en not in {"municipality", "district"}:
         raise HTTPException(
@@ -28,31 +60,29 @@ def get_choropleth(
             detail="Choropleth endpoint supports only municipality or district level.",
         )
     page, page_size, offset = normalize_pagination(page, page_size)
+    keyset = (
+        decode_cursor(cursor, kind=_CHOROPLETH_CURSOR, fields=(str, UUID))
+        if cursor
+        else [None, None]
+    )
+    mode = resolve_total_mode(total_mode, cursor)
     params = {
         "metric": metric,
         "period": period,
         "level": level_en,
         "limit": page_size,
-        "offset": offset,
+        "offset": 0 if cursor else offset,
+        "cursor_name": keyset[0],
+        "cursor_territory_id": keyset[1],
+        "geometry_precision": precision,
+        "zoom": zoom,
     }
 
-    total = db.execute(
-        text(
-            """
-            SELECT COUNT(*)
-            FROM silver.fact_indicator fi
-            JOIN silver.dim_territory dt ON dt.territory_id = fi.territory_id
-            WHERE fi.indicator_code = :metric
-              AND fi.reference_period = :period
-              AND dt.level::text = :level
-            """
-        ),
-        params,
-    ).scalar_one()
+    total = count_rows(db, _CHOROPLETH_FROM_WHERE, params, mode=mode)
 
     rows = db.execute(
         text(
-            """
+            f"""
             SELECT
                 dt.territory_id::text AS territory_id,
                 dt.name AS territory_name,
@@ -60,13 +90,16 @@ def get_choropleth(
                 fi.indicator_code AS metric,
                 fi.reference_period,
                 fi.value::double precision AS value,
-                ST_AsGeoJSON(dt.geometry)::jsonb AS geometry
-            FROM silver.fact_indicator fi
-            JOIN silver.dim_territory dt ON dt.territory_id = fi.territory_id
-            WHERE fi.indicator_code = :metric
-              AND fi.reference_period = :period
-              AND dt.level::text = :level
-            ORDER BY dt.name
+                {geometry_json_sql(level=level_en, zoom=zoom)}
+            {_CHOROPLETH_FROM_WHERE}
+              AND (
+                    CAST(:cursor_name AS TEXT) IS NULL
+                    OR (dt.name, dt.territory_id) > (
+                        CAST(:cursor_name AS TEXT),
+                        CAST(:cursor_territory_id AS UUID)
+                    )
+                  )
+            ORDER BY dt.name, dt.territory_id
             LIMIT :limit OFFSET :offset
             """
         ),
@@ -78,4 +111,25 @@ def get_choropleth(
         item = dict(row)
         item["level"] = to_external_level(item["level"])
         items.append(item)
-    return PaginatedResponse(page=page, page_size=page_size, total=total, items=items)
+    topology = None
+    if format == "topojson":
+        topology = build_topology(
+            ((item["territory_id"], item.pop("geometry")) for item in items),
+            quantization=quantization,
+        )
+        for item in items:
+            item["geometry"] = None
+    return ChoroplethResponse(
+        page=page,
+        page_size=page_size,
+        total=total,
+        items=items,
+        next_cursor=next_page_cursor(
+            _CHOROPLETH_CURSOR,
+            rows,
+            page_size=page_size,
+            keys=("territory_name", "territory_id"),
+        ),
+        total_estimated=mode == "estimated",
+        topology=topology,
+    )
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
-from app.api.utils import normalize_pagination
+from app.api.utils import (
+    TOTAL_MODE_PATTERN,
+    count_rows,
+    decode_cursor,
+    next_page_cursor,
+    normalize_pagination,
+    resolve_total_mode,
+)
 from app.schemas.responses import PaginatedResponse
 
 router = APIRouter(tags=["indicators"])
 
+_INDICATORS_CURSOR = "indicators"
+_INDICATORS_FROM_WHERE = """
+            FROM silver.fact_indicator
+            WHERE (CAST(:territory_id AS TEXT) IS NULL OR territory_id::text = CAST(:territory_id AS TEXT))
+              AND (CAST(:indicator_code AS TEXT) IS NULL OR indicator_code = CAST(:indicator_code AS TEXT))
+              AND (CAST(:period AS TEXT) IS NULL OR reference_period = CAST(:period AS TEXT))
+              AND (CAST(:source AS TEXT) IS NULL OR source = CAST(:source AS TEXT))
+              AND (CAST(:dataset AS TEXT) IS NULL OR dataset = CAST(:dataset AS TEXT))
+"""
+
 
 @router.get("/indicators", response_model=PaginatedResponse)
 def get_indicators(
@@ -20,9 +39,17 @@ def get_indicators(
     dataset: str | None = Query(default=None),
     page: int = Query(default=1),
     page_size: int = Query(default=100),
+    cursor: str | None = Query(default=None),
+    total_mode: str | None = Query(default=None, pattern=TOTAL_MODE_PATTERN),
     db: Session = Depends(get_db),
 ) -> PaginatedResponse:
     page, page_size, offset = normalize_pagination(page, page_size)
+    keyset = (
+        decode_cursor(cursor, kind=_INDICATORS_CURSOR, fields=(str, str, UUID))
+        if cursor
+        else [None, None, None]
+    )
+    mode = resolve_total_mode(total_mode, cursor)
 
     params = {
         "territory_id": territory_id,
@@ -31,27 +58,19 @@ def get_indicators(
         "source": source,
         "dataset": dataset,
         "limit": page_size,
-        "offset": offset,
+        "offset": 0 if cursor else offset,
+        "cursor_period": keyset[0],
+        "cursor_indicator_code": keyset[1],
+        "cursor_fact_id": keyset[2],
     }
 
-    total = db.execute(
-        text(
-            """
-            SELECT COUNT(*)
-            FROM silver.fact_indicator
-            WHERE (CAST(:territory_id AS TEXT) IS NULL OR territory_id::text = CAST(:territory_id AS TEXT))
-              AND (CAST(:indicator_code AS TEXT) IS NULL OR indicator_code = CAST(:indicator_code AS TEXT))
-              AND (CAST(:period AS TEXT) IS NULL OR reference_period = CAST(:period AS TEXT))
-              AND (CAST(:source AS TEXT) IS NULL OR source = CAST(:source AS TEXT))
-              AND (CAST(:dataset AS TEXT) IS NULL OR dataset = CAST(:dataset AS TEXT))
-            """
-        ),
-        params,
-    ).scalar_one()
+    total = count_rows(db, _INDICATORS_FROM_WHERE, params, mode=mode)
 
+    # Sort is (reference_period DESC, indicator_code, fact_id); the leading bound
+    # lets the index seek past earlier periods, the rest resolves ties in-period.
     rows = db.execute(
         text(
-            """
+            f"""
             SELECT
                 fact_id::text AS fact_id,
                 territory_id::text AS territory_id,
@@ -64,17 +83,37 @@ def get_indicators(
                 value,
                 reference_period,
                 updated_at
-            FROM silver.fact_indicator
-            WHERE (CAST(:territory_id AS TEXT) IS NULL OR territory_id::text = CAST(:territory_id AS TEXT))
-              AND (CAST(:indicator_code AS TEXT) IS NULL OR indicator_code = CAST(:indicator_code AS TEXT))
-              AND (CAST(:period AS TEXT) IS NULL OR reference_period = CAST(:period AS TEXT))
-              AND (CAST(:source AS TEXT) IS NULL OR source = CAST(:source AS TEXT))
-              AND (CAST(:dataset AS TEXT) IS NULL OR dataset = CAST(:dataset AS TEXT))
-            ORDER BY reference_period DESC, indicator_code
+            {_INDICATORS_FROM_WHERE}
+              AND (
+                    CAST(:cursor_period AS TEXT) IS NULL
+                    OR (
+                        reference_period <= CAST(:cursor_period AS TEXT)
+                        AND (
+                            reference_period < CAST(:cursor_period AS TEXT)
+                            OR (indicator_code, fact_id) > (
+                                CAST(:cursor_indicator_code AS TEXT),
+                                CAST(:cursor_fact_id AS UUID)
+                            )
+                        )
+                    )
+                  )
+            ORDER BY reference_period DESC, indicator_code, fact_id
             LIMIT :limit OFFSET :offset
             """
         ),
         params,
     ).mappings().all()
 
-    return PaginatedResponse(page=page, page_size=page_size, total=total, items=[dict(row) for row in rows])
+    return PaginatedResponse(
+        page=page,
+        page_size=page_size,
+        total=total,
+        items=[dict(row) for row in rows],
+        next_cursor=next_page_cursor(
+            _INDICATORS_CURSOR,
+            rows,
+            page_size=page_size,
+            keys=("reference_period", "indicator_code", "fact_id"),
+        ),
+        total_estimated=mode == "estimated",
+    )
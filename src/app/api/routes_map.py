@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import math
 import time
@@ -8,15 +7,20 @@ from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import Response
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.json_passthrough import (
+    EMPTY_GEOMETRY_JSON_SQL,
+    fetch_json_items,
+    json_passthrough_response,
+)
 from app.api.territory_levels import normalize_level
+from app.perf_metrics import get_perf_registry
 from app.schemas.map import (
     EnvironmentRiskCollectionResponse,
-    EnvironmentRiskItem,
     MapLayerCoverageItem,
     MapLayerReadinessItem,
     MapLayerItem,
@@ -33,12 +37,11 @@ from app.schemas.map import (
     UrbanNearbyPoiItem,
     UrbanNearbyPoisResponse,
     UrbanPoiCollectionResponse,
-    UrbanPoiFeatureItem,
     UrbanTransportStopCollectionResponse,
-    UrbanTransportStopFeatureItem,
     UrbanRoadCollectionResponse,
-    UrbanRoadFeatureItem,
 )
+from app.single_flight import SingleFlight
+from app.tile_cache import get_tile_cache, tile_etag
 
 router = APIRouter(prefix="/map", tags=["map"])
 _STATIC_METADATA_GENERATED_AT = datetime.now(tz=UTC)
@@ -670,7 +673,7 @@ def get_environment_risk(
     include_geometry: bool = Query(default=True),
     limit: int = Query(default=1000, ge=1, le=5000),
     db: Session = Depends(get_db),
-) -> EnvironmentRiskCollectionResponse:
+) -> Response:
     level_en = normalize_level(level) or "district"
     if level_en not in {"district", "census_sector"}:
         raise HTTPException(
@@ -701,35 +704,36 @@ def get_environment_risk(
         ) from exc
 
     if effective_period is None:
-        return EnvironmentRiskCollectionResponse(
-            generated_at_utc=datetime.now(tz=UTC),
-            level=level_en,
-            period=None,
-            count=0,
-            items=[],
+        return json_passthrough_response(
+            {"generated_at_utc": datetime.now(tz=UTC), "level": level_en, "period": None, "count": 0},
+            "[]",
         )
 
-    geometry_select = "ST_AsGeoJSON(v.geometry)::text AS geometry_json" if include_geometry else "NULL::text AS geometry_json"
+    geometry_select = (
+        f"COALESCE(ST_AsGeoJSON(v.geometry)::json, {EMPTY_GEOMETRY_JSON_SQL}) AS geometry"
+        if include_geometry
+        else "NULL::json AS geometry"
+    )
     sql = f"""
         SELECT
-            v.reference_period,
+            v.reference_period::text AS reference_period,
             v.territory_id::text AS territory_id,
-            v.territory_name,
-            v.territory_level,
-            v.municipality_ibge_code,
+            v.territory_name::text AS territory_name,
+            v.territory_level::text AS territory_level,
+            v.municipality_ibge_code::text AS municipality_ibge_code,
             v.hazard_score::double precision AS hazard_score,
             v.exposure_score::double precision AS exposure_score,
             v.environment_risk_score::double precision AS environment_risk_score,
-            v.priority_status,
+            v.priority_status::text AS priority_status,
             v.area_km2::double precision AS area_km2,
             v.road_km::double precision AS road_km,
-            v.pois_count::int AS pois_count,
-            v.transport_stops_count::int AS transport_stops_count,
+            COALESCE(v.pois_count, 0)::int AS pois_count,
+            COALESCE(v.transport_stops_count, 0)::int AS transport_stops_count,
             v.road_density_km_per_km2::double precision AS road_density_km_per_km2,
             v.pois_per_km2::double precision AS pois_per_km2,
             v.transport_stops_per_km2::double precision AS transport_stops_per_km2,
-            v.uses_proxy_allocation,
-            v.allocation_method,
+            COALESCE(v.uses_proxy_allocation, FALSE) AS uses_proxy_allocation,
+            v.allocation_method::text AS allocation_method,
             {geometry_select}
         FROM map.v_environment_risk_aggregation v
         WHERE v.territory_level = :level
@@ -738,10 +742,12 @@ def get_environment_risk(
         LIMIT :limit
     """
     try:
-        rows = db.execute(
-            text(sql),
+        count, items_json = fetch_json_items(
+            db,
+            sql,
             {"level": level_en, "period": effective_period, "limit": limit},
-        ).mappings().all()
+            order_by="features.environment_risk_score DESC, features.territory_name ASC",
+        )
     except SQLAlchemyError as exc:
         raise HTTPException(
             status_code=503,
@@ -751,44 +757,14 @@ def get_environment_risk(
             ),
         ) from exc
 
-    items = [
-        EnvironmentRiskItem(
-            reference_period=str(row["reference_period"]),
-            territory_id=str(row["territory_id"]),
-            territory_name=str(row["territory_name"]),
-            territory_level=str(row["territory_level"]),
-            municipality_ibge_code=row.get("municipality_ibge_code"),
-            hazard_score=float(row["hazard_score"]),
-            exposure_score=float(row["exposure_score"]),
-            environment_risk_score=float(row["environment_risk_score"]),
-            priority_status=str(row["priority_status"]),
-            area_km2=float(row["area_km2"]) if row.get("area_km2") is not None else None,
-            road_km=float(row["road_km"]) if row.get("road_km") is not None else None,
-            pois_count=int(row.get("pois_count") or 0),
-            transport_stops_count=int(row.get("transport_stops_count") or 0),
-            road_density_km_per_km2=(
-                float(row["road_density_km_per_km2"])
-                if row.get("road_density_km_per_km2") is not None
-                else None
-            ),
-            pois_per_km2=float(row["pois_per_km2"]) if row.get("pois_per_km2") is not None else None,
-            transport_stops_per_km2=(
-                float(row["transport_stops_per_km2"])
-                if row.get("transport_stops_per_km2") is not None
-                else None
-            ),
-            uses_proxy_allocation=bool(row.get("uses_proxy_allocation")),
-            allocation_method=str(row["allocation_method"]),
-            geometry=_parse_geojson(row.get("geometry_json")) if include_geometry else None,
-        )
-        for row in rows
-    ]
-    return EnvironmentRiskCollectionResponse(
-        generated_at_utc=datetime.now(tz=UTC),
-        level=level_en,
-        period=str(effective_period),
-        count=len(items),
-        items=items,
+    return json_passthrough_response(
+        {
+            "generated_at_utc": datetime.now(tz=UTC),
+            "level": level_en,
+            "period": str(effective_period),
+            "count": count,
+        },
+        items_json,
     )
 
 
@@ -798,20 +774,20 @@ def get_urban_roads(
     road_class: str | None = Query(default=None),
     limit: int = Query(default=1000, ge=1, le=5000),
     db: Session = Depends(get_db),
-) -> UrbanRoadCollectionResponse:
+) -> Response:
     parsed_bbox = _parse_bbox(bbox)
     minx = miny = maxx = maxy = None
     if parsed_bbox is not None:
         minx, miny, maxx, maxy = parsed_bbox
 
-    sql = """
+    sql = f"""
         SELECT
             road_id::text AS road_id,
-            source,
+            source::text AS source,
             name,
             road_class,
             COALESCE(ST_Length(ST_Transform(geom, 31983)), 0)::double precision AS length_m,
-            ST_AsGeoJSON(geom)::text AS geometry_json
+            COALESCE(ST_AsGeoJSON(geom)::json, {EMPTY_GEOMETRY_JSON_SQL}) AS geometry
         FROM map.urban_road_segment
         WHERE (
                 CAST(:road_class AS TEXT) IS NULL
@@ -834,8 +810,9 @@ def get_urban_roads(
         LIMIT :limit
     """
     try:
-        rows = db.execute(
-            text(sql),
+        count, items_json = fetch_json_items(
+            db,
+            sql,
             {
                 "road_class": road_class,
                 "minx": minx,
@@ -844,7 +821,8 @@ def get_urban_roads(
                 "maxy": maxy,
                 "limit": limit,
             },
-        ).mappings().all()
+            order_by="features.road_id::bigint",
+        )
     except SQLAlchemyError as exc:
         raise HTTPException(
             status_code=503,
@@ -854,21 +832,9 @@ def get_urban_roads(
             ),
         ) from exc
 
-    items = [
-        UrbanRoadFeatureItem(
-            road_id=str(row["road_id"]),
-            source=str(row["source"]),
-            name=row.get("name"),
-            road_class=row.get("road_class"),
-            length_m=float(row.get("length_m") or 0.0),
-            geometry=_parse_geojson(row.get("geometry_json")),
-        )
-        for row in rows
-    ]
-    return UrbanRoadCollectionResponse(
-        generated_at_utc=datetime.now(tz=UTC),
-        count=len(items),
-        items=items,
+    return json_passthrough_response(
+        {"generated_at_utc": datetime.now(tz=UTC), "count": count},
+        items_json,
     )
 
 
@@ -878,20 +844,20 @@ def get_urban_pois(
     category: str | None = Query(default=None),
     limit: int = Query(default=1000, ge=1, le=5000),
     db: Session = Depends(get_db),
-) -> UrbanPoiCollectionResponse:
+) -> Response:
     parsed_bbox = _parse_bbox(bbox)
     minx = miny = maxx = maxy = None
     if parsed_bbox is not None:
         minx, miny, maxx, maxy = parsed_bbox
 
-    sql = """
+    sql = f"""
         SELECT
             poi_id::text AS poi_id,
-            source,
+            source::text AS source,
             name,
             category,
             subcategory,
-            ST_AsGeoJSON(geom)::text AS geometry_json
+            COALESCE(ST_AsGeoJSON(geom)::json, {EMPTY_GEOMETRY_JSON_SQL}) AS geometry
         FROM map.urban_poi
         WHERE (
                 CAST(:category AS TEXT) IS NULL
@@ -914,8 +880,9 @@ def get_urban_pois(
         LIMIT :limit
     """
     try:
-        rows = db.execute(
-            text(sql),
+        count, items_json = fetch_json_items(
+            db,
+            sql,
             {
                 "category": category,
                 "minx": minx,
@@ -924,7 +891,8 @@ def get_urban_pois(
                 "maxy": maxy,
                 "limit": limit,
             },
-        ).mappings().all()
+            order_by="features.poi_id::bigint",
+        )
     except SQLAlchemyError as exc:
         raise HTTPException(
             status_code=503,
@@ -934,21 +902,9 @@ def get_urban_pois(
             ),
         ) from exc
 
-    items = [
-        UrbanPoiFeatureItem(
-            poi_id=str(row["poi_id"]),
-            source=str(row["source"]),
-            name=row.get("name"),
-            category=row.get("category"),
-            subcategory=row.get("subcategory"),
-            geometry=_parse_geojson(row.get("geometry_json")),
-        )
-        for row in rows
-    ]
-    return UrbanPoiCollectionResponse(
-        generated_at_utc=datetime.now(tz=UTC),
-        count=len(items),
-        items=items,
+    return json_passthrough_response(
+        {"generated_at_utc": datetime.now(tz=UTC), "count": count},
+        items_json,
     )
 
 
@@ -958,21 +914,21 @@ def get_urban_transport_stops(
     mode: str | None = Query(default=None),
     limit: int = Query(default=1000, ge=1, le=5000),
     db: Session = Depends(get_db),
-) -> UrbanTransportStopCollectionResponse:
+) -> Response:
     parsed_bbox = _parse_bbox(bbox)
     minx = miny = maxx = maxy = None
     if parsed_bbox is not None:
         minx, miny, maxx, maxy = parsed_bbox
 
-    sql = """
+    sql = f"""
         SELECT
             transport_id::text AS transport_id,
-            source,
+            source::text AS source,
             name,
             mode,
             operator,
             is_accessible,
-            ST_AsGeoJSON(geom)::text AS geometry_json
+            COALESCE(ST_AsGeoJSON(geom)::json, {EMPTY_GEOMETRY_JSON_SQL}) AS geometry
         FROM map.urban_transport_stop
         WHERE (
                 CAST(:mode AS TEXT) IS NULL
@@ -995,8 +951,9 @@ def get_urban_transport_stops(
         LIMIT :limit
     """
     try:
-        rows = db.execute(
-            text(sql),
+        count, items_json = fetch_json_items(
+            db,
+            sql,
             {
                 "mode": mode,
                 "minx": minx,
@@ -1005,7 +962,8 @@ def get_urban_transport_stops(
                 "maxy": maxy,
                 "limit": limit,
             },
-        ).mappings().all()
+            order_by="features.transport_id::bigint",
+        )
     except SQLAlchemyError as exc:
         raise HTTPException(
             status_code=503,
@@ -1015,22 +973,9 @@ def get_urban_transport_stops(
             ),
         ) from exc
 
-    items = [
-        UrbanTransportStopFeatureItem(
-            transport_id=str(row["transport_id"]),
-            source=str(row["source"]),
-            name=row.get("name"),
-            mode=row.get("mode"),
-            operator=row.get("operator"),
-            is_accessible=row.get("is_accessible"),
-            geometry=_parse_geojson(row.get("geometry_json")),
-        )
-        for row in rows
-    ]
-    return UrbanTransportStopCollectionResponse(
-        generated_at_utc=datetime.now(tz=UTC),
-        count=len(items),
-        items=items,
+    return json_passthrough_response(
+        {"generated_at_utc": datetime.now(tz=UTC), "count": count},
+        items_json,
     )
 
 
@@ -1293,6 +1238,11 @@ _ZOOM_TOLERANCE_METERS: list[tuple[int, float]] = [
 ]
 
 
+# Levels served from map.territory_tile_geometry (db/sql/022_map_tile_geometry_pyramid.sql),
+# which holds one pre-validated, pre-simplified EPSG:3857 geometry per zoom band above.
+_PYRAMID_TILE_LEVELS = frozenset({"municipality", "district", "census_sector"})
+
+
 def _tolerance_for_zoom(z: int) -> float:
     for max_zoom, tol in _ZOOM_TOLERANCE_METERS:
         if z < max_zoom:
@@ -1300,8 +1250,15 @@ def _tolerance_for_zoom(z: int) -> float:
     return 100.0
 
 
-_TILE_METRICS: list[dict[str, object]] = []
-_TILE_METRICS_MAX = 500
+def _zoom_band_for_zoom(z: int) -> int:
+    for max_zoom, _tol in _ZOOM_TOLERANCE_METERS:
+        if z < max_zoom:
+            return max_zoom
+    return _ZOOM_TOLERANCE_METERS[-1][0]
+
+
+# Concurrent requests for the same tile share one render (and one pooled connection).
+_TILE_FLIGHT = SingleFlight("map_tiles")
 
 
 def _tile_to_bbox(z: int, x: int, y: int) -> tuple[float, float, float, float]:
@@ -1313,29 +1270,14 @@ def _tile_to_bbox(z: int, x: int, y: int) -> tuple[float, float, float, float]:
     return (lon_min, lat_min, lon_max, lat_max)
 
 
-@router.get(
-    "/tiles/{layer}/{z}/{x}/{y}.mvt",
-    responses={
-        200: {"content": {"application/vnd.mapbox-vector-tile": {}}},
-        204: {"description": "Empty tile"},
-        404: {"description": "Unknown layer"},
-    },
-)
-def get_mvt_tile(
+def _build_tile_query(
     layer: str,
     z: int,
     x: int,
     y: int,
-    request: Request,
-    db: Session = Depends(get_db),
-) -> Response:
-    t0 = time.monotonic()
-
+) -> tuple[TextClause, dict[str, object]]:
     level = _LAYER_TO_LEVEL.get(layer)
     urban_layer = _URBAN_TILE_LAYERS.get(layer)
-    if level is None and urban_layer is None:
-        raise HTTPException(status_code=404, detail={"reason": "Unknown layer", "layer": layer})
-
     tolerance_meters = _tolerance_for_zoom(z)
     layer_filter = _LAYER_EXTRA_WHERE.get(layer, "")
     name_expr = _LAYER_NAME_EXPR.get(layer, "dt.name")
@@ -1384,6 +1326,30 @@ def get_mvt_tile(
             WHERE features.geom IS NOT NULL
             """
         )
+    elif level in _PYRAMID_TILE_LEVELS:
+        sql = text(
+            f"""
+            WITH tile_extent AS (
+                SELECT ST_TileEnvelope(:z, :x, :y) AS envelope
+            ),
+            features AS (
+                SELECT
+                    dt.territory_id::text AS tid,
+                    {name_expr} AS tname,
+                    ST_AsMVTGeom(tg.geom_3857, te.envelope, 4096, 64, true) AS geom
+                FROM map.territory_tile_geometry tg
+                CROSS JOIN tile_extent te
+                JOIN silver.dim_territory dt ON dt.territory_id = tg.territory_id
+                WHERE tg.territory_level = :level
+                  AND tg.max_zoom = :zoom_band
+                  AND tg.geom_3857 && te.envelope
+                  {layer_filter}
+            )
+            SELECT ST_AsMVT(features.*, :layer_name) AS mvt
+            FROM features
+            WHERE features.geom IS NOT NULL
+            """
+        )
     else:
         sql = text(
             f"""
@@ -1428,44 +1394,46 @@ def get_mvt_tile(
         "y": y,
         "level": level,
         "tolerance_meters": tolerance_meters,
+        "zoom_band": _zoom_band_for_zoom(z),
         "layer_name": layer,
     }
+    return sql, params
 
-    try:
-        execution = db.execute(sql, params)
-    except SQLAlchemyError as exc:
-        raise HTTPException(
-            status_code=503,
-            detail=(
-                "Map tile backend is unavailable. Ensure map SQL objects are applied "
-                "with scripts/init_db.py."
-            ),
-        ) from exc
 
+def render_mvt_tile(db: Session, layer: str, z: int, x: int, y: int) -> bytes:
+    """Render one MVT tile from PostGIS. Raises SQLAlchemyError when the backend fails."""
+    execution = db.execute(*_build_tile_query(layer, z, x, y))
     scalar_one_or_none = getattr(execution, "scalar_one_or_none", None)
     if callable(scalar_one_or_none):
         result = scalar_one_or_none()
     else:
         result = execution.scalar()
-    mvt_bytes = bytes(result) if result else b""
+    return bytes(result) if result else b""
 
-    elapsed_ms = round((time.monotonic() - t0) * 1000, 1)
-    _TILE_METRICS.append(
-        {
-            "layer": layer,
-            "z": z,
-            "elapsed_ms": elapsed_ms,
-            "bytes": len(mvt_bytes),
-            "ts": time.time(),
-        }
-    )
-    if len(_TILE_METRICS) > _TILE_METRICS_MAX:
-        del _TILE_METRICS[: len(_TILE_METRICS) - _TILE_METRICS_MAX]
 
+def _record_tile_metric(
+    layer: str,
+    z: int,
+    elapsed_ms: float,
+    size_bytes: int,
+    *,
+    cache_hit: bool,
+) -> None:
+    get_perf_registry().observe_tile(layer, elapsed_ms, size_bytes, cache_hit=cache_hit)
+
+
+def _tile_response(
+    layer: str,
+    mvt_bytes: bytes,
+    etag: str,
+    request: Request,
+    *,
+    elapsed_ms: float,
+    cache_status: str,
+) -> Response:
     if not mvt_bytes:
-        return Response(status_code=204)
+        return Response(status_code=204, headers={"X-Tile-Cache": cache_status})
 
-    etag = f"\"{hashlib.sha256(mvt_bytes).hexdigest()}\""
     if request.headers.get("if-none-match") == etag:
         return Response(
             status_code=304,
@@ -1474,6 +1442,7 @@ def get_mvt_tile(
                 "ETag": etag,
                 "X-Map-Layer": layer,
                 "Access-Control-Allow-Origin": "*",
+                "X-Tile-Cache": cache_status,
             },
         )
 
@@ -1486,36 +1455,81 @@ def get_mvt_tile(
             "X-Map-Layer": layer,
             "Access-Control-Allow-Origin": "*",
             "X-Tile-Ms": str(elapsed_ms),
+            "X-Tile-Cache": cache_status,
         },
     )
 
 
+@router.get(
+    "/tiles/{layer}/{z}/{x}/{y}.mvt",
+    responses={
+        200: {"content": {"application/vnd.mapbox-vector-tile": {}}},
+        204: {"description": "Empty tile"},
+        404: {"description": "Unknown layer"},
+    },
+)
+def get_mvt_tile(
+    layer: str,
+    z: int,
+    x: int,
+    y: int,
+    request: Request,
+    db: Session = Depends(get_db),
+) -> Response:
+    t0 = time.monotonic()
+
+    if layer not in _LAYER_TO_LEVEL and layer not in _URBAN_TILE_LAYERS:
+        raise HTTPException(status_code=404, detail={"reason": "Unknown layer", "layer": layer})
+
+    tile_cache = get_tile_cache()
+    cached_tile = tile_cache.get(layer, z, x, y) if tile_cache is not None else None
+    if cached_tile is not None:
+        elapsed_ms = round((time.monotonic() - t0) * 1000, 1)
+        _record_tile_metric(layer, z, elapsed_ms, len(cached_tile.content), cache_hit=True)
+        return _tile_response(
+            layer,
+            cached_tile.content,
+            cached_tile.etag,
+            request,
+            elapsed_ms=elapsed_ms,
+            cache_status=f"hit-{cached_tile.source}",
+        )
+
+    def _render_and_store() -> tuple[bytes, str]:
+        rendered = render_mvt_tile(db, layer, z, x, y)
+        if tile_cache is not None:
+            return rendered, tile_cache.put(layer, z, x, y, rendered).etag
+        return rendered, tile_etag(rendered)
+
+    try:
+        mvt_bytes, etag = _TILE_FLIGHT.do((layer, z, x, y), _render_and_store)
+    except SQLAlchemyError as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=(
+                "Map tile backend is unavailable. Ensure map SQL objects are applied "
+                "with scripts/init_db.py."
+            ),
+        ) from exc
+
+    elapsed_ms = round((time.monotonic() - t0) * 1000, 1)
+    _record_tile_metric(layer, z, elapsed_ms, len(mvt_bytes), cache_hit=False)
+    return _tile_response(
+        layer,
+        mvt_bytes,
+        etag,
+        request,
+        elapsed_ms=elapsed_ms,
+        cache_status="miss" if tile_cache is not None else "bypass",
+    )
+
+
 @router.get("/tiles/metrics")
 def get_tile_metrics() -> dict:
-    if not _TILE_METRICS:
-        return {"count": 0, "by_layer": {}, "p50_ms": 0, "p95_ms": 0, "p99_ms": 0}
-
-    latencies = sorted(m["elapsed_ms"] for m in _TILE_METRICS)  # type: ignore[type-var]
-    n = len(latencies)
-
-    by_layer: dict[str, dict[str, object]] = {}
-    for m in _TILE_METRICS:
-        lname = str(m["layer"])
-        if lname not in by_layer:
-            by_layer[lname] = {"count": 0, "total_ms": 0.0, "total_bytes": 0}
-        by_layer[lname]["count"] = int(by_layer[lname]["count"]) + 1  # type: ignore[arg-type]
-        by_layer[lname]["total_ms"] = float(by_layer[lname]["total_ms"]) + float(m["elapsed_ms"])  # type: ignore[arg-type]
-        by_layer[lname]["total_bytes"] = int(by_layer[lname]["total_bytes"]) + int(m["bytes"])  # type: ignore[arg-type]
-
-    for stats in by_layer.values():
-        cnt = int(stats["count"])  # type: ignore[arg-type]
-        stats["avg_ms"] = round(float(stats["total_ms"]) / cnt, 1) if cnt else 0  # type: ignore[arg-type]
-        stats["avg_bytes"] = round(int(stats["total_bytes"]) / cnt) if cnt else 0  # type: ignore[arg-type]
-
+    tile_cache = get_tile_cache()
+    cache_stats = tile_cache.stats() if tile_cache is not None else {"enabled": False}
     return {
-        "count": n,
-        "p50_ms": latencies[n // 2],
-        "p95_ms": latencies[min(n - 1, int(n * 0.95))],
-        "p99_ms": latencies[min(n - 1, int(n * 0.99))],
-        "by_layer": by_layer,
+        **get_perf_registry().tile_summary(),
+        "cache": cache_stats,
+        "single_flight": _TILE_FLIGHT.stats(),
     }
@@ -10,20 +10,32 @@ from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
-from app.api.utils import normalize_pagination
+from app.api.utils import (
+    TOTAL_MODE_PATTERN,
+    count_rows,
+    decode_cursor,
+    next_page_cursor,
+    normalize_pagination,
+    resolve_total_mode,
+)
 from app.db import session_scope
 from app.ops_robustness_window import build_ops_robustness_window_report
 from app.ops_readiness import build_backend_readiness_report
+from app.perf_metrics import get_perf_registry
+from app.query_cache import get_query_cache
 from app.schemas.responses import PaginatedResponse
 from app.settings import get_settings
+from app.single_flight import single_flight_stats
+from app.tile_cache import get_tile_cache
 
 router = APIRouter(prefix="/ops", tags=["ops"])
 logger = logging.getLogger(__name__)
@@ -649,6 +661,24 @@ def _classify_transition(
     return "regressed"
 
 
+_PIPELINE_RUNS_CURSOR = "pipeline_runs"
+_PIPELINE_RUNS_FROM_WHERE = """
+            FROM ops.pipeline_runs
+            WHERE (CAST(:run_id AS TEXT) IS NULL OR run_id::text = CAST(:run_id AS TEXT))
+              AND (CAST(:job_name AS TEXT) IS NULL OR job_name = CAST(:job_name AS TEXT))
+              AND (CAST(:status AS TEXT) IS NULL OR status = CAST(:status AS TEXT))
+              AND (CAST(:source AS TEXT) IS NULL OR source = CAST(:source AS TEXT))
+              AND (CAST(:dataset AS TEXT) IS NULL OR dataset = CAST(:dataset AS TEXT))
+              AND (CAST(:wave AS TEXT) IS NULL OR wave = CAST(:wave AS TEXT))
+              AND (
+                    CAST(:reference_period AS TEXT) IS NULL
+                    OR reference_period = CAST(:reference_period AS TEXT)
+                  )
+              AND (CAST(:started_from AS TIMESTAMPTZ) IS NULL OR started_at_utc >= CAST(:started_from AS TIMESTAMPTZ))
+              AND (CAST(:started_to AS TIMESTAMPTZ) IS NULL OR started_at_utc <= CAST(:started_to AS TIMESTAMPTZ))
+"""
+
+
 @router.get("/pipeline-runs", response_model=PaginatedResponse)
 def list_pipeline_runs(
     run_id: str | None = Query(default=None),
@@ -663,9 +693,17 @@ def list_pipeline_runs(
     started_to: datetime | None = Query(default=None),  # noqa: B008
     page: int = Query(default=1),
     page_size: int = Query(default=100),
+    cursor: str | None = Query(default=None),
+    total_mode: str | None = Query(default=None, pattern=TOTAL_MODE_PATTERN),
     db: Session = Depends(get_db),  # noqa: B008
 ) -> PaginatedResponse:
     page, page_size, offset = normalize_pagination(page, page_size)
+    keyset = (
+        decode_cursor(cursor, kind=_PIPELINE_RUNS_CURSOR, fields=(datetime, UUID))
+        if cursor
+        else [None, None]
+    )
+    mode = resolve_total_mode(total_mode, cursor)
     effective_status = run_status if run_status is not None else status
     params = {
         "run_id": run_id,
@@ -678,34 +716,16 @@ def list_pipeline_runs(
         "started_from": started_from,
         "started_to": started_to,
         "limit": page_size,
-        "offset": offset,
+        "offset": 0 if cursor else offset,
+        "cursor_started_at": keyset[0],
+        "cursor_run_id": keyset[1],
     }
 
-    total = db.execute(
-        text(
-            """
-            SELECT COUNT(*)
-            FROM ops.pipeline_runs
-            WHERE (CAST(:run_id AS TEXT) IS NULL OR run_id::text = CAST(:run_id AS TEXT))
-              AND (CAST(:job_name AS TEXT) IS NULL OR job_name = CAST(:job_name AS TEXT))
-              AND (CAST(:status AS TEXT) IS NULL OR status = CAST(:status AS TEXT))
-              AND (CAST(:source AS TEXT) IS NULL OR source = CAST(:source AS TEXT))
-              AND (CAST(:dataset AS TEXT) IS NULL OR dataset = CAST(:dataset AS TEXT))
-              AND (CAST(:wave AS TEXT) IS NULL OR wave = CAST(:wave AS TEXT))
-              AND (
-                    CAST(:reference_period AS TEXT) IS NULL
-                    OR reference_period = CAST(:reference_period AS TEXT)
-                  )
-              AND (CAST(:started_from AS TIMESTAMPTZ) IS NULL OR started_at_utc >= CAST(:started_from AS TIMESTAMPTZ))
-              AND (CAST(:started_to AS TIMESTAMPTZ) IS NULL OR started_at_utc <= CAST(:started_to AS TIMESTAMPTZ))
-            """
-        ),
-        params,
-    ).scalar_one()
+    total = count_rows(db, _PIPELINE_RUNS_FROM_WHERE, params, mode=mode)
 
     rows = db.execute(
         text(
-            """
+            f"""
             SELECT
                 run_id::text AS run_id,
                 job_name,
@@ -725,19 +745,14 @@ def list_pipeline_runs(
                 manifest_path,
                 checksum_sha256,
                 details
-            FROM ops.pipeline_runs
-            WHERE (CAST(:run_id AS TEXT) IS NULL OR run_id::text = CAST(:run_id AS TEXT))
-              AND (CAST(:job_name AS TEXT) IS NULL OR job_name = CAST(:job_name AS TEXT))
-              AND (CAST(:status AS TEXT) IS NULL OR status = CAST(:status AS TEXT))
-              AND (CAST(:source AS TEXT) IS NULL OR source = CAST(:source AS TEXT))
-              AND (CAST(:dataset AS TEXT) IS NULL OR dataset = CAST(:dataset AS TEXT))
-              AND (CAST(:wave AS TEXT) IS NULL OR wave = CAST(:wave AS TEXT))
+            {_PIPELINE_RUNS_FROM_WHERE}
               AND (
-                    CAST(:reference_period AS TEXT) IS NULL
-                    OR reference_period = CAST(:reference_period AS TEXT)
+                    CAST(:cursor_started_at AS TIMESTAMPTZ) IS NULL
+                    OR (started_at_utc, run_id) < (
+                        CAST(:cursor_started_at AS TIMESTAMPTZ),
+                        CAST(:cursor_run_id AS UUID)
+                    )
                   )
-              AND (CAST(:started_from AS TIMESTAMPTZ) IS NULL OR started_at_utc >= CAST(:started_from AS TIMESTAMPTZ))
-              AND (CAST(:started_to AS TIMESTAMPTZ) IS NULL OR started_at_utc <= CAST(:started_to AS TIMESTAMPTZ))
             ORDER BY started_at_utc DESC, run_id DESC
             LIMIT :limit OFFSET :offset
             """
@@ -750,6 +765,13 @@ def list_pipeline_runs(
         page_size=page_size,
         total=total,
         items=[dict(row) for row in rows],
+        next_cursor=next_page_cursor(
+            _PIPELINE_RUNS_CURSOR,
+            rows,
+            page_size=page_size,
+            keys=("started_at_utc", "run_id"),
+        ),
+        total_estimated=mode == "estimated",
     )
 
 
@@ -798,6 +820,23 @@ def ingest_frontend_event(
     return FrontendEventIngestResponse(status="accepted", event_id=int(event_id))
 
 
+_FRONTEND_EVENTS_CURSOR = "frontend_events"
+_FRONTEND_EVENTS_FROM_WHERE = """
+            FROM ops.frontend_events fe
+            WHERE (CAST(:category AS TEXT) IS NULL OR fe.category = CAST(:category AS TEXT))
+              AND (CAST(:severity AS TEXT) IS NULL OR fe.severity = CAST(:severity AS TEXT))
+              AND (CAST(:name AS TEXT) IS NULL OR fe.name = CAST(:name AS TEXT))
+              AND (
+                    CAST(:event_from AS TIMESTAMPTZ) IS NULL
+                    OR fe.event_timestamp_utc >= CAST(:event_from AS TIMESTAMPTZ)
+                  )
+              AND (
+                    CAST(:event_to AS TIMESTAMPTZ) IS NULL
+                    OR fe.event_timestamp_utc <= CAST(:event_to AS TIMESTAMPTZ)
+                  )
+"""
+
+
 @router.get("/frontend-events", response_model=PaginatedResponse)
 def list_frontend_events(
     category: str | None = Query(default=None),
@@ -807,9 +846,17 @@ def list_frontend_events(
     event_to: datetime | None = Query(default=None),  # noqa: B008
     page: int = Query(default=1),
     page_size: int = Query(default=100),
+    cursor: str | None = Query(default=None),
+    total_mode: str | None = Query(default=None, pattern=TOTAL_MODE_PATTERN),
     db: Session = Depends(get_db),  # noqa: B008
 ) -> PaginatedResponse:
     page, page_size, offset = normalize_pagination(page, page_size)
+    keyset = (
+        decode_cursor(cursor, kind=_FRONTEND_EVENTS_CURSOR, fields=(datetime, int))
+        if cursor
+        else [None, None]
+    )
+    mode = resolve_total_mode(total_mode, cursor)
     params = {
         "category": category,
         "severity": severity,
@@ -817,33 +864,16 @@ def list_frontend_events(
         "event_from": event_from,
         "event_to": event_to,
         "limit": page_size,
-        "offset": offset,
+        "offset": 0 if cursor else offset,
+        "cursor_event_timestamp": keyset[0],
+        "cursor_event_id": keyset[1],
     }
 
-    total = db.execute(
-        text(
-            """
-            SELECT COUNT(*)
-            FROM ops.frontend_events fe
-            WHERE (CAST(:category AS TEXT) IS NULL OR fe.category = CAST(:category AS TEXT))
-              AND (CAST(:severity AS TEXT) IS NULL OR fe.severity = CAST(:severity AS TEXT))
-              AND (CAST(:name AS TEXT) IS NULL OR fe.name = CAST(:name AS TEXT))
-              AND (
-                    CAST(:event_from AS TIMESTAMPTZ) IS NULL
-                    OR fe.event_timestamp_utc >= CAST(:event_from AS TIMESTAMPTZ)
-                  )
-              AND (
-                    CAST(:event_to AS TIMESTAMPTZ) IS NULL
-                    OR fe.event_timestamp_utc <= CAST(:event_to AS TIMESTAMPTZ)
-                  )
-            """
-        ),
-        params,
-    ).scalar_one()
+    total = count_rows(db, _FRONTEND_EVENTS_FROM_WHERE, params, mode=mode)
 
     rows = db.execute(
         text(
-            """
+            f"""
             SELECT
                 fe.event_id,
                 fe.category,
@@ -854,17 +884,13 @@ def list_frontend_events(
                 fe.received_at_utc,
                 fe.request_id,
                 fe.user_agent
-            FROM ops.frontend_events fe
-            WHERE (CAST(:category AS TEXT) IS NULL OR fe.category = CAST(:category AS TEXT))
-              AND (CAST(:severity AS TEXT) IS NULL OR fe.severity = CAST(:severity AS TEXT))
-              AND (CAST(:name AS TEXT) IS NULL OR fe.name = CAST(:name AS TEXT))
-              AND (
-                    CAST(:event_from AS TIMESTAMPTZ) IS NULL
-                    OR fe.event_timestamp_utc >= CAST(:event_from AS TIMESTAMPTZ)
-                  )
+            {_FRONTEND_EVENTS_FROM_WHERE}
               AND (
-                    CAST(:event_to AS TIMESTAMPTZ) IS NULL
-                    OR fe.event_timestamp_utc <= CAST(:event_to AS TIMESTAMPTZ)
+                    CAST(:cursor_event_timestamp AS TIMESTAMPTZ) IS NULL
+                    OR (fe.event_timestamp_utc, fe.event_id) < (
+                        CAST(:cursor_event_timestamp AS TIMESTAMPTZ),
+                        CAST(:cursor_event_id AS BIGINT)
+                    )
                   )
             ORDER BY fe.event_timestamp_utc DESC, fe.event_id DESC
             LIMIT :limit OFFSET :offset
@@ -878,6 +904,13 @@ def list_frontend_events(
         page_size=page_size,
         total=total,
         items=[dict(row) for row in rows],
+        next_cursor=next_page_cursor(
+            _FRONTEND_EVENTS_CURSOR,
+            rows,
+            page_size=page_size,
+            keys=("event_timestamp_utc", "event_id"),
+        ),
+        total_estimated=mode == "estimated",
     )
 
 
@@ -922,6 +955,19 @@ def get_admin_sync_job(
     return AdminSyncJobEnvelopeResponse(job=None if job is None else AdminSyncJobStatusResponse(**job))
 
 
+_PIPELINE_CHECKS_CURSOR = "pipeline_checks"
+_PIPELINE_CHECKS_FROM_WHERE = """
+            FROM ops.pipeline_checks pc
+            JOIN ops.pipeline_runs pr ON pr.run_id = pc.run_id
+            WHERE (CAST(:run_id AS TEXT) IS NULL OR pc.run_id::text = CAST(:run_id AS TEXT))
+              AND (CAST(:job_name AS TEXT) IS NULL OR pr.job_name = CAST(:job_name AS TEXT))
+              AND (CAST(:status AS TEXT) IS NULL OR pc.status = CAST(:status AS TEXT))
+              AND (CAST(:check_name AS TEXT) IS NULL OR pc.check_name = CAST(:check_name AS TEXT))
+              AND (CAST(:created_from AS TIMESTAMPTZ) IS NULL OR pc.created_at_utc >= CAST(:created_from AS TIMESTAMPTZ))
+              AND (CAST(:created_to AS TIMESTAMPTZ) IS NULL OR pc.created_at_utc <= CAST(:created_to AS TIMESTAMPTZ))
+"""
+
+
 @router.get("/pipeline-checks", response_model=PaginatedResponse)
 def list_pipeline_checks(
     run_id: str | None = Query(default=None),
@@ -932,9 +978,17 @@ def list_pipeline_checks(
     created_to: datetime | None = Query(default=None),  # noqa: B008
     page: int = Query(default=1),
     page_size: int = Query(default=100),
+    cursor: str | None = Query(default=None),
+    total_mode: str | None = Query(default=None, pattern=TOTAL_MODE_PATTERN),
     db: Session = Depends(get_db),  # noqa: B008
 ) -> PaginatedResponse:
     page, page_size, offset = normalize_pagination(page, page_size)
+    keyset = (
+        decode_cursor(cursor, kind=_PIPELINE_CHECKS_CURSOR, fields=(datetime, int))
+        if cursor
+        else [None, None]
+    )
+    mode = resolve_total_mode(total_mode, cursor)
     params = {
         "run_id": run_id,
         "job_name": job_name,
@@ -943,29 +997,16 @@ def list_pipeline_checks(
         "created_from": created_from,
         "created_to": created_to,
         "limit": page_size,
-        "offset": offset,
+        "offset": 0 if cursor else offset,
+        "cursor_created_at": keyset[0],
+        "cursor_check_id": keyset[1],
     }
 
-    total = db.execute(
-        text(
-            """
-            SELECT COUNT(*)
-            FROM ops.pipeline_checks pc
-            JOIN ops.pipeline_runs pr ON pr.run_id = pc.run_id
-            WHERE (CAST(:run_id AS TEXT) IS NULL OR pc.run_id::text = CAST(:run_id AS TEXT))
-              AND (CAST(:job_name AS TEXT) IS NULL OR pr.job_name = CAST(:job_name AS TEXT))
-              AND (CAST(:status AS TEXT) IS NULL OR pc.status = CAST(:status AS TEXT))
-              AND (CAST(:check_name AS TEXT) IS NULL OR pc.check_name = CAST(:check_name AS TEXT))
-              AND (CAST(:created_from AS TIMESTAMPTZ) IS NULL OR pc.created_at_utc >= CAST(:created_from AS TIMESTAMPTZ))
-              AND (CAST(:created_to AS TIMESTAMPTZ) IS NULL OR pc.created_at_utc <= CAST(:created_to AS TIMESTAMPTZ))
-            """
-        ),
-        params,
-    ).scalar_one()
+    total = count_rows(db, _PIPELINE_CHECKS_FROM_WHERE, params, mode=mode)
 
     rows = db.execute(
         text(
-            """
+            f"""
             SELECT
                 pc.check_id,
                 pc.run_id::text AS run_id,
@@ -980,14 +1021,14 @@ def list_pipeline_checks(
                 pc.observed_value,
                 pc.threshold_value,
                 pc.created_at_utc
-            FROM ops.pipeline_checks pc
-            JOIN ops.pipeline_runs pr ON pr.run_id = pc.run_id
-            WHERE (CAST(:run_id AS TEXT) IS NULL OR pc.run_id::text = CAST(:run_id AS TEXT))
-              AND (CAST(:job_name AS TEXT) IS NULL OR pr.job_name = CAST(:job_name AS TEXT))
-              AND (CAST(:status AS TEXT) IS NULL OR pc.status = CAST(:status AS TEXT))
-              AND (CAST(:check_name AS TEXT) IS NULL OR pc.check_name = CAST(:check_name AS TEXT))
-              AND (CAST(:created_from AS TIMESTAMPTZ) IS NULL OR pc.created_at_utc >= CAST(:created_from AS TIMESTAMPTZ))
-              AND (CAST(:created_to AS TIMESTAMPTZ) IS NULL OR pc.created_at_utc <= CAST(:created_to AS TIMESTAMPTZ))
+            {_PIPELINE_CHECKS_FROM_WHERE}
+              AND (
+                    CAST(:cursor_created_at AS TIMESTAMPTZ) IS NULL
+                    OR (pc.created_at_utc, pc.check_id) < (
+                        CAST(:cursor_created_at AS TIMESTAMPTZ),
+                        CAST(:cursor_check_id AS BIGINT)
+                    )
+                  )
             ORDER BY pc.created_at_utc DESC, pc.check_id DESC
             LIMIT :limit OFFSET :offset
             """
@@ -1000,6 +1041,13 @@ def list_pipeline_checks(
         page_size=page_size,
         total=total,
         items=[dict(row) for row in rows],
+        next_cursor=next_page_cursor(
+            _PIPELINE_CHECKS_CURSOR,
+            rows,
+            page_size=page_size,
+            keys=("created_at_utc", "check_id"),
+        ),
+        total_estimated=mode == "estimated",
     )
 
 
@@ -1952,3 +2000,33 @@ def get_ops_timeseries(
         "items": _aggregate_timeseries_rows([dict(row) for row in rows]),
     }
 
+
+@router.get("/perf")
+def get_perf_metrics(
+    top: int = Query(default=25, ge=1, le=500, description="Slowest statement sites to list."),
+) -> dict[str, Any]:
+    """Request, SQL statement, pool and tile latency since process start (this worker only).
+
+    Requests and statements are sorted by total time spent, so the first statement
+    sites are where the database time of this worker goes.
+    """
+    query_cache = get_query_cache()
+    tile_cache = get_tile_cache()
+    return {
+        "enabled": settings.perf_metrics_enabled,
+        **get_perf_registry().snapshot(top_statements=top),
+        "caches": {
+            "query": query_cache.stats() if query_cache is not None else {"enabled": False},
+            "tiles": tile_cache.stats() if tile_cache is not None else {"enabled": False},
+            "single_flight": single_flight_stats(),
+        },
+    }
+
+
+@router.get("/metrics", response_class=Response)
+def get_prometheus_metrics() -> Response:
+    """The same counters in the Prometheus text exposition format."""
+    return Response(
+        content=get_perf_registry().render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import UTC
 from datetime import datetime
 import hashlib
 from uuid import uuid4
 from typing import Any
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
-from app.api.territory_levels import normalize_level, to_external_level
+from app.api.geo_encoding import (
+    DEFAULT_GEOMETRY_PRECISION,
+    DEFAULT_TOPOLOGY_QUANTIZATION,
+    GEOMETRY_FORMAT_PATTERN,
+    MAX_GEOMETRY_PRECISION,
+    build_topology,
+    geometry_json_sql,
+)
+from app.api.json_passthrough import fetch_json_items, json_passthrough_response
+from app.api.peer_engine import PeerMatrix, PeerResult, get_peer_matrix
+from app.api.territory_levels import external_level_sql, normalize_level, to_external_level
 from app.api.strategic_engine_config import (
     load_strategic_engine_config,
     score_to_status,
@@ -48,16 +61,23 @@ from app.schemas.qg import (
     PriorityListResponse,
     PrioritySummaryResponse,
     QgMetadata,
+    ScenarioAdjustmentRange,
+    ScenarioSimulateBatchError,
+    ScenarioSimulateBatchRequest,
+    ScenarioSimulateBatchResponse,
     ScenarioSimulateRequest,
     ScenarioSimulateResponse,
     TerritoryCompareItem,
     TerritoryCompareResponse,
     TerritoryPeerItem,
+    TerritoryPeersBatchRequest,
+    TerritoryPeersBatchResponse,
     TerritoryPeersResponse,
     TerritoryProfileDomain,
     TerritoryProfileIndicator,
     TerritoryProfileResponse,
 )
+from app.single_flight import SingleFlight
 
 router = APIRouter(tags=["qg"])
 
@@ -307,12 +327,31 @@ def _build_insight_deep_link(row: dict[str, Any], item_severity: str) -> str:
     )
 
 
+# Coalesces identical concurrent QG queries (e.g. a burst of /mapa loads).
+_QUERY_FLIGHT = SingleFlight("qg_queries")
+
+
 def _fetch_priority_rows(
     db: Session,
     period: str | None,
     level: str | None,
     domain: str | None,
     limit: int,
+) -> list[dict[str, Any]]:
+    rows = _QUERY_FLIGHT.do(
+        ("priority_rows", period, level, domain, limit),
+        lambda: _query_priority_rows(db, period, level, domain, limit),
+    )
+    # Rows are shared with coalesced callers; hand each caller its own dicts.
+    return [dict(row) for row in rows]
+
+
+def _query_priority_rows(
+    db: Session,
+    period: str | None,
+    level: str | None,
+    domain: str | None,
+    limit: int,
 ) -> list[dict[str, Any]]:
     query = text(
         """
@@ -341,71 +380,17 @@ def _fetch_priority_rows(
                 mpd.driver_rank::int AS driver_rank,
                 mpd.driver_total::int AS driver_total,
                 mpd.priority_score::double precision AS score,
-                mpd.priority_status::text AS status
+                mpd.priority_status::text AS status,
+                mpd.coverage_covered_territories::int AS coverage_covered_territories,
+                mpd.coverage_total_territories::int AS coverage_total_territories,
+                mpd.coverage_pct::double precision AS coverage_pct
             FROM gold.mart_priority_drivers mpd
             WHERE (CAST(:period AS TEXT) IS NULL OR mpd.reference_period = CAST(:period AS TEXT))
               AND (CAST(:level AS TEXT) IS NULL OR mpd.territory_level::text = CAST(:level AS TEXT))
               AND (CAST(:domain AS TEXT) IS NULL OR mpd.domain = CAST(:domain AS TEXT))
-        ),
-        territory_totals AS (
-            SELECT
-                dt.level::text AS territory_level,
-                COUNT(*)::int AS total_territories
-            FROM silver.dim_territory dt
-            GROUP BY dt.level::text
-        ),
-        domain_coverage AS (
-            SELECT
-                b.reference_period,
-                b.territory_level,
-                b.domain,
-                COUNT(DISTINCT b.territory_id)::int AS covered_territories,
-                COALESCE(tt.total_territories, 0)::int AS total_territories,
-                CASE
-                    WHEN COALESCE(tt.total_territories, 0) = 0 THEN 0.0
-                    ELSE ROUND(
-                        (COUNT(DISTINCT b.territory_id)::numeric / tt.total_territories::numeric) * 100,
-                        2
-                    )::double precision
-                END AS coverage_pct
-            FROM base b
-            LEFT JOIN territory_totals tt
-                ON tt.territory_level = b.territory_level
-            GROUP BY b.reference_period, b.territory_level, b.domain, tt.total_territories
         )
-        SELECT
-            b.territory_id,
-            b.territory_name,
-            b.territory_level,
-            b.domain,
-            b.indicator_code,
-            b.indicator_name,
-            b.value,
-            b.unit,
-            b.reference_period,
-            b.source,
-            b.dataset,
-            b.updated_at,
-            b.score_version,
-            b.config_version,
-            b.scoring_method,
-            b.critical_threshold,
-            b.attention_threshold,
-            b.domain_weight,
-            b.indicator_weight,
-            b.weighted_magnitude,
-            b.driver_rank,
-            b.driver_total,
-            b.score,
-            b.status,
-            dc.covered_territories AS coverage_covered_territories,
-            dc.total_territories AS coverage_total_territories,
-            dc.coverage_pct
+        SELECT b.*
         FROM base b
-        LEFT JOIN domain_coverage dc
-            ON dc.reference_period = b.reference_period
-           AND dc.territory_level = b.territory_level
-           AND dc.domain = b.domain
         ORDER BY b.driver_rank ASC, b.territory_name ASC, b.indicator_code ASC
         LIMIT :limit
         """
@@ -507,46 +492,42 @@ def _previous_reference_period(period: str | None) -> str | None:
     return None
 
 
-def _compute_trend(current_value: float, previous_value: float | None) -> str:
-    """Return 'up', 'down' or 'stable' based on value delta."""
-    if previous_value is None:
-        return "stable"
-    if current_value == previous_value:
-        return "stable"
-    delta_pct = ((current_value - previous_value) / abs(previous_value)) * 100 if previous_value != 0 else 0
-    if delta_pct >= 2:
-        return "up"
-    if delta_pct <= -2:
-        return "down"
-    return "stable"
-
-
-def _fetch_previous_values(
+def _fetch_period_trends(
     db: Session,
-    *,
-    period: str,
-    level: str | None,
-) -> dict[tuple[str, str], float]:
-    """Return {(territory_id, indicator_code): value} for the previous period."""
-    prev_period = _previous_reference_period(period)
-    if prev_period is None:
+    rows: list[dict[str, Any]],
+) -> dict[tuple[str, str, str], str]:
+    """Return {(territory_id, indicator_code, reference_period): trend} for ``rows``.
+
+    Trends are precomputed by dbt_build in gold.indicator_period_change (+/-2%
+    against the previous year); keys missing there default to 'stable'.
+    """
+    territory_ids = sorted({str(row["territory_id"]) for row in rows})
+    periods = sorted({str(row["reference_period"]) for row in rows if row.get("reference_period")})
+    if not territory_ids or not periods:
         return {}
-    rows = db.execute(
+    change_rows = db.execute(
         text(
             """
             SELECT
-                dt.territory_id::text AS territory_id,
-                fi.indicator_code,
-                fi.value::double precision AS value
-            FROM silver.fact_indicator fi
-            JOIN silver.dim_territory dt ON dt.territory_id = fi.territory_id
-            WHERE fi.reference_period = CAST(:period AS TEXT)
-              AND (CAST(:level AS TEXT) IS NULL OR dt.level::text = CAST(:level AS TEXT))
+                ipc.territory_id,
+                ipc.indicator_code,
+                ipc.reference_period,
+                ipc.trend
+            FROM gold.indicator_period_change ipc
+            WHERE ipc.territory_id = ANY(CAST(:territory_ids AS TEXT[]))
+              AND ipc.reference_period = ANY(CAST(:periods AS TEXT[]))
             """
         ),
-        {"period": prev_period, "level": level},
+        {"territory_ids": territory_ids, "periods": periods},
     ).mappings().all()
-    return {(str(row["territory_id"]), str(row["indicator_code"])): float(row["value"]) for row in rows}
+    return {
+        (
+            str(row["territory_id"]),
+            str(row["indicator_code"]),
+            str(row["reference_period"]),
+        ): str(row["trend"])
+        for row in change_rows
+    }
 
 
 def _fetch_territory_indicator_scores(
@@ -555,6 +536,25 @@ def _fetch_territory_indicator_scores(
     territory_id: str | None,
     period: str | None,
     level: str,
+) -> list[dict[str, Any]]:
+    rows = _QUERY_FLIGHT.do(
+        ("territory_indicator_scores", territory_id, period, level),
+        lambda: _query_territory_indicator_scores(
+            db,
+            territory_id=territory_id,
+            period=period,
+            level=level,
+        ),
+    )
+    return [dict(row) for row in rows]
+
+
+def _query_territory_indicator_scores(
+    db: Session,
+    *,
+    territory_id: str | None,
+    period: str | None,
+    level: str,
 ) -> list[dict[str, Any]]:
     cfg = load_strategic_engine_config()
     crit = cfg.scoring.critical_threshold
@@ -1562,17 +1562,16 @@ def get_priority_list(
     level_en = normalize_level(level)
     rows = _fetch_priority_rows(db=db, period=period, level=level_en, domain=domain, limit=limit)
 
-    previous_values: dict[tuple[str, str], float] = {}
-    if period:
-        previous_values = _fetch_previous_values(db, period=period, level=level_en)
+    trends = _fetch_period_trends(db, rows)
 
     items = []
     for row in rows:
         trail = _build_explainability_trail(row)
         rationale = _build_priority_rationale(row, trail)
-
-        prev_val = previous_values.get((row["territory_id"], row["indicator_code"]))
-        trend = _compute_trend(float(row["value"]), prev_val)
+        trend = trends.get(
+            (row["territory_id"], row["indicator_code"], str(row["reference_period"])),
+            "stable",
+        )
 
         items.append(
             PriorityItem(
@@ -1706,11 +1705,18 @@ def get_insight_highlights(
             return "attention"
         return "info"
 
-    insights: list[InsightHighlightItem] = []
+    selected_rows: list[tuple[dict[str, Any], str]] = []
     for row in priority_rows:
         item_severity = _to_severity(row["status"])
         if severity and item_severity != severity:
             continue
+        selected_rows.append((row, item_severity))
+        if len(selected_rows) >= limit:
+            break
+    trends = _fetch_period_trends(db, [row for row, _ in selected_rows])
+
+    insights: list[InsightHighlightItem] = []
+    for row, item_severity in selected_rows:
         trail = _build_explainability_trail(row)
         insights.append(
             InsightHighlightItem(
@@ -1720,6 +1726,10 @@ def get_insight_highlights(
                 territory_id=row["territory_id"],
                 territory_name=row["territory_name"],
                 explanation=_build_insight_explanation(row),
+                trend=trends.get(
+                    (row["territory_id"], row["indicator_code"], str(row["reference_period"])),
+                    "stable",
+                ),
                 evidence=PriorityEvidence(
                     indicator_code=row["indicator_code"],
                     reference_period=row["reference_period"],
@@ -1736,8 +1746,6 @@ def get_insight_highlights(
                 deep_link=_build_insight_deep_link(row, item_severity),
             )
         )
-        if len(insights) >= limit:
-            break
 
     updated_at = max((row["updated_at"] for row in priority_rows), default=None)
     score_version = next(
@@ -1758,146 +1766,298 @@ def get_insight_highlights(
     )
 
 
-@router.post("/scenarios/simulate", response_model=ScenarioSimulateResponse)
-def simulate_scenario(
-    payload: ScenarioSimulateRequest,
-    db: Session = Depends(get_db),  # noqa: B008
-) -> ScenarioSimulateResponse:
-    level_en = normalize_level(payload.level) or "municipality"
-    rows = _fetch_priority_rows(
-        db=db,
-        period=payload.period,
-        level=level_en,
-        domain=payload.domain,
-        limit=500,
-    )
+_SCENARIO_PEER_LIMIT = 500
+_SCENARIO_BATCH_MAX_ITEMS = 500
 
-    territory_rows = [
-        row
-        for row in rows
-        if str(row["territory_id"]) == payload.territory_id and row.get("value") is not None
-    ]
-    if not territory_rows:
-        raise HTTPException(status_code=404, detail="No indicators found for selected territory")
+_IMPACT_LABELS = {
+    "improved": "melhora",
+    "worsened": "piora",
+    "unchanged": "inalterado",
+}
 
-    target_row: dict[str, Any] | None = None
-    if payload.indicator_code:
-        for row in territory_rows:
-            if str(row["indicator_code"]) == payload.indicator_code:
-                target_row = row
-                break
-        if target_row is None:
-            raise HTTPException(status_code=404, detail="Indicator not found for selected territory")
-    else:
-        target_row = territory_rows[0]
 
-    base_value = float(target_row["value"])
-    simulated_value = round(base_value * (1 + (payload.adjustment_percent / 100.0)), 6)
-    delta_value = round(simulated_value - base_value, 6)
+@dataclass(frozen=True)
+class _ScenarioPeers:
+    """Peer ranking of one indicator, shared by every simulation on it."""
+
+    peer_rows: list[dict[str, Any]]
+    rank_by_territory: dict[str, int]
+    # Ascending |value| of all peers, searched with np.searchsorted.
+    sorted_abs_values: np.ndarray
 
-    target_indicator_code = str(target_row["indicator_code"])
-    peer_candidates = [
-        row
-        for row in rows
-        if row.get("value") is not None and str(row["indicator_code"]) == target_indicator_code
-    ]
-    if not peer_candidates:
-        raise HTTPException(status_code=404, detail="No peers found for selected indicator")
 
+def _build_scenario_peers(rows: list[dict[str, Any]], indicator_code: str) -> _ScenarioPeers | None:
     peers_by_territory: dict[str, dict[str, Any]] = {}
-    for row in peer_candidates:
+    for row in rows:
+        if row.get("value") is None or str(row["indicator_code"]) != indicator_code:
+            continue
         territory_key = str(row["territory_id"])
         current = peers_by_territory.get(territory_key)
         if current is None or abs(float(row["value"])) > abs(float(current["value"])):
             peers_by_territory[territory_key] = row
+    if not peers_by_territory:
+        return None
 
     peer_rows = list(peers_by_territory.values())
     peer_rows.sort(key=lambda item: (abs(float(item["value"])), str(item["territory_name"])), reverse=True)
+    return _ScenarioPeers(
+        peer_rows=peer_rows,
+        rank_by_territory={str(row["territory_id"]): index + 1 for index, row in enumerate(peer_rows)},
+        sorted_abs_values=np.sort(np.abs(np.array([float(row["value"]) for row in peer_rows]))),
+    )
 
-    base_rank = next(
-        (index + 1 for index, row in enumerate(peer_rows) if str(row["territory_id"]) == payload.territory_id),
-        None,
+
+def _simulated_ranks(
+    peers: _ScenarioPeers,
+    *,
+    base_rank: int,
+    base_abs: float,
+    simulated_values: np.ndarray,
+) -> np.ndarray:
+    """Rank of the territory after replacing its value, for many simulated values at once.
+
+    Equivalent to re-sorting the peers by |value| (stable) with the simulated value in
+    place: a larger |value| goes ahead of every peer with |value| >= it, a smaller one
+    goes behind every other peer with |value| > it, and an equal one keeps its rank.
+    """
+    sorted_abs = peers.sorted_abs_values
+    total = sorted_abs.size
+    simulated_abs = np.abs(simulated_values)
+    ahead_when_larger = total - np.searchsorted(sorted_abs, simulated_abs, side="left")
+    # The territory itself (|value| == base_abs > simulated) is counted as strictly larger.
+    ahead_when_smaller = total - np.searchsorted(sorted_abs, simulated_abs, side="right") - 1
+    ahead = np.where(
+        simulated_abs > base_abs,
+        ahead_when_larger,
+        np.where(simulated_abs < base_abs, ahead_when_smaller, base_rank - 1),
     )
+    return ahead + 1
+
+
+def _scenario_target_row(
+    rows: list[dict[str, Any]],
+    territory_id: str,
+    indicator_code: str | None,
+) -> dict[str, Any]:
+    territory_rows = [
+        row
+        for row in rows
+        if str(row["territory_id"]) == territory_id and row.get("value") is not None
+    ]
+    if not territory_rows:
+        raise HTTPException(status_code=404, detail="No indicators found for selected territory")
+    if not indicator_code:
+        return territory_rows[0]
+    for row in territory_rows:
+        if str(row["indicator_code"]) == indicator_code:
+            return row
+    raise HTTPException(status_code=404, detail="Indicator not found for selected territory")
+
+
+def _simulate_scenarios(
+    rows: list[dict[str, Any]],
+    *,
+    territory_id: str,
+    indicator_code: str | None,
+    adjustment_percents: list[float],
+    period: str | None,
+    peers_cache: dict[str, _ScenarioPeers | None],
+) -> list[ScenarioSimulateResponse]:
+    """Simulate several adjustments of one territory/indicator against a shared ranking."""
+    target_row = _scenario_target_row(rows, territory_id, indicator_code)
+    target_indicator_code = str(target_row["indicator_code"])
+    if target_indicator_code not in peers_cache:
+        peers_cache[target_indicator_code] = _build_scenario_peers(rows, target_indicator_code)
+    peers = peers_cache[target_indicator_code]
+    if peers is None:
+        raise HTTPException(status_code=404, detail="No peers found for selected indicator")
+
+    base_rank = peers.rank_by_territory.get(territory_id)
     if base_rank is None:
         raise HTTPException(status_code=404, detail="Selected territory missing from peer ranking")
 
-    simulated_rows: list[tuple[str, float]] = []
-    for row in peer_rows:
-        territory_key = str(row["territory_id"])
-        if territory_key == payload.territory_id:
-            simulated_rows.append((territory_key, simulated_value))
+    base_value = float(target_row["value"])
+    base_abs = abs(float(peers.peer_rows[base_rank - 1]["value"]))
+    simulated_values = [
+        round(base_value * (1 + (adjustment_percent / 100.0)), 6)
+        for adjustment_percent in adjustment_percents
+    ]
+    simulated_ranks = _simulated_ranks(
+        peers,
+        base_rank=base_rank,
+        base_abs=base_abs,
+        simulated_values=np.array(simulated_values, dtype=np.float64),
+    )
+
+    peer_count = len(peers.peer_rows)
+    base_score = _score_from_rank(base_rank, peer_count)
+    status_before = _score_to_status(base_score)
+    metadata = _qg_metadata(
+        max((row.get("updated_at") for row in peers.peer_rows), default=target_row.get("updated_at")),
+        notes="scenario_simulation_v1_rule_based",
+        unit=target_row.get("unit"),
+    )
+    unit = target_row.get("unit")
+    fmt_base = _format_highlight_value(base_value, unit)
+
+    responses: list[ScenarioSimulateResponse] = []
+    for adjustment_percent, simulated_value, simulated_rank in zip(
+        adjustment_percents, simulated_values, simulated_ranks.tolist()
+    ):
+        delta_value = round(simulated_value - base_value, 6)
+        simulated_score = _score_from_rank(simulated_rank, peer_count)
+        status_after = _score_to_status(simulated_score)
+
+        rank_delta = base_rank - simulated_rank
+        if status_before != status_after:
+            impact = _status_impact(status_before, status_after)
+        elif rank_delta > 0:
+            impact = "improved"
+        elif rank_delta < 0:
+            impact = "worsened"
         else:
-            simulated_rows.append((territory_key, float(row["value"])))
+            impact = "unchanged"
+
+        fmt_sim = _format_highlight_value(simulated_value, unit)
+        fmt_delta = _format_highlight_value(delta_value, unit)
+        impact_label = _IMPACT_LABELS.get(impact, impact)
 
-    simulated_rows.sort(key=lambda item: abs(item[1]), reverse=True)
-    simulated_rank = next(
-        (index + 1 for index, (territory_key, _value) in enumerate(simulated_rows) if territory_key == payload.territory_id),
-        base_rank,
+        explanation = [
+            f"Ajuste aplicado: {adjustment_percent:.2f}% no indicador {str(target_row['indicator_name'])}.",
+            f"Valor base {fmt_base} para valor simulado {fmt_sim} (delta {fmt_delta}).",
+            f"Posicao no ranking do indicador: {base_rank} -> {simulated_rank} entre {peer_count} territorios.",
+            f"Score de ranking estimado: {base_score:.2f} -> {simulated_score:.2f}, impacto {impact_label}.",
+        ]
+
+        responses.append(
+            ScenarioSimulateResponse(
+                territory_id=str(target_row["territory_id"]),
+                territory_name=str(target_row["territory_name"]),
+                territory_level=to_external_level(str(target_row["territory_level"])),
+                period=period,
+                domain=str(target_row["domain"]),
+                indicator_code=str(target_row["indicator_code"]),
+                indicator_name=str(target_row["indicator_name"]),
+                base_value=base_value,
+                simulated_value=simulated_value,
+                delta_value=delta_value,
+                adjustment_percent=adjustment_percent,
+                base_score=base_score,
+                simulated_score=simulated_score,
+                peer_count=peer_count,
+                base_rank=base_rank,
+                simulated_rank=simulated_rank,
+                rank_delta=rank_delta,
+                status_before=status_before,
+                status_after=status_after,
+                impact=impact,
+                metadata=metadata,
+                explanation=explanation,
+            )
+        )
+    return responses
+
+
+@router.post("/scenarios/simulate", response_model=ScenarioSimulateResponse)
+def simulate_scenario(
+    payload: ScenarioSimulateRequest,
+    db: Session = Depends(get_db),  # noqa: B008
+) -> ScenarioSimulateResponse:
+    level_en = normalize_level(payload.level) or "municipality"
+    rows = _fetch_priority_rows(
+        db=db,
+        period=payload.period,
+        level=level_en,
+        domain=payload.domain,
+        limit=_SCENARIO_PEER_LIMIT,
     )
+    return _simulate_scenarios(
+        rows,
+        territory_id=payload.territory_id,
+        indicator_code=payload.indicator_code,
+        adjustment_percents=[payload.adjustment_percent],
+        period=payload.period,
+        peers_cache={},
+    )[0]
 
-    peer_count = len(peer_rows)
-    base_score = _score_from_rank(base_rank, peer_count)
-    simulated_score = _score_from_rank(simulated_rank, peer_count)
 
-    status_before = _score_to_status(base_score)
-    status_after = _score_to_status(simulated_score)
-
-    rank_delta = base_rank - simulated_rank
-    if status_before != status_after:
-        impact = _status_impact(status_before, status_after)
-    elif rank_delta > 0:
-        impact = "improved"
-    elif rank_delta < 0:
-        impact = "worsened"
-    else:
-        impact = "unchanged"
+def _expand_adjustment_range(adjustment_range: ScenarioAdjustmentRange) -> list[float]:
+    if adjustment_range.stop < adjustment_range.start:
+        raise HTTPException(status_code=422, detail="adjustment_range.stop must be >= start")
+    steps = int((adjustment_range.stop - adjustment_range.start) / adjustment_range.step + 1e-9)
+    if steps + 1 > _SCENARIO_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=422, detail="adjustment_range expands to too many scenarios")
+    return [round(adjustment_range.start + index * adjustment_range.step, 6) for index in range(steps + 1)]
 
-    _IMPACT_LABELS = {
-        "improved": "melhora",
-        "worsened": "piora",
-        "unchanged": "inalterado",
-    }
 
-    unit = target_row.get("unit")
-    fmt_base = _format_highlight_value(base_value, unit)
-    fmt_sim = _format_highlight_value(simulated_value, unit)
-    fmt_delta = _format_highlight_value(delta_value, unit)
-    impact_label = _IMPACT_LABELS.get(impact, impact)
-
-    explanation = [
-        f"Ajuste aplicado: {payload.adjustment_percent:.2f}% no indicador {str(target_row['indicator_name'])}.",
-        f"Valor base {fmt_base} para valor simulado {fmt_sim} (delta {fmt_delta}).",
-        f"Posicao no ranking do indicador: {base_rank} -> {simulated_rank} entre {peer_count} territorios.",
-        f"Score de ranking estimado: {base_score:.2f} -> {simulated_score:.2f}, impacto {impact_label}.",
+@router.post("/scenarios/simulate/batch", response_model=ScenarioSimulateBatchResponse)
+def simulate_scenarios_batch(
+    payload: ScenarioSimulateBatchRequest,
+    db: Session = Depends(get_db),  # noqa: B008
+) -> ScenarioSimulateBatchResponse:
+    """Simulate many (territory, indicator, adjustment) tuples from one priority-row load."""
+    requests: list[tuple[str, str | None, float]] = [
+        (item.territory_id, item.indicator_code, item.adjustment_percent) for item in payload.items
     ]
+    if payload.adjustment_range is not None:
+        if not payload.territory_id:
+            raise HTTPException(status_code=422, detail="adjustment_range requires territory_id")
+        requests.extend(
+            (payload.territory_id, payload.indicator_code, adjustment_percent)
+            for adjustment_percent in _expand_adjustment_range(payload.adjustment_range)
+        )
+    if not requests:
+        raise HTTPException(status_code=422, detail="Provide items or adjustment_range")
+    if len(requests) > _SCENARIO_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=422, detail="Too many scenarios in one batch")
 
-    return ScenarioSimulateResponse(
-        territory_id=str(target_row["territory_id"]),
-        territory_name=str(target_row["territory_name"]),
-        territory_level=to_external_level(str(target_row["territory_level"])),
+    level_en = normalize_level(payload.level) or "municipality"
+    rows = _fetch_priority_rows(
+        db=db,
         period=payload.period,
-        domain=str(target_row["domain"]),
-        indicator_code=str(target_row["indicator_code"]),
-        indicator_name=str(target_row["indicator_name"]),
-        base_value=base_value,
-        simulated_value=simulated_value,
-        delta_value=delta_value,
-        adjustment_percent=payload.adjustment_percent,
-        base_score=base_score,
-        simulated_score=simulated_score,
-        peer_count=peer_count,
-        base_rank=base_rank,
-        simulated_rank=simulated_rank,
-        rank_delta=rank_delta,
-        status_before=status_before,
-        status_after=status_after,
-        impact=impact,
-        metadata=_qg_metadata(
-            max((row.get("updated_at") for row in peer_rows), default=target_row.get("updated_at")),
-            notes="scenario_simulation_v1_rule_based",
-            unit=target_row.get("unit"),
-        ),
-        explanation=explanation,
+        level=level_en,
+        domain=payload.domain,
+        limit=_SCENARIO_PEER_LIMIT,
+    )
+
+    # Group by (territory, indicator) so each group is re-ranked in one vectorized pass.
+    groups: dict[tuple[str, str | None], list[int]] = {}
+    for position, (territory_id, indicator_code, _adjustment) in enumerate(requests):
+        groups.setdefault((territory_id, indicator_code), []).append(position)
+
+    peers_cache: dict[str, _ScenarioPeers | None] = {}
+    results: list[ScenarioSimulateResponse | None] = [None] * len(requests)
+    errors: list[ScenarioSimulateBatchError] = []
+    for (territory_id, indicator_code), positions in groups.items():
+        try:
+            responses = _simulate_scenarios(
+                rows,
+                territory_id=territory_id,
+                indicator_code=indicator_code,
+                adjustment_percents=[requests[position][2] for position in positions],
+                period=payload.period,
+                peers_cache=peers_cache,
+            )
+        except HTTPException as exc:
+            errors.extend(
+                ScenarioSimulateBatchError(
+                    territory_id=territory_id,
+                    indicator_code=indicator_code,
+                    adjustment_percent=requests[position][2],
+                    detail=str(exc.detail),
+                )
+                for position in positions
+            )
+            continue
+        for position, response in zip(positions, responses):
+            results[position] = response
+
+    return ScenarioSimulateBatchResponse(
+        period=payload.period,
+        level=to_external_level(level_en),
+        domain=payload.domain,
+        items=[item for item in results if item is not None],
+        errors=errors,
     )
 
 
@@ -2195,85 +2355,104 @@ def get_territory_peers(
         raise HTTPException(status_code=404, detail="Territory not found")
 
     territory_level = str(territory["territory_level"])
-    target_rows = _fetch_territory_indicator_scores(
-        db=db,
-        territory_id=territory_id,
-        period=period,
-        level=territory_level,
-    )
-    if not target_rows:
+    matrix = _get_peer_matrix(db, level=territory_level, period=period)
+    if territory_id not in matrix:
         raise HTTPException(status_code=404, detail="No indicators found for selected territory")
 
-    all_rows = _fetch_territory_indicator_scores(
-        db=db,
-        territory_id=None,
-        period=period,
-        level=territory_level,
-    )
+    return _peers_response(territory, matrix.top_peers(territory_id, limit=limit), period=period)
 
-    target_scores = {str(row["indicator_code"]): float(row["score"]) for row in target_rows}
-    rows_by_territory: dict[str, dict[str, Any]] = {}
-    for row in all_rows:
-        candidate_territory_id = str(row["territory_id"])
-        if candidate_territory_id == territory_id:
-            continue
-        bucket = rows_by_territory.setdefault(
-            candidate_territory_id,
-            {
-                "territory_id": candidate_territory_id,
-                "territory_name": str(row["territory_name"]),
-                "territory_level": str(row["territory_level"]),
-                "scores": {},
-                "updated_at_rows": [],
-            },
-        )
-        bucket["scores"][str(row["indicator_code"])] = float(row["score"])
-        if row.get("updated_at") is not None:
-            bucket["updated_at_rows"].append(row["updated_at"])
-
-    peer_items: list[TerritoryPeerItem] = []
-    updated_at_values: list[datetime] = []
-    for candidate in rows_by_territory.values():
-        candidate_scores = candidate["scores"]
-        shared_codes = sorted(set(target_scores.keys()) & set(candidate_scores.keys()))
-        if not shared_codes:
-            continue
-
-        mean_abs_error = sum(abs(target_scores[code] - candidate_scores[code]) for code in shared_codes) / len(shared_codes)
-        similarity_score = round(max(0.0, 100.0 - mean_abs_error), 2)
-        avg_score = round(sum(candidate_scores[code] for code in shared_codes) / len(shared_codes), 2)
 
-        peer_items.append(
-            TerritoryPeerItem(
-                territory_id=candidate["territory_id"],
-                territory_name=candidate["territory_name"],
-                territory_level=to_external_level(candidate["territory_level"]),
-                similarity_score=similarity_score,
-                shared_indicators=len(shared_codes),
-                avg_score=avg_score,
-                status=_score_to_status(avg_score),
+@router.post("/territory/peers/batch", response_model=TerritoryPeersBatchResponse)
+def get_territory_peers_batch(
+    payload: TerritoryPeersBatchRequest,
+    db: Session = Depends(get_db),  # noqa: B008
+) -> TerritoryPeersBatchResponse:
+    requested_ids = list(dict.fromkeys(payload.territory_ids))
+    contexts = _get_territory_contexts(db, requested_ids)
+
+    ids_by_level: dict[str, list[str]] = {}
+    for territory_id in requested_ids:
+        context = contexts.get(territory_id)
+        if context is not None:
+            ids_by_level.setdefault(str(context["territory_level"]), []).append(territory_id)
+
+    results_by_id: dict[str, TerritoryPeersResponse] = {}
+    for territory_level, level_ids in ids_by_level.items():
+        matrix = _get_peer_matrix(db, level=territory_level, period=payload.period)
+        for result in matrix.top_peers_many(level_ids, limit=payload.limit):
+            results_by_id[result.territory_id] = _peers_response(
+                contexts[result.territory_id],
+                result,
+                period=payload.period,
             )
-        )
-        updated_at_values.extend(candidate["updated_at_rows"])
 
-    peer_items.sort(
-        key=lambda item: (
-            item.shared_indicators,
-            item.similarity_score,
-            item.territory_name,
+    results = [results_by_id[tid] for tid in requested_ids if tid in results_by_id]
+    updated_at = max(
+        (item.metadata.updated_at for item in results if item.metadata.updated_at is not None),
+        default=None,
+    )
+    return TerritoryPeersBatchResponse(
+        period=payload.period,
+        metadata=_qg_metadata(updated_at, notes="territory_peers_v1_similarity_rule_based"),
+        results=results,
+        missing_territory_ids=[tid for tid in requested_ids if tid not in results_by_id],
+    )
+
+
+def _get_peer_matrix(db: Session, *, level: str, period: str | None) -> PeerMatrix:
+    return get_peer_matrix(
+        level=level,
+        period=period,
+        load_rows=lambda: _fetch_territory_indicator_scores(
+            db=db,
+            territory_id=None,
+            period=period,
+            level=level,
         ),
-        reverse=True,
     )
-    peer_items = peer_items[:limit]
 
-    updated_at = max(updated_at_values, default=None)
+
+def _get_territory_contexts(db: Session, territory_ids: list[str]) -> dict[str, dict[str, Any]]:
+    rows = db.execute(
+        text(
+            """
+            SELECT
+                territory_id::text AS territory_id,
+                name AS territory_name,
+                level::text AS territory_level
+            FROM silver.dim_territory
+            WHERE territory_id::text = ANY(:territory_ids)
+            """
+        ),
+        {"territory_ids": territory_ids},
+    ).mappings().all()
+    return {str(row["territory_id"]): dict(row) for row in rows}
+
+
+def _peers_response(
+    territory: dict[str, Any],
+    result: PeerResult,
+    *,
+    period: str | None,
+) -> TerritoryPeersResponse:
     return TerritoryPeersResponse(
         territory_id=territory["territory_id"],
         territory_name=territory["territory_name"],
-        territory_level=to_external_level(territory_level),
+        territory_level=to_external_level(str(territory["territory_level"])),
         period=period,
-        metadata=_qg_metadata(updated_at, notes="territory_peers_v1_similarity_rule_based"),
-        items=peer_items,
+        metadata=_qg_metadata(result.updated_at, notes="territory_peers_v1_similarity_rule_based"),
+        items=[
+            TerritoryPeerItem(
+                territory_id=match.territory_id,
+                territory_name=match.territory_name,
+                territory_level=to_external_level(match.territory_level),
+                similarity_score=match.similarity_score,
+                shared_indicators=match.shared_indicators,
+                avg_score=match.avg_score,
+                status=_score_to_status(match.avg_score),
+            )
+            for match in result.items
+        ],
     )
 
 
@@ -3235,10 +3414,62 @@ def get_electorate_map(
     year: int | None = Query(default=None, ge=1900, le=2100),
     include_geometry: bool = Query(default=True),
     limit: int = Query(default=1000, ge=1, le=5000),
+    format: str = Query(default="geojson", pattern=GEOMETRY_FORMAT_PATTERN),
+    precision: int = Query(default=DEFAULT_GEOMETRY_PRECISION, ge=0, le=MAX_GEOMETRY_PRECISION),
+    zoom: int | None = Query(default=None, ge=0, le=22),
+    quantization: int = Query(default=DEFAULT_TOPOLOGY_QUANTIZATION, ge=1_000, le=10_000_000),
     db: Session = Depends(get_db),  # noqa: B008
-) -> ElectorateMapResponse:
+) -> ElectorateMapResponse | Response:
     level_en = normalize_level(level) or "municipality"
-    geometry_select = "ST_AsGeoJSON(dt.geometry)::jsonb AS geometry" if include_geometry else "NULL::jsonb AS geometry"
+    geometry_select = (
+        geometry_json_sql(level=level_en, zoom=zoom)
+        if include_geometry
+        else "NULL::json AS geometry"
+    )
+    geometry_params = {"geometry_precision": precision, "zoom": zoom}
+
+    def _map_response(**kwargs: Any) -> ElectorateMapResponse:
+        response = ElectorateMapResponse(**kwargs)
+        if format == "topojson" and include_geometry and response.items:
+            response.topology = build_topology(
+                ((item.territory_id, item.geometry) for item in response.items),
+                quantization=quantization,
+            )
+            for item in response.items:
+                item.geometry = None
+        return response
+
+    def _render_map(
+        select_sql: str,
+        params: dict[str, Any],
+        *,
+        order_by: str,
+        item_year: int,
+        metadata: QgMetadata,
+    ) -> ElectorateMapResponse | Response:
+        # ``select_sql`` emits ElectorateMapItem fields as-is; GeoJSON output is then
+        # assembled by Postgres and passed through, TopoJSON needs the rows here.
+        params = {**params, **geometry_params, "metric": metric, "item_year": item_year}
+        if format == "geojson":
+            _count, items_json = fetch_json_items(db, select_sql, params, order_by=order_by)
+            return json_passthrough_response(
+                {
+                    "level": to_external_level(level_en),
+                    "metric": metric,
+                    "year": item_year,
+                    "metadata": metadata,
+                    "topology": None,
+                },
+                items_json,
+            )
+        rows = db.execute(text(select_sql), params).mappings().all()
+        return _map_response(
+            level=to_external_level(level_en),
+            metric=metric,
+            year=item_year,
+            metadata=metadata,
+            items=[ElectorateMapItem(**row) for row in rows],
+        )
 
     if metric == "voters":
         effective_year, electorate_storage_year, electorate_year_note = _resolve_electorate_year_binding(
@@ -3247,7 +3478,7 @@ def get_electorate_map(
             requested_year=year,
         )
         if effective_year is None or electorate_storage_year is None:
-            return ElectorateMapResponse(
+            return _map_response(
                 level=to_external_level(level_en),
                 metric=metric,
                 year=None,
@@ -3282,7 +3513,7 @@ def get_electorate_map(
                 geometry_final = """
                     CASE
                         WHEN g.real_geom IS NOT NULL THEN
-                            ST_AsGeoJSON(g.real_geom)::jsonb
+                            ST_AsGeoJSON(g.real_geom, :geometry_precision)::json
                         WHEN sede.geometry IS NOT NULL THEN
                             ST_AsGeoJSON(
                                 ST_ClosestPoint(
@@ -3294,17 +3525,17 @@ def get_electorate_map(
                                         (('x' || substring(md5(COALESCE(NULLIF(g.polling_place_code,''), g.polling_place_name)), 9, 8))::bit(32)::int::double precision / 2147483647.0)
                                             * (ST_YMax(ST_Envelope(sede.geometry)) - ST_YMin(ST_Envelope(sede.geometry))) * 0.35
                                     )
-                                )
-                            )::jsonb
-                        ELSE NULL::jsonb
+                                ),
+                                :geometry_precision
+                            )::json
+                        ELSE NULL::json
                     END AS geometry
                 """
             else:
-                geometry_final = "NULL::jsonb AS geometry"
+                geometry_final = "NULL::json AS geometry"
 
-            rows = db.execute(
-                text(
-                    f"""
+            return _render_map(
+                f"""
                     WITH sede AS (
                         SELECT geometry
                         FROM silver.dim_territory
@@ -3340,41 +3571,21 @@ def get_electorate_map(
                         md5(COALESCE(NULLIF(g.polling_place_code, ''), g.polling_place_name))::text AS territory_id,
                         g.polling_place_name AS territory_name,
                         'polling_place'::text AS territory_level,
+                        CAST(:metric AS TEXT) AS metric,
+                        g.value,
+                        CAST(:item_year AS INT) AS year,
+                        {geometry_final},
                         g.polling_place_name,
                         g.polling_place_code,
                         g.section_count,
-                        g.sections,
-                        g.value,
-                        {geometry_final}
+                        COALESCE(g.sections, ARRAY[]::text[]) AS sections
                     FROM grouped g
                     CROSS JOIN sede
                     ORDER BY g.polling_place_name ASC
-                    """
-                ),
+                """,
                 {"level": level_en, "year": electorate_storage_year, "limit": limit},
-            ).mappings().all()
-
-            items = [
-                ElectorateMapItem(
-                    territory_id=row["territory_id"],
-                    territory_name=row["territory_name"],
-                    territory_level=row["territory_level"],
-                    metric=metric,
-                    value=float(row["value"]) if row["value"] is not None else None,
-                    year=effective_year,
-                    geometry=row["geometry"],
-                    polling_place_name=row["polling_place_name"],
-                    polling_place_code=row["polling_place_code"],
-                    section_count=row["section_count"],
-                    sections=[str(section) for section in (row["sections"] or [])],
-                )
-                for row in rows
-            ]
-
-            return ElectorateMapResponse(
-                level=to_external_level(level_en),
-                metric=metric,
-                year=effective_year,
+                order_by="features.polling_place_name ASC",
+                item_year=effective_year,
                 metadata=QgMetadata(
                     source_name="silver.fact_electorate + silver.dim_territory(metadata.polling_place_*)",
                     updated_at=None,
@@ -3384,18 +3595,22 @@ def get_electorate_map(
                     source_classification="oficial",
                     config_version=load_strategic_engine_config().version,
                 ),
-                items=items,
             )
 
-        rows = db.execute(
-            text(
-                f"""
+        return _render_map(
+            f"""
                 SELECT
                     dt.territory_id::text AS territory_id,
                     dt.name AS territory_name,
-                    dt.level::text AS territory_level,
+                    {external_level_sql("dt.level::text")} AS territory_level,
+                    CAST(:metric AS TEXT) AS metric,
                     SUM(fe.voters)::double precision AS value,
-                    {geometry_select}
+                    CAST(:item_year AS INT) AS year,
+                    {geometry_select},
+                    NULL::text AS polling_place_name,
+                    NULL::text AS polling_place_code,
+                    NULL::int AS section_count,
+                    NULL::text[] AS sections
                 FROM silver.fact_electorate fe
                 JOIN silver.dim_territory dt ON dt.territory_id = fe.territory_id
                 WHERE dt.level::text = :level
@@ -3403,27 +3618,10 @@ def get_electorate_map(
                 GROUP BY dt.territory_id, dt.name, dt.level, dt.geometry
                 ORDER BY dt.name ASC
                 LIMIT :limit
-                """
-            ),
+            """,
             {"level": level_en, "year": electorate_storage_year, "limit": limit},
-        ).mappings().all()
-
-        items = [
-            ElectorateMapItem(
-                territory_id=row["territory_id"],
-                territory_name=row["territory_name"],
-                territory_level=to_external_level(row["territory_level"]),
-                metric=metric,
-                value=float(row["value"]) if row["value"] is not None else None,
-                year=effective_year,
-                geometry=row["geometry"],
-            )
-            for row in rows
-        ]
-        return ElectorateMapResponse(
-            level=to_external_level(level_en),
-            metric=metric,
-            year=effective_year,
+            order_by="features.territory_name ASC",
+            item_year=effective_year,
             metadata=QgMetadata(
                 source_name="silver.fact_electorate",
                 updated_at=None,
@@ -3433,7 +3631,6 @@ def get_electorate_map(
                 source_classification="oficial",
                 config_version=load_strategic_engine_config().version,
             ),
-            items=items,
         )
 
     effective_year = _resolve_available_year(
@@ -3443,7 +3640,7 @@ def get_electorate_map(
         table_kind="election",
     )
     if effective_year is None:
-        return ElectorateMapResponse(
+        return _map_response(
             level=to_external_level(level_en),
             metric=metric,
             year=None,
@@ -3460,9 +3657,8 @@ def get_electorate_map(
         )
 
     office, election_round = _resolve_election_scope(db, level=level_en, year=effective_year)
-    rows = db.execute(
-        text(
-            f"""
+    return _render_map(
+        f"""
             WITH grouped AS (
                 SELECT
                     dt.territory_id::text AS territory_id,
@@ -3485,7 +3681,8 @@ def get_electorate_map(
             SELECT
                 territory_id,
                 territory_name,
-                territory_level,
+                {external_level_sql("territory_level")} AS territory_level,
+                CAST(:metric AS TEXT) AS metric,
                 CASE
                     WHEN :metric = 'turnout' THEN turnout
                     WHEN :metric = 'abstention_rate' THEN (abstention / NULLIF(turnout + abstention, 0)) * 100
@@ -3493,38 +3690,25 @@ def get_electorate_map(
                     WHEN :metric = 'null_rate' THEN (votes_null / NULLIF(votes_total, 0)) * 100
                     ELSE NULL
                 END::double precision AS value,
-                geometry
+                CAST(:item_year AS INT) AS year,
+                geometry,
+                NULL::text AS polling_place_name,
+                NULL::text AS polling_place_code,
+                NULL::int AS section_count,
+                NULL::text[] AS sections
             FROM grouped
             ORDER BY territory_name ASC
             LIMIT :limit
-            """
-        ),
+        """,
         {
             "level": level_en,
             "year": effective_year,
-            "metric": metric,
             "limit": limit,
             "office": office,
             "election_round": election_round,
         },
-    ).mappings().all()
-
-    items = [
-        ElectorateMapItem(
-            territory_id=row["territory_id"],
-            territory_name=row["territory_name"],
-            territory_level=to_external_level(row["territory_level"]),
-            metric=metric,
-            value=float(row["value"]) if row["value"] is not None else None,
-            year=effective_year,
-            geometry=row["geometry"],
-        )
-        for row in rows
-    ]
-    return ElectorateMapResponse(
-        level=to_external_level(level_en),
-        metric=metric,
-        year=effective_year,
+        order_by="features.territory_name ASC",
+        item_year=effective_year,
         metadata=QgMetadata(
             source_name="silver.fact_election_result",
             updated_at=None,
@@ -3534,5 +3718,4 @@ def get_electorate_map(
             source_classification="oficial",
             config_version=load_strategic_engine_config().version,
         ),
-        items=items,
     )
@@ -30,3 +30,9 @@ def normalize_level(level: str | None) -> str | None:
 
 def to_external_level(level_en: str) -> str:
     return EN_TO_PT.get(level_en, level_en)
+
+
+def external_level_sql(expression: str) -> str:
+    """SQL counterpart of ``to_external_level`` for rows rendered directly by Postgres."""
+    branches = " ".join(f"WHEN '{en}' THEN '{pt}'" for en, pt in EN_TO_PT.items())
+    return f"CASE ({expression}) {branches} ELSE ({expression}) END"
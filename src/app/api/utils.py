@@ -1,8 +1,100 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+TOTAL_MODES = ("exact", "estimated")
+TOTAL_MODE_PATTERN = "^(exact|estimated)$"
+
 
 def normalize_pagination(page: int, page_size: int, max_page_size: int = 1000) -> tuple[int, int, int]:
     clean_page = max(1, page)
     clean_page_size = max(1, min(page_size, max_page_size))
     offset = (clean_page - 1) * clean_page_size
     return clean_page, clean_page_size, offset
+
+
+def resolve_total_mode(total_mode: str | None, cursor: str | None) -> str:
+    """Default to an exact COUNT(*) for page requests and a planner estimate for cursor requests."""
+    if total_mode is not None:
+        return total_mode
+    return "estimated" if cursor else "exact"
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """Opaque keyset continuation token for the sort key ``values`` of the last row served."""
+    payload = [kind]
+    payload.extend(value.isoformat() if isinstance(value, datetime) else value for value in values)
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _coerce_cursor_value(value: Any, field_type: type) -> Any:
+    if field_type is datetime:
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        raise ValueError("expected ISO timestamp")
+    if field_type is UUID:
+        return str(UUID(str(value)))
+    if field_type is int:
+        if isinstance(value, bool) or not isinstance(value, int | str):
+            raise ValueError("expected integer")
+        return int(value)
+    if not isinstance(value, str):
+        raise ValueError("expected string")
+    return value
+
+
+def decode_cursor(cursor: str, *, kind: str, fields: Sequence[type]) -> list[Any]:
+    """Decode a token from ``encode_cursor``; malformed or foreign tokens raise 422."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(fields) + 1 or payload[0] != kind:
+            raise ValueError("cursor does not belong to this endpoint")
+        return [
+            _coerce_cursor_value(value, field)
+            for value, field in zip(payload[1:], fields, strict=True)
+        ]
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise HTTPException(status_code=422, detail="Invalid pagination cursor.") from exc
+
+
+def next_page_cursor(
+    kind: str,
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    page_size: int,
+    keys: Sequence[str],
+) -> str | None:
+    """Cursor after the last row of a full page; ``None`` once the listing is exhausted."""
+    if len(rows) < page_size or not rows:
+        return None
+    last = rows[-1]
+    return encode_cursor(kind, [last[key] for key in keys])
+
+
+def count_rows(
+    db: Session,
+    from_where_sql: str,
+    params: Mapping[str, Any],
+    *,
+    mode: str,
+) -> int:
+    """Exact ``COUNT(*)`` or the planner row estimate (``EXPLAIN``) for ``FROM ... WHERE ...``."""
+    if mode == "estimated":
+        statement = text(f"EXPLAIN (FORMAT JSON) SELECT 1 {from_where_sql}")
+        plan = db.execute(statement, params).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return max(0, int(plan[0]["Plan"]["Plan Rows"]))
+    return int(db.execute(text(f"SELECT COUNT(*) {from_where_sql}"), params).scalar_one())
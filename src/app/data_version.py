@@ -0,0 +1,127 @@
+"""Per-domain data versions used to validate cached API responses.
+
+``ops.data_versions`` keeps a counter per data domain that
+``upsert_pipeline_run`` bumps whenever a job of that domain finishes a
+successful load. The API combines the versions a route depends on with the
+route and its query parameters into an ETag, so conditional requests can be
+answered without running the endpoint.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db import session_scope
+from app.logging import get_logger
+from app.settings import Settings, get_settings
+
+DATA_DOMAINS: tuple[str, ...] = ("territory", "electorate", "indicators", "urban", "marts")
+
+_JOB_DOMAIN_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("ibge_admin_", "territory"),
+    ("ibge_geometries_", "territory"),
+    ("tse_", "electorate"),
+    ("urban_", "urban"),
+    ("dbt_build", "marts"),
+)
+# Jobs that only inspect or catalog data and never change what the API serves.
+_JOBS_WITHOUT_DATA = frozenset({"quality_suite", "tse_catalog_discovery"})
+
+
+def data_domain_for_job(job_name: str) -> str | None:
+    if job_name in _JOBS_WITHOUT_DATA:
+        return None
+    for prefix, domain in _JOB_DOMAIN_PREFIXES:
+        if job_name.startswith(prefix):
+            return domain
+    return "indicators"
+
+
+def bump_data_version(session: Session, *, domain: str, job_name: str, run_id: str) -> None:
+    session.execute(
+        text(
+            """
+            INSERT INTO ops.data_versions (domain, version, last_job_name, last_run_id)
+            VALUES (:domain, 2, :job_name, CAST(:run_id AS uuid))
+            ON CONFLICT (domain) DO UPDATE SET
+                version = ops.data_versions.version + 1,
+                last_job_name = EXCLUDED.last_job_name,
+                last_run_id = EXCLUDED.last_run_id,
+                updated_at_utc = NOW()
+            """
+        ),
+        {"domain": domain, "job_name": job_name, "run_id": run_id},
+    )
+
+
+def read_data_versions(settings: Settings) -> dict[str, int]:
+    with session_scope(settings) as session:
+        rows = session.execute(text("SELECT domain, version FROM ops.data_versions")).all()
+    return {str(row[0]): int(row[1]) for row in rows}
+
+
+def data_version_token(versions: dict[str, int], domains: Iterable[str]) -> str:
+    payload = ",".join(f"{domain}:{versions.get(domain, 0)}" for domain in sorted(set(domains)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def data_version_etag(route: str, params: Iterable[tuple[str, str]], token: str) -> str:
+    normalized = sorted((key, value.strip()) for key, value in params if value.strip())
+    payload = json.dumps([route, normalized, token], ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    return f'W/"dv-{digest}"'
+
+
+class DataVersionTracker:
+    """Caches the ``ops.data_versions`` snapshot, re-reading it every ``poll_seconds``."""
+
+    def __init__(
+        self,
+        *,
+        loader: Callable[[], dict[str, int]],
+        poll_seconds: float = 5.0,
+    ) -> None:
+        self._loader = loader
+        self._poll_seconds = max(0.0, float(poll_seconds))
+        self._lock = threading.Lock()
+        self._versions: dict[str, int] | None = None
+        self._checked_at = float("-inf")
+
+    def snapshot(self) -> dict[str, int] | None:
+        """Return the current versions, or ``None`` when they cannot be read."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self._poll_seconds:
+                return self._versions
+        try:
+            versions: dict[str, int] | None = dict(self._loader())
+        except Exception:
+            get_logger("data_version").warning("Could not read data versions.")
+            versions = None
+        with self._lock:
+            self._versions = versions
+            self._checked_at = now
+        return versions
+
+    def global_token(self) -> str:
+        versions = self.snapshot()
+        if versions is None:
+            raise RuntimeError("Data versions are unavailable.")
+        return data_version_token(versions, DATA_DOMAINS)
+
+
+@lru_cache(maxsize=1)
+def get_data_version_tracker() -> DataVersionTracker:
+    settings = get_settings()
+    return DataVersionTracker(
+        loader=lambda: read_data_versions(settings),
+        poll_seconds=settings.data_version_poll_seconds,
+    )
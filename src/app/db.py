@@ -7,6 +7,7 @@ from typing import Iterator
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.perf_metrics import InstrumentedQueuePool, instrument_engine, perf_metrics_enabled
 from app.settings import Settings, get_settings
 
 
@@ -17,7 +18,9 @@ def _resolve_database_url(settings: Settings | None = None) -> str:
 
 @lru_cache(maxsize=4)
 def _get_engine_cached(database_url: str):
-    return create_engine(
+    instrumented = perf_metrics_enabled()
+    pool_options = {"poolclass": InstrumentedQueuePool} if instrumented else {}
+    engine = create_engine(
         database_url,
         pool_pre_ping=True,
         pool_size=5,
@@ -25,7 +28,11 @@ def _get_engine_cached(database_url: str):
         pool_timeout=30,
         pool_recycle=600,
         future=True,
+        **pool_options,
     )
+    if instrumented:
+        instrument_engine(engine)
+    return engine
 
 
 def get_engine(settings: Settings | None = None):
@@ -0,0 +1,420 @@
+"""Streaming bulk export of silver facts as NDJSON, CSV or Parquet.
+
+Rows are read through a server-side cursor (``yield_per``) and encoded batch by
+batch, so memory stays bounded by ``batch_size`` whatever the table size. Every
+export is ordered by ``fact_id`` and every row carries it: an interrupted or
+chunked download (``limit``) resumes by passing the last ``fact_id`` received
+as ``after``.
+
+Used by ``GET /v1/exports/{name}`` and ``scripts/export_silver_facts.py``.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Connection, text
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+EXPORT_FORMAT_PATTERN = "^(ndjson|csv|parquet)$"
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+DEFAULT_EXPORT_BATCH_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    name: str
+    # One of "string", "int", "float", "timestamp"; drives the Parquet schema.
+    kind: str
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+    name: str
+    table: str
+    key_sql: str
+    select_sql: str
+    from_sql: str
+    columns: tuple[ExportColumn, ...]
+    # Filter name -> predicate bound to ``:<filter name>``. Values bound through
+    # ``CAST(:<name> AS INTEGER)`` are validated as integers by build_export_query.
+    filters: Mapping[str, str] = field(default_factory=dict)
+
+    @property
+    def column_names(self) -> list[str]:
+        return [column.name for column in self.columns]
+
+
+_LEVEL_FILTER = "dt.level::text = CAST(:level AS TEXT)"
+
+EXPORT_DATASETS: dict[str, ExportDataset] = {
+    "fact_indicator": ExportDataset(
+        name="fact_indicator",
+        table="silver.fact_indicator",
+        key_sql="fi.fact_id",
+        select_sql="""
+            fi.fact_id::text AS fact_id,
+            fi.territory_id::text AS territory_id,
+            dt.level::text AS territory_level,
+            fi.source,
+            fi.dataset,
+            fi.indicator_code,
+            fi.indicator_name,
+            fi.unit,
+            fi.category,
+            fi.value::double precision AS value,
+            fi.reference_period,
+            fi.updated_at
+        """,
+        from_sql="""
+            silver.fact_indicator fi
+            JOIN silver.dim_territory dt ON dt.territory_id = fi.territory_id
+        """,
+        columns=(
+            ExportColumn("fact_id", "string"),
+            ExportColumn("territory_id", "string"),
+            ExportColumn("territory_level", "string"),
+            ExportColumn("source", "string"),
+            ExportColumn("dataset", "string"),
+            ExportColumn("indicator_code", "string"),
+            ExportColumn("indicator_name", "string"),
+            ExportColumn("unit", "string"),
+            ExportColumn("category", "string"),
+            ExportColumn("value", "float"),
+            ExportColumn("reference_period", "string"),
+            ExportColumn("updated_at", "timestamp"),
+        ),
+        filters={
+            "territory_id": "fi.territory_id::text = CAST(:territory_id AS TEXT)",
+            "level": _LEVEL_FILTER,
+            "indicator_code": "fi.indicator_code = CAST(:indicator_code AS TEXT)",
+            "period": "fi.reference_period = CAST(:period AS TEXT)",
+            "source": "fi.source = CAST(:source AS TEXT)",
+            "dataset": "fi.dataset = CAST(:dataset AS TEXT)",
+        },
+    ),
+    "fact_electorate": ExportDataset(
+        name="fact_electorate",
+        table="silver.fact_electorate",
+        key_sql="fe.fact_id",
+        select_sql="""
+            fe.fact_id::text AS fact_id,
+            fe.territory_id::text AS territory_id,
+            dt.level::text AS territory_level,
+            fe.reference_year,
+            fe.sex,
+            fe.age_range,
+            fe.education,
+            fe.voters
+        """,
+        from_sql="""
+            silver.fact_electorate fe
+            JOIN silver.dim_territory dt ON dt.territory_id = fe.territory_id
+        """,
+        columns=(
+            ExportColumn("fact_id", "string"),
+            ExportColumn("territory_id", "string"),
+            ExportColumn("territory_level", "string"),
+            ExportColumn("reference_year", "int"),
+            ExportColumn("sex", "string"),
+            ExportColumn("age_range", "string"),
+            ExportColumn("education", "string"),
+            ExportColumn("voters", "int"),
+        ),
+        filters={
+            "territory_id": "fe.territory_id::text = CAST(:territory_id AS TEXT)",
+            "level": _LEVEL_FILTER,
+            "period": "fe.reference_year = CAST(:period AS INTEGER)",
+        },
+    ),
+    "fact_election_result": ExportDataset(
+        name="fact_election_result",
+        table="silver.fact_election_result",
+        key_sql="fr.fact_id",
+        select_sql="""
+            fr.fact_id::text AS fact_id,
+            fr.territory_id::text AS territory_id,
+            dt.level::text AS territory_level,
+            fr.election_year,
+            fr.election_round,
+            fr.office,
+            fr.metric,
+            fr.value::double precision AS value
+        """,
+        from_sql="""
+            silver.fact_election_result fr
+            JOIN silver.dim_territory dt ON dt.territory_id = fr.territory_id
+        """,
+        columns=(
+            ExportColumn("fact_id", "string"),
+            ExportColumn("territory_id", "string"),
+            ExportColumn("territory_level", "string"),
+            ExportColumn("election_year", "int"),
+            ExportColumn("election_round", "int"),
+            ExportColumn("office", "string"),
+            ExportColumn("metric", "string"),
+            ExportColumn("value", "float"),
+        ),
+        filters={
+            "territory_id": "fr.territory_id::text = CAST(:territory_id AS TEXT)",
+            "level": _LEVEL_FILTER,
+            "year": "fr.election_year = CAST(:year AS INTEGER)",
+            "office": "fr.office = CAST(:office AS TEXT)",
+            "round": "fr.election_round = CAST(:round AS INTEGER)",
+        },
+    ),
+    "fact_candidate_vote": ExportDataset(
+        name="fact_candidate_vote",
+        table="silver.fact_candidate_vote",
+        key_sql="fcv.fact_id",
+        select_sql="""
+            fcv.fact_id::text AS fact_id,
+            fcv.territory_id::text AS territory_id,
+            dt.level::text AS territory_level,
+            de.election_year,
+            de.election_round,
+            de.office,
+            dc.candidate_number,
+            dc.candidate_name,
+            dc.ballot_name,
+            dc.party_abbr,
+            fcv.votes
+        """,
+        from_sql="""
+            silver.fact_candidate_vote fcv
+            JOIN silver.dim_territory dt ON dt.territory_id = fcv.territory_id
+            JOIN silver.dim_election de ON de.election_id = fcv.election_id
+            JOIN silver.dim_candidate dc ON dc.candidate_id = fcv.candidate_id
+        """,
+        columns=(
+            ExportColumn("fact_id", "string"),
+            ExportColumn("territory_id", "string"),
+            ExportColumn("territory_level", "string"),
+            ExportColumn("election_year", "int"),
+            ExportColumn("election_round", "int"),
+            ExportColumn("office", "string"),
+            ExportColumn("candidate_number", "string"),
+            ExportColumn("candidate_name", "string"),
+            ExportColumn("ballot_name", "string"),
+            ExportColumn("party_abbr", "string"),
+            ExportColumn("votes", "int"),
+        ),
+        filters={
+            "territory_id": "fcv.territory_id::text = CAST(:territory_id AS TEXT)",
+            "level": _LEVEL_FILTER,
+            "year": "de.election_year = CAST(:year AS INTEGER)",
+            "office": "de.office = CAST(:office AS TEXT)",
+            "round": "de.election_round = CAST(:round AS INTEGER)",
+        },
+    ),
+}
+
+
+def build_export_query(
+    dataset: ExportDataset,
+    *,
+    filters: Mapping[str, Any],
+    after: str | None,
+    limit: int | None,
+) -> tuple[str, dict[str, Any]]:
+    """Return (sql, params); raises ValueError for filters the dataset does not support."""
+    unsupported = sorted(set(filters) - set(dataset.filters))
+    if unsupported:
+        raise ValueError(
+            f"Unsupported filter(s) for {dataset.name}: {', '.join(unsupported)}. "
+            f"Expected any of {sorted(dataset.filters)}."
+        )
+    predicates = [dataset.filters[name] for name in sorted(filters)]
+    params: dict[str, Any] = dict(filters)
+    for name in sorted(filters):
+        if f"CAST(:{name} AS INTEGER)" not in dataset.filters[name]:
+            continue
+        try:
+            params[name] = int(str(filters[name]).strip())
+        except ValueError:
+            raise ValueError(
+                f"Filter '{name}' for {dataset.name} must be an integer, got {filters[name]!r}."
+            ) from None
+    if after is not None:
+        predicates.append(f"{dataset.key_sql} > CAST(:after AS UUID)")
+        params["after"] = str(UUID(after))
+    sql = f"SELECT {dataset.select_sql} FROM {dataset.from_sql}"
+    if predicates:
+        sql += " WHERE " + " AND ".join(predicates)
+    sql += f" ORDER BY {dataset.key_sql}"
+    if limit is not None:
+        sql += " LIMIT :limit"
+        params["limit"] = int(limit)
+    return sql, params
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def encode_ndjson(batches: Iterable[list[dict[str, Any]]]) -> Iterator[bytes]:
+    for batch in batches:
+        yield "".join(
+            json.dumps(row, ensure_ascii=False, default=_json_default) + "\n" for row in batch
+        ).encode("utf-8")
+
+
+def encode_csv(
+    batches: Iterable[list[dict[str, Any]]],
+    columns: list[str],
+    *,
+    header: bool = True,
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore", lineterminator="\n")
+    if header:
+        writer.writeheader()
+    for batch in batches:
+        writer.writerows(
+            {
+                key: value.isoformat() if isinstance(value, datetime | date) else value
+                for key, value in row.items()
+            }
+            for row in batch
+        )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+    tail = buffer.getvalue()
+    if tail:
+        yield tail.encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to the generator."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def encode_parquet(
+    batches: Iterable[list[dict[str, Any]]],
+    columns: tuple[ExportColumn, ...],
+) -> Iterator[bytes]:
+    """One Parquet row group per batch; bytes are yielded as soon as each group is written."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    arrow_types = {
+        "string": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    schema = pa.schema([pa.field(column.name, arrow_types[column.kind]) for column in columns])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        for batch in batches:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    tail = sink.drain()
+    if tail:
+        yield tail
+
+
+class FactExportStream:
+    """Runs the export query eagerly (so errors surface before streaming) and yields bytes.
+
+    Owns ``connection`` and closes it once the stream is exhausted or closed.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        dataset: ExportDataset,
+        *,
+        export_format: str,
+        filters: Mapping[str, Any] | None = None,
+        after: str | None = None,
+        limit: int | None = None,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+        csv_header: bool = True,
+    ) -> None:
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format '{export_format}'.")
+        self.dataset = dataset
+        self.export_format = export_format
+        self.batch_size = max(1, batch_size)
+        self.csv_header = csv_header
+        self.rows_written = 0
+        self._connection = connection
+        sql, params = build_export_query(dataset, filters=filters or {}, after=after, limit=limit)
+        try:
+            self._result = (
+                connection.execution_options(yield_per=self.batch_size)
+                .execute(text(sql), params)
+                .mappings()
+            )
+        except Exception:
+            connection.close()
+            raise
+
+    @property
+    def media_type(self) -> str:
+        return EXPORT_MEDIA_TYPES[self.export_format]
+
+    def _batches(self) -> Iterator[list[dict[str, Any]]]:
+        for partition in self._result.partitions(self.batch_size):
+            batch = [dict(row) for row in partition]
+            self.rows_written += len(batch)
+            yield batch
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            if self.export_format == "ndjson":
+                yield from encode_ndjson(self._batches())
+            elif self.export_format == "csv":
+                yield from encode_csv(
+                    self._batches(),
+                    self.dataset.column_names,
+                    header=self.csv_header,
+                )
+            else:
+                yield from encode_parquet(self._batches(), self.dataset.columns)
+        finally:
+            self._result.close()
+            self._connection.close()
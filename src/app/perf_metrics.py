@@ -0,0 +1,584 @@
+"""Process-wide latency telemetry for the API and its database access.
+
+Every observation lands in a fixed-bucket ``LatencyHistogram`` (constant memory,
+O(log buckets) per sample, quantiles estimated from the buckets), grouped into
+families held by one ``PerfRegistry``:
+
+- HTTP requests per method and route template (``PerfMetricsMiddleware``);
+- SQL statements per call site, i.e. the first application frame
+  (``app/api/routes_qg.py:1234 get_priority_list``) that issued them, with row
+  and error counts (SQLAlchemy engine events installed by ``instrument_engine``);
+- connection pool checkouts: wait time, checkouts that had to wait for a
+  connection and checkout timeouts (``InstrumentedQueuePool``, timed around the
+  public ``Pool.connect()``);
+- MVT tile renders per layer.
+
+The registry is exposed as JSON on ``/v1/ops/perf`` and in the Prometheus text
+format on ``/v1/ops/metrics``. Counters are cumulative since process start and
+per worker; Prometheus sums them across workers.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections.abc import Iterable
+from functools import lru_cache
+from inspect import signature
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.settings import get_settings
+
+# Upper bounds in milliseconds; a final +Inf bucket catches the rest.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+)
+METRIC_PREFIX = "tip"
+OTHER_LABEL = "<other>"
+UNMATCHED_ROUTE = "<unmatched>"
+# Bounds the number of label values per family so a bug can't grow memory unbounded.
+MAX_SERIES_PER_FAMILY = 1000
+
+_SOURCE_ROOT = Path(__file__).resolve().parent.parent
+# Generic query helpers: statements are attributed to the route that called them.
+_SKIPPED_SOURCE_FILES = frozenset(
+    str(_SOURCE_ROOT / relative)
+    for relative in (
+        "app/perf_metrics.py",
+        "app/api/utils.py",
+        "app/api/json_passthrough.py",
+    )
+)
+_SQL_SAMPLE_CHARS = 240
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class LatencyHistogram:
+    """Cumulative latency distribution over ``LATENCY_BUCKETS_MS``."""
+
+    __slots__ = ("bucket_counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.sum_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by linear interpolation inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            upper = LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+            if bucket_count and cumulative + bucket_count >= rank:
+                fraction = (rank - cumulative) / bucket_count
+                return min(lower + (upper - lower) * fraction, self.max_ms)
+            cumulative += bucket_count
+            lower = upper
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "avg_ms": round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.quantile(0.50), 3),
+            "p95_ms": round(self.quantile(0.95), 3),
+            "p99_ms": round(self.quantile(0.99), 3),
+        }
+
+
+class _RequestSeries:
+    __slots__ = ("latency", "statuses")
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.statuses: dict[str, int] = {}
+
+
+class _StatementSeries:
+    __slots__ = ("latency", "rows", "errors", "sql")
+
+    def __init__(self, sql: str) -> None:
+        self.latency = LatencyHistogram()
+        self.rows = 0
+        self.errors = 0
+        self.sql = sql
+
+
+class _TileSeries:
+    __slots__ = ("latency", "bytes", "cache_hits")
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.bytes = 0
+        self.cache_hits = 0
+
+
+def _bounded_key(series: dict[Any, Any], key: Any, overflow_key: Any) -> Any:
+    if key in series or len(series) < MAX_SERIES_PER_FAMILY:
+        return key
+    return overflow_key
+
+
+def compact_sql(statement: str) -> str:
+    compacted = _WHITESPACE_RE.sub(" ", statement).strip()
+    if len(compacted) > _SQL_SAMPLE_CHARS:
+        return compacted[: _SQL_SAMPLE_CHARS - 3] + "..."
+    return compacted
+
+
+# Per code object: ``(relative path, function)`` for application code, ``None`` otherwise.
+# Code objects are few and long-lived, so after warm-up walking the stack of a
+# statement costs one dict lookup per frame instead of path string checks.
+_CALL_SITE_CACHE: dict[CodeType, tuple[str, str] | None] = {}
+_CALL_SITE_CACHE_ROOT = ""
+_CALL_SITE_CACHE_MAX = 20000
+
+
+def _code_call_site(code: CodeType, root: str) -> tuple[str, str] | None:
+    filename = code.co_filename
+    site = None
+    if filename.startswith(root) and filename not in _SKIPPED_SOURCE_FILES:
+        site = (filename[len(root) + 1 :].replace("\\", "/"), code.co_name)
+    if len(_CALL_SITE_CACHE) < _CALL_SITE_CACHE_MAX:
+        _CALL_SITE_CACHE[code] = site
+    return site
+
+
+def statement_call_site() -> str:
+    """``<path relative to src>:<line> <function>`` of the first application frame."""
+    global _CALL_SITE_CACHE_ROOT
+    root = str(_SOURCE_ROOT)
+    if root != _CALL_SITE_CACHE_ROOT:
+        _CALL_SITE_CACHE.clear()
+        _CALL_SITE_CACHE_ROOT = root
+    cached = _CALL_SITE_CACHE.get
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        site = cached(code, False)
+        if site is False:
+            site = _code_call_site(code, root)
+        if site is not None:
+            return f"{site[0]}:{frame.f_lineno} {site[1]}"
+        frame = frame.f_back  # type: ignore[assignment]
+    return OTHER_LABEL
+
+
+class PerfRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self._requests: dict[tuple[str, str], _RequestSeries] = {}
+        self._statements: dict[str, _StatementSeries] = {}
+        self._tiles: dict[str, _TileSeries] = {}
+        self._pool_wait = LatencyHistogram()
+        self._pool_counters = {"checkouts": 0, "waits": 0, "timeouts": 0}
+
+    def observe_request(self, method: str, route: str, status_code: int, elapsed_ms: float) -> None:
+        with self._lock:
+            key = _bounded_key(self._requests, (method, route), (method, OTHER_LABEL))
+            series = self._requests.get(key)
+            if series is None:
+                series = self._requests[key] = _RequestSeries()
+            series.latency.observe(elapsed_ms)
+            status = str(status_code)
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+
+    def observe_statement(
+        self,
+        site: str,
+        statement: str,
+        elapsed_ms: float,
+        *,
+        rows: int | None = None,
+        error: bool = False,
+    ) -> None:
+        with self._lock:
+            key = _bounded_key(self._statements, site, OTHER_LABEL)
+            series = self._statements.get(key)
+            if series is None:
+                series = self._statements[key] = _StatementSeries(compact_sql(statement))
+            series.latency.observe(elapsed_ms)
+            if rows is not None and rows > 0:
+                series.rows += rows
+            if error:
+                series.errors += 1
+
+    def observe_pool_checkout(self, wait_ms: float, *, waited: bool, timed_out: bool) -> None:
+        with self._lock:
+            self._pool_wait.observe(wait_ms)
+            self._pool_counters["checkouts"] += 1
+            if waited:
+                self._pool_counters["waits"] += 1
+            if timed_out:
+                self._pool_counters["timeouts"] += 1
+
+    def observe_tile(
+        self, layer: str, elapsed_ms: float, size_bytes: int, *, cache_hit: bool
+    ) -> None:
+        with self._lock:
+            key = _bounded_key(self._tiles, layer, OTHER_LABEL)
+            series = self._tiles.get(key)
+            if series is None:
+                series = self._tiles[key] = _TileSeries()
+            series.latency.observe(elapsed_ms)
+            series.bytes += size_bytes
+            if cache_hit:
+                series.cache_hits += 1
+
+    def tile_summary(self) -> dict[str, Any]:
+        """All tile renders merged, plus per-layer totals (shape of ``/v1/map/tiles/metrics``)."""
+        merged = LatencyHistogram()
+        by_layer: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for layer, series in self._tiles.items():
+                latency = series.latency
+                merged.bucket_counts = [
+                    a + b for a, b in zip(merged.bucket_counts, latency.bucket_counts, strict=True)
+                ]
+                merged.count += latency.count
+                merged.sum_ms += latency.sum_ms
+                merged.max_ms = max(merged.max_ms, latency.max_ms)
+                by_layer[layer] = {
+                    "count": latency.count,
+                    "total_ms": round(latency.sum_ms, 3),
+                    "total_bytes": series.bytes,
+                    "cache_hits": series.cache_hits,
+                    "avg_ms": round(latency.sum_ms / latency.count, 1) if latency.count else 0,
+                    "avg_bytes": round(series.bytes / latency.count) if latency.count else 0,
+                }
+        snapshot = merged.snapshot()
+        return {
+            "count": snapshot["count"],
+            "p50_ms": snapshot["p50_ms"],
+            "p95_ms": snapshot["p95_ms"],
+            "p99_ms": snapshot["p99_ms"],
+            "by_layer": by_layer,
+        }
+
+    def snapshot(self, *, top_statements: int = 25) -> dict[str, Any]:
+        with self._lock:
+            requests = [
+                {
+                    "method": method,
+                    "route": route,
+                    **series.latency.snapshot(),
+                    "statuses": dict(series.statuses),
+                }
+                for (method, route), series in self._requests.items()
+            ]
+            statements = [
+                {
+                    "site": site,
+                    **series.latency.snapshot(),
+                    "rows": series.rows,
+                    "errors": series.errors,
+                    "sql": series.sql,
+                }
+                for site, series in self._statements.items()
+            ]
+            pool = {
+                **self._pool_counters,
+                "wait": self._pool_wait.snapshot(),
+                "connections": pool_connection_gauges(),
+            }
+            uptime_seconds = round(time.time() - self.started_at, 1)
+        requests.sort(key=lambda item: item["sum_ms"], reverse=True)
+        statements.sort(key=lambda item: item["sum_ms"], reverse=True)
+        return {
+            "uptime_seconds": uptime_seconds,
+            "requests": requests,
+            "statements": statements[:top_statements],
+            "statement_sites": len(statements),
+            "pool": pool,
+            "tiles": self.tile_summary(),
+        }
+
+    def render_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            _histogram_family(
+                lines,
+                "http_request_duration_seconds",
+                "Latency of API requests by route template.",
+                (
+                    ({"method": method, "route": route}, series.latency)
+                    for (method, route), series in self._requests.items()
+                ),
+            )
+            _counter_family(
+                lines,
+                "http_requests_total",
+                "API responses by route template and status code.",
+                (
+                    ({"method": method, "route": route, "status": status}, count)
+                    for (method, route), series in self._requests.items()
+                    for status, count in series.statuses.items()
+                ),
+            )
+            _histogram_family(
+                lines,
+                "db_statement_duration_seconds",
+                "SQL statement execution time by application call site.",
+                (({"site": site}, series.latency) for site, series in self._statements.items()),
+            )
+            _counter_family(
+                lines,
+                "db_statement_rows_total",
+                "Rows returned or affected by SQL statements by call site.",
+                (({"site": site}, series.rows) for site, series in self._statements.items()),
+            )
+            _counter_family(
+                lines,
+                "db_statement_errors_total",
+                "Failed SQL statements by call site.",
+                (({"site": site}, series.errors) for site, series in self._statements.items()),
+            )
+            _histogram_family(
+                lines,
+                "db_pool_checkout_wait_seconds",
+                "Time spent obtaining a connection from the pool.",
+                [({}, self._pool_wait)],
+            )
+            for name, counter, help_text in (
+                ("db_pool_checkouts_total", "checkouts", "Connection pool checkouts."),
+                (
+                    "db_pool_checkout_waits_total",
+                    "waits",
+                    "Checkouts that found no idle connection and had to wait.",
+                ),
+                (
+                    "db_pool_checkout_timeouts_total",
+                    "timeouts",
+                    "Checkouts that gave up after the pool timeout.",
+                ),
+            ):
+                _counter_family(lines, name, help_text, [({}, self._pool_counters[counter])])
+            _histogram_family(
+                lines,
+                "map_tile_duration_seconds",
+                "MVT tile response time by layer.",
+                (({"layer": layer}, series.latency) for layer, series in self._tiles.items()),
+            )
+            _counter_family(
+                lines,
+                "map_tile_bytes_total",
+                "MVT tile bytes served by layer.",
+                (({"layer": layer}, series.bytes) for layer, series in self._tiles.items()),
+            )
+            _counter_family(
+                lines,
+                "map_tile_cache_hits_total",
+                "MVT tiles served from the tile cache by layer.",
+                (({"layer": layer}, series.cache_hits) for layer, series in self._tiles.items()),
+            )
+        gauges = pool_connection_gauges()
+        _gauge_family(
+            lines,
+            "db_pool_connections",
+            "Pooled connections by state.",
+            (({"state": state}, value) for state, value in gauges.items()),
+        )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = time.time()
+            self._requests.clear()
+            self._statements.clear()
+            self._tiles.clear()
+            self._pool_wait = LatencyHistogram()
+            self._pool_counters = dict.fromkeys(self._pool_counters, 0)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: dict[str, str], **extra: str) -> str:
+    merged = {**labels, **extra}
+    if not merged:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in merged.items()) + "}"
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _histogram_family(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    series: Iterable[tuple[dict[str, str], LatencyHistogram]],
+) -> None:
+    metric = f"{METRIC_PREFIX}_{name}"
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} histogram")
+    for labels, histogram in series:
+        cumulative = 0
+        for index, bucket_count in enumerate(histogram.bucket_counts):
+            cumulative += bucket_count
+            if index < len(LATENCY_BUCKETS_MS):
+                le = _format_number(LATENCY_BUCKETS_MS[index] / 1000)
+            else:
+                le = "+Inf"
+            lines.append(f"{metric}_bucket{_labels(labels, le=le)} {cumulative}")
+        lines.append(f"{metric}_sum{_labels(labels)} {_format_number(histogram.sum_ms / 1000)}")
+        lines.append(f"{metric}_count{_labels(labels)} {histogram.count}")
+
+
+def _counter_family(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    series: Iterable[tuple[dict[str, str], int]],
+) -> None:
+    metric = f"{METRIC_PREFIX}_{name}"
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} counter")
+    for labels, value in series:
+        lines.append(f"{metric}{_labels(labels)} {value}")
+
+
+def _gauge_family(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    series: Iterable[tuple[dict[str, str], int]],
+) -> None:
+    metric = f"{METRIC_PREFIX}_{name}"
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} gauge")
+    for labels, value in series:
+        lines.append(f"{metric}{_labels(labels)} {value}")
+
+
+@lru_cache(maxsize=1)
+def get_perf_registry() -> PerfRegistry:
+    return PerfRegistry()
+
+
+def perf_metrics_enabled() -> bool:
+    return get_settings().perf_metrics_enabled
+
+
+_INSTRUMENTED_POOLS: weakref.WeakSet[InstrumentedQueuePool] = weakref.WeakSet()
+_DEFAULT_MAX_OVERFLOW: int = signature(QueuePool.__init__).parameters["max_overflow"].default
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` that records how long each checkout waited for a connection.
+
+    Only public pool API is used: ``connect()`` (what ``Engine`` calls for every
+    checkout) is timed, and whether the checkout had to wait is read from
+    ``checkedin()``/``overflow()`` against the ``max_overflow`` it was built with.
+    """
+
+    def __init__(
+        self, *args: Any, max_overflow: int = _DEFAULT_MAX_OVERFLOW, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self.max_overflow_limit = max_overflow
+        _INSTRUMENTED_POOLS.add(self)
+
+    def connect(self) -> Any:
+        # No idle connection and no overflow left: this checkout blocks until one is returned.
+        waited = (
+            self.max_overflow_limit > -1
+            and self.checkedin() == 0
+            and self.overflow() >= self.max_overflow_limit
+        )
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            get_perf_registry().observe_pool_checkout(
+                (time.perf_counter() - started) * 1000, waited=True, timed_out=True
+            )
+            raise
+        get_perf_registry().observe_pool_checkout(
+            (time.perf_counter() - started) * 1000, waited=waited, timed_out=False
+        )
+        return connection
+
+
+def pool_connection_gauges() -> dict[str, int]:
+    gauges = {"size": 0, "checked_out": 0, "checked_in": 0, "overflow": 0}
+    for pool in list(_INSTRUMENTED_POOLS):
+        gauges["size"] += pool.size()
+        gauges["checked_out"] += pool.checkedout()
+        gauges["checked_in"] += pool.checkedin()
+        gauges["overflow"] += max(pool.overflow(), 0)
+    return gauges
+
+
+_STATEMENT_TIMERS = "perf_statement_timers"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_STATEMENT_TIMERS, []).append(
+        (time.perf_counter(), statement_call_site())
+    )
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    timers = conn.info.get(_STATEMENT_TIMERS)
+    if not timers:
+        return
+    started, site = timers.pop()
+    rowcount = getattr(cursor, "rowcount", -1)
+    get_perf_registry().observe_statement(
+        site,
+        statement,
+        (time.perf_counter() - started) * 1000,
+        rows=rowcount if isinstance(rowcount, int) and rowcount >= 0 else None,
+    )
+
+
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    timers = conn.info.get(_STATEMENT_TIMERS) if conn is not None else None
+    if not timers:
+        return
+    started, site = timers.pop()
+    get_perf_registry().observe_statement(
+        site,
+        exception_context.statement or "",
+        (time.perf_counter() - started) * 1000,
+        error=True,
+    )
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """Attach statement timing hooks to ``engine`` (idempotent)."""
+    if not isinstance(engine, Engine):
+        return engine
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+    return engine
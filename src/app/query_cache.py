@@ -0,0 +1,242 @@
+"""Server-side result cache for read-heavy QG/territory API endpoints.
+
+Entries are serialized response bodies keyed by route, normalized query
+parameters and a data version token. The token is derived from
+``ops.data_versions`` (see ``app.data_version``), so every successful load moves
+readers to a fresh key space. Entries live in a bounded in-process LRU with a TTL and can
+optionally be mirrored to ``<query_cache_root>/<data_version>/`` so several
+uvicorn workers share them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from app.data_version import get_data_version_tracker
+from app.logging import get_logger
+from app.settings import get_settings
+
+_INITIAL_VERSION = "initial"
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    body: bytes
+    media_type: str
+    stored_at: float
+    source: str
+
+
+def normalize_query_params(items: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Sort parameters and drop empty values so equivalent URLs share a cache key."""
+    return sorted((key, value.strip()) for key, value in items if value.strip())
+
+
+def result_cache_key(route: str, params: Iterable[tuple[str, str]], data_version: str) -> str:
+    payload = json.dumps(
+        [route, normalize_query_params(params), data_version],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class QueryResultCache:
+    """Bounded TTL + LRU cache of response bodies, optionally mirrored to disk."""
+
+    def __init__(
+        self,
+        *,
+        max_items: int = 512,
+        ttl_seconds: float = 300,
+        disk_root: Path | None = None,
+        version_loader: Callable[[], str],
+        version_poll_seconds: float = 5.0,
+    ) -> None:
+        self.max_items = max(1, max_items)
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.disk_root = disk_root
+        self._version_loader = version_loader
+        self._version_poll_seconds = max(0.0, float(version_poll_seconds))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CachedResult] = OrderedDict()
+        self._version = _INITIAL_VERSION
+        self._version_checked_at = float("-inf")
+        self._version_available = False
+        self._counters: dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+            "version_errors": 0,
+        }
+
+    def current_version(self) -> str | None:
+        """Return the data version, polling the loader at most every ``version_poll_seconds``.
+
+        Returns ``None`` when the version cannot be read; callers must then bypass the cache.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._version_checked_at < self._version_poll_seconds:
+                return self._version if self._version_available else None
+        try:
+            version = self._version_loader()
+        except Exception:
+            get_logger("query_cache").warning("Could not read data version; bypassing cache.")
+            with self._lock:
+                self._version_checked_at = now
+                self._version_available = False
+                self._counters["version_errors"] += 1
+            return None
+        with self._lock:
+            self._version_checked_at = now
+            self._version_available = True
+            changed = version != self._version
+            if changed:
+                self._entries.clear()
+                self._version = version
+                self._counters["invalidations"] += 1
+        if changed and self.disk_root is not None:
+            _drop_stale_disk_versions(self.disk_root, version)
+        return version
+
+    def _disk_path(self, root: Path, version: str, key: str) -> Path:
+        return root / version / key[:2] / f"{key}.json"
+
+    def _is_fresh(self, stored_at: float) -> bool:
+        return time.time() - stored_at < self.ttl_seconds
+
+    def _remember(self, key: str, result: CachedResult) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def get(self, key: str, *, version: str) -> CachedResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                if self._is_fresh(result.stored_at):
+                    self._entries.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return CachedResult(result.body, result.media_type, result.stored_at, "memory")
+                del self._entries[key]
+                self._counters["expirations"] += 1
+
+        if self.disk_root is not None:
+            result = self._read_disk(self.disk_root, version, key)
+            if result is not None:
+                self._remember(key, result)
+                with self._lock:
+                    self._counters["disk_hits"] += 1
+                return result
+
+        with self._lock:
+            self._counters["misses"] += 1
+        return None
+
+    def _read_disk(self, root: Path, version: str, key: str) -> CachedResult | None:
+        path = self._disk_path(root, version, key)
+        try:
+            stored_at = path.stat().st_mtime
+            if not self._is_fresh(stored_at):
+                return None
+            envelope = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return CachedResult(
+            body=str(envelope["body"]).encode("utf-8"),
+            media_type=str(envelope.get("media_type") or "application/json"),
+            stored_at=stored_at,
+            source="disk",
+        )
+
+    def put(self, key: str, body: bytes, *, media_type: str, version: str) -> None:
+        result = CachedResult(
+            body=body,
+            media_type=media_type,
+            stored_at=time.time(),
+            source="store",
+        )
+        self._remember(key, result)
+        with self._lock:
+            self._counters["stores"] += 1
+
+        if self.disk_root is None:
+            return
+        path = self._disk_path(self.disk_root, version, key)
+        try:
+            envelope = {"media_type": media_type, "body": body.decode("utf-8")}
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+            tmp_path.write_text(json.dumps(envelope, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except (OSError, UnicodeDecodeError):
+            get_logger("query_cache").warning("Could not persist query result on disk.", key=key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version_checked_at = float("-inf")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            memory_items = len(self._entries)
+            version = self._version
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        lookups = hits + counters["misses"]
+        return {
+            "enabled": True,
+            "data_version": version,
+            "memory_items": memory_items,
+            "max_items": self.max_items,
+            "ttl_seconds": self.ttl_seconds,
+            "disk_enabled": self.disk_root is not None,
+            "hits": hits,
+            **counters,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def _drop_stale_disk_versions(root: Path, version: str) -> None:
+    try:
+        children = list(root.iterdir())
+    except OSError:
+        return
+    for child in children:
+        if child.is_dir() and child.name != version:
+            shutil.rmtree(child, ignore_errors=True)
+
+
+@lru_cache(maxsize=1)
+def get_query_cache() -> QueryResultCache | None:
+    settings = get_settings()
+    if not settings.query_cache_enabled:
+        return None
+    return QueryResultCache(
+        max_items=settings.query_cache_max_items,
+        ttl_seconds=settings.query_cache_ttl_seconds,
+        disk_root=settings.query_cache_root if settings.query_cache_disk_enabled else None,
+        # The tracker already polls ops.data_versions; no second throttle here.
+        version_loader=get_data_version_tracker().global_token,
+        version_poll_seconds=0,
+    )
@@ -167,6 +167,7 @@ class InsightHighlightItem(BaseModel):
     territory_id: str
     territory_name: str
     explanation: list[str]
+    trend: str = "stable"
     evidence: PriorityEvidence
     explainability: ExplainabilityTrail
     robustness: str
@@ -253,6 +254,19 @@ class TerritoryPeersResponse(BaseModel):
     items: list[TerritoryPeerItem]
 
 
+class TerritoryPeersBatchRequest(BaseModel):
+    territory_ids: list[str] = Field(min_length=1, max_length=100)
+    period: str | None = None
+    limit: int = Field(default=5, ge=1, le=20)
+
+
+class TerritoryPeersBatchResponse(BaseModel):
+    period: str | None
+    metadata: QgMetadata
+    results: list[TerritoryPeersResponse]
+    missing_territory_ids: list[str]
+
+
 class ElectorateBreakdownItem(BaseModel):
     label: str
     voters: int
@@ -294,6 +308,8 @@ class ElectorateMapResponse(BaseModel):
     year: int | None
     metadata: QgMetadata
     items: list[ElectorateMapItem]
+    # Set when format=topojson; item geometries are then null and keyed by territory_id here.
+    topology: dict | None = None
 
 
 class ElectorateHistoryItem(BaseModel):
@@ -437,6 +453,44 @@ class ScenarioSimulateResponse(BaseModel):
     explanation: list[str]
 
 
+class ScenarioSimulateBatchItem(BaseModel):
+    territory_id: str
+    indicator_code: str | None = None
+    adjustment_percent: float = Field(ge=-95, le=300)
+
+
+class ScenarioAdjustmentRange(BaseModel):
+    start: float = Field(ge=-95, le=300)
+    stop: float = Field(ge=-95, le=300)
+    step: float = Field(gt=0)
+
+
+class ScenarioSimulateBatchRequest(BaseModel):
+    period: str | None = None
+    level: str | None = "municipality"
+    domain: str | None = None
+    items: list[ScenarioSimulateBatchItem] = Field(default_factory=list, max_length=500)
+    # Sweep applied to territory_id/indicator_code, expanded inclusively into extra items.
+    territory_id: str | None = None
+    indicator_code: str | None = None
+    adjustment_range: ScenarioAdjustmentRange | None = None
+
+
+class ScenarioSimulateBatchError(BaseModel):
+    territory_id: str
+    indicator_code: str | None
+    adjustment_percent: float
+    detail: str
+
+
+class ScenarioSimulateBatchResponse(BaseModel):
+    period: str | None
+    level: str
+    domain: str | None
+    items: list[ScenarioSimulateResponse]
+    errors: list[ScenarioSimulateBatchError]
+
+
 class BriefGenerateRequest(BaseModel):
     period: str | None = None
     level: str | None = "municipality"
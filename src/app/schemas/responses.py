@@ -10,3 +10,11 @@ class PaginatedResponse(BaseModel):
     page_size: int
     total: int
     items: list[dict[str, Any]]
+    # Keyset continuation token (pass back as ?cursor=) and whether total is a planner estimate.
+    next_cursor: str | None = None
+    total_estimated: bool = False
+
+
+class ChoroplethResponse(PaginatedResponse):
+    # With format=topojson the item geometries move into one shared-border topology.
+    topology: dict[str, Any] | None = None
@@ -46,12 +46,35 @@ class Settings(BaseSettings):
     request_timeout_seconds: int = 30
     http_max_retries: int = 3
     http_backoff_seconds: float = 1.5
+    http_max_connections: int = 20
+    http_host_concurrency: int = 4
+    http_host_rate_limit_per_second: float = 0.0
+    http_cache_enabled: bool = True
     bronze_retention_days: int = 3650
 
+    tile_cache_enabled: bool = True
+    tile_cache_max_items: int = 4096
+    tile_cache_disk_enabled: bool = True
+
+    query_cache_enabled: bool = True
+    query_cache_max_items: int = 512
+    query_cache_ttl_seconds: int = 300
+    query_cache_disk_enabled: bool = False
+    data_version_poll_seconds: float = 5.0
+    perf_metrics_enabled: bool = True
+    silver_cache_enabled: bool = True
+
+    orchestration_max_workers: int = 6
+    orchestration_host_concurrency: int = 2
+    orchestration_host_concurrency_overrides: str = ""
+
     ibge_api_base_url: str = "https://servicodados.ibge.gov.br/api/v1/localidades"
     tse_ckan_base_url: str = "https://dadosabertos.tse.jus.br/api/3/action"
     portal_transparencia_api_base_url: str = "https://api.portaldatransparencia.gov.br/api-de-dados"
     portal_transparencia_api_key: str | None = None
+    portal_transparencia_max_concurrency: int = 4
+    portal_transparencia_rate_limit_per_second: float = 1.5
+    portal_transparencia_page_prefetch: int = 2
     mte_ftp_host: str = "ftp.mtps.gov.br"
     mte_ftp_port: int = 21
     mte_ftp_root_candidates: str = "/pdet/microdados/NOVO CAGED,/pdet/microdados/NOVO_CAGED"
@@ -62,6 +85,15 @@ class Settings(BaseSettings):
     def cors_allow_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_allow_origins.split(",") if origin.strip()]
 
+    @property
+    def orchestration_host_limits(self) -> dict[str, int]:
+        limits: dict[str, int] = {}
+        for item in self.orchestration_host_concurrency_overrides.split(","):
+            host, _, value = item.partition("=")
+            if host.strip() and value.strip().isdigit():
+                limits[host.strip()] = max(1, int(value.strip()))
+        return limits
+
     @property
     def bronze_root(self) -> Path:
         return self.data_root / "bronze"
@@ -74,6 +106,22 @@ class Settings(BaseSettings):
     def silver_root(self) -> Path:
         return self.data_root / "silver"
 
+    @property
+    def http_cache_root(self) -> Path:
+        return self.data_root / "cache" / "http"
+
+    @property
+    def tile_cache_root(self) -> Path:
+        return self.data_root / "cache" / "tiles"
+
+    @property
+    def tile_archive_root(self) -> Path:
+        return self.data_root / "cache" / "tile_archives"
+
+    @property
+    def query_cache_root(self) -> Path:
+        return self.data_root / "cache" / "query"
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
@@ -0,0 +1,81 @@
+"""In-process request coalescing for expensive read queries.
+
+Sync FastAPI endpoints run on the threadpool, so a burst of identical requests
+(the same tile, the same priority list) would each check out a pooled
+connection and run the same query. ``SingleFlight.do`` lets the first caller
+for a key run the computation while concurrent callers with the same key wait
+for its result (or exception) instead of issuing their own query. Followers
+never touch their own ``Session``, which only checks out a connection lazily.
+
+Results are handed to every caller as-is; callers that mutate them must copy.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+_INSTANCES: weakref.WeakSet[SingleFlight] = weakref.WeakSet()
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        self._counters = {"executions": 0, "coalesced": 0, "errors": 0}
+        _INSTANCES.add(self)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._counters["executions"] += 1
+            else:
+                call.waiters += 1
+                self._counters["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            with self._lock:
+                self._counters["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"name": self.name, "in_flight": len(self._calls), **self._counters}
+
+
+def single_flight_stats() -> list[dict[str, Any]]:
+    """``stats()`` of every live ``SingleFlight``, ordered by name."""
+    return sorted((flight.stats() for flight in list(_INSTANCES)), key=lambda item: item["name"])
@@ -0,0 +1,131 @@
+"""MBTiles archives of pre-rendered MVT tiles, one SQLite file per map layer.
+
+Archives follow the MBTiles 1.3 layout (``metadata`` + ``tiles`` with TMS rows)
+and record the tile cache data version they were seeded for, so the tile
+endpoint only serves an archive while it still matches the loaded geometries.
+Empty tiles are stored as zero-length blobs to avoid re-querying known gaps.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+from uuid import uuid4
+
+_SCHEMA_SQL = (
+    "CREATE TABLE metadata (name TEXT PRIMARY KEY, value TEXT)",
+    (
+        "CREATE TABLE tiles ("
+        "zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB, "
+        "PRIMARY KEY (zoom_level, tile_column, tile_row))"
+    ),
+)
+
+
+def archive_path(root: Path, layer: str) -> Path:
+    return root / f"{layer}.mbtiles"
+
+
+def _tms_row(z: int, y: int) -> int:
+    return (1 << z) - 1 - y
+
+
+class MBTilesWriter:
+    """Writes tiles into a temporary file and atomically publishes it on ``close``."""
+
+    def __init__(self, path: Path, *, metadata: dict[str, str], batch_size: int = 500) -> None:
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.tiles_written = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        self._conn = sqlite3.connect(self._tmp_path)
+        self._conn.execute("PRAGMA journal_mode = OFF")
+        self._conn.execute("PRAGMA synchronous = OFF")
+        for statement in _SCHEMA_SQL:
+            self._conn.execute(statement)
+        self._conn.executemany(
+            "INSERT INTO metadata (name, value) VALUES (?, ?)",
+            sorted(metadata.items()),
+        )
+        self._pending: list[tuple[int, int, int, bytes]] = []
+
+    def write(self, z: int, x: int, y: int, content: bytes) -> None:
+        self._pending.append((z, x, _tms_row(z, y), content))
+        self.tiles_written += 1
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) "
+            "VALUES (?, ?, ?, ?)",
+            self._pending,
+        )
+        self._conn.commit()
+        self._pending = []
+
+    def close(self) -> None:
+        self._flush()
+        self._conn.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        self._conn.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> MBTilesWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _connect_readonly(path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def read_archive_metadata(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    try:
+        conn = _connect_readonly(path)
+        try:
+            rows = conn.execute("SELECT name, value FROM metadata").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+    return {str(name): str(value) for name, value in rows}
+
+
+def read_archive_tile(path: Path, z: int, x: int, y: int, *, data_version: str) -> bytes | None:
+    """Return the archived tile, or ``None`` if absent or seeded for another data version."""
+    if not path.exists():
+        return None
+    try:
+        conn = _connect_readonly(path)
+        try:
+            version_row = conn.execute(
+                "SELECT value FROM metadata WHERE name = 'data_version'"
+            ).fetchone()
+            if version_row is None or version_row[0] != data_version:
+                return None
+            tile_row = conn.execute(
+                "SELECT tile_data FROM tiles "
+                "WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+                (z, x, _tms_row(z, y)),
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    if tile_row is None:
+        return None
+    return bytes(tile_row[0] or b"")
@@ -0,0 +1,233 @@
+"""Persistent MVT tile cache shared by the map API and geometry connectors.
+
+Tiles live in a bounded in-process LRU backed by an on-disk store laid out as
+``<tile_cache_root>/<data_version>/<layer>/<z>/<x>/<y>.mvt``. The data version
+token is a small file under the cache root: connectors that write map geometries
+bump it, which moves readers to a fresh namespace without a Postgres round trip.
+Pre-seeded MBTiles archives (``scripts/seed_map_tiles.py``) are consulted after
+the disk store when they were seeded for the current data version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from app.logging import get_logger
+from app.settings import Settings, get_settings
+from app.tile_archive import archive_path, read_archive_tile
+
+_VERSION_FILE_NAME = "data_version"
+_INITIAL_VERSION = "initial"
+
+
+@dataclass(frozen=True)
+class CachedTile:
+    content: bytes
+    etag: str
+    source: str
+
+
+def tile_etag(content: bytes) -> str:
+    return f"\"{hashlib.sha256(content).hexdigest()}\""
+
+
+def _version_path(root: Path) -> Path:
+    return root / _VERSION_FILE_NAME
+
+
+def read_tile_data_version(root: Path) -> str:
+    try:
+        token = _version_path(root).read_text(encoding="utf-8").strip()
+    except OSError:
+        return _INITIAL_VERSION
+    return token or _INITIAL_VERSION
+
+
+def bump_tile_data_version(root: Path, *, reason: str | None = None) -> str:
+    """Write a new data version token and drop tiles rendered for older versions."""
+    root.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    token = f"{stamp}-{uuid4().hex[:8]}"
+    tmp_path = root / f".{_VERSION_FILE_NAME}.{uuid4().hex}.tmp"
+    tmp_path.write_text(token, encoding="utf-8")
+    os.replace(tmp_path, _version_path(root))
+
+    for child in root.iterdir():
+        if child.is_dir() and child.name != token:
+            shutil.rmtree(child, ignore_errors=True)
+
+    get_logger("tile_cache").info("Tile cache data version bumped.", version=token, reason=reason)
+    return token
+
+
+def invalidate_tile_cache(settings: Settings, *, reason: str) -> str | None:
+    """Bump the tile data version after a connector write; never fails the caller."""
+    try:
+        return bump_tile_data_version(settings.tile_cache_root, reason=reason)
+    except OSError:
+        get_logger("tile_cache").warning(
+            "Could not bump tile cache data version.",
+            root=settings.tile_cache_root.as_posix(),
+            reason=reason,
+        )
+        return None
+
+
+class TileCache:
+    """Bounded LRU of rendered tiles mirrored to disk, keyed by data version."""
+
+    def __init__(
+        self,
+        *,
+        root: Path,
+        max_items: int = 4096,
+        disk_enabled: bool = True,
+        archive_root: Path | None = None,
+    ) -> None:
+        self.root = root
+        self.max_items = max(1, max_items)
+        self.disk_enabled = disk_enabled
+        self.archive_root = archive_root
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str, int, int, int], CachedTile] = OrderedDict()
+        self._version = _INITIAL_VERSION
+        self._counters: dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "archive_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    def _current_version(self) -> str:
+        version = read_tile_data_version(self.root)
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+                self._counters["invalidations"] += 1
+        return version
+
+    def _tile_path(self, version: str, layer: str, z: int, x: int, y: int) -> Path:
+        return self.root / version / layer / str(z) / str(x) / f"{y}.mvt"
+
+    def _remember(self, key: tuple[str, str, int, int, int], tile: CachedTile) -> None:
+        with self._lock:
+            self._entries[key] = tile
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def get(self, layer: str, z: int, x: int, y: int) -> CachedTile | None:
+        version = self._current_version()
+        key = (version, layer, z, x, y)
+        with self._lock:
+            tile = self._entries.get(key)
+            if tile is not None:
+                self._entries.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return CachedTile(content=tile.content, etag=tile.etag, source="memory")
+
+        if self.disk_enabled:
+            path = self._tile_path(version, layer, z, x, y)
+            try:
+                content = path.read_bytes()
+            except OSError:
+                content = None
+            if content is not None:
+                tile = CachedTile(content=content, etag=tile_etag(content), source="disk")
+                self._remember(key, tile)
+                with self._lock:
+                    self._counters["disk_hits"] += 1
+                return tile
+
+        if self.archive_root is not None:
+            content = read_archive_tile(
+                archive_path(self.archive_root, layer),
+                z,
+                x,
+                y,
+                data_version=version,
+            )
+            if content is not None:
+                tile = CachedTile(content=content, etag=tile_etag(content), source="archive")
+                self._remember(key, tile)
+                with self._lock:
+                    self._counters["archive_hits"] += 1
+                return tile
+
+        with self._lock:
+            self._counters["misses"] += 1
+        return None
+
+    def put(self, layer: str, z: int, x: int, y: int, content: bytes) -> CachedTile:
+        version = self._current_version()
+        tile = CachedTile(content=content, etag=tile_etag(content), source="render")
+        self._remember((version, layer, z, x, y), tile)
+        with self._lock:
+            self._counters["stores"] += 1
+
+        if self.disk_enabled:
+            path = self._tile_path(version, layer, z, x, y)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+                tmp_path.write_bytes(content)
+                os.replace(tmp_path, path)
+            except OSError:
+                get_logger("tile_cache").warning(
+                    "Could not persist tile on disk.",
+                    layer=layer,
+                    z=z,
+                    x=x,
+                    y=y,
+                )
+        return tile
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            memory_items = len(self._entries)
+            version = self._version
+        hits = counters["memory_hits"] + counters["disk_hits"] + counters["archive_hits"]
+        lookups = hits + counters["misses"]
+        return {
+            "enabled": True,
+            "data_version": version,
+            "memory_items": memory_items,
+            "max_items": self.max_items,
+            "disk_enabled": self.disk_enabled,
+            "hits": hits,
+            **counters,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_tile_cache() -> TileCache | None:
+    settings = get_settings()
+    if not settings.tile_cache_enabled:
+        return None
+    return TileCache(
+        root=settings.tile_cache_root,
+        max_items=settings.tile_cache_max_items,
+        disk_enabled=settings.tile_cache_disk_enabled,
+        archive_root=settings.tile_archive_root,
+    )
@@ -0,0 +1,218 @@
+"""Dependency DAG for the MVP connectors and a bounded concurrent scheduler.
+
+Each connector declares the jobs it depends on and the source host group it
+talks to. ``run_connector_dag`` starts a connector as soon as its dependencies
+finished, capped by a global worker limit and a per-host-group limit so a single
+upstream portal is never hit by more than a few concurrent fetches.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from app.logging import get_logger
+
+
+@dataclass(frozen=True)
+class ConnectorNode:
+    job_name: str
+    runner: str
+    host: str
+    depends_on: tuple[str, ...] = ()
+
+
+_GEOMETRY_STAGE = ("ibge_geometries_fetch",)
+_TSE_STAGE = ("tse_catalog_discovery",)
+
+_FETCH_CONNECTORS: tuple[ConnectorNode, ...] = (
+    ConnectorNode("ibge_admin_fetch", "run_ibge_admin", "ibge"),
+    ConnectorNode("ibge_geometries_fetch", "run_ibge_geometries", "ibge", ("ibge_admin_fetch",)),
+    ConnectorNode("ibge_indicators_fetch", "run_ibge_indicators", "ibge", _GEOMETRY_STAGE),
+    ConnectorNode("tse_catalog_discovery", "run_tse_catalog", "tse", ("ibge_admin_fetch",)),
+    ConnectorNode("tse_electorate_fetch", "run_tse_electorate", "tse", _TSE_STAGE),
+    # Electorate, results and candidate votes all upsert electoral zones/sections in
+    # silver.dim_territory, so they run in sequence to avoid conflicting upserts.
+    ConnectorNode("tse_results_fetch", "run_tse_results", "tse", ("tse_electorate_fetch",)),
+    ConnectorNode(
+        "tse_candidate_votes_fetch",
+        "run_tse_candidate_votes",
+        "tse",
+        ("tse_results_fetch",),
+    ),
+    ConnectorNode("education_inep_fetch", "run_inep_education", "inep", _GEOMETRY_STAGE),
+    ConnectorNode("health_datasus_fetch", "run_datasus_health", "datasus", _GEOMETRY_STAGE),
+    ConnectorNode("finance_siconfi_fetch", "run_siconfi_finance", "tesouro", _GEOMETRY_STAGE),
+    ConnectorNode(
+        "portal_transparencia_fetch",
+        "run_portal_transparencia",
+        "portal_transparencia",
+        _GEOMETRY_STAGE,
+    ),
+    ConnectorNode("labor_mte_fetch", "run_mte_labor", "mte", _GEOMETRY_STAGE),
+    ConnectorNode("sidra_indicators_fetch", "run_sidra_indicators", "ibge", _GEOMETRY_STAGE),
+    ConnectorNode("senatran_fleet_fetch", "run_senatran_fleet", "gov_br", _GEOMETRY_STAGE),
+    ConnectorNode(
+        "sejusp_public_safety_fetch",
+        "run_sejusp_public_safety",
+        "sejusp_mg",
+        _GEOMETRY_STAGE,
+    ),
+    ConnectorNode(
+        "siops_health_finance_fetch",
+        "run_siops_health_finance",
+        "datasus",
+        _GEOMETRY_STAGE,
+    ),
+    ConnectorNode("snis_sanitation_fetch", "run_snis_sanitation", "gov_br", _GEOMETRY_STAGE),
+    ConnectorNode("inmet_climate_fetch", "run_inmet_climate", "inmet", _GEOMETRY_STAGE),
+    ConnectorNode("inpe_queimadas_fetch", "run_inpe_queimadas", "inpe", _GEOMETRY_STAGE),
+    ConnectorNode("ana_hydrology_fetch", "run_ana_hydrology", "ana", _GEOMETRY_STAGE),
+    ConnectorNode(
+        "anatel_connectivity_fetch",
+        "run_anatel_connectivity",
+        "anatel",
+        _GEOMETRY_STAGE,
+    ),
+    ConnectorNode("aneel_energy_fetch", "run_aneel_energy", "aneel", _GEOMETRY_STAGE),
+    ConnectorNode(
+        "suasweb_social_assistance_fetch",
+        "run_suasweb_social_assistance",
+        "mds",
+        _GEOMETRY_STAGE,
+    ),
+    ConnectorNode(
+        "cneas_social_assistance_fetch",
+        "run_cneas_social_assistance",
+        "mds",
+        _GEOMETRY_STAGE,
+    ),
+    ConnectorNode(
+        "cecad_social_protection_fetch",
+        "run_cecad_social_protection",
+        "mds",
+        _GEOMETRY_STAGE,
+    ),
+    ConnectorNode("censo_suas_fetch", "run_censo_suas", "mds", _GEOMETRY_STAGE),
+    ConnectorNode("urban_roads_fetch", "run_urban_roads", "osm", _GEOMETRY_STAGE),
+    ConnectorNode("urban_pois_fetch", "run_urban_pois", "osm", _GEOMETRY_STAGE),
+    ConnectorNode("urban_transport_fetch", "run_urban_transport", "osm", _GEOMETRY_STAGE),
+)
+
+MVP_CONNECTOR_DAG: tuple[ConnectorNode, ...] = (
+    *_FETCH_CONNECTORS,
+    ConnectorNode(
+        "dbt_build",
+        "run_dbt_build",
+        "internal",
+        tuple(node.job_name for node in _FETCH_CONNECTORS),
+    ),
+    ConnectorNode("quality_suite", "run_quality_suite", "internal", ("dbt_build",)),
+)
+
+
+def validate_connector_dag(nodes: Iterable[ConnectorNode]) -> list[ConnectorNode]:
+    """Return the nodes in a valid topological order or raise ``ValueError``."""
+    node_list = list(nodes)
+    by_name: dict[str, ConnectorNode] = {}
+    for node in node_list:
+        if node.job_name in by_name:
+            raise ValueError(f"Duplicate connector job in DAG: {node.job_name}.")
+        by_name[node.job_name] = node
+    for node in node_list:
+        missing = [dep for dep in node.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(
+                f"Connector {node.job_name} depends on unknown jobs: {', '.join(missing)}."
+            )
+
+    ordered: list[ConnectorNode] = []
+    visited: set[str] = set()
+    visiting: set[str] = set()
+
+    def _visit(node: ConnectorNode) -> None:
+        if node.job_name in visited:
+            return
+        if node.job_name in visiting:
+            raise ValueError(f"Dependency cycle detected at connector {node.job_name}.")
+        visiting.add(node.job_name)
+        for dep in node.depends_on:
+            _visit(by_name[dep])
+        visiting.discard(node.job_name)
+        visited.add(node.job_name)
+        ordered.append(node)
+
+    for node in node_list:
+        _visit(node)
+    return ordered
+
+
+def run_connector_dag(
+    nodes: Iterable[ConnectorNode],
+    *,
+    resolve_runner: Callable[[str], Callable[..., dict[str, Any]]],
+    common_kwargs: dict[str, Any],
+    max_workers: int,
+    host_concurrency: int,
+    host_limits: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    """Run connectors as their dependencies complete and return results in DAG order.
+
+    Connector runners report failures in their result payload; an exception raised by a
+    runner stops scheduling new jobs and is re-raised once in-flight jobs finish.
+    """
+    ordered = validate_connector_dag(nodes)
+    logger = get_logger("connector_dag")
+    max_workers = max(1, int(max_workers))
+    host_limits = host_limits or {}
+
+    pending = list(ordered)
+    done: set[str] = set()
+    results: dict[str, Any] = {}
+    running: dict[Future[dict[str, Any]], tuple[ConnectorNode, float]] = {}
+    host_running: Counter[str] = Counter()
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="connector") as pool:
+        while pending or running:
+            for node in list(pending):
+                if len(running) >= max_workers:
+                    break
+                if any(dep not in done for dep in node.depends_on):
+                    continue
+                if host_running[node.host] >= max(1, host_limits.get(node.host, host_concurrency)):
+                    continue
+                runner = resolve_runner(node.runner)
+                running[pool.submit(runner, **common_kwargs)] = (node, time.perf_counter())
+                host_running[node.host] += 1
+                pending.remove(node)
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node, job_started_at = running.pop(future)
+                host_running[node.host] -= 1
+                results[node.job_name] = future.result()
+                done.add(node.job_name)
+                logger.info(
+                    "Connector finished.",
+                    job=node.job_name,
+                    host=node.host,
+                    status=(
+                        results[node.job_name].get("status")
+                        if isinstance(results[node.job_name], dict)
+                        else None
+                    ),
+                    duration_seconds=round(time.perf_counter() - job_started_at, 2),
+                )
+
+    logger.info(
+        "Connector DAG finished.",
+        jobs=len(ordered),
+        max_workers=max_workers,
+        duration_seconds=round(time.perf_counter() - started_at, 2),
+    )
+    return {node.job_name: results[node.job_name] for node in ordered}
@@ -28,6 +28,7 @@ from prefect import flow
 
 from app.logging import configure_logging
 from app.settings import get_settings
+from orchestration.connector_dag import MVP_CONNECTOR_DAG, run_connector_dag
 from pipelines.datasus_health import run as run_datasus_health
 from pipelines.dbt_build import run as run_dbt_build
 from pipelines.ibge_admin import run as run_ibge_admin
@@ -64,6 +65,11 @@ settings = get_settings()
 configure_logging(settings.log_level)
 
 
+def _resolve_runner(name: str) -> Any:
+    # Looked up at call time so connector runners can be swapped (e.g. in tests).
+    return globals()[name]
+
+
 @flow(name="ibge_admin_fetch")
 def ibge_admin_fetch(
     reference_period: str,
@@ -88,6 +94,7 @@ def run_mvp_all(
     dry_run: bool = False,
     max_retries: int = 3,
     timeout_seconds: int = 30,
+    max_workers: int | None = None,
 ) -> dict[str, Any]:
     common_kwargs = {
         "reference_period": reference_period,
@@ -96,40 +103,14 @@ def run_mvp_all(
         "max_retries": max_retries,
         "timeout_seconds": timeout_seconds,
     }
-    results = {
-        "ibge_admin_fetch": run_ibge_admin(**common_kwargs),
-        "ibge_geometries_fetch": run_ibge_geometries(**common_kwargs),
-        "ibge_indicators_fetch": run_ibge_indicators(**common_kwargs),
-        "tse_catalog_discovery": run_tse_catalog(**common_kwargs),
-        "tse_electorate_fetch": run_tse_electorate(**common_kwargs),
-        "tse_results_fetch": run_tse_results(**common_kwargs),
-        "tse_candidate_votes_fetch": run_tse_candidate_votes(**common_kwargs),
-        "education_inep_fetch": run_inep_education(**common_kwargs),
-        "health_datasus_fetch": run_datasus_health(**common_kwargs),
-        "finance_siconfi_fetch": run_siconfi_finance(**common_kwargs),
-        "portal_transparencia_fetch": run_portal_transparencia(**common_kwargs),
-        "labor_mte_fetch": run_mte_labor(**common_kwargs),
-        "sidra_indicators_fetch": run_sidra_indicators(**common_kwargs),
-        "senatran_fleet_fetch": run_senatran_fleet(**common_kwargs),
-        "sejusp_public_safety_fetch": run_sejusp_public_safety(**common_kwargs),
-        "siops_health_finance_fetch": run_siops_health_finance(**common_kwargs),
-        "snis_sanitation_fetch": run_snis_sanitation(**common_kwargs),
-        "inmet_climate_fetch": run_inmet_climate(**common_kwargs),
-        "inpe_queimadas_fetch": run_inpe_queimadas(**common_kwargs),
-        "ana_hydrology_fetch": run_ana_hydrology(**common_kwargs),
-        "anatel_connectivity_fetch": run_anatel_connectivity(**common_kwargs),
-        "aneel_energy_fetch": run_aneel_energy(**common_kwargs),
-        "suasweb_social_assistance_fetch": run_suasweb_social_assistance(**common_kwargs),
-        "cneas_social_assistance_fetch": run_cneas_social_assistance(**common_kwargs),
-        "cecad_social_protection_fetch": run_cecad_social_protection(**common_kwargs),
-        "censo_suas_fetch": run_censo_suas(**common_kwargs),
-        "urban_roads_fetch": run_urban_roads(**common_kwargs),
-        "urban_pois_fetch": run_urban_pois(**common_kwargs),
-        "urban_transport_fetch": run_urban_transport(**common_kwargs),
-        "dbt_build": run_dbt_build(**common_kwargs),
-        "quality_suite": run_quality_suite(**common_kwargs),
-    }
-    return results
+    return run_connector_dag(
+        MVP_CONNECTOR_DAG,
+        resolve_runner=_resolve_runner,
+        common_kwargs=common_kwargs,
+        max_workers=max_workers or settings.orchestration_max_workers,
+        host_concurrency=settings.orchestration_host_concurrency,
+        host_limits=settings.orchestration_host_limits,
+    )
 
 
 @flow(name="territorial_mvp_wave_1")
@@ -0,0 +1,226 @@
+"""Async HTTP client for connectors that fetch many resources from the same sources.
+
+One ``httpx.AsyncClient`` (and its connection pool) is shared by every request
+issued through an ``AsyncHttpClient``. Requests are gated per host by a
+concurrency limit and an optional minimum interval between request starts, so
+catalog entries can be fetched concurrently without hammering a single portal.
+GET responses carrying ``ETag``/``Last-Modified`` are kept in an
+``HttpResponseCache`` and revalidated with conditional requests on later runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.settings import Settings
+from pipelines.common.http_cache import CachedResponse, HttpResponseCache
+from pipelines.common.http_client import HttpClientConfig
+
+_RETRY_AFTER_STATUSES = {429, 503}
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+@dataclass
+class _HostGate:
+    semaphore: asyncio.Semaphore
+    min_interval_seconds: float
+    next_slot: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    async def acquire(self) -> None:
+        await self.semaphore.acquire()
+        if self.min_interval_seconds <= 0:
+            return
+        async with self.lock:
+            now = asyncio.get_running_loop().time()
+            wait_seconds = max(self.next_slot - now, 0.0)
+            self.next_slot = max(self.next_slot, now) + self.min_interval_seconds
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+    def release(self) -> None:
+        self.semaphore.release()
+
+
+@dataclass(frozen=True)
+class AsyncHttpClientLimits:
+    max_connections: int = 20
+    host_concurrency: int = 4
+    host_rate_limit_per_second: float = 0.0
+
+    @property
+    def host_min_interval_seconds(self) -> float:
+        if self.host_rate_limit_per_second <= 0:
+            return 0.0
+        return 1.0 / self.host_rate_limit_per_second
+
+
+class AsyncHttpClient:
+    """Use as ``async with AsyncHttpClient.from_settings(settings) as client: ...``."""
+
+    def __init__(
+        self,
+        config: HttpClientConfig,
+        *,
+        limits: AsyncHttpClientLimits | None = None,
+        cache: HttpResponseCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.config = config
+        self.limits = limits or AsyncHttpClientLimits()
+        self.cache = cache
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._gates: dict[str, _HostGate] = {}
+        self.stats = {"requests": 0, "not_modified": 0, "retries": 0}
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Settings,
+        *,
+        timeout_seconds: int | None = None,
+        max_retries: int | None = None,
+        backoff_seconds: float | None = None,
+        use_cache: bool | None = None,
+        host_concurrency: int | None = None,
+        host_rate_limit_per_second: float | None = None,
+    ) -> AsyncHttpClient:
+        config = HttpClientConfig(
+            timeout_seconds=timeout_seconds or settings.request_timeout_seconds,
+            max_retries=max_retries if max_retries is not None else settings.http_max_retries,
+            backoff_seconds=backoff_seconds or settings.http_backoff_seconds,
+        )
+        limits = AsyncHttpClientLimits(
+            max_connections=settings.http_max_connections,
+            host_concurrency=host_concurrency or settings.http_host_concurrency,
+            host_rate_limit_per_second=(
+                host_rate_limit_per_second
+                if host_rate_limit_per_second is not None
+                else settings.http_host_rate_limit_per_second
+            ),
+        )
+        cache_enabled = settings.http_cache_enabled if use_cache is None else use_cache
+        cache = HttpResponseCache(settings.http_cache_root) if cache_enabled else None
+        return cls(config, limits=limits, cache=cache)
+
+    async def __aenter__(self) -> AsyncHttpClient:
+        self._ensure_client()
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.config.timeout_seconds,
+                follow_redirects=True,
+                trust_env=False,
+                transport=self._transport,
+                limits=httpx.Limits(
+                    max_connections=self.limits.max_connections,
+                    max_keepalive_connections=self.limits.max_connections,
+                ),
+            )
+        return self._client
+
+    def _gate_for(self, url: str) -> _HostGate:
+        host = httpx.URL(url).host
+        gate = self._gates.get(host)
+        if gate is None:
+            gate = _HostGate(
+                semaphore=asyncio.Semaphore(max(1, self.limits.host_concurrency)),
+                min_interval_seconds=self.limits.host_min_interval_seconds,
+            )
+            self._gates[host] = gate
+        return gate
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        delay = self.config.backoff_seconds * (2**attempt)
+        if response is not None and response.status_code in _RETRY_AFTER_STATUSES:
+            retry_after = response.headers.get("retry-after", "").strip()
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), _MAX_RETRY_AFTER_SECONDS))
+        return delay
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        client = self._ensure_client()
+        gate = self._gate_for(url)
+        last_error: Exception | None = None
+        for attempt in range(self.config.max_retries + 1):
+            response: httpx.Response | None = None
+            await gate.acquire()
+            try:
+                self.stats["requests"] += 1
+                response = await client.request(method, url, **kwargs)
+                if response.status_code == 304:
+                    return response
+                response.raise_for_status()
+                return response
+            except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+                last_error = exc
+            finally:
+                gate.release()
+            if attempt >= self.config.max_retries:
+                break
+            self.stats["retries"] += 1
+            await asyncio.sleep(self._retry_delay(attempt, response))
+        raise RuntimeError(f"Request failed after retries for URL: {url}") from last_error
+
+    async def _get(self, url: str, **kwargs: Any) -> tuple[bytes, str]:
+        cache_key = str(httpx.URL(url, params=kwargs.get("params")))
+        cached: CachedResponse | None = self.cache.get(cache_key) if self.cache else None
+        if cached is not None:
+            kwargs["headers"] = {**cached.conditional_headers(), **(kwargs.get("headers") or {})}
+
+        response = await self._request("GET", url, **kwargs)
+        if response.status_code == 304:
+            if cached is None:
+                raise RuntimeError(f"Unexpected 304 without cached response for URL: {url}")
+            self.stats["not_modified"] += 1
+            return cached.content, cached.content_type
+
+        content_type = response.headers.get("content-type", "")
+        if self.cache is not None:
+            self.cache.put(
+                cache_key,
+                content=response.content,
+                content_type=content_type,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+        return response.content, content_type
+
+    async def get_json(self, url: str, **kwargs: Any) -> Any:
+        content, content_type = await self._get(url, **kwargs)
+        if "json" not in content_type:
+            raise ValueError(f"Unexpected content-type '{content_type}' for URL: {url}")
+        return json.loads(content)
+
+    async def download_bytes(
+        self,
+        url: str,
+        *,
+        expected_content_types: list[str] | None = None,
+        min_bytes: int = 1,
+        **kwargs: Any,
+    ) -> tuple[bytes, str]:
+        payload, content_type = await self._get(url, **kwargs)
+        if expected_content_types and not any(
+            token in content_type for token in expected_content_types
+        ):
+            raise ValueError(f"Unexpected content-type '{content_type}' for URL: {url}")
+        if len(payload) < min_bytes:
+            raise ValueError(f"Payload too small ({len(payload)} bytes) for URL: {url}")
+        return payload, content_type
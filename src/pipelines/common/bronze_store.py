@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import shutil
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from hashlib import sha256
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+import yaml
 
 from app.settings import Settings
 from pipelines.common.manifest import build_manifest, write_manifest
@@ -21,6 +25,10 @@ class BronzeArtifact:
     size_bytes: int
     checksum_sha256: str
     uri: str
+    # From the manifest ``change_detection`` section; empty for older manifests.
+    definition_fingerprint: str = ""
+    etag: str = ""
+    last_modified: str = ""
 
 
 def sha256_file(path: Path) -> str:
@@ -31,7 +39,12 @@ def sha256_file(path: Path) -> str:
     return hasher.hexdigest()
 
 
-def _slug(value: str) -> str:
+def sha256_bytes(payload: bytes) -> str:
+    return sha256(payload).hexdigest()
+
+
+def path_slug(value: str) -> str:
+    """Directory name for a source/dataset/period; shared by the bronze and silver stores."""
     return (
         value.strip()
         .lower()
@@ -63,15 +76,101 @@ def persist_raw_bytes(
     run_id: str | None = None,
     tables_written: list[str] | None = None,
     rows_written: list[dict[str, int]] | None = None,
+    change_detection: dict[str, str] | None = None,
+) -> BronzeArtifact:
+    return _persist_raw(
+        write_raw=lambda raw_path: raw_path.write_bytes(raw_bytes),
+        settings=settings,
+        source=source,
+        dataset=dataset,
+        reference_period=reference_period,
+        extension=extension,
+        uri=uri,
+        territory_scope=territory_scope,
+        dataset_version=dataset_version,
+        checks=checks,
+        notes=notes,
+        extracted_at=extracted_at,
+        run_id=run_id,
+        tables_written=tables_written,
+        rows_written=rows_written,
+        change_detection=change_detection,
+    )
+
+
+def persist_raw_stream(
+    *,
+    settings: Settings,
+    source: str,
+    dataset: str,
+    reference_period: str,
+    raw_stream: BinaryIO,
+    extension: str,
+    uri: str,
+    territory_scope: str,
+    dataset_version: str = "unknown",
+    checks: list[dict[str, str]] | None = None,
+    notes: str = "",
+    extracted_at: datetime | None = None,
+    run_id: str | None = None,
+    tables_written: list[str] | None = None,
+    rows_written: list[dict[str, int]] | None = None,
+    change_detection: dict[str, str] | None = None,
+) -> BronzeArtifact:
+    """Same as ``persist_raw_bytes`` but copies a seekable stream from its start in chunks."""
+
+    def _write_stream(raw_path: Path) -> None:
+        raw_stream.seek(0)
+        with raw_path.open("wb") as file_obj:
+            shutil.copyfileobj(raw_stream, file_obj, length=1024 * 1024)
+
+    return _persist_raw(
+        write_raw=_write_stream,
+        settings=settings,
+        source=source,
+        dataset=dataset,
+        reference_period=reference_period,
+        extension=extension,
+        uri=uri,
+        territory_scope=territory_scope,
+        dataset_version=dataset_version,
+        checks=checks,
+        notes=notes,
+        extracted_at=extracted_at,
+        run_id=run_id,
+        tables_written=tables_written,
+        rows_written=rows_written,
+        change_detection=change_detection,
+    )
+
+
+def _persist_raw(
+    *,
+    write_raw: Callable[[Path], Any],
+    settings: Settings,
+    source: str,
+    dataset: str,
+    reference_period: str,
+    extension: str,
+    uri: str,
+    territory_scope: str,
+    dataset_version: str,
+    checks: list[dict[str, str]] | None,
+    notes: str,
+    extracted_at: datetime | None,
+    run_id: str | None,
+    tables_written: list[str] | None,
+    rows_written: list[dict[str, int]] | None,
+    change_detection: dict[str, str] | None,
 ) -> BronzeArtifact:
     extracted_at = extracted_at or datetime.now(UTC)
     if extracted_at.tzinfo is None:
         extracted_at = extracted_at.replace(tzinfo=UTC)
     extracted_at_utc = extracted_at.replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
-    source_slug = _slug(source)
-    dataset_slug = _slug(dataset)
-    period_slug = _slug(reference_period)
+    source_slug = path_slug(source)
+    dataset_slug = path_slug(dataset)
+    period_slug = path_slug(reference_period)
     ts_folder = _timestamp_folder(extracted_at)
     safe_extension = extension if extension.startswith(".") else f".{extension}"
 
@@ -80,7 +179,7 @@ def persist_raw_bytes(
     )
     bronze_dir.mkdir(parents=True, exist_ok=True)
     raw_path = bronze_dir / f"raw{safe_extension}"
-    raw_path.write_bytes(raw_bytes)
+    write_raw(raw_path)
 
     checksum = sha256_file(raw_path)
     size_bytes = raw_path.stat().st_size
@@ -111,6 +210,7 @@ def persist_raw_bytes(
         run_id=run_id,
         tables_written=tables_written,
         rows_written=rows_written,
+        change_detection=change_detection,
     )
     write_manifest(manifest, manifest_path)
 
@@ -124,7 +224,64 @@ def persist_raw_bytes(
         size_bytes=size_bytes,
         checksum_sha256=checksum,
         uri=uri,
+        **_change_detection_fields(change_detection),
+    )
+
+
+def _change_detection_fields(change_detection: dict[str, Any] | None) -> dict[str, str]:
+    values = change_detection or {}
+    return {
+        "definition_fingerprint": str(values.get("definition_fingerprint") or ""),
+        "etag": str(values.get("etag") or ""),
+        "last_modified": str(values.get("last_modified") or ""),
+    }
+
+
+def find_latest_loaded_artifact(
+    *,
+    settings: Settings,
+    source: str,
+    dataset: str,
+    reference_period: str,
+) -> BronzeArtifact | None:
+    """Return the newest bronze artifact for the key if its run loaded rows into the database.
+
+    Only the most recent manifest is considered: if that run loaded nothing (blocked or
+    empty payload) the caller must not assume the database reflects the artifact.
+    """
+    manifest_dir = (
+        settings.manifests_root
+        / path_slug(source)
+        / path_slug(dataset)
+        / path_slug(reference_period)
     )
+    for manifest_path in sorted(manifest_dir.glob("extracted_at=*.yml"), reverse=True):
+        try:
+            manifest = yaml.safe_load(manifest_path.read_text(encoding="utf-8")) or {}
+            raw = manifest["raw"]
+            rows_written = (manifest.get("load") or {}).get("rows_written") or []
+            change_detection = manifest.get("change_detection") or {}
+            artifact = BronzeArtifact(
+                source=source,
+                dataset=dataset,
+                reference_period=reference_period,
+                extracted_at_utc=str(manifest["extracted_at_utc"]),
+                local_path=Path(raw["local_path"]),
+                manifest_path=manifest_path,
+                size_bytes=int(raw["size_bytes"]),
+                checksum_sha256=str(raw["checksum_sha256"]),
+                uri=str(raw.get("uri") or ""),
+                **_change_detection_fields(change_detection),
+            )
+        except (OSError, KeyError, TypeError, ValueError, AttributeError, yaml.YAMLError):
+            continue
+        loaded_rows = sum(
+            int(entry.get("rows") or 0) for entry in rows_written if isinstance(entry, dict)
+        )
+        if loaded_rows <= 0:
+            return None
+        return artifact
+    return None
 
 
 def artifact_to_dict(artifact: BronzeArtifact) -> dict[str, Any]:
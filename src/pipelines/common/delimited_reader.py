@@ -0,0 +1,223 @@
+"""Delimited text (CSV/TXT) parsing shared by the tabular connectors.
+
+Portals publish the same kind of file in UTF-8 or Latin-1, with ``;``, ``,``,
+tab or ``|`` as delimiter and sometimes behind a few lines of preamble (INMET
+station metadata before the ``Data;Hora`` header). ``read_delimited`` detects
+the encoding, the delimiter and the header row from a bounded sample of the
+payload and parses the whole payload once, instead of running ``pd.read_csv``
+over the full bytes for every encoding/delimiter combination.
+
+The detected ``DelimitedDialect`` is remembered per ``(source, dataset)``: the
+next file of the same feed reuses it as long as its sample still fits (same
+header width), so a weekly rerun skips detection altogether.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+import threading
+from collections import Counter
+from dataclasses import dataclass, replace
+
+import pandas as pd
+
+DEFAULT_ENCODINGS: tuple[str, ...] = ("utf-8", "latin1")
+DEFAULT_SEPARATORS: tuple[str, ...] = (";", ",", "\t", "|")
+SNIFF_SAMPLE_BYTES = 64 * 1024
+_SNIFF_SAMPLE_ROWS = 200
+
+DialectKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class DelimitedDialect:
+    encoding: str
+    sep: str
+    skiprows: int = 0
+    columns: int = 1
+
+
+_DIALECTS: dict[DialectKey, DelimitedDialect] = {}
+_DIALECTS_LOCK = threading.Lock()
+
+
+def remembered_dialect(key: DialectKey) -> DelimitedDialect | None:
+    with _DIALECTS_LOCK:
+        return _DIALECTS.get(key)
+
+
+def forget_dialects() -> None:
+    with _DIALECTS_LOCK:
+        _DIALECTS.clear()
+
+
+def detect_encoding(sample: bytes, encodings: tuple[str, ...] = DEFAULT_ENCODINGS) -> str:
+    """First encoding that decodes ``sample`` (a multi-byte character cut at the end is fine)."""
+    for encoding in encodings:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return encodings[-1]
+
+
+def _sample_text(sample: bytes, encoding: str, *, truncated: bool) -> str:
+    text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(sample, final=False)
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    if truncated:
+        # The last line is most likely cut in the middle; don't let it skew the counts.
+        text = text[: max(text.rfind("\n"), 0)]
+    return text
+
+
+def _field_counts(text: str, sep: str) -> list[int]:
+    """Fields per physical row of ``text``; blank rows count as 0."""
+    try:
+        reader = csv.reader(io.StringIO(text), delimiter=sep, strict=False)
+        counts = []
+        for row in reader:
+            counts.append(len(row))
+            if len(counts) >= _SNIFF_SAMPLE_ROWS:
+                break
+        return counts
+    except csv.Error:
+        return []
+
+
+def _header_index(counts: list[int], columns: int) -> int:
+    # Preamble rows (``REGIAO:;SE``) are much narrower than the table below them.
+    for index, count in enumerate(counts):
+        if count * 2 > columns:
+            return index
+    return 0
+
+
+def _dialect_candidates(
+    text: str,
+    *,
+    encoding: str,
+    separators: tuple[str, ...],
+) -> list[tuple[tuple[bool, float, int], DelimitedDialect]]:
+    scored = []
+    for order, sep in enumerate(separators):
+        counts = _field_counts(text, sep)
+        non_blank = [count for count in counts if count]
+        if not non_blank:
+            scored.append(((False, 0.0, 0), -order, DelimitedDialect(encoding, sep)))
+            continue
+        frequencies = Counter(non_blank)
+        columns = max(frequencies, key=lambda count: (frequencies[count], count))
+        header = _header_index(counts, columns)
+        table = [count for count in counts[header:] if count]
+        consistency = round(sum(1 for count in table if count == columns) / len(table), 1)
+        dialect = DelimitedDialect(encoding, sep, skiprows=header, columns=columns)
+        scored.append(((columns > 1, consistency, columns), -order, dialect))
+    scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [(score, dialect) for score, _order, dialect in scored]
+
+
+def sniff_dialect(
+    sample: bytes,
+    *,
+    truncated: bool = False,
+    encodings: tuple[str, ...] = DEFAULT_ENCODINGS,
+    separators: tuple[str, ...] = DEFAULT_SEPARATORS,
+) -> list[DelimitedDialect]:
+    """Candidate dialects for ``sample``, most plausible first.
+
+    A delimiter ranks higher when it splits the rows into more than one column,
+    when more rows agree on the column count and then when it yields more columns.
+    Remaining encodings follow as fallbacks with the same delimiter order.
+    """
+    encoding = detect_encoding(sample, encodings)
+    text = _sample_text(sample, encoding, truncated=truncated)
+    ranked = [
+        dialect
+        for _score, dialect in _dialect_candidates(text, encoding=encoding, separators=separators)
+    ]
+    fallbacks = [
+        replace(dialect, encoding=other)
+        for other in encodings
+        if other != encoding
+        for dialect in ranked
+    ]
+    return ranked + fallbacks
+
+
+def _fits(dialect: DelimitedDialect, sample: bytes, *, truncated: bool) -> bool:
+    try:
+        codecs.getincrementaldecoder(dialect.encoding)().decode(sample, final=False)
+    except (LookupError, UnicodeDecodeError):
+        return False
+    counts = _field_counts(_sample_text(sample, dialect.encoding, truncated=truncated), dialect.sep)
+    return len(counts) > dialect.skiprows and counts[dialect.skiprows] == dialect.columns
+
+
+def _parse(raw_bytes: bytes, dialect: DelimitedDialect) -> pd.DataFrame:
+    return pd.read_csv(
+        io.BytesIO(raw_bytes),
+        encoding=dialect.encoding,
+        sep=dialect.sep,
+        skiprows=dialect.skiprows,
+        low_memory=False,
+    )
+
+
+def read_delimited(
+    raw_bytes: bytes,
+    *,
+    dialect_key: DialectKey | None = None,
+    encodings: tuple[str, ...] = DEFAULT_ENCODINGS,
+    separators: tuple[str, ...] = DEFAULT_SEPARATORS,
+    sample_bytes: int = SNIFF_SAMPLE_BYTES,
+) -> pd.DataFrame:
+    """Parse a delimited payload with the dialect detected from its first ``sample_bytes``.
+
+    Only when the full parse fails (the sample hid invalid UTF-8 further down,
+    or a ragged row) is the next candidate dialect tried.
+    """
+    sample = raw_bytes[:sample_bytes]
+    truncated = len(raw_bytes) > sample_bytes
+    remembered = remembered_dialect(dialect_key) if dialect_key is not None else None
+    if (
+        remembered is not None
+        and remembered.encoding in encodings
+        and remembered.sep in separators
+        and _fits(remembered, sample, truncated=truncated)
+    ):
+        candidates = [remembered]
+    else:
+        remembered = None
+        candidates = sniff_dialect(
+            sample, truncated=truncated, encodings=encodings, separators=separators
+        )
+
+    last_error: Exception | None = None
+    tried: set[DelimitedDialect] = set()
+    while candidates:
+        dialect = candidates.pop(0)
+        if dialect in tried:
+            continue
+        tried.add(dialect)
+        try:
+            dataframe = _parse(raw_bytes, dialect)
+        except Exception as exc:
+            last_error = exc
+            if isinstance(exc, UnicodeDecodeError):
+                # Another delimiter won't fix the encoding; move on to the next one.
+                candidates = [item for item in candidates if item.encoding != dialect.encoding]
+            if not candidates and dialect == remembered:
+                candidates = sniff_dialect(
+                    sample, truncated=truncated, encodings=encodings, separators=separators
+                )
+            continue
+        if dialect_key is not None:
+            with _DIALECTS_LOCK:
+                _DIALECTS[dialect_key] = dialect
+        return dataframe
+
+    raise ValueError(f"Could not parse CSV/TXT with supported encodings/delimiters: {last_error}")
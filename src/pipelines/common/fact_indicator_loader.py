@@ -0,0 +1,160 @@
+"""Set-based bulk upsert of indicator rows into ``silver.fact_indicator``.
+
+Rows are streamed into a transaction-scoped staging table with ``COPY`` (plain
+``executemany`` inserts when the DBAPI driver has no COPY support) and merged
+into the fact table with a single ``INSERT ... SELECT ... ON CONFLICT``. Rows
+whose name, unit and value did not change are left untouched, so
+``updated_at`` only moves when the indicator actually changed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import text
+
+STAGE_TABLE = "_stage_fact_indicator"
+FACT_INDICATOR_COLUMNS = (
+    "territory_id",
+    "source",
+    "dataset",
+    "indicator_code",
+    "indicator_name",
+    "unit",
+    "category",
+    "value",
+    "reference_period",
+)
+_STAGE_COLUMNS = ("load_seq", *FACT_INDICATOR_COLUMNS)
+_CONFLICT_KEY = "territory_id, source, dataset, indicator_code, category, reference_period"
+
+_CREATE_STAGE_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} (
+    load_seq BIGINT NOT NULL,
+    territory_id UUID NOT NULL,
+    source TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    indicator_code TEXT NOT NULL,
+    indicator_name TEXT NOT NULL,
+    unit TEXT NULL,
+    category TEXT NULL,
+    value NUMERIC NOT NULL,
+    reference_period TEXT NOT NULL
+) ON COMMIT DROP
+"""
+
+_MERGE_SQL = f"""
+WITH staged AS (
+    SELECT DISTINCT ON ({_CONFLICT_KEY})
+        {", ".join(FACT_INDICATOR_COLUMNS)}
+    FROM {STAGE_TABLE}
+    ORDER BY {_CONFLICT_KEY}, load_seq DESC
+),
+merged AS (
+    INSERT INTO silver.fact_indicator ({", ".join(FACT_INDICATOR_COLUMNS)})
+    SELECT {", ".join(FACT_INDICATOR_COLUMNS)}
+    FROM staged
+    ON CONFLICT ({_CONFLICT_KEY})
+    DO UPDATE SET
+        indicator_name = EXCLUDED.indicator_name,
+        unit = EXCLUDED.unit,
+        value = EXCLUDED.value,
+        updated_at = NOW()
+    WHERE silver.fact_indicator.indicator_name IS DISTINCT FROM EXCLUDED.indicator_name
+       OR silver.fact_indicator.unit IS DISTINCT FROM EXCLUDED.unit
+       OR silver.fact_indicator.value IS DISTINCT FROM EXCLUDED.value
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    (SELECT COUNT(*) FROM staged) AS staged_rows,
+    COUNT(*) FILTER (WHERE inserted) AS inserted_rows,
+    COUNT(*) FILTER (WHERE NOT inserted) AS updated_rows
+FROM merged
+"""
+
+
+@dataclass(frozen=True)
+class FactIndicatorLoadResult:
+    staged: int
+    inserted: int
+    updated: int
+
+    @property
+    def unchanged(self) -> int:
+        return max(self.staged - self.inserted - self.updated, 0)
+
+    @property
+    def rows_written(self) -> int:
+        """Rows accepted by the merge (inserted, updated or already current)."""
+        return self.staged
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "staged": self.staged,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+        }
+
+
+def _stage_tuple(seq: int, row: Mapping[str, Any]) -> tuple[Any, ...]:
+    value = row["value"]
+    return (
+        seq,
+        str(row["territory_id"]),
+        row["source"],
+        row["dataset"],
+        row["indicator_code"],
+        row["indicator_name"],
+        row.get("unit"),
+        row.get("category"),
+        None if value is None else str(value),
+        str(row["reference_period"]),
+    )
+
+
+def _copy_into_stage(session: Any, staged_rows: list[tuple[Any, ...]]) -> bool:
+    driver_connection = getattr(session.connection().connection, "driver_connection", None)
+    cursor_factory = getattr(driver_connection, "cursor", None)
+    if cursor_factory is None:
+        return False
+    with cursor_factory() as cursor:
+        if not hasattr(cursor, "copy"):
+            return False
+        copy_sql = f"COPY {STAGE_TABLE} ({', '.join(_STAGE_COLUMNS)}) FROM STDIN"
+        with cursor.copy(copy_sql) as copy:
+            for staged_row in staged_rows:
+                copy.write_row(staged_row)
+    return True
+
+
+def _insert_into_stage(session: Any, staged_rows: list[tuple[Any, ...]]) -> None:
+    placeholders = ", ".join(f":{column}" for column in _STAGE_COLUMNS)
+    session.execute(
+        text(f"INSERT INTO {STAGE_TABLE} ({', '.join(_STAGE_COLUMNS)}) VALUES ({placeholders})"),
+        [dict(zip(_STAGE_COLUMNS, staged_row, strict=True)) for staged_row in staged_rows],
+    )
+
+
+def bulk_upsert_fact_indicators(
+    session: Any,
+    rows: Iterable[Mapping[str, Any]],
+) -> FactIndicatorLoadResult:
+    """Upsert indicator rows in one round trip per batch; the last duplicate key wins."""
+    staged_rows = [_stage_tuple(seq, row) for seq, row in enumerate(rows)]
+    if not staged_rows:
+        return FactIndicatorLoadResult(staged=0, inserted=0, updated=0)
+
+    session.execute(text(_CREATE_STAGE_SQL))
+    session.execute(text(f"TRUNCATE {STAGE_TABLE}"))
+    if not _copy_into_stage(session, staged_rows):
+        _insert_into_stage(session, staged_rows)
+
+    counts = session.execute(text(_MERGE_SQL)).mappings().one()
+    return FactIndicatorLoadResult(
+        staged=int(counts["staged_rows"] or 0),
+        inserted=int(counts["inserted_rows"] or 0),
+        updated=int(counts["updated_rows"] or 0),
+    )
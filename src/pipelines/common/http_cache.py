@@ -0,0 +1,93 @@
+"""On-disk cache of HTTP response bodies keyed by URL, used for conditional GETs.
+
+Each entry keeps the body next to a small JSON sidecar holding the validators
+(``ETag``/``Last-Modified``) returned by the upstream server. Connectors send
+them back as ``If-None-Match``/``If-Modified-Since`` and reuse the cached body
+when the server answers ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    content: bytes
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpResponseCache:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = self.root / key[:2] / key
+        return base.with_suffix(".json"), base.with_suffix(".body")
+
+    def get(self, url: str) -> CachedResponse | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            content = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return CachedResponse(
+            url=url,
+            content=content,
+            content_type=str(meta.get("content_type") or ""),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def put(
+        self,
+        url: str,
+        *,
+        content: bytes,
+        content_type: str,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> bool:
+        """Store ``content`` when the server sent a validator; return whether it was cached."""
+        if not etag and not last_modified:
+            return False
+        meta_path, body_path = self._paths(url)
+        meta: dict[str, Any] = {
+            "url": url,
+            "content_type": content_type,
+            "etag": etag,
+            "last_modified": last_modified,
+            "size_bytes": len(content),
+        }
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        # Body first, sidecar last: a reader only trusts entries whose sidecar exists.
+        _atomic_write(body_path, content)
+        _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        return True
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, BinaryIO
 
 import httpx
 
@@ -16,6 +16,32 @@ class HttpClientConfig:
     backoff_seconds: float
 
 
+@dataclass(frozen=True)
+class HttpValidators:
+    """``ETag`` / ``Last-Modified`` of a response, replayed on the next conditional GET."""
+
+    etag: str = ""
+    last_modified: str = ""
+
+    @classmethod
+    def from_headers(cls, headers: httpx.Headers) -> HttpValidators:
+        return cls(
+            etag=headers.get("etag", ""),
+            last_modified=headers.get("last-modified", ""),
+        )
+
+    def request_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
 class HttpClient:
     def __init__(self, config: HttpClientConfig):
         self.config = config
@@ -40,11 +66,20 @@ class HttpClient:
     def close(self) -> None:
         self.client.close()
 
-    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        allow_not_modified: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
         last_error: Exception | None = None
         for attempt in range(self.config.max_retries + 1):
             try:
                 response = self.client.request(method, url, **kwargs)
+                if allow_not_modified and response.status_code == 304:
+                    return response
                 response.raise_for_status()
                 return response
             except (httpx.RequestError, httpx.HTTPStatusError) as exc:
@@ -78,3 +113,78 @@ class HttpClient:
         if len(payload) < min_bytes:
             raise ValueError(f"Payload too small ({len(payload)} bytes) for URL: {url}")
         return payload, content_type
+
+    def download_bytes_if_modified(
+        self,
+        url: str,
+        *,
+        validators: HttpValidators | None = None,
+        expected_content_types: list[str] | None = None,
+        min_bytes: int = 1,
+        **kwargs: Any,
+    ) -> tuple[bytes | None, str, HttpValidators]:
+        """Conditional GET: ``None`` instead of the payload when the server answers 304.
+
+        ``validators`` from a previous response become ``If-None-Match`` /
+        ``If-Modified-Since``; the validators of this response are returned so the
+        caller can store them for the next run.
+        """
+        headers = {**(kwargs.pop("headers", None) or {})}
+        if validators:
+            headers.update(validators.request_headers())
+        response = self._request("GET", url, allow_not_modified=True, headers=headers, **kwargs)
+        if response.status_code == 304:
+            return None, response.headers.get("content-type", ""), validators or HttpValidators()
+        content_type = response.headers.get("content-type", "")
+        if expected_content_types and not any(
+            token in content_type for token in expected_content_types
+        ):
+            raise ValueError(f"Unexpected content-type '{content_type}' for URL: {url}")
+        payload = response.content
+        if len(payload) < min_bytes:
+            raise ValueError(f"Payload too small ({len(payload)} bytes) for URL: {url}")
+        return payload, content_type, HttpValidators.from_headers(response.headers)
+
+    def download_to_file(
+        self,
+        url: str,
+        destination: BinaryIO,
+        *,
+        expected_content_types: list[str] | None = None,
+        min_bytes: int = 1,
+        chunk_size: int = 1024 * 1024,
+        **kwargs: Any,
+    ) -> tuple[int, str]:
+        """Stream the response body into ``destination`` without buffering it in memory.
+
+        ``destination`` must be seekable: it is rewound and truncated before every attempt.
+        """
+        last_error: Exception | None = None
+        for attempt in range(self.config.max_retries + 1):
+            destination.seek(0)
+            destination.truncate()
+            try:
+                with self.client.stream("GET", url, **kwargs) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get("content-type", "")
+                    if expected_content_types and not any(
+                        token in content_type for token in expected_content_types
+                    ):
+                        raise ValueError(f"Unexpected content-type '{content_type}' for URL: {url}")
+                    size = 0
+                    for chunk in response.iter_bytes(chunk_size):
+                        destination.write(chunk)
+                        size += len(chunk)
+                break
+            except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+                last_error = exc
+                if attempt >= self.config.max_retries:
+                    raise RuntimeError(
+                        f"Request failed after retries for URL: {url}"
+                    ) from last_error
+                time.sleep(self.config.backoff_seconds * (2**attempt))
+        if size < min_bytes:
+            raise ValueError(f"Payload too small ({size} bytes) for URL: {url}")
+        destination.flush()
+        destination.seek(0)
+        return size, content_type
@@ -47,8 +47,9 @@ def build_manifest(
     notes: str = "",
     extracted_at_utc: str | None = None,
     run_id: str | None = None,
+    change_detection: dict[str, str] | None = None,
 ) -> dict[str, Any]:
-    return {
+    manifest: dict[str, Any] = {
         "source": source,
         "dataset": dataset,
         "dataset_version": dataset_version,
@@ -80,6 +81,10 @@ def build_manifest(
         },
         "notes": notes,
     }
+    if change_detection:
+        # What a later run compares before re-processing the same source (see bronze_store).
+        manifest["change_detection"] = dict(change_detection)
+    return manifest
 
 
 def validate_manifest(manifest: dict[str, Any]) -> list[str]:
@@ -6,8 +6,11 @@ import json
 from typing import Any
 
 from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.data_version import bump_data_version, data_domain_for_job
+from app.logging import get_logger
 from pipelines.common.quality import CheckResult
 
 
@@ -124,6 +127,17 @@ def upsert_pipeline_run(
         },
     )
 
+    domain = data_domain_for_job(job_name)
+    if status == "success" and rows_loaded > 0 and domain is not None:
+        # Savepoint keeps the run record even when ops.data_versions is missing.
+        try:
+            with session.begin_nested():
+                bump_data_version(session, domain=domain, job_name=job_name, run_id=run_id)
+        except SQLAlchemyError:
+            get_logger("observability").warning(
+                "Could not bump data version.", job_name=job_name, domain=domain
+            )
+
 
 def replace_pipeline_checks(
     *,
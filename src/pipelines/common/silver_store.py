@@ -0,0 +1,149 @@
+"""Parquet cache of parsed and filtered source frames under ``settings.silver_root``.
+
+Bronze keeps the raw payload; parsing it again (statewide CSVs, XLSX inside
+zips) is what makes a forced rerun or a backfill slow, even when only the
+indicator catalog changed (a changed connector definition fingerprint makes the
+tabular connectors reprocess an unchanged payload, see
+``tabular_indicator_connector._definition_fingerprint``). The connectors
+therefore store the frame they derive from a payload - normalized columns,
+municipality rows, reference year applied - and use it as-is, keyed by
+``(source, dataset, reference_period, checksum)`` plus a variant hash of
+everything else the filtering depends on. A later run with the same payload
+reads it back through a memory-mapped Arrow reader instead of parsing.
+
+Object columns are stored as text (``None`` for missing cells): the connector
+only ever reads them through ``str()`` based normalization, and Parquet needs a
+single type per column.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import pandas as pd
+
+from app.logging import get_logger
+from app.settings import Settings
+from pipelines.common.bronze_store import path_slug
+
+SILVER_FRAME_FORMAT_VERSION = 1
+ROWS_EXTRACTED_ATTR = "rows_extracted"
+_METADATA_PREFIX = "tip."
+
+
+@dataclass(frozen=True)
+class SilverFrameKey:
+    source: str
+    dataset: str
+    reference_period: str
+    checksum_sha256: str
+    variant: str = ""
+
+
+def frame_variant(**parameters: Any) -> str:
+    """Short stable hash of the parameters a cached frame was filtered with."""
+    payload = json.dumps(
+        {"format": SILVER_FRAME_FORMAT_VERSION, **parameters},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def silver_frame_path(settings: Settings, key: SilverFrameKey) -> Path:
+    file_name = key.checksum_sha256
+    if key.variant:
+        file_name = f"{file_name}-{key.variant}"
+    return (
+        settings.silver_root
+        / "frames"
+        / path_slug(key.source)
+        / path_slug(key.dataset)
+        / path_slug(key.reference_period)
+        / f"{file_name}.parquet"
+    )
+
+
+def _text_or_none(value: Any) -> str | None:
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return str(value)
+
+
+def _to_storable(frame: pd.DataFrame) -> pd.DataFrame:
+    storable = frame.reset_index(drop=True)
+    storable.columns = [str(column) for column in storable.columns]
+    for column in storable.columns:
+        if storable[column].dtype == object:
+            storable[column] = storable[column].map(_text_or_none)
+    return storable
+
+
+def write_silver_frame(
+    settings: Settings,
+    key: SilverFrameKey,
+    frame: pd.DataFrame,
+    *,
+    rows_extracted: int,
+) -> Path | None:
+    """Write ``frame`` atomically; returns ``None`` (and logs) when it cannot be stored."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+
+    path = silver_frame_path(settings, key)
+    tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        table = pa.Table.from_pandas(_to_storable(frame), preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[f"{_METADATA_PREFIX}{ROWS_EXTRACTED_ATTR}".encode()] = str(rows_extracted).encode()
+        metadata[f"{_METADATA_PREFIX}source".encode()] = key.source.encode("utf-8")
+        metadata[f"{_METADATA_PREFIX}dataset".encode()] = key.dataset.encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    except Exception as exc:
+        tmp_path.unlink(missing_ok=True)
+        get_logger("silver_store").warning(
+            "Could not write silver frame.", path=path.as_posix(), error=str(exc)
+        )
+        return None
+    return path
+
+
+def read_silver_frame(settings: Settings, key: SilverFrameKey) -> pd.DataFrame | None:
+    """Cached frame for ``key`` or ``None``.
+
+    ``frame.attrs["rows_extracted"]`` carries the row count of the full parsed
+    payload, so run summaries stay the same on a cache hit. A missing, partial
+    or unreadable file is a miss.
+    """
+    path = silver_frame_path(settings, key)
+    if not path.exists():
+        return None
+    try:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path, memory_map=True)
+        frame = table.to_pandas()
+        metadata = table.schema.metadata or {}
+        raw_rows = metadata.get(f"{_METADATA_PREFIX}{ROWS_EXTRACTED_ATTR}".encode(), b"")
+        rows_extracted = int(raw_rows.decode() or len(frame))
+    except Exception as exc:
+        get_logger("silver_store").warning(
+            "Could not read silver frame; parsing the payload again.",
+            path=path.as_posix(),
+            error=str(exc),
+        )
+        return None
+    frame.attrs[ROWS_EXTRACTED_ATTR] = rows_extracted
+    return frame
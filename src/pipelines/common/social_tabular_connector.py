@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Literal
 from uuid import uuid4
 
+import pandas as pd
 from sqlalchemy import text
 
 from app.db import session_scope
@@ -104,7 +105,7 @@ def _validate_sql_identifiers(definition: SocialConnectorDefinition) -> None:
 
 
 def _aggregate_metric(
-    municipality_rows: list[dict[str, Any]],
+    municipality_rows: pd.DataFrame,
     *,
     candidates: tuple[str, ...],
     aggregator: str,
@@ -125,7 +126,7 @@ def _build_metrics_output(
     *,
     territory_id: str,
     reference_period: str,
-    municipality_rows: list[dict[str, Any]],
+    municipality_rows: pd.DataFrame,
 ) -> tuple[dict[str, Decimal | None], list[dict[str, Any]]]:
     metric_values: dict[str, Decimal | None] = {}
     indicator_rows: list[dict[str, Any]] = []
@@ -242,6 +243,7 @@ def run_social_connector(
             municipality_name=municipality_name,
             municipality_ibge_code=municipality_ibge_code,
             client=client,
+            settings=None if dry_run else settings,
         )
         if dataset is None:
             warnings.append(
@@ -301,22 +303,11 @@ def run_social_connector(
 
         df, raw_bytes, source_suffix, source_type, source_uri, source_file_name, source_warnings = dataset
         warnings.extend(source_warnings)
-        rows_extracted = int(len(df))
+        rows_extracted = tabular._rows_extracted(df)
 
-        municipality_rows = tabular._resolve_municipality_rows(
-            df,
-            municipality_ibge_code=municipality_ibge_code,
-            municipality_name=municipality_name,
-            code_columns=definition.municipality_code_columns,
-            name_columns=definition.municipality_name_columns,
-            source_file_name=source_file_name,
-        )
-        municipality_rows = tabular._filter_rows_by_reference_year(
-            municipality_rows,
-            year=parsed_reference_period,
-            year_columns=definition.reference_year_columns,
-        )
-        if not municipality_rows:
+        # Already reduced to the municipality rows of the reference year by the resolver.
+        municipality_rows = df
+        if municipality_rows.empty:
             warnings.append(
                 f"{definition.source} row not found for municipality code/name "
                 f"({municipality_ibge_code}/{municipality_name})."
@@ -386,7 +377,7 @@ def run_social_connector(
             },
             {
                 "name": f"{check_prefix}_municipality_rows_found",
-                "status": "pass" if municipality_rows else "warn",
+                "status": "pass" if not municipality_rows.empty else "warn",
                 "details": f"Municipality rows matched: {len(municipality_rows)}.",
                 "observed_value": len(municipality_rows),
                 "threshold_value": 1,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import json
 import math
@@ -7,7 +8,8 @@ import re
 import time
 import unicodedata
 import zipfile
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
@@ -21,9 +23,27 @@ from sqlalchemy import text
 from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
-from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
-from pipelines.common.http_client import HttpClient
+from pipelines.common.bronze_store import (
+    BronzeArtifact,
+    artifact_to_dict,
+    find_latest_loaded_artifact,
+    persist_raw_bytes,
+    sha256_bytes,
+)
+from pipelines.common.delimited_reader import DialectKey, read_delimited
+from pipelines.common.fact_indicator_loader import (
+    FactIndicatorLoadResult,
+    bulk_upsert_fact_indicators,
+)
+from pipelines.common.http_client import HttpClient, HttpValidators
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
+from pipelines.common.silver_store import (
+    ROWS_EXTRACTED_ATTR,
+    SilverFrameKey,
+    frame_variant,
+    read_silver_frame,
+    write_silver_frame,
+)
 
 _DEFAULT_MUNICIPALITY_CODE_COLUMNS = (
     "municipio_ibge",
@@ -78,6 +98,28 @@ class TabularConnectorDefinition:
 ResolvedDataset = tuple[pd.DataFrame, bytes, str, str, str, str]
 
 
+class _SourceUnchanged(Exception):
+    """Raised before parsing when the payload matches the last loaded bronze artifact.
+
+    ``detected_by`` is ``"checksum"`` when the downloaded payload hashed to the bronze
+    checksum and ``"not_modified"`` when the server answered a conditional GET with 304.
+    """
+
+    def __init__(
+        self,
+        *,
+        source_type: str,
+        source_uri: str,
+        source_file_name: str,
+        detected_by: Literal["checksum", "not_modified"] = "checksum",
+    ):
+        super().__init__(f"{source_type} source '{source_file_name}' unchanged since last load.")
+        self.source_type = source_type
+        self.source_uri = source_uri
+        self.source_file_name = source_file_name
+        self.detected_by = detected_by
+
+
 def _normalize_text(value: str) -> str:
     stripped = value.strip().casefold()
     normalized = unicodedata.normalize("NFKD", stripped)
@@ -126,6 +168,34 @@ def _parse_numeric(value: Any) -> Decimal | None:
         return None
 
 
+def _definition_fingerprint(
+    definition: TabularConnectorDefinition,
+    resources: list[dict[str, Any]],
+) -> str:
+    """Hash of everything besides the payload that shapes the loaded indicator rows.
+
+    Stored in the bronze manifest; a source is only skipped as unchanged when both
+    the payload checksum and this fingerprint match the last load.
+    """
+    payload = json.dumps(
+        {
+            "resources": resources,
+            "indicator_specs": [asdict(spec) for spec in definition.indicator_specs],
+            "fact_dataset_name": definition.fact_dataset_name,
+            "dataset_version": definition.dataset_version,
+            "territory_scope": definition.territory_scope,
+            "municipality_code_columns": definition.municipality_code_columns,
+            "municipality_name_columns": definition.municipality_name_columns,
+            "reference_year_columns": definition.reference_year_columns,
+            "prefer_manual_first": definition.prefer_manual_first,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def _load_catalog(path: Path) -> list[dict[str, Any]]:
     if not path.exists():
         return []
@@ -187,47 +257,6 @@ def _extract_tabular_bytes_from_zip(
         return archive.read(selected), Path(selected).suffix.casefold()
 
 
-def _read_delimited_with_fallback(raw_bytes: bytes) -> pd.DataFrame:
-    best_df: pd.DataFrame | None = None
-    best_score: tuple[int, int] = (-1, -1)
-
-    for encoding in ("utf-8", "latin1"):
-        text = raw_bytes.decode(encoding, errors="replace")
-        lines = text.splitlines()
-        for idx, line in enumerate(lines):
-            normalized = _normalize_text(line)
-            if normalized.startswith("data;hora"):
-                try:
-                    inmet_df = pd.read_csv(
-                        io.BytesIO(raw_bytes),
-                        encoding=encoding,
-                        sep=";",
-                        skiprows=idx,
-                        low_memory=False,
-                    )
-                    score = (len(inmet_df.columns), int(len(inmet_df)))
-                    if score > best_score:
-                        best_df = inmet_df
-                        best_score = score
-                except Exception:
-                    pass
-                break
-
-        for sep in (";", ",", "\t", "|"):
-            try:
-                df = pd.read_csv(io.BytesIO(raw_bytes), encoding=encoding, sep=sep, low_memory=False)
-            except Exception:
-                continue
-            score = (len(df.columns), int(len(df)))
-            if score > best_score:
-                best_df = df
-                best_score = score
-
-    if best_df is None:
-        raise ValueError("Could not parse CSV/TXT with supported encodings/delimiters.")
-    return best_df
-
-
 def _read_json_payload(raw_bytes: bytes) -> pd.DataFrame:
     payload = json.loads(raw_bytes.decode("utf-8"))
     if isinstance(payload, list):
@@ -265,6 +294,7 @@ def _load_dataframe_from_bytes(
     *,
     suffix: str,
     preferred_zip_entry_names: tuple[str, ...] | None = None,
+    dialect_key: DialectKey | None = None,
 ) -> pd.DataFrame:
     normalized_suffix = suffix.casefold()
     if normalized_suffix == ".zip":
@@ -272,9 +302,9 @@ def _load_dataframe_from_bytes(
             raw_bytes,
             preferred_names=preferred_zip_entry_names,
         )
-        return _load_dataframe_from_bytes(inner_bytes, suffix=inner_suffix)
+        return _load_dataframe_from_bytes(inner_bytes, suffix=inner_suffix, dialect_key=dialect_key)
     if normalized_suffix in {".csv", ".txt"}:
-        return _read_delimited_with_fallback(raw_bytes)
+        return read_delimited(raw_bytes, dialect_key=dialect_key)
     if normalized_suffix in {".xlsx", ".xls"}:
         return pd.read_excel(io.BytesIO(raw_bytes))
     if normalized_suffix == ".json":
@@ -290,7 +320,9 @@ def _list_manual_candidates(path: Path) -> list[Path]:
 
 
 def _normalize_dataframe_columns(df: pd.DataFrame) -> pd.DataFrame:
-    return df.rename(columns={col: _normalize_column_name(str(col)) for col in df.columns})
+    normalized = df.rename(columns={col: _normalize_column_name(str(col)) for col in df.columns})
+    # Headers that only differ in accents/case collapse into one name; keep the last one.
+    return normalized.loc[:, ~normalized.columns.duplicated(keep="last")]
 
 
 def _to_digits(value: Any) -> str:
@@ -300,6 +332,37 @@ def _to_digits(value: Any) -> str:
     return "".join(ch for ch in text_value if ch.isdigit())
 
 
+def _map_unique(series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """Apply ``func`` once per distinct value of ``series``.
+
+    Municipality, service and year columns repeat a handful of values over
+    thousands of rows, so normalizing the uniques and broadcasting the result
+    back through the factorized codes replaces a Python call per cell.
+    Missing cells (``None``/``NaN``) are all mapped as ``NaN``.
+    """
+    try:
+        codes, uniques = pd.factorize(series)
+    except TypeError:
+        # Unhashable cells (lists from JSON payloads) are matched on their text.
+        codes, uniques = pd.factorize(series.astype(str))
+    mapped = [func(value) for value in uniques]
+    mapped.append(func(math.nan))
+    return pd.Series(pd.Series(mapped, dtype=object).to_numpy()[codes], index=series.index, dtype=object)
+
+
+def _column_mask(frame: pd.DataFrame, column: str, predicate: Callable[[Any], bool]) -> pd.Series:
+    if column not in frame.columns:
+        return pd.Series(False, index=frame.index)
+    return _map_unique(frame[column], predicate).astype(bool)
+
+
+def _drop_duplicate_rows(frame: pd.DataFrame) -> pd.DataFrame:
+    if frame.empty:
+        return frame
+    signatures = pd.util.hash_pandas_object(frame.astype(str), index=False)
+    return frame.loc[~signatures.duplicated().to_numpy()].reset_index(drop=True)
+
+
 def _resolve_municipality_rows(
     df: pd.DataFrame,
     *,
@@ -308,132 +371,116 @@ def _resolve_municipality_rows(
     code_columns: tuple[str, ...],
     name_columns: tuple[str, ...],
     source_file_name: str | None = None,
-) -> list[dict[str, Any]]:
-    if df.empty:
-        return []
+) -> pd.DataFrame:
     normalized_df = _normalize_dataframe_columns(df)
+    if normalized_df.empty:
+        return normalized_df.reset_index(drop=True)
     target_name = _normalize_text(municipality_name)
     code_candidates = {municipality_ibge_code}
     if len(municipality_ibge_code) >= 6:
         code_candidates.add(municipality_ibge_code[:6])
 
-    matches: list[dict[str, Any]] = []
-    seen_signatures: set[str] = set()
-
     has_code_columns = any(column in normalized_df.columns for column in code_columns)
     has_name_columns = any(column in normalized_df.columns for column in name_columns)
 
-    for _, row in normalized_df.iterrows():
-        row_dict = row.to_dict()
-        signature = json.dumps({k: str(v) for k, v in row_dict.items()}, sort_keys=True, ensure_ascii=False)
-
-        matched_by_code = False
-        for column in code_columns:
-            if column not in normalized_df.columns:
-                continue
-            if _to_digits(row.get(column)) in code_candidates:
-                matched_by_code = True
-                break
-
-        matched_by_name = False
-        if not matched_by_code:
-            for column in name_columns:
-                if column not in normalized_df.columns:
-                    continue
-                row_name = _normalize_text(str(row.get(column, "")))
-                if row_name == target_name or target_name in row_name:
-                    matched_by_name = True
-                    break
-
-        if matched_by_code or matched_by_name:
-            if signature not in seen_signatures:
-                seen_signatures.add(signature)
-                matches.append(row_dict)
+    mask = pd.Series(False, index=normalized_df.index)
+    for column in code_columns:
+        mask |= _column_mask(
+            normalized_df,
+            column,
+            lambda value: _to_digits(value) in code_candidates,
+        )
+    for column in name_columns:
+        mask |= _column_mask(
+            normalized_df,
+            column,
+            lambda value: target_name in _normalize_text(str(value)),
+        )
 
     if (
-        not matches
+        not mask.any()
         and source_file_name
         and not has_code_columns
         and not has_name_columns
         and target_name
         and target_name in _normalize_text(Path(source_file_name).stem)
     ):
-        return [row.to_dict() for _, row in normalized_df.iterrows()]
+        return normalized_df.reset_index(drop=True)
 
-    return matches
-
-
-def _extract_candidate_values(rows: list[dict[str, Any]], candidates: tuple[str, ...]) -> list[Decimal]:
-    return _extract_candidate_values_with_filters(rows, candidates=candidates, row_filters=None)
+    return _drop_duplicate_rows(normalized_df.loc[mask])
 
 
-def _row_matches_filters(
-    row: dict[str, Any],
+def _row_filter_mask(
+    frame: pd.DataFrame,
     *,
     row_filters: dict[str, tuple[str, ...]] | None,
-) -> bool:
+) -> pd.Series:
+    mask = pd.Series(True, index=frame.index)
     if not row_filters:
-        return True
+        return mask
     for raw_column, allowed_values in row_filters.items():
         column = _normalize_column_name(str(raw_column))
-        if column not in row:
-            return False
-        row_value = _normalize_text(str(row.get(column, "")))
+        if column not in frame.columns:
+            return pd.Series(False, index=frame.index)
         allowed_tokens = tuple(_normalize_text(str(item)) for item in allowed_values if str(item).strip())
         if not allowed_tokens:
             continue
-        if not any(token == row_value or token in row_value for token in allowed_tokens):
-            return False
-    return True
+        mask &= _column_mask(
+            frame,
+            column,
+            lambda value, allowed=allowed_tokens: any(
+                token in _normalize_text(str(value)) for token in allowed
+            ),
+        )
+    return mask
+
+
+def _candidate_values(frame: pd.DataFrame, candidates: tuple[str, ...]) -> pd.Series:
+    """First parseable candidate column per row (``None`` when no candidate parses)."""
+    values = pd.Series(None, index=frame.index, dtype=object)
+    for key in candidates:
+        if key not in frame.columns:
+            continue
+        parsed = _map_unique(frame[key], _parse_numeric)
+        values = values.where(values.notna(), parsed)
+    return values
+
+
+def _extract_candidate_values(rows: pd.DataFrame, candidates: tuple[str, ...]) -> list[Decimal]:
+    return _extract_candidate_values_with_filters(rows, candidates=candidates, row_filters=None)
 
 
 def _extract_candidate_values_with_filters(
-    rows: list[dict[str, Any]],
+    rows: pd.DataFrame,
     *,
     candidates: tuple[str, ...],
     row_filters: dict[str, tuple[str, ...]] | None,
 ) -> list[Decimal]:
-    values: list[Decimal] = []
-    for row in rows:
-        if not _row_matches_filters(row, row_filters=row_filters):
-            continue
-        for key in candidates:
-            if key not in row:
-                continue
-            value = _parse_numeric(row.get(key))
-            if value is not None:
-                values.append(value)
-                break
-    return values
+    if rows.empty:
+        return []
+    selected = rows.loc[_row_filter_mask(rows, row_filters=row_filters)]
+    return _candidate_values(selected, candidates).dropna().tolist()
 
 
-def _has_non_empty_candidate_value(row: dict[str, Any], candidates: tuple[str, ...]) -> bool:
-    for key in candidates:
-        if key not in row:
-            continue
-        raw_value = row.get(key)
-        if raw_value is None:
-            continue
-        token = str(raw_value).strip()
-        if not token or token.casefold() in {"nan", "none", "null", "-", "..."}:
-            continue
-        return True
-    return False
+def _is_non_empty_value(value: Any) -> bool:
+    if value is None:
+        return False
+    token = str(value).strip()
+    return bool(token) and token.casefold() not in {"nan", "none", "null", "-", "..."}
 
 
 def _count_rows_with_candidates(
-    rows: list[dict[str, Any]],
+    rows: pd.DataFrame,
     *,
     candidates: tuple[str, ...],
     row_filters: dict[str, tuple[str, ...]] | None,
 ) -> int:
-    count = 0
-    for row in rows:
-        if not _row_matches_filters(row, row_filters=row_filters):
-            continue
-        if _has_non_empty_candidate_value(row, candidates):
-            count += 1
-    return count
+    if rows.empty:
+        return 0
+    has_value = pd.Series(False, index=rows.index)
+    for key in candidates:
+        has_value |= _column_mask(rows, key, _is_non_empty_value)
+    return int((has_value & _row_filter_mask(rows, row_filters=row_filters)).sum())
 
 
 def _aggregate_values(values: list[Decimal], aggregator: str) -> Decimal:
@@ -465,40 +512,39 @@ def _value_matches_reference_year(value: Any, year: str) -> bool:
 
 
 def _filter_rows_by_reference_year(
-    rows: list[dict[str, Any]],
+    rows: pd.DataFrame,
     *,
     year: str,
     year_columns: tuple[str, ...],
-) -> list[dict[str, Any]]:
-    if not rows or not year_columns:
+) -> pd.DataFrame:
+    if rows.empty or not year_columns:
         return rows
-    normalized_columns = tuple(_normalize_column_name(str(column)) for column in year_columns)
-    filtered: list[dict[str, Any]] = []
+    normalized_columns = tuple(
+        dict.fromkeys(_normalize_column_name(str(column)) for column in year_columns)
+    )
+    matches = pd.Series(False, index=rows.index)
     has_year_signal = False
-    for row in rows:
-        for column in normalized_columns:
-            if column not in row:
-                continue
-            row_value = row.get(column)
-            if str(row_value or "").strip():
-                has_year_signal = True
-            if _value_matches_reference_year(row.get(column), year):
-                filtered.append(row)
-                break
-    if filtered:
-        return filtered
+    for column in normalized_columns:
+        if column not in rows.columns:
+            continue
+        matches |= _column_mask(rows, column, lambda value: _value_matches_reference_year(value, year))
+        has_year_signal = has_year_signal or bool(
+            _column_mask(rows, column, lambda value: bool(str(value or "").strip())).any()
+        )
+    if matches.any():
+        return rows.loc[matches].reset_index(drop=True)
     # If there is no usable year signal in the payload, keep backward-compatible fallback.
     if not has_year_signal:
         return rows
     # If year columns are present but no row matches the requested period, block the load.
-    return []
+    return rows.iloc[0:0]
 
 
 def _build_indicator_rows(
     *,
     territory_id: str,
     reference_period: str,
-    municipality_rows: list[dict[str, Any]],
+    municipality_rows: pd.DataFrame,
     source: str,
     fact_dataset_name: str,
     indicator_specs: tuple[IndicatorSpec, ...],
@@ -551,6 +597,76 @@ def _build_indicator_rows(
     return rows
 
 
+def _rows_extracted(df: pd.DataFrame) -> int:
+    return int(df.attrs.get(ROWS_EXTRACTED_ATTR, len(df)))
+
+
+def _load_municipality_frame(
+    raw_bytes: bytes,
+    *,
+    suffix: str,
+    definition: TabularConnectorDefinition,
+    reference_period: str,
+    municipality_name: str,
+    municipality_ibge_code: str,
+    source_file_name: str,
+    preferred_zip_entry_names: tuple[str, ...] | None = None,
+    settings: Settings | None = None,
+) -> pd.DataFrame:
+    """Parse a payload down to the municipality rows of the reference year.
+
+    With ``settings`` (and ``silver_cache_enabled``) the result is cached as
+    Parquet per payload checksum, so reruns and backfills over an unchanged
+    payload skip parsing. ``attrs["rows_extracted"]`` keeps the size of the
+    full payload either way.
+    """
+    key: SilverFrameKey | None = None
+    if settings is not None and settings.silver_cache_enabled:
+        key = SilverFrameKey(
+            source=definition.source,
+            dataset=definition.dataset_name,
+            reference_period=reference_period,
+            checksum_sha256=sha256_bytes(raw_bytes),
+            variant=frame_variant(
+                suffix=suffix,
+                municipality_ibge_code=municipality_ibge_code,
+                municipality_name=municipality_name,
+                code_columns=definition.municipality_code_columns,
+                name_columns=definition.municipality_name_columns,
+                year_columns=definition.reference_year_columns,
+                source_file_name=source_file_name,
+                preferred_zip_entry_names=preferred_zip_entry_names,
+            ),
+        )
+        cached = read_silver_frame(settings, key)
+        if cached is not None:
+            return cached
+
+    df = _load_dataframe_from_bytes(
+        raw_bytes,
+        suffix=suffix,
+        preferred_zip_entry_names=preferred_zip_entry_names,
+        dialect_key=(definition.source, definition.dataset_name),
+    )
+    frame = _resolve_municipality_rows(
+        df,
+        municipality_ibge_code=municipality_ibge_code,
+        municipality_name=municipality_name,
+        code_columns=definition.municipality_code_columns,
+        name_columns=definition.municipality_name_columns,
+        source_file_name=source_file_name,
+    )
+    frame = _filter_rows_by_reference_year(
+        frame,
+        year=_parse_reference_year(reference_period),
+        year_columns=definition.reference_year_columns,
+    ).copy()
+    frame.attrs[ROWS_EXTRACTED_ATTR] = len(df)
+    if key is not None:
+        write_silver_frame(settings, key, frame, rows_extracted=len(df))
+    return frame
+
+
 def _render_uri_template(
     template: str,
     *,
@@ -572,6 +688,7 @@ def _resolve_dataset(
     municipality_name: str,
     municipality_ibge_code: str,
     client: HttpClient,
+    settings: Settings | None = None,
 ) -> tuple[pd.DataFrame, bytes, str, str, str, str, list[str]] | None:
     datasets, warnings = _resolve_datasets(
         definition=definition,
@@ -579,6 +696,7 @@ def _resolve_dataset(
         municipality_name=municipality_name,
         municipality_ibge_code=municipality_ibge_code,
         client=client,
+        settings=settings,
     )
     if not datasets:
         return None
@@ -593,17 +711,89 @@ def _resolve_datasets(
     municipality_name: str,
     municipality_ibge_code: str,
     client: HttpClient,
+    previous_artifact: BronzeArtifact | None = None,
+    response_validators: dict[str, HttpValidators] | None = None,
+    settings: Settings | None = None,
 ) -> tuple[list[ResolvedDataset], list[str]]:
+    """Download the source datasets and parse them down to the municipality rows.
+
+    With a ``previous_artifact`` and a single source, ``_SourceUnchanged`` is raised
+    before parsing when the payload hashes to its checksum, or before downloading
+    when the server answers 304 to a GET conditioned on its ``ETag`` /
+    ``Last-Modified``. The validators of that download are stored in
+    ``response_validators`` by URI. ``settings`` enables the silver frame cache
+    (see ``_load_municipality_frame``).
+    """
     warnings: list[str] = []
     resources = _load_catalog(definition.catalog_path)
+    unchanged_checksum = previous_artifact.checksum_sha256 if previous_artifact else None
     manual_candidates = _list_manual_candidates(definition.manual_dir)
+    remote_resource_count = sum(1 for resource in resources if str(resource.get("uri", "")).strip())
+
+    def _raise_if_unchanged(
+        raw_bytes: bytes,
+        *,
+        source_type: str,
+        source_uri: str,
+        source_file_name: str,
+    ) -> None:
+        if unchanged_checksum and sha256_bytes(raw_bytes) == unchanged_checksum:
+            raise _SourceUnchanged(
+                source_type=source_type,
+                source_uri=source_uri,
+                source_file_name=source_file_name,
+            )
+
+    def _download_single_remote(uri: str) -> bytes:
+        validators = None
+        if previous_artifact is not None and previous_artifact.uri == uri:
+            validators = HttpValidators(
+                etag=previous_artifact.etag,
+                last_modified=previous_artifact.last_modified,
+            )
+        raw_bytes, _content_type, current_validators = client.download_bytes_if_modified(
+            uri,
+            validators=validators,
+            min_bytes=16,
+        )
+        if raw_bytes is None:
+            raise _SourceUnchanged(
+                source_type="remote",
+                source_uri=uri,
+                source_file_name=Path(uri).name,
+                detected_by="not_modified",
+            )
+        if response_validators is not None and current_validators:
+            response_validators[uri] = current_validators
+        _raise_if_unchanged(
+            raw_bytes,
+            source_type="remote",
+            source_uri=uri,
+            source_file_name=Path(uri).name,
+        )
+        return raw_bytes
 
     def _try_manual() -> list[ResolvedDataset]:
         for candidate in manual_candidates:
             try:
                 raw_bytes = candidate.read_bytes()
+                _raise_if_unchanged(
+                    raw_bytes,
+                    source_type="manual",
+                    source_uri=candidate.resolve().as_uri(),
+                    source_file_name=candidate.name,
+                )
                 suffix = candidate.suffix.casefold()
-                df = _load_dataframe_from_bytes(raw_bytes, suffix=suffix)
+                df = _load_municipality_frame(
+                    raw_bytes,
+                    suffix=suffix,
+                    definition=definition,
+                    reference_period=reference_period,
+                    municipality_name=municipality_name,
+                    municipality_ibge_code=municipality_ibge_code,
+                    source_file_name=candidate.name,
+                    settings=settings,
+                )
                 return [
                     (
                         df,
@@ -614,6 +804,8 @@ def _resolve_datasets(
                         candidate.name,
                     )
                 ]
+            except _SourceUnchanged:
+                raise
             except Exception as exc:
                 warnings.append(f"{definition.source} manual source failed for '{candidate.name}': {exc}")
         return []
@@ -635,17 +827,28 @@ def _resolve_datasets(
                 or ".json"
             )
             try:
-                raw_bytes, _content_type = client.download_bytes(uri, min_bytes=16)
-                df = _load_dataframe_from_bytes(
+                if remote_resource_count == 1:
+                    raw_bytes = _download_single_remote(uri)
+                else:
+                    raw_bytes, _content_type = client.download_bytes(uri, min_bytes=16)
+                df = _load_municipality_frame(
                     raw_bytes,
                     suffix=suffix,
+                    definition=definition,
+                    reference_period=reference_period,
+                    municipality_name=municipality_name,
+                    municipality_ibge_code=municipality_ibge_code,
+                    source_file_name=Path(uri).name,
                     preferred_zip_entry_names=(
                         municipality_name,
                         municipality_ibge_code,
                         municipality_ibge_code[:6],
                     ),
+                    settings=settings,
                 )
                 resolved.append((df, raw_bytes, suffix, "remote", uri, Path(uri).name))
+            except _SourceUnchanged:
+                raise
             except Exception as exc:
                 warnings.append(f"{definition.source} remote source failed for '{uri}': {exc}")
         return resolved
@@ -666,64 +869,102 @@ def _resolve_datasets(
     return _try_manual(), warnings
 
 
-def _upsert_fact_indicator_rows(settings: Settings, load_rows: list[dict[str, Any]]) -> int:
+def _upsert_fact_indicator_rows(
+    settings: Settings,
+    load_rows: list[dict[str, Any]],
+) -> FactIndicatorLoadResult:
     if not load_rows:
-        return 0
+        return FactIndicatorLoadResult(staged=0, inserted=0, updated=0)
     with session_scope(settings) as session:
-        for row in load_rows:
-            session.execute(
-                text(
-                    """
-                    INSERT INTO silver.fact_indicator (
-                        territory_id,
-                        source,
-                        dataset,
-                        indicator_code,
-                        indicator_name,
-                        unit,
-                        category,
-                        value,
-                        reference_period
-                    )
-                    VALUES (
-                        CAST(:territory_id AS uuid),
-                        :source,
-                        :dataset,
-                        :indicator_code,
-                        :indicator_name,
-                        :unit,
-                        :category,
-                        :value,
-                        :reference_period
-                    )
-                    ON CONFLICT (
-                        territory_id,
-                        source,
-                        dataset,
-                        indicator_code,
-                        category,
-                        reference_period
-                    )
-                    DO UPDATE SET
-                        indicator_name = EXCLUDED.indicator_name,
-                        unit = EXCLUDED.unit,
-                        value = EXCLUDED.value,
-                        updated_at = NOW()
-                    """
-                ),
+        return bulk_upsert_fact_indicators(session, load_rows)
+
+
+def _record_skipped_unchanged(
+    definition: TabularConnectorDefinition,
+    *,
+    settings: Settings,
+    run_id: str,
+    reference_period: str,
+    started_at_utc: datetime,
+    started_at: float,
+    warnings: list[str],
+    unchanged: _SourceUnchanged,
+    previous_artifact: BronzeArtifact,
+) -> dict[str, Any]:
+    check_prefix = _normalize_column_name(definition.source)
+    if unchanged.detected_by == "not_modified":
+        details = (
+            f"{definition.source} server answered 304 Not Modified for "
+            f"'{unchanged.source_file_name}' since {previous_artifact.extracted_at_utc}; "
+            "download, parse and load skipped."
+        )
+    else:
+        details = (
+            f"{definition.source} payload '{unchanged.source_file_name}' matches bronze checksum "
+            f"{previous_artifact.checksum_sha256[:12]} from {previous_artifact.extracted_at_utc}; "
+            "parse and load skipped."
+        )
+    with session_scope(settings) as session:
+        upsert_pipeline_run(
+            session=session,
+            run_id=run_id,
+            job_name=definition.job_name,
+            source=definition.source,
+            dataset=definition.dataset_name,
+            wave=definition.wave,
+            reference_period=reference_period,
+            started_at_utc=started_at_utc,
+            finished_at_utc=datetime.now(UTC),
+            status="success",
+            rows_extracted=0,
+            rows_loaded=0,
+            warnings_count=len(warnings),
+            errors_count=0,
+            bronze_path=previous_artifact.local_path.as_posix(),
+            manifest_path=previous_artifact.manifest_path.as_posix(),
+            checksum_sha256=previous_artifact.checksum_sha256,
+            details={
+                "reason": "skipped_unchanged",
+                "detected_by": unchanged.detected_by,
+                "source_type": unchanged.source_type,
+                "source_uri": unchanged.source_uri,
+                "source_file_name": unchanged.source_file_name,
+                "previous_extracted_at_utc": previous_artifact.extracted_at_utc,
+            },
+        )
+        replace_pipeline_checks_from_dicts(
+            session=session,
+            run_id=run_id,
+            checks=[
                 {
-                    "territory_id": row["territory_id"],
-                    "source": row["source"],
-                    "dataset": row["dataset"],
-                    "indicator_code": row["indicator_code"],
-                    "indicator_name": row["indicator_name"],
-                    "unit": row["unit"],
-                    "category": row["category"],
-                    "value": str(row["value"]),
-                    "reference_period": row["reference_period"],
-                },
-            )
-    return len(load_rows)
+                    "name": f"{check_prefix}_source_unchanged",
+                    "status": "pass",
+                    "details": details,
+                    "observed_value": 1,
+                    "threshold_value": 1,
+                }
+            ],
+        )
+
+    elapsed = time.perf_counter() - started_at
+    get_logger(definition.job_name).info(
+        f"{definition.source} tabular job skipped: source unchanged.",
+        run_id=run_id,
+        checksum_sha256=previous_artifact.checksum_sha256,
+        duration_seconds=round(elapsed, 2),
+    )
+    return {
+        "job": definition.job_name,
+        "status": "success",
+        "run_id": run_id,
+        "duration_seconds": round(elapsed, 2),
+        "rows_extracted": 0,
+        "rows_written": 0,
+        "warnings": warnings,
+        "errors": [],
+        "skipped_unchanged": True,
+        "bronze": artifact_to_dict(previous_artifact),
+    }
 
 
 def run_tabular_connector(
@@ -736,7 +977,6 @@ def run_tabular_connector(
     timeout_seconds: int = 30,
     settings: Settings | None = None,
 ) -> dict[str, Any]:
-    del force
     settings = settings or get_settings()
     logger = get_logger(definition.job_name)
     run_id = str(uuid4())
@@ -766,13 +1006,51 @@ def run_tabular_connector(
         max_retries=max_retries,
     )
     try:
-        datasets, source_warnings = _resolve_datasets(
-            definition=definition,
-            reference_period=parsed_reference_period,
-            municipality_name=municipality_name,
-            municipality_ibge_code=municipality_ibge_code,
-            client=client,
+        definition_fingerprint = _definition_fingerprint(
+            definition, _load_catalog(definition.catalog_path)
+        )
+        previous_artifact = (
+            None
+            if force or dry_run
+            else find_latest_loaded_artifact(
+                settings=settings,
+                source=definition.source,
+                dataset=definition.dataset_name,
+                reference_period=parsed_reference_period,
+            )
         )
+        if (
+            previous_artifact is not None
+            and previous_artifact.definition_fingerprint != definition_fingerprint
+        ):
+            # Catalog or indicator specs changed since that load: same payload, new rows.
+            previous_artifact = None
+        response_validators: dict[str, HttpValidators] = {}
+        try:
+            datasets, source_warnings = _resolve_datasets(
+                definition=definition,
+                reference_period=parsed_reference_period,
+                municipality_name=municipality_name,
+                municipality_ibge_code=municipality_ibge_code,
+                client=client,
+                previous_artifact=previous_artifact,
+                response_validators=response_validators,
+                # Dry runs leave data/ untouched, silver frames included.
+                settings=None if dry_run else settings,
+            )
+        except _SourceUnchanged as unchanged:
+            assert previous_artifact is not None
+            return _record_skipped_unchanged(
+                definition,
+                settings=settings,
+                run_id=run_id,
+                reference_period=parsed_reference_period,
+                started_at_utc=started_at_utc,
+                started_at=started_at,
+                warnings=warnings,
+                unchanged=unchanged,
+                previous_artifact=previous_artifact,
+            )
         warnings.extend(source_warnings)
         if not datasets:
             warnings.append(
@@ -830,11 +1108,11 @@ def run_tabular_connector(
             }
 
         rows_extracted = 0
-        municipality_rows: list[dict[str, Any]] = []
+        resource_frames: list[pd.DataFrame] = []
         source_types: set[str] = set()
         source_entries: list[dict[str, Any]] = []
         for df, raw_bytes, source_suffix, source_type, source_uri, source_file_name in datasets:
-            rows_extracted += len(df)
+            rows_extracted += _rows_extracted(df)
             source_types.add(source_type)
             source_entries.append(
                 {
@@ -846,41 +1124,21 @@ def run_tabular_connector(
                 }
             )
 
-            resource_rows = _resolve_municipality_rows(
-                df,
-                municipality_ibge_code=municipality_ibge_code,
-                municipality_name=municipality_name,
-                code_columns=definition.municipality_code_columns,
-                name_columns=definition.municipality_name_columns,
-                source_file_name=source_file_name,
-            )
-            resource_rows = _filter_rows_by_reference_year(
-                resource_rows,
-                year=parsed_reference_period,
-                year_columns=definition.reference_year_columns,
-            )
-            if not resource_rows:
+            # ``df`` already holds the municipality rows of the reference year
+            # (see ``_load_municipality_frame``).
+            if df.empty:
                 warnings.append(
                     f"{definition.source} row not found for municipality code/name "
                     f"({municipality_ibge_code}/{municipality_name}) in '{source_file_name}'."
                 )
                 continue
-            municipality_rows.extend(resource_rows)
-
-        if municipality_rows:
-            deduplicated_rows: list[dict[str, Any]] = []
-            seen_signatures: set[str] = set()
-            for row in municipality_rows:
-                signature = json.dumps(
-                    {k: str(v) for k, v in row.items()},
-                    sort_keys=True,
-                    ensure_ascii=False,
-                )
-                if signature in seen_signatures:
-                    continue
-                seen_signatures.add(signature)
-                deduplicated_rows.append(row)
-            municipality_rows = deduplicated_rows
+            resource_frames.append(df)
+
+        municipality_rows = (
+            _drop_duplicate_rows(pd.concat(resource_frames, ignore_index=True))
+            if resource_frames
+            else pd.DataFrame()
+        )
 
         load_rows = _build_indicator_rows(
             territory_id=territory_id,
@@ -902,26 +1160,22 @@ def run_tabular_connector(
                 try:
                     manual_raw_bytes = manual_candidate.read_bytes()
                     manual_suffix = manual_candidate.suffix.casefold()
-                    manual_df = _load_dataframe_from_bytes(manual_raw_bytes, suffix=manual_suffix)
+                    manual_rows = _load_municipality_frame(
+                        manual_raw_bytes,
+                        suffix=manual_suffix,
+                        definition=definition,
+                        reference_period=parsed_reference_period,
+                        municipality_name=municipality_name,
+                        municipality_ibge_code=municipality_ibge_code,
+                        source_file_name=manual_candidate.name,
+                        settings=None if dry_run else settings,
+                    )
                 except Exception as exc:
                     warnings.append(
                         f"{definition.source} manual fallback failed for '{manual_candidate.name}': {exc}"
                     )
                     continue
 
-                manual_rows = _resolve_municipality_rows(
-                    manual_df,
-                    municipality_ibge_code=municipality_ibge_code,
-                    municipality_name=municipality_name,
-                    code_columns=definition.municipality_code_columns,
-                    name_columns=definition.municipality_name_columns,
-                    source_file_name=manual_candidate.name,
-                )
-                manual_rows = _filter_rows_by_reference_year(
-                    manual_rows,
-                    year=parsed_reference_period,
-                    year_columns=definition.reference_year_columns,
-                )
                 manual_load_rows = _build_indicator_rows(
                     territory_id=territory_id,
                     reference_period=parsed_reference_period,
@@ -951,7 +1205,7 @@ def run_tabular_connector(
                 source_type = "manual"
                 source_uri = manual_candidate.resolve().as_uri()
                 source_file_name = manual_candidate.name
-                rows_extracted = len(manual_df)
+                rows_extracted = _rows_extracted(manual_rows)
                 municipality_rows = manual_rows
                 load_rows = manual_load_rows
                 break
@@ -991,7 +1245,8 @@ def run_tabular_connector(
                 },
             }
 
-        rows_written = _upsert_fact_indicator_rows(settings, load_rows)
+        load_result = _upsert_fact_indicator_rows(settings, load_rows)
+        rows_written = load_result.rows_written
 
         checks = [
             {
@@ -1003,7 +1258,7 @@ def run_tabular_connector(
             },
             {
                 "name": f"{check_prefix}_municipality_row_found",
-                "status": "pass" if municipality_rows else "warn",
+                "status": "pass" if not municipality_rows.empty else "warn",
                 "details": (
                     f"Municipality should be present in {definition.source} dataset. "
                     f"Matches found: {len(municipality_rows)}."
@@ -1054,6 +1309,10 @@ def run_tabular_connector(
             if persist_raw
             else json.dumps(bronze_payload, ensure_ascii=False).encode("utf-8")
         )
+        change_detection = {"definition_fingerprint": definition_fingerprint}
+        validators = response_validators.get(source_uri) if source_type == "remote" else None
+        if persist_raw and validators:
+            change_detection.update(etag=validators.etag, last_modified=validators.last_modified)
         artifact = persist_raw_bytes(
             settings=settings,
             source=definition.source,
@@ -1071,6 +1330,7 @@ def run_tabular_connector(
             rows_written=(
                 [{"table": "silver.fact_indicator", "rows": rows_written}] if rows_written > 0 else []
             ),
+            change_detection=change_detection,
         )
 
         status = "success" if rows_written > 0 else "blocked"
@@ -1106,6 +1366,7 @@ def run_tabular_connector(
                         for entry in source_entries
                     ],
                     "rows_written": rows_written,
+                    "fact_indicator_load": load_result.as_dict(),
                     "municipality_matches": len(municipality_rows),
                 },
             )
@@ -26,6 +26,11 @@ WAVE = "MVP-1"
 DBT_PROJECT_DIR = Path("dbt_project")
 DBT_MODELS_DIR = Path("dbt_project/models/gold")
 ALLOWED_BUILD_MODES = ("auto", "dbt", "sql_direct")
+PRIORITY_DRIVERS_MODEL = "mart_priority_drivers"
+INDICATOR_CHANGE_MODEL = "indicator_period_change"
+# Overlap applied to the last refresh timestamp so rows committed by connector
+# transactions that were still open during the previous refresh are not missed.
+PRIORITY_REFRESH_OVERLAP_SQL = "INTERVAL '1 hour'"
 
 
 def _load_gold_models(models_dir: Path = DBT_MODELS_DIR) -> list[tuple[str, str]]:
@@ -173,6 +178,181 @@ def _collect_gold_model_row_counts(
     return built_models
 
 
+def _decide_priority_refresh_mode(state: dict[str, Any] | None, *, force: bool) -> str:
+    if force or not state or state.get("last_refreshed_at") is None:
+        return "full"
+    if (state.get("score_version"), state.get("config_version")) != (
+        state.get("active_score_version"),
+        state.get("active_config_version"),
+    ):
+        return "full"
+    active_updated_at = state.get("active_updated_at_utc")
+    if active_updated_at is not None and active_updated_at > state["last_refreshed_at"]:
+        return "full"
+    # Territory names (rank tiebreak) and per-level totals (coverage) feed every period.
+    territory_updated_at = state.get("territory_updated_at_utc")
+    if territory_updated_at is not None and territory_updated_at > state["last_refreshed_at"]:
+        return "full"
+    return "incremental"
+
+
+def _resolve_touched_reference_periods(
+    session: Any,
+    *,
+    since: Any,
+    model: str = PRIORITY_DRIVERS_MODEL,
+    yearly_only: bool = False,
+) -> list[str]:
+    """Periods whose ``model`` rows may be stale since ``since``.
+
+    A period is touched when one of its fact rows was updated since then, or when
+    its number of (territory, indicator) pairs with a value in silver differs from
+    the row count of ``model``: deleted fact rows and periods gone from silver
+    leave no ``updated_at`` behind. ``yearly_only`` restricts both checks to YYYY
+    periods, for models that never hold rows for other periods.
+    """
+    period_filter = "AND fi.reference_period ~ '^[0-9]{4}$'" if yearly_only else ""
+    rows = session.execute(
+        text(
+            f"""
+            SELECT DISTINCT fi.reference_period
+            FROM silver.fact_indicator fi
+            WHERE fi.updated_at > CAST(:since AS TIMESTAMPTZ) - {PRIORITY_REFRESH_OVERLAP_SQL}
+              {period_filter}
+            UNION
+            SELECT COALESCE(s.reference_period, gm.reference_period)
+            FROM (
+                SELECT
+                    fi.reference_period,
+                    COUNT(DISTINCT (fi.territory_id, fi.indicator_code)) AS row_count
+                FROM silver.fact_indicator fi
+                JOIN silver.dim_territory dt ON dt.territory_id = fi.territory_id
+                WHERE fi.value IS NOT NULL
+                  {period_filter}
+                GROUP BY fi.reference_period
+            ) AS s
+            FULL JOIN (
+                SELECT reference_period, COUNT(*) AS row_count
+                FROM gold.{model}
+                GROUP BY reference_period
+            ) AS gm ON gm.reference_period = s.reference_period
+            WHERE s.row_count IS DISTINCT FROM gm.row_count
+            """
+        ),
+        {"since": since},
+    ).scalars().all()
+    return sorted(str(period) for period in rows if period is not None)
+
+
+def _refresh_priority_drivers_mart(*, settings: Settings, force: bool) -> dict[str, Any]:
+    """Refresh gold.mart_priority_drivers only for reference periods touched since the last run."""
+    with session_scope(settings) as session:
+        state_row = session.execute(
+            text(
+                f"""
+                SELECT
+                    latest.refreshed_at_utc AS last_refreshed_at,
+                    latest.score_version,
+                    latest.config_version,
+                    COALESCE(cfg.score_version, 'v1.0.0') AS active_score_version,
+                    COALESCE(cfg.config_version, '1.0.0') AS active_config_version,
+                    cfg.updated_at_utc AS active_updated_at_utc,
+                    (SELECT MAX(dt.updated_at) FROM silver.dim_territory dt)
+                        AS territory_updated_at_utc
+                FROM (SELECT 1) AS anchor
+                LEFT JOIN LATERAL (
+                    SELECT refreshed_at_utc, score_version, config_version
+                    FROM gold.{PRIORITY_DRIVERS_MODEL}
+                    ORDER BY refreshed_at_utc DESC
+                    LIMIT 1
+                ) AS latest ON TRUE
+                LEFT JOIN ops.v_strategic_score_version_active cfg ON TRUE
+                """
+            )
+        ).mappings().first()
+        state = dict(state_row) if state_row else None
+        mode = _decide_priority_refresh_mode(state, force=force)
+
+        periods: list[str] | None = None
+        if mode == "incremental":
+            periods = _resolve_touched_reference_periods(
+                session,
+                since=state["last_refreshed_at"] if state else None,
+            )
+            if not periods:
+                return {
+                    "model": PRIORITY_DRIVERS_MODEL,
+                    "mode": "skipped",
+                    "periods": [],
+                    "row_count": 0,
+                }
+
+        row_count = session.execute(
+            text(f"SELECT gold.refresh_{PRIORITY_DRIVERS_MODEL}(CAST(:periods AS TEXT[]))"),
+            {"periods": periods},
+        ).scalar_one()
+    return {
+        "model": PRIORITY_DRIVERS_MODEL,
+        "mode": mode,
+        "periods": periods or [],
+        "row_count": int(row_count or 0),
+    }
+
+
+def _refresh_indicator_change_table(*, settings: Settings, force: bool) -> dict[str, Any]:
+    """Refresh gold.indicator_period_change for touched periods and the year after each one."""
+    with session_scope(settings) as session:
+        state = session.execute(
+            text(
+                f"""
+                SELECT
+                    (SELECT MAX(refreshed_at_utc) FROM gold.{INDICATOR_CHANGE_MODEL})
+                        AS last_refreshed_at,
+                    (SELECT MAX(dt.updated_at) FROM silver.dim_territory dt)
+                        AS territory_updated_at_utc
+                """
+            )
+        ).mappings().one()
+        last_refreshed_at = state["last_refreshed_at"]
+        territory_updated_at = state["territory_updated_at_utc"]
+        mode = "incremental"
+        if force or last_refreshed_at is None:
+            mode = "full"
+        elif territory_updated_at is not None and territory_updated_at > last_refreshed_at:
+            # territory_level is copied from dim_territory into every row.
+            mode = "full"
+
+        periods: list[str] | None = None
+        if mode == "incremental":
+            # Only YYYY periods get rows; a touched monthly period would insert
+            # nothing, leave MAX(refreshed_at_utc) as is and be resolved again
+            # on every build.
+            periods = _resolve_touched_reference_periods(
+                session,
+                since=last_refreshed_at,
+                model=INDICATOR_CHANGE_MODEL,
+                yearly_only=True,
+            )
+            if not periods:
+                return {
+                    "model": INDICATOR_CHANGE_MODEL,
+                    "mode": "skipped",
+                    "periods": [],
+                    "row_count": 0,
+                }
+
+        row_count = session.execute(
+            text(f"SELECT gold.refresh_{INDICATOR_CHANGE_MODEL}(CAST(:periods AS TEXT[]))"),
+            {"periods": periods},
+        ).scalar_one()
+    return {
+        "model": INDICATOR_CHANGE_MODEL,
+        "mode": mode,
+        "periods": periods or [],
+        "row_count": int(row_count or 0),
+    }
+
+
 def run(
     *,
     reference_period: str,
@@ -182,7 +362,7 @@ def run(
     timeout_seconds: int = 30,
     settings: Settings | None = None,
 ) -> dict[str, Any]:
-    del force, max_retries
+    del max_retries
     settings = settings or get_settings()
     logger = get_logger(JOB_NAME)
     run_id = str(uuid4())
@@ -236,6 +416,21 @@ def run(
         else:
             built_models = _run_sql_direct_build(settings=settings, models=models)
 
+        priority_refresh: dict[str, Any] | None = None
+        try:
+            priority_refresh = _refresh_priority_drivers_mart(settings=settings, force=force)
+        except Exception as exc:
+            warnings.append(f"Could not refresh gold.{PRIORITY_DRIVERS_MODEL}: {exc}")
+
+        indicator_change_refresh: dict[str, Any] | None = None
+        try:
+            indicator_change_refresh = _refresh_indicator_change_table(
+                settings=settings,
+                force=force,
+            )
+        except Exception as exc:
+            warnings.append(f"Could not refresh gold.{INDICATOR_CHANGE_MODEL}: {exc}")
+
         rows_written = len(built_models)
         bronze_payload = {
             "job": JOB_NAME,
@@ -244,6 +439,8 @@ def run(
             "build_mode_effective": effective_mode,
             "models_dir": DBT_MODELS_DIR.as_posix(),
             "built_models": built_models,
+            "priority_drivers_refresh": priority_refresh,
+            "indicator_change_refresh": indicator_change_refresh,
             "dbt_cli": dbt_cli_meta,
         }
         raw_bytes = json.dumps(bronze_payload, ensure_ascii=False).encode("utf-8")
@@ -263,6 +460,28 @@ def run(
                 "status": "pass",
                 "details": f"Build mode effective: {effective_mode}.",
             },
+            {
+                "name": "priority_drivers_mart_refreshed",
+                "status": "pass" if priority_refresh is not None else "warn",
+                "details": (
+                    f"gold.{PRIORITY_DRIVERS_MODEL} refresh mode={priority_refresh['mode']} "
+                    f"periods={priority_refresh['periods']} rows={priority_refresh['row_count']}."
+                    if priority_refresh is not None
+                    else f"gold.{PRIORITY_DRIVERS_MODEL} refresh failed; see warnings."
+                ),
+            },
+            {
+                "name": "indicator_period_change_refreshed",
+                "status": "pass" if indicator_change_refresh is not None else "warn",
+                "details": (
+                    f"gold.{INDICATOR_CHANGE_MODEL} "
+                    f"refresh mode={indicator_change_refresh['mode']} "
+                    f"periods={indicator_change_refresh['periods']} "
+                    f"rows={indicator_change_refresh['row_count']}."
+                    if indicator_change_refresh is not None
+                    else f"gold.{INDICATOR_CHANGE_MODEL} refresh failed; see warnings."
+                ),
+            },
         ]
         artifact = persist_raw_bytes(
             settings=settings,
@@ -311,6 +530,8 @@ def run(
                     "build_mode_requested": requested_mode,
                     "build_mode_effective": effective_mode,
                     "models": built_models,
+                    "priority_drivers_refresh": priority_refresh,
+                    "indicator_change_refresh": indicator_change_refresh,
                     "dbt_cli": dbt_cli_meta,
                 },
             )
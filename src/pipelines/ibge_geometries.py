@@ -14,6 +14,7 @@ from sqlalchemy import text
 from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
+from app.tile_cache import invalidate_tile_cache
 from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
 from pipelines.common.http_client import HttpClient
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
@@ -588,6 +589,13 @@ def run(
                 warnings.append(
                     "Could not refresh map materialized layers after geometry load."
                 )
+            try:
+                with session.begin_nested():
+                    session.execute(text("SELECT map.refresh_territory_tile_geometry()"))
+            except Exception:
+                warnings.append(
+                    "Could not refresh map tile geometry pyramid after geometry load."
+                )
 
             if district_invalid_repaired > 0:
                 warnings.append(
@@ -612,6 +620,8 @@ def run(
             )
             geometry_indicator_rows = sum(geometry_indicator_counts.values())
 
+        invalidate_tile_cache(settings, reason=JOB_NAME)
+
         checks = [
             {
                 "name": "municipality_geometry_non_empty",
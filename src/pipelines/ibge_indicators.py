@@ -15,6 +15,7 @@ from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
 from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
+from pipelines.common.fact_indicator_loader import bulk_upsert_fact_indicators
 from pipelines.common.http_client import HttpClient
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
 
@@ -323,53 +324,8 @@ def run(
         rows_written = 0
         if load_rows:
             with session_scope(settings) as session:
-                for row in load_rows:
-                    session.execute(
-                        text(
-                            """
-                            INSERT INTO silver.fact_indicator (
-                                territory_id,
-                                source,
-                                dataset,
-                                indicator_code,
-                                indicator_name,
-                                unit,
-                                category,
-                                value,
-                                reference_period
-                            )
-                            VALUES (
-                                CAST(:territory_id AS uuid),
-                                :source,
-                                :dataset,
-                                :indicator_code,
-                                :indicator_name,
-                                :unit,
-                                :category,
-                                :value,
-                                :reference_period
-                            )
-                            ON CONFLICT (
-                                territory_id,
-                                source,
-                                dataset,
-                                indicator_code,
-                                category,
-                                reference_period
-                            )
-                            DO UPDATE SET
-                                indicator_name = EXCLUDED.indicator_name,
-                                unit = EXCLUDED.unit,
-                                value = EXCLUDED.value,
-                                updated_at = NOW()
-                            """
-                        ),
-                        {
-                            **row,
-                            "value": str(row["value"]),
-                        },
-                    )
-                    rows_written += 1
+                load_result = bulk_upsert_fact_indicators(session, load_rows)
+            rows_written = load_result.rows_written
 
         bronze_payload = {
             "job": JOB_NAME,
@@ -22,6 +22,8 @@ from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
 from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
+from pipelines.common.delimited_reader import read_delimited
+from pipelines.common.fact_indicator_loader import bulk_upsert_fact_indicators
 from pipelines.common.http_client import HttpClient
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
 
@@ -156,25 +158,6 @@ def _list_manual_candidates(manual_dir: Path) -> list[Path]:
     return sorted(candidates, key=lambda p: p.stat().st_mtime, reverse=True)
 
 
-def _read_delimited_with_fallback(
-    raw_bytes: bytes,
-    *,
-    separators: tuple[str, ...] = (";", ","),
-) -> pd.DataFrame:
-    for encoding in ("utf-8", "latin1"):
-        for sep in separators:
-            try:
-                return pd.read_csv(
-                    io.BytesIO(raw_bytes),
-                    encoding=encoding,
-                    sep=sep,
-                    low_memory=False,
-                )
-            except Exception:
-                continue
-    raise ValueError("Could not parse tabular file with supported delimiters/encodings.")
-
-
 def _extract_tabular_bytes_from_zip(zip_bytes: bytes) -> tuple[bytes, str]:
     with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
         names = [name for name in archive.namelist() if _is_tabular_candidate(name)]
@@ -191,7 +174,11 @@ def _load_dataframe_from_bytes(raw_bytes: bytes, *, suffix: str) -> pd.DataFrame
         return _load_dataframe_from_bytes(inner_bytes, suffix=inner_suffix)
     if normalized_suffix in {".csv", ".txt"}:
         separators = (";", ",") if normalized_suffix == ".csv" else (";", ",", "\t", "|")
-        return _read_delimited_with_fallback(raw_bytes, separators=separators)
+        return read_delimited(
+            raw_bytes,
+            dialect_key=(SOURCE, DATASET_NAME),
+            separators=separators,
+        )
     raise ValueError(f"Unsupported dataset format '{suffix}'.")
 
 
@@ -910,55 +897,9 @@ def run(
                 },
             }
 
-        rows_written = 0
         with session_scope(settings) as session:
-            for row in load_rows:
-                session.execute(
-                    text(
-                        """
-                        INSERT INTO silver.fact_indicator (
-                            territory_id,
-                            source,
-                            dataset,
-                            indicator_code,
-                            indicator_name,
-                            unit,
-                            category,
-                            value,
-                            reference_period
-                        )
-                        VALUES (
-                            CAST(:territory_id AS uuid),
-                            :source,
-                            :dataset,
-                            :indicator_code,
-                            :indicator_name,
-                            :unit,
-                            :category,
-                            :value,
-                            :reference_period
-                        )
-                        ON CONFLICT (
-                            territory_id,
-                            source,
-                            dataset,
-                            indicator_code,
-                            category,
-                            reference_period
-                        )
-                        DO UPDATE SET
-                            indicator_name = EXCLUDED.indicator_name,
-                            unit = EXCLUDED.unit,
-                            value = EXCLUDED.value,
-                            updated_at = NOW()
-                        """
-                    ),
-                    {
-                        **row,
-                        "value": str(row["value"]),
-                    },
-                )
-                rows_written += 1
+            load_result = bulk_upsert_fact_indicators(session, load_rows)
+        rows_written = load_result.rows_written
 
         checks = [
             {
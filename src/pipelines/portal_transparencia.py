@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import time
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import Decimal, InvalidOperation
 from typing import Any
@@ -13,8 +15,12 @@ from sqlalchemy import text
 from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
+from pipelines.common.async_http_client import AsyncHttpClient
 from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
-from pipelines.common.http_client import HttpClient
+from pipelines.common.fact_indicator_loader import (
+    FactIndicatorLoadResult,
+    bulk_upsert_fact_indicators,
+)
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
 
 JOB_NAME = "portal_transparencia_fetch"
@@ -89,26 +95,50 @@ def _extract_items(payload: Any) -> list[dict[str, Any]]:
     return []
 
 
-def _fetch_paginated(
-    client: HttpClient,
+async def _fetch_paginated(
+    client: AsyncHttpClient,
     *,
     url: str,
     headers: dict[str, str],
     params: dict[str, Any],
+    on_page: Callable[[list[dict[str, Any]]], None],
     max_pages: int = 300,
-) -> tuple[list[dict[str, Any]], int]:
-    rows: list[dict[str, Any]] = []
-    page = 1
+    prefetch: int = 1,
+) -> int:
+    """Fetch pages ``prefetch`` at a time and hand each non-empty page to ``on_page`` in order.
+
+    Stops at the first empty page; pages prefetched beyond it are discarded. Returns the
+    number of pages consumed, including the terminating empty page.
+    """
+    prefetch = max(1, prefetch)
     pages = 0
-    while page <= max_pages:
-        payload = client.get_json(url, headers=headers, params={**params, "pagina": page})
-        page_rows = _extract_items(payload)
-        pages += 1
-        if not page_rows:
-            break
-        rows.extend(page_rows)
-        page += 1
-    return rows, pages
+    next_page = 1
+    while next_page <= max_pages:
+        window = range(next_page, min(next_page + prefetch, max_pages + 1))
+        payloads = await _gather_or_cancel(
+            client.get_json(url, headers=headers, params={**params, "pagina": page})
+            for page in window
+        )
+        for payload in payloads:
+            page_rows = _extract_items(payload)
+            pages += 1
+            if not page_rows:
+                return pages
+            on_page(page_rows)
+        next_page = window.stop
+    return pages
+
+
+async def _gather_or_cancel(coros: Iterable[Awaitable[Any]]) -> list[Any]:
+    """Like ``asyncio.gather`` but cancels the remaining tasks as soon as one fails."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 def _sum_field(rows: list[dict[str, Any]], field: str) -> Decimal:
@@ -121,16 +151,62 @@ def _sum_field(rows: list[dict[str, Any]], field: str) -> Decimal:
     return total
 
 
-def _count_distinct_people(rows: list[dict[str, Any]], *fields: str) -> int:
+def _distinct_people(rows: list[dict[str, Any]], *fields: str) -> set[str]:
     seen: set[str] = set()
     for row in rows:
-        for field in fields:
-            raw = str(row.get(field, "") or "").strip()
+        for field_name in fields:
+            raw = str(row.get(field_name, "") or "").strip()
             digits = "".join(ch for ch in raw if ch.isdigit())
             if digits:
                 seen.add(digits)
                 break
-    return len(seen)
+    return seen
+
+
+_BENEFIT_SUM_FIELDS = ("valor", "quantidadeBeneficiados")
+_AGGREGATE_SUM_FIELDS: dict[str, tuple[str, ...]] = {
+    "bpc": _BENEFIT_SUM_FIELDS,
+    "bolsa": _BENEFIT_SUM_FIELDS,
+    "novo_bolsa": ("valorSaque",),
+    "auxilio_brasil": _BENEFIT_SUM_FIELDS,
+    "auxilio_emergencial": _BENEFIT_SUM_FIELDS,
+    "peti": ("valor",),
+    "safra": ("valor",),
+    "defeso": ("valor",),
+    "recursos": ("valor",),
+    "convenios": ("valor", "valorLiberado"),
+    "renuncias": ("valorRenunciado",),
+    "covid_transferencias": ("valor",),
+}
+_AGGREGATE_PEOPLE_FIELDS: dict[str, tuple[str, ...]] = {"novo_bolsa": ("nis", "cpfFormatado")}
+
+
+@dataclass
+class EndpointAggregate:
+    """Running totals for one endpoint, folded page by page instead of keeping every row."""
+
+    sum_fields: tuple[str, ...]
+    people_fields: tuple[str, ...] = ()
+    rows: int = 0
+    sums: dict[str, Decimal] = field(default_factory=dict)
+    people: set[str] = field(default_factory=set)
+
+    @classmethod
+    def for_key(cls, metric_key: str) -> EndpointAggregate:
+        return cls(
+            sum_fields=_AGGREGATE_SUM_FIELDS.get(metric_key, ()),
+            people_fields=_AGGREGATE_PEOPLE_FIELDS.get(metric_key, ()),
+        )
+
+    def add_rows(self, rows: list[dict[str, Any]]) -> None:
+        self.rows += len(rows)
+        for sum_field in self.sum_fields:
+            self.sums[sum_field] = self.total(sum_field) + _sum_field(rows, sum_field)
+        if self.people_fields:
+            self.people.update(_distinct_people(rows, *self.people_fields))
+
+    def total(self, sum_field: str) -> Decimal:
+        return self.sums.get(sum_field, Decimal("0"))
 
 
 def _resolve_municipality_context(settings: Settings) -> tuple[str, str, str, str]:
@@ -165,67 +241,99 @@ def _build_url(settings: Settings, endpoint: str) -> str:
     return f"{base}/{suffix}"
 
 
-def _collect_monthly_rows(
-    client: HttpClient,
+async def _collect_endpoint(
+    client: AsyncHttpClient,
+    *,
+    metric_key: str,
+    url: str,
+    headers: dict[str, str],
+    params_list: list[dict[str, Any]],
+    prefetch: int,
+    row_filter: Callable[[dict[str, Any]], bool] | None = None,
+) -> tuple[EndpointAggregate, int]:
+    aggregate = EndpointAggregate.for_key(metric_key)
+
+    def _on_page(page_rows: list[dict[str, Any]]) -> None:
+        aggregate.add_rows(
+            page_rows if row_filter is None else [row for row in page_rows if row_filter(row)]
+        )
+
+    page_counts = await _gather_or_cancel(
+        _fetch_paginated(
+            client,
+            url=url,
+            headers=headers,
+            params=params,
+            on_page=_on_page,
+            prefetch=prefetch,
+        )
+        for params in params_list
+    )
+    return aggregate, sum(page_counts)
+
+
+async def _collect_monthly_rows(
+    client: AsyncHttpClient,
     *,
     settings: Settings,
+    metric_key: str,
     endpoint: str,
     year: int,
     municipality_ibge_code: str,
     headers: dict[str, str],
-) -> tuple[list[dict[str, Any]], int]:
-    rows: list[dict[str, Any]] = []
-    pages = 0
-    for mes_ano in _month_tokens(year):
-        batch_rows, batch_pages = _fetch_paginated(
-            client,
-            url=_build_url(settings, endpoint),
-            headers=headers,
-            params={"mesAno": int(mes_ano), "codigoIbge": municipality_ibge_code},
-        )
-        pages += batch_pages
-        rows.extend(batch_rows)
-    return rows, pages
+    prefetch: int,
+) -> tuple[EndpointAggregate, int]:
+    return await _collect_endpoint(
+        client,
+        metric_key=metric_key,
+        url=_build_url(settings, endpoint),
+        headers=headers,
+        params_list=[
+            {"mesAno": int(mes_ano), "codigoIbge": municipality_ibge_code}
+            for mes_ano in _month_tokens(year)
+        ],
+        prefetch=prefetch,
+    )
 
 
-def _collect_resources_rows(
-    client: HttpClient,
+async def _collect_resources_rows(
+    client: AsyncHttpClient,
     *,
     settings: Settings,
     year: int,
     municipality_ibge_code: str,
     uf: str,
     headers: dict[str, str],
-) -> tuple[list[dict[str, Any]], int]:
-    rows: list[dict[str, Any]] = []
-    pages = 0
-    for mes_ano in _month_tokens(year):
-        month_ref = _month_mm_yyyy(mes_ano)
-        batch_rows, batch_pages = _fetch_paginated(
-            client,
-            url=_build_url(settings, "despesas/recursos-recebidos"),
-            headers=headers,
-            params={
-                "mesAnoInicio": month_ref,
-                "mesAnoFim": month_ref,
+    prefetch: int,
+) -> tuple[EndpointAggregate, int]:
+    return await _collect_endpoint(
+        client,
+        metric_key="recursos",
+        url=_build_url(settings, "despesas/recursos-recebidos"),
+        headers=headers,
+        params_list=[
+            {
+                "mesAnoInicio": _month_mm_yyyy(mes_ano),
+                "mesAnoFim": _month_mm_yyyy(mes_ano),
                 "uf": uf,
                 "codigoIBGE": municipality_ibge_code,
-            },
-        )
-        pages += batch_pages
-        rows.extend(batch_rows)
-    return rows, pages
+            }
+            for mes_ano in _month_tokens(year)
+        ],
+        prefetch=prefetch,
+    )
 
 
-def _collect_convenios_rows(
-    client: HttpClient,
+async def _collect_convenios_rows(
+    client: AsyncHttpClient,
     *,
     settings: Settings,
     year: int,
     municipality_ibge_code: str,
     uf: str,
     headers: dict[str, str],
-) -> tuple[list[dict[str, Any]], int, list[str]]:
+    prefetch: int,
+) -> tuple[EndpointAggregate, int, list[str]]:
     warnings: list[str] = []
     default_params = {
         "codigoIBGE": municipality_ibge_code,
@@ -234,83 +342,197 @@ def _collect_convenios_rows(
         "dataFinal": f"31/12/{year}",
     }
     try:
-        rows, pages = _fetch_paginated(
+        aggregate, pages = await _collect_endpoint(
             client,
+            metric_key="convenios",
             url=_build_url(settings, "convenios"),
             headers=headers,
-            params=default_params,
+            params_list=[default_params],
+            prefetch=prefetch,
         )
-        return rows, pages, warnings
+        return aggregate, pages, warnings
     except Exception as exc:
         warnings.append(f"convenios with date range failed: {exc}. Retrying without date filters.")
-        rows, pages = _fetch_paginated(
+        aggregate, pages = await _collect_endpoint(
             client,
+            metric_key="convenios",
             url=_build_url(settings, "convenios"),
             headers=headers,
-            params={"codigoIBGE": municipality_ibge_code, "uf": uf},
+            params_list=[{"codigoIBGE": municipality_ibge_code, "uf": uf}],
+            prefetch=prefetch,
         )
-        return rows, pages, warnings
+        return aggregate, pages, warnings
 
 
-def _collect_renuncias_rows(
-    client: HttpClient,
+async def _collect_renuncias_rows(
+    client: AsyncHttpClient,
     *,
     settings: Settings,
     year: int,
     municipality_ibge_code: str,
     headers: dict[str, str],
-) -> tuple[list[dict[str, Any]], int]:
-    rows, pages = _fetch_paginated(
+    prefetch: int,
+) -> tuple[EndpointAggregate, int]:
+    def _matches_year(row: dict[str, Any]) -> bool:
+        row_year = str(row.get("ano", "")).strip()
+        return not row_year or row_year == str(year)
+
+    return await _collect_endpoint(
         client,
+        metric_key="renuncias",
         url=_build_url(settings, "renuncias-valor"),
         headers=headers,
-        params={"codigoIbge": municipality_ibge_code},
+        params_list=[{"codigoIbge": municipality_ibge_code}],
+        prefetch=prefetch,
+        row_filter=_matches_year,
     )
-    filtered: list[dict[str, Any]] = []
-    for row in rows:
-        row_year = str(row.get("ano", "")).strip()
-        if row_year and row_year != str(year):
-            continue
-        filtered.append(row)
-    return filtered, pages
 
 
-def _collect_coronavirus_rows(
-    client: HttpClient,
+async def _collect_coronavirus_rows(
+    client: AsyncHttpClient,
     *,
     settings: Settings,
     year: int,
     municipality_ibge_code: str,
     uf: str,
     headers: dict[str, str],
-) -> tuple[list[dict[str, Any]], int]:
-    rows: list[dict[str, Any]] = []
-    pages = 0
-    for mes_ano in _month_tokens(year):
-        batch_rows, batch_pages = _fetch_paginated(
-            client,
-            url=_build_url(settings, "coronavirus/transferencias"),
-            headers=headers,
-            params={"mesAno": int(mes_ano), "uf": uf, "codigoIbge": municipality_ibge_code},
+    prefetch: int,
+) -> tuple[EndpointAggregate, int]:
+    return await _collect_endpoint(
+        client,
+        metric_key="covid_transferencias",
+        url=_build_url(settings, "coronavirus/transferencias"),
+        headers=headers,
+        params_list=[
+            {"mesAno": int(mes_ano), "uf": uf, "codigoIbge": municipality_ibge_code}
+            for mes_ano in _month_tokens(year)
+        ],
+        prefetch=prefetch,
+    )
+
+
+_MONTHLY_ENDPOINT_SPECS: tuple[tuple[str, str], ...] = (
+    ("bpc", "bpc-por-municipio"),
+    ("bolsa", "bolsa-familia-por-municipio"),
+    ("novo_bolsa", "novo-bolsa-familia-por-municipio"),
+    ("auxilio_brasil", "auxilio-brasil-por-municipio"),
+    ("auxilio_emergencial", "auxilio-emergencial-por-municipio"),
+    ("peti", "peti-por-municipio"),
+    ("safra", "safra-por-municipio"),
+    ("defeso", "seguro-defeso-por-municipio"),
+)
+
+
+async def _collect_all_endpoints(
+    client: AsyncHttpClient,
+    *,
+    settings: Settings,
+    year: int,
+    municipality_ibge_code: str,
+    uf: str,
+    headers: dict[str, str],
+) -> tuple[dict[str, EndpointAggregate], dict[str, dict[str, Any]], list[str]]:
+    """Collect every endpoint concurrently; the client's per-host limits bound the fan-out.
+
+    A failing endpoint yields an empty aggregate and a warning, like a sequential run would.
+    """
+    prefetch = settings.portal_transparencia_page_prefetch
+    common = {"settings": settings, "year": year, "headers": headers, "prefetch": prefetch}
+    jobs: list[tuple[str, str, Awaitable[Any]]] = [
+        (
+            metric_key,
+            endpoint,
+            _collect_monthly_rows(
+                client,
+                metric_key=metric_key,
+                endpoint=endpoint,
+                municipality_ibge_code=municipality_ibge_code,
+                **common,
+            ),
         )
-        pages += batch_pages
-        rows.extend(batch_rows)
-    return rows, pages
+        for metric_key, endpoint in _MONTHLY_ENDPOINT_SPECS
+    ]
+    jobs.extend(
+        [
+            (
+                "recursos",
+                "despesas/recursos-recebidos",
+                _collect_resources_rows(
+                    client, municipality_ibge_code=municipality_ibge_code, uf=uf, **common
+                ),
+            ),
+            (
+                "convenios",
+                "convenios",
+                _collect_convenios_rows(
+                    client, municipality_ibge_code=municipality_ibge_code, uf=uf, **common
+                ),
+            ),
+            (
+                "renuncias",
+                "renuncias-valor",
+                _collect_renuncias_rows(
+                    client, municipality_ibge_code=municipality_ibge_code, **common
+                ),
+            ),
+            (
+                "covid_transferencias",
+                "coronavirus/transferencias",
+                _collect_coronavirus_rows(
+                    client, municipality_ibge_code=municipality_ibge_code, uf=uf, **common
+                ),
+            ),
+        ]
+    )
+
+    async with client:
+        outcomes = await asyncio.gather(*(job for _, _, job in jobs), return_exceptions=True)
+
+    aggregates: dict[str, EndpointAggregate] = {}
+    endpoint_stats: dict[str, dict[str, Any]] = {}
+    warnings: list[str] = []
+    for (metric_key, endpoint, _job), outcome in zip(jobs, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            aggregates[metric_key] = EndpointAggregate.for_key(metric_key)
+            endpoint_stats[metric_key] = {"endpoint": endpoint, "rows": 0, "error": str(outcome)}
+            warnings.append(f"{endpoint} failed: {outcome}")
+            continue
+        aggregate, pages, *endpoint_warnings = outcome
+        for extra in endpoint_warnings:
+            warnings.extend(extra)
+        aggregates[metric_key] = aggregate
+        endpoint_stats[metric_key] = {"endpoint": endpoint, "rows": aggregate.rows, "pages": pages}
+    return aggregates, endpoint_stats, warnings
 
 
 def _build_metrics(*, rows_by_key: dict[str, list[dict[str, Any]]]) -> list[IndicatorMetric]:
-    bpc_rows = rows_by_key.get("bpc", [])
-    bolsa_rows = rows_by_key.get("bolsa", [])
-    nbf_rows = rows_by_key.get("novo_bolsa", [])
-    aux_brasil_rows = rows_by_key.get("auxilio_brasil", [])
-    aux_emerg_rows = rows_by_key.get("auxilio_emergencial", [])
-    peti_rows = rows_by_key.get("peti", [])
-    safra_rows = rows_by_key.get("safra", [])
-    defeso_rows = rows_by_key.get("defeso", [])
-    recursos_rows = rows_by_key.get("recursos", [])
-    convenios_rows = rows_by_key.get("convenios", [])
-    renuncias_rows = rows_by_key.get("renuncias", [])
-    covid_rows = rows_by_key.get("covid_transferencias", [])
+    aggregates: dict[str, EndpointAggregate] = {}
+    for metric_key, rows in rows_by_key.items():
+        aggregates[metric_key] = EndpointAggregate.for_key(metric_key)
+        aggregates[metric_key].add_rows(rows)
+    return _build_metrics_from_aggregates(aggregates)
+
+
+def _build_metrics_from_aggregates(
+    aggregates: dict[str, EndpointAggregate],
+) -> list[IndicatorMetric]:
+    def _aggregate(metric_key: str) -> EndpointAggregate:
+        return aggregates.get(metric_key) or EndpointAggregate.for_key(metric_key)
+
+    bpc = _aggregate("bpc")
+    bolsa = _aggregate("bolsa")
+    novo_bolsa = _aggregate("novo_bolsa")
+    auxilio_brasil = _aggregate("auxilio_brasil")
+    auxilio_emergencial = _aggregate("auxilio_emergencial")
+    peti = _aggregate("peti")
+    safra = _aggregate("safra")
+    defeso = _aggregate("defeso")
+    recursos = _aggregate("recursos")
+    convenios = _aggregate("convenios")
+    renuncias = _aggregate("renuncias")
+    covid = _aggregate("covid_transferencias")
 
     return [
         IndicatorMetric(
@@ -318,188 +540,142 @@ def _build_metrics(*, rows_by_key: dict[str, list[dict[str, Any]]]) -> list[Indi
             name="Portal Transparencia BPC valor total",
             unit="BRL",
             category="assistencia_social",
-            value=_sum_field(bpc_rows, "valor"),
+            value=bpc.total("valor"),
         ),
         IndicatorMetric(
             code="PT_BPC_BENEFICIARIOS_TOTAL",
             name="Portal Transparencia BPC beneficiarios",
             unit="count",
             category="assistencia_social",
-            value=Decimal(_sum_field(bpc_rows, "quantidadeBeneficiados")),
+            value=Decimal(bpc.total("quantidadeBeneficiados")),
         ),
         IndicatorMetric(
             code="PT_BOLSA_FAMILIA_VALOR_TOTAL",
             name="Portal Transparencia Bolsa Familia valor total",
             unit="BRL",
             category="assistencia_social",
-            value=_sum_field(bolsa_rows, "valor"),
+            value=bolsa.total("valor"),
         ),
         IndicatorMetric(
             code="PT_BOLSA_FAMILIA_BENEFICIARIOS_TOTAL",
             name="Portal Transparencia Bolsa Familia beneficiarios",
             unit="count",
             category="assistencia_social",
-            value=Decimal(_sum_field(bolsa_rows, "quantidadeBeneficiados")),
+            value=Decimal(bolsa.total("quantidadeBeneficiados")),
         ),
         IndicatorMetric(
             code="PT_NOVO_BOLSA_FAMILIA_VALOR_TOTAL",
             name="Portal Transparencia Novo Bolsa Familia valor saque",
             unit="BRL",
             category="assistencia_social",
-            value=_sum_field(nbf_rows, "valorSaque"),
+            value=novo_bolsa.total("valorSaque"),
         ),
         IndicatorMetric(
             code="PT_NOVO_BOLSA_FAMILIA_BENEFICIARIOS_UNICOS",
             name="Portal Transparencia Novo Bolsa Familia beneficiarios unicos",
             unit="count",
             category="assistencia_social",
-            value=Decimal(_count_distinct_people(nbf_rows, "nis", "cpfFormatado")),
+            value=Decimal(len(novo_bolsa.people)),
         ),
         IndicatorMetric(
             code="PT_AUXILIO_BRASIL_VALOR_TOTAL",
             name="Portal Transparencia Auxilio Brasil valor total",
             unit="BRL",
             category="assistencia_social",
-            value=_sum_field(aux_brasil_rows, "valor"),
+            value=auxilio_brasil.total("valor"),
         ),
         IndicatorMetric(
             code="PT_AUXILIO_BRASIL_BENEFICIARIOS_TOTAL",
             name="Portal Transparencia Auxilio Brasil beneficiarios",
             unit="count",
             category="assistencia_social",
-            value=Decimal(_sum_field(aux_brasil_rows, "quantidadeBeneficiados")),
+            value=Decimal(auxilio_brasil.total("quantidadeBeneficiados")),
         ),
         IndicatorMetric(
             code="PT_AUXILIO_EMERGENCIAL_VALOR_TOTAL",
             name="Portal Transparencia Auxilio Emergencial valor total",
             unit="BRL",
             category="assistencia_social",
-            value=_sum_field(aux_emerg_rows, "valor"),
+            value=auxilio_emergencial.total("valor"),
         ),
         IndicatorMetric(
             code="PT_AUXILIO_EMERGENCIAL_BENEFICIARIOS_TOTAL",
             name="Portal Transparencia Auxilio Emergencial beneficiarios",
             unit="count",
             category="assistencia_social",
-            value=Decimal(_sum_field(aux_emerg_rows, "quantidadeBeneficiados")),
+            value=Decimal(auxilio_emergencial.total("quantidadeBeneficiados")),
         ),
         IndicatorMetric(
             code="PT_PETI_VALOR_TOTAL",
             name="Portal Transparencia PETI valor total",
             unit="BRL",
             category="assistencia_social",
-            value=_sum_field(peti_rows, "valor"),
+            value=peti.total("valor"),
         ),
         IndicatorMetric(
             code="PT_SAFRA_VALOR_TOTAL",
             name="Portal Transparencia Garantia Safra valor total",
             unit="BRL",
             category="assistencia_social",
-            value=_sum_field(safra_rows, "valor"),
+            value=safra.total("valor"),
         ),
         IndicatorMetric(
             code="PT_SEGURO_DEFESO_VALOR_TOTAL",
             name="Portal Transparencia Seguro Defeso valor total",
             unit="BRL",
             category="assistencia_social",
-            value=_sum_field(defeso_rows, "valor"),
+            value=defeso.total("valor"),
         ),
         IndicatorMetric(
             code="PT_RECURSOS_RECEBIDOS_VALOR_TOTAL",
             name="Portal Transparencia recursos recebidos valor total",
             unit="BRL",
             category="financas_publicas",
-            value=_sum_field(recursos_rows, "valor"),
+            value=recursos.total("valor"),
         ),
         IndicatorMetric(
             code="PT_CONVENIOS_VALOR_TOTAL",
             name="Portal Transparencia convenios valor total",
             unit="BRL",
             category="financas_publicas",
-            value=_sum_field(convenios_rows, "valor"),
+            value=convenios.total("valor"),
         ),
         IndicatorMetric(
             code="PT_CONVENIOS_VALOR_LIBERADO_TOTAL",
             name="Portal Transparencia convenios valor liberado total",
             unit="BRL",
             category="financas_publicas",
-            value=_sum_field(convenios_rows, "valorLiberado"),
+            value=convenios.total("valorLiberado"),
         ),
         IndicatorMetric(
             code="PT_CONVENIOS_QUANTIDADE",
             name="Portal Transparencia quantidade de convenios",
             unit="count",
             category="financas_publicas",
-            value=Decimal(len(convenios_rows)),
+            value=Decimal(convenios.rows),
         ),
         IndicatorMetric(
             code="PT_RENUNCIAS_VALOR_TOTAL",
             name="Portal Transparencia renuncias fiscais valor total",
             unit="BRL",
             category="financas_publicas",
-            value=_sum_field(renuncias_rows, "valorRenunciado"),
+            value=renuncias.total("valorRenunciado"),
         ),
         IndicatorMetric(
             code="PT_COVID_TRANSFERENCIAS_VALOR_TOTAL",
             name="Portal Transparencia COVID transferencias valor total",
             unit="BRL",
             category="financas_publicas",
-            value=_sum_field(covid_rows, "valor"),
+            value=covid.total("valor"),
         ),
     ]
 
 
-def _upsert_indicators(settings: Settings, rows: list[dict[str, Any]]) -> int:
+def _upsert_indicators(settings: Settings, rows: list[dict[str, Any]]) -> FactIndicatorLoadResult:
     if not rows:
-        return 0
+        return FactIndicatorLoadResult(staged=0, inserted=0, updated=0)
     with session_scope(settings) as session:
-        for row in rows:
-            session.execute(
-                text(
-                    """
-                    INSERT INTO silver.fact_indicator (
-                        territory_id,
-                        source,
-                        dataset,
-                        indicator_code,
-                        indicator_name,
-                        unit,
-                        category,
-                        value,
-                        reference_period
-                    )
-                    VALUES (
-                        CAST(:territory_id AS uuid),
-                        :source,
-                        :dataset,
-                        :indicator_code,
-                        :indicator_name,
-                        :unit,
-                        :category,
-                        :value,
-                        :reference_period
-                    )
-                    ON CONFLICT (
-                        territory_id,
-                        source,
-                        dataset,
-                        indicator_code,
-                        category,
-                        reference_period
-                    )
-                    DO UPDATE SET
-                        indicator_name = EXCLUDED.indicator_name,
-                        unit = EXCLUDED.unit,
-                        value = EXCLUDED.value,
-                        updated_at = NOW()
-                    """
-                ),
-                {
-                    **row,
-                    "value": str(row["value"]),
-                },
-            )
-    return len(rows)
+        return bulk_upsert_fact_indicators(session, rows)
 
 
 def run(
@@ -581,49 +757,18 @@ def run(
             "errors": [],
         }
 
-    client = HttpClient.from_settings(
+    client = AsyncHttpClient.from_settings(
         settings,
         timeout_seconds=timeout_seconds,
         max_retries=max_retries,
+        use_cache=False,
+        host_concurrency=settings.portal_transparencia_max_concurrency,
+        host_rate_limit_per_second=settings.portal_transparencia_rate_limit_per_second,
     )
     try:
         headers = {"chave-api-dados": settings.portal_transparencia_api_key}
-
-        endpoint_rows: dict[str, list[dict[str, Any]]] = {}
-        endpoint_stats: dict[str, dict[str, Any]] = {}
-
-        endpoint_specs: tuple[tuple[str, str], ...] = (
-            ("bpc", "bpc-por-municipio"),
-            ("bolsa", "bolsa-familia-por-municipio"),
-            ("novo_bolsa", "novo-bolsa-familia-por-municipio"),
-            ("auxilio_brasil", "auxilio-brasil-por-municipio"),
-            ("auxilio_emergencial", "auxilio-emergencial-por-municipio"),
-            ("peti", "peti-por-municipio"),
-            ("safra", "safra-por-municipio"),
-            ("defeso", "seguro-defeso-por-municipio"),
-        )
-
-        rows_extracted = 0
-        for metric_key, endpoint in endpoint_specs:
-            try:
-                rows, pages = _collect_monthly_rows(
-                    client,
-                    settings=settings,
-                    endpoint=endpoint,
-                    year=reference_year,
-                    municipality_ibge_code=municipality_ibge_code,
-                    headers=headers,
-                )
-                endpoint_rows[metric_key] = rows
-                endpoint_stats[metric_key] = {"endpoint": endpoint, "rows": len(rows), "pages": pages}
-                rows_extracted += len(rows)
-            except Exception as exc:
-                endpoint_rows[metric_key] = []
-                endpoint_stats[metric_key] = {"endpoint": endpoint, "rows": 0, "error": str(exc)}
-                warnings.append(f"{endpoint} failed: {exc}")
-
-        try:
-            recursos_rows, recursos_pages = _collect_resources_rows(
+        aggregates, endpoint_stats, endpoint_warnings = asyncio.run(
+            _collect_all_endpoints(
                 client,
                 settings=settings,
                 year=reference_year,
@@ -631,74 +776,11 @@ def run(
                 uf=uf,
                 headers=headers,
             )
-            endpoint_rows["recursos"] = recursos_rows
-            endpoint_stats["recursos"] = {
-                "endpoint": "despesas/recursos-recebidos",
-                "rows": len(recursos_rows),
-                "pages": recursos_pages,
-            }
-            rows_extracted += len(recursos_rows)
-        except Exception as exc:
-            endpoint_rows["recursos"] = []
-            endpoint_stats["recursos"] = {"endpoint": "despesas/recursos-recebidos", "rows": 0, "error": str(exc)}
-            warnings.append(f"despesas/recursos-recebidos failed: {exc}")
-
-        try:
-            convenios_rows, convenios_pages, convenios_warnings = _collect_convenios_rows(
-                client,
-                settings=settings,
-                year=reference_year,
-                municipality_ibge_code=municipality_ibge_code,
-                uf=uf,
-                headers=headers,
-            )
-            warnings.extend(convenios_warnings)
-            endpoint_rows["convenios"] = convenios_rows
-            endpoint_stats["convenios"] = {"endpoint": "convenios", "rows": len(convenios_rows), "pages": convenios_pages}
-            rows_extracted += len(convenios_rows)
-        except Exception as exc:
-            endpoint_rows["convenios"] = []
-            endpoint_stats["convenios"] = {"endpoint": "convenios", "rows": 0, "error": str(exc)}
-            warnings.append(f"convenios failed: {exc}")
-
-        try:
-            renuncias_rows, renuncias_pages = _collect_renuncias_rows(
-                client,
-                settings=settings,
-                year=reference_year,
-                municipality_ibge_code=municipality_ibge_code,
-                headers=headers,
-            )
-            endpoint_rows["renuncias"] = renuncias_rows
-            endpoint_stats["renuncias"] = {"endpoint": "renuncias-valor", "rows": len(renuncias_rows), "pages": renuncias_pages}
-            rows_extracted += len(renuncias_rows)
-        except Exception as exc:
-            endpoint_rows["renuncias"] = []
-            endpoint_stats["renuncias"] = {"endpoint": "renuncias-valor", "rows": 0, "error": str(exc)}
-            warnings.append(f"renuncias-valor failed: {exc}")
-
-        try:
-            covid_rows, covid_pages = _collect_coronavirus_rows(
-                client,
-                settings=settings,
-                year=reference_year,
-                municipality_ibge_code=municipality_ibge_code,
-                uf=uf,
-                headers=headers,
-            )
-            endpoint_rows["covid_transferencias"] = covid_rows
-            endpoint_stats["covid_transferencias"] = {
-                "endpoint": "coronavirus/transferencias",
-                "rows": len(covid_rows),
-                "pages": covid_pages,
-            }
-            rows_extracted += len(covid_rows)
-        except Exception as exc:
-            endpoint_rows["covid_transferencias"] = []
-            endpoint_stats["covid_transferencias"] = {"endpoint": "coronavirus/transferencias", "rows": 0, "error": str(exc)}
-            warnings.append(f"coronavirus/transferencias failed: {exc}")
+        )
+        warnings.extend(endpoint_warnings)
+        rows_extracted = sum(aggregate.rows for aggregate in aggregates.values())
 
-        metrics = _build_metrics(rows_by_key=endpoint_rows)
+        metrics = _build_metrics_from_aggregates(aggregates)
         indicator_rows = [
             {
                 "territory_id": territory_id,
@@ -784,7 +866,8 @@ def run(
             rows_written=[{"table": "silver.fact_indicator", "rows": len(indicator_rows)}],
         )
 
-        rows_written = _upsert_indicators(settings, indicator_rows)
+        load_result = _upsert_indicators(settings, indicator_rows)
+        rows_written = load_result.rows_written
 
         run_status = "success" if rows_written > 0 else "blocked"
         with session_scope(settings) as session:
@@ -810,6 +893,7 @@ def run(
                     "artifact": artifact_to_dict(artifact),
                     "endpoint_stats": endpoint_stats,
                     "metrics_count": len(metrics),
+                    "fact_indicator_load": load_result.as_dict(),
                 },
             )
             replace_pipeline_checks_from_dicts(
@@ -897,5 +981,3 @@ def run(
             "warnings": warnings,
             "errors": [error_message],
         }
-    finally:
-        client.close()
@@ -21,6 +21,8 @@ from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
 from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
+from pipelines.common.delimited_reader import read_delimited
+from pipelines.common.fact_indicator_loader import bulk_upsert_fact_indicators
 from pipelines.common.http_client import HttpClient
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
 
@@ -171,21 +173,6 @@ def _extract_tabular_bytes_from_zip(zip_bytes: bytes) -> tuple[bytes, str]:
         return archive.read(selected), Path(selected).suffix.casefold()
 
 
-def _read_delimited_with_fallback(raw_bytes: bytes) -> pd.DataFrame:
-    for encoding in ("utf-8", "latin1"):
-        for sep in (";", ",", "\t", "|"):
-            try:
-                dataframe = pd.read_csv(io.BytesIO(raw_bytes), encoding=encoding, sep=sep, low_memory=False)
-                if dataframe.shape[1] == 1:
-                    sample = str(dataframe.iloc[0, 0]) if not dataframe.empty else ""
-                    if any(token in sample for token in (";", ",", "\t", "|")):
-                        continue
-                return dataframe
-            except Exception:
-                continue
-    raise ValueError("Could not parse CSV/TXT with supported encodings/delimiters.")
-
-
 def _load_senatran_structured_csv(raw_bytes: bytes) -> pd.DataFrame:
     for encoding in ("utf-8", "latin1"):
         try:
@@ -222,7 +209,7 @@ def _load_dataframe_from_bytes(raw_bytes: bytes, *, suffix: str) -> pd.DataFrame
             return _load_senatran_structured_csv(raw_bytes)
         except Exception:
             pass
-        return _read_delimited_with_fallback(raw_bytes)
+        return read_delimited(raw_bytes, dialect_key=(SOURCE, DATASET_NAME))
     if normalized_suffix in {".xlsx", ".xls"}:
         return pd.read_excel(io.BytesIO(raw_bytes))
     raise ValueError(f"Unsupported dataset format '{suffix}'.")
@@ -622,60 +609,8 @@ def run(
         rows_written = 0
         if load_rows:
             with session_scope(settings) as session:
-                for row in load_rows:
-                    session.execute(
-                        text(
-                            """
-                            INSERT INTO silver.fact_indicator (
-                                territory_id,
-                                source,
-                                dataset,
-                                indicator_code,
-                                indicator_name,
-                                unit,
-                                category,
-                                value,
-                                reference_period
-                            )
-                            VALUES (
-                                CAST(:territory_id AS uuid),
-                                :source,
-                                :dataset,
-                                :indicator_code,
-                                :indicator_name,
-                                :unit,
-                                :category,
-                                :value,
-                                :reference_period
-                            )
-                            ON CONFLICT (
-                                territory_id,
-                                source,
-                                dataset,
-                                indicator_code,
-                                category,
-                                reference_period
-                            )
-                            DO UPDATE SET
-                                indicator_name = EXCLUDED.indicator_name,
-                                unit = EXCLUDED.unit,
-                                value = EXCLUDED.value,
-                                updated_at = NOW()
-                            """
-                        ),
-                        {
-                            "territory_id": row["territory_id"],
-                            "source": row["source"],
-                            "dataset": row["dataset"],
-                            "indicator_code": row["indicator_code"],
-                            "indicator_name": row["indicator_name"],
-                            "unit": row["unit"],
-                            "category": row["category"],
-                            "value": str(row["value"]),
-                            "reference_period": row["reference_period"],
-                        },
-                    )
-            rows_written = len(load_rows)
+                load_result = bulk_upsert_fact_indicators(session, load_rows)
+            rows_written = load_result.rows_written
 
         checks = [
             {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import time
@@ -15,8 +16,9 @@ from sqlalchemy import text
 from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
+from pipelines.common.async_http_client import AsyncHttpClient
 from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
-from pipelines.common.http_client import HttpClient
+from pipelines.common.fact_indicator_loader import bulk_upsert_fact_indicators
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
 
 JOB_NAME = "sidra_indicators_fetch"
@@ -124,6 +126,83 @@ def _resolve_municipality_context(settings: Settings) -> tuple[str, str]:
     return str(row[0]).strip(), str(row[1]).strip()
 
 
+async def _fetch_entry_payload(
+    client: AsyncHttpClient,
+    entry: dict[str, Any],
+    *,
+    municipality_ibge_code: str,
+    reference_period: str,
+) -> dict[str, Any]:
+    indicator_code = entry["indicator_code"]
+    endpoint = entry["endpoint"]
+    try:
+        payload = await client.get_json(endpoint)
+        return {"payload": payload, "used_endpoint": endpoint, "warning": None, "error_item": None}
+    except Exception as exc:
+        if not entry["fallback_endpoint_template"]:
+            return {
+                "payload": None,
+                "used_endpoint": endpoint,
+                "warning": f"{indicator_code}: primary request failed ({exc}).",
+                "error_item": {
+                    "indicator_code": indicator_code,
+                    "status": "error",
+                    "requested_endpoint": endpoint,
+                    "error": str(exc),
+                },
+            }
+
+    fallback_endpoint = _render_endpoint(
+        entry["fallback_endpoint_template"],
+        municipality_ibge_code=municipality_ibge_code,
+        reference_period=reference_period,
+        fallback_period="last%201",
+    )
+    try:
+        payload = await client.get_json(fallback_endpoint)
+    except Exception as fallback_exc:
+        return {
+            "payload": None,
+            "used_endpoint": fallback_endpoint,
+            "warning": f"{indicator_code}: primary and fallback requests failed ({fallback_exc}).",
+            "error_item": {
+                "indicator_code": indicator_code,
+                "status": "error",
+                "requested_endpoint": endpoint,
+                "fallback_endpoint": fallback_endpoint,
+                "error": str(fallback_exc),
+            },
+        }
+    return {
+        "payload": payload,
+        "used_endpoint": fallback_endpoint,
+        "warning": f"{indicator_code}: primary request failed; fallback endpoint used.",
+        "error_item": None,
+    }
+
+
+async def _fetch_catalog_payloads(
+    client: AsyncHttpClient,
+    entries: list[dict[str, Any]],
+    *,
+    municipality_ibge_code: str,
+    reference_period: str,
+) -> list[dict[str, Any]]:
+    """Fetch every catalog entry concurrently; outcomes keep the catalog order."""
+    async with client:
+        return await asyncio.gather(
+            *(
+                _fetch_entry_payload(
+                    client,
+                    entry,
+                    municipality_ibge_code=municipality_ibge_code,
+                    reference_period=reference_period,
+                )
+                for entry in entries
+            )
+        )
+
+
 def run(
     *,
     reference_period: str,
@@ -169,7 +248,7 @@ def run(
             "errors": [str(exc)],
         }
 
-    client = HttpClient.from_settings(
+    client = AsyncHttpClient.from_settings(
         settings,
         timeout_seconds=timeout_seconds,
         max_retries=max_retries,
@@ -179,78 +258,55 @@ def run(
         load_rows: list[dict[str, Any]] = []
         request_failures = 0
 
+        entries: list[dict[str, Any]] = []
         for item in catalog:
             indicator_code = str(item.get("indicator_code", "")).strip()
-            indicator_name = str(item.get("indicator_name", "")).strip() or indicator_code
             endpoint_template = str(item.get("endpoint", "")).strip()
-            fallback_endpoint_template = str(item.get("fallback_endpoint", "")).strip()
-            unit = str(item.get("unit", "")).strip() or None
-            category = str(item.get("category", "")).strip() or "sidra"
-
             if not indicator_code or not endpoint_template:
                 warnings.append(f"Catalog entry skipped due to missing required fields: {item}")
                 continue
+            entries.append(
+                {
+                    "indicator_code": indicator_code,
+                    "indicator_name": str(item.get("indicator_name", "")).strip() or indicator_code,
+                    "endpoint": _render_endpoint(
+                        endpoint_template,
+                        municipality_ibge_code=municipality_ibge_code,
+                        reference_period=requested_period,
+                        fallback_period="last%201",
+                    ),
+                    "fallback_endpoint_template": str(item.get("fallback_endpoint", "")).strip(),
+                    "unit": str(item.get("unit", "")).strip() or None,
+                    "category": str(item.get("category", "")).strip() or "sidra",
+                }
+            )
 
-            endpoint = _render_endpoint(
-                endpoint_template,
+        outcomes = asyncio.run(
+            _fetch_catalog_payloads(
+                client,
+                entries,
                 municipality_ibge_code=municipality_ibge_code,
                 reference_period=requested_period,
-                fallback_period="last%201",
             )
+        )
 
-            payload: Any = None
-            used_endpoint = endpoint
-            try:
-                payload = client.get_json(endpoint)
-            except Exception as exc:
-                if not fallback_endpoint_template:
-                    request_failures += 1
-                    warnings.append(f"{indicator_code}: primary request failed ({exc}).")
-                    raw_items.append(
-                        {
-                            "indicator_code": indicator_code,
-                            "status": "error",
-                            "requested_endpoint": endpoint,
-                            "error": str(exc),
-                        }
-                    )
-                    continue
-
-                fallback_endpoint = _render_endpoint(
-                    fallback_endpoint_template,
-                    municipality_ibge_code=municipality_ibge_code,
-                    reference_period=requested_period,
-                    fallback_period="last%201",
-                )
-                try:
-                    payload = client.get_json(fallback_endpoint)
-                    used_endpoint = fallback_endpoint
-                    warnings.append(
-                        f"{indicator_code}: primary request failed; fallback endpoint used."
-                    )
-                except Exception as fallback_exc:
-                    request_failures += 1
-                    warnings.append(
-                        f"{indicator_code}: primary and fallback requests failed ({fallback_exc})."
-                    )
-                    raw_items.append(
-                        {
-                            "indicator_code": indicator_code,
-                            "status": "error",
-                            "requested_endpoint": endpoint,
-                            "fallback_endpoint": fallback_endpoint,
-                            "error": str(fallback_exc),
-                        }
-                    )
-                    continue
+        for entry, outcome in zip(entries, outcomes, strict=True):
+            indicator_code = entry["indicator_code"]
+            if outcome["warning"]:
+                warnings.append(outcome["warning"])
+            if outcome["error_item"] is not None:
+                request_failures += 1
+                raw_items.append(outcome["error_item"])
+                continue
 
+            payload = outcome["payload"]
             value, effective_period = _extract_sidra_value(payload, requested_period)
             raw_items.append(
                 {
                     "indicator_code": indicator_code,
                     "status": "ok" if value is not None else "no_value",
-                    "requested_endpoint": endpoint,
-                    "used_endpoint": used_endpoint,
+                    "requested_endpoint": entry["endpoint"],
+                    "used_endpoint": outcome["used_endpoint"],
                     "rows_count": len(payload) if isinstance(payload, list) else 0,
                 }
             )
@@ -265,9 +321,9 @@ def run(
                     "source": SOURCE,
                     "dataset": FACT_DATASET_NAME,
                     "indicator_code": indicator_code,
-                    "indicator_name": indicator_name,
-                    "unit": unit,
-                    "category": category,
+                    "indicator_name": entry["indicator_name"],
+                    "unit": entry["unit"],
+                    "category": entry["category"],
                     "value": value,
                     "reference_period": effective_period,
                 }
@@ -301,60 +357,8 @@ def run(
         rows_written = 0
         if load_rows:
             with session_scope(settings) as session:
-                for row in load_rows:
-                    session.execute(
-                        text(
-                            """
-                            INSERT INTO silver.fact_indicator (
-                                territory_id,
-                                source,
-                                dataset,
-                                indicator_code,
-                                indicator_name,
-                                unit,
-                                category,
-                                value,
-                                reference_period
-                            )
-                            VALUES (
-                                CAST(:territory_id AS uuid),
-                                :source,
-                                :dataset,
-                                :indicator_code,
-                                :indicator_name,
-                                :unit,
-                                :category,
-                                :value,
-                                :reference_period
-                            )
-                            ON CONFLICT (
-                                territory_id,
-                                source,
-                                dataset,
-                                indicator_code,
-                                category,
-                                reference_period
-                            )
-                            DO UPDATE SET
-                                indicator_name = EXCLUDED.indicator_name,
-                                unit = EXCLUDED.unit,
-                                value = EXCLUDED.value,
-                                updated_at = NOW()
-                            """
-                        ),
-                        {
-                            "territory_id": row["territory_id"],
-                            "source": row["source"],
-                            "dataset": row["dataset"],
-                            "indicator_code": row["indicator_code"],
-                            "indicator_name": row["indicator_name"],
-                            "unit": row["unit"],
-                            "category": row["category"],
-                            "value": str(row["value"]),
-                            "reference_period": row["reference_period"],
-                        },
-                    )
-                rows_written = len(load_rows)
+                load_result = bulk_upsert_fact_indicators(session, load_rows)
+            rows_written = load_result.rows_written
 
         checks = [
             {
@@ -519,5 +523,3 @@ def run(
             "warnings": warnings,
             "errors": [str(exc)],
         }
-    finally:
-        client.close()
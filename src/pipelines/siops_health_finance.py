@@ -20,6 +20,8 @@ from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
 from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
+from pipelines.common.delimited_reader import read_delimited
+from pipelines.common.fact_indicator_loader import bulk_upsert_fact_indicators
 from pipelines.common.http_client import HttpClient
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
 
@@ -144,23 +146,13 @@ def _extract_tabular_bytes_from_zip(zip_bytes: bytes) -> tuple[bytes, str]:
         return archive.read(selected), Path(selected).suffix.casefold()
 
 
-def _read_delimited_with_fallback(raw_bytes: bytes) -> pd.DataFrame:
-    for encoding in ("utf-8", "latin1"):
-        for sep in (";", ",", "\t", "|"):
-            try:
-                return pd.read_csv(io.BytesIO(raw_bytes), encoding=encoding, sep=sep, low_memory=False)
-            except Exception:
-                continue
-    raise ValueError("Could not parse CSV/TXT with supported encodings/delimiters.")
-
-
 def _load_dataframe_from_bytes(raw_bytes: bytes, *, suffix: str) -> pd.DataFrame:
     normalized_suffix = suffix.casefold()
     if normalized_suffix == ".zip":
         inner_bytes, inner_suffix = _extract_tabular_bytes_from_zip(raw_bytes)
         return _load_dataframe_from_bytes(inner_bytes, suffix=inner_suffix)
     if normalized_suffix in {".csv", ".txt"}:
-        return _read_delimited_with_fallback(raw_bytes)
+        return read_delimited(raw_bytes, dialect_key=(SOURCE, DATASET_NAME))
     if normalized_suffix in {".xlsx", ".xls"}:
         return pd.read_excel(io.BytesIO(raw_bytes))
     raise ValueError(f"Unsupported dataset format '{suffix}'.")
@@ -468,60 +460,8 @@ def run(
         rows_written = 0
         if load_rows:
             with session_scope(settings) as session:
-                for row in load_rows:
-                    session.execute(
-                        text(
-                            """
-                            INSERT INTO silver.fact_indicator (
-                                territory_id,
-                                source,
-                                dataset,
-                                indicator_code,
-                                indicator_name,
-                                unit,
-                                category,
-                                value,
-                                reference_period
-                            )
-                            VALUES (
-                                CAST(:territory_id AS uuid),
-                                :source,
-                                :dataset,
-                                :indicator_code,
-                                :indicator_name,
-                                :unit,
-                                :category,
-                                :value,
-                                :reference_period
-                            )
-                            ON CONFLICT (
-                                territory_id,
-                                source,
-                                dataset,
-                                indicator_code,
-                                category,
-                                reference_period
-                            )
-                            DO UPDATE SET
-                                indicator_name = EXCLUDED.indicator_name,
-                                unit = EXCLUDED.unit,
-                                value = EXCLUDED.value,
-                                updated_at = NOW()
-                            """
-                        ),
-                        {
-                            "territory_id": row["territory_id"],
-                            "source": row["source"],
-                            "dataset": row["dataset"],
-                            "indicator_code": row["indicator_code"],
-                            "indicator_name": row["indicator_name"],
-                            "unit": row["unit"],
-                            "category": row["category"],
-                            "value": str(row["value"]),
-                            "reference_period": row["reference_period"],
-                        },
-                    )
-            rows_written = len(load_rows)
+                load_result = bulk_upsert_fact_indicators(session, load_rows)
+            rows_written = load_result.rows_written
 
         checks = [
             {
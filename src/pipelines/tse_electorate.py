@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import io
 import json
+import tempfile
 import time
 import unicodedata
 import zipfile
+from contextlib import ExitStack
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, BinaryIO
 from uuid import uuid4
 
 import pandas as pd
@@ -15,7 +17,7 @@ from sqlalchemy import text
 from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
-from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
+from pipelines.common.bronze_store import artifact_to_dict, persist_raw_stream
 from pipelines.common.http_client import HttpClient
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
 
@@ -65,6 +67,11 @@ _LOCAL_VOTING_COLUMN_ALIASES: dict[str, tuple[str, ...]] = {
 }
 _MIN_REFERENCE_YEAR = 1900
 _MAX_REFERENCE_YEAR_OFFSET = 1
+# TSE archives are downloaded into a spooled temp file: small files stay in memory,
+# statewide files (hundreds of MB for MG) roll over to disk so RSS stays bounded.
+_ZIP_SPOOL_MAX_BYTES = 32 * 1024 * 1024
+_ZIP_CONTENT_TYPES = ["zip", "octet-stream", "application/octet-stream"]
+_CSV_CHUNK_SIZE = 200_000
 
 
 def _normalize_text(value: str) -> str:
@@ -122,6 +129,31 @@ def _normalize_reference_year(value: Any, *, requested_year: int) -> tuple[int,
     return requested_year, True
 
 
+def _open_zip_archive(zip_source: bytes | BinaryIO) -> zipfile.ZipFile:
+    if isinstance(zip_source, (bytes, bytearray)):
+        return zipfile.ZipFile(io.BytesIO(zip_source))
+    zip_source.seek(0)
+    return zipfile.ZipFile(zip_source)
+
+
+def _download_zip_to_spool(client: HttpClient, url: str, stack: ExitStack) -> BinaryIO:
+    spool = stack.enter_context(tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_MAX_BYTES))
+    client.download_to_file(
+        url,
+        spool,
+        expected_content_types=_ZIP_CONTENT_TYPES,
+        min_bytes=1024,
+    )
+    return spool
+
+
+def _municipality_mask(chunk: pd.DataFrame, *, uf: str, target_name: str) -> pd.Series:
+    # Normalize each distinct municipality name once instead of once per CSV row.
+    names = chunk["NM_MUNICIPIO"].astype(str)
+    matching_names = [name for name in names.unique() if _normalize_text(name) == target_name]
+    return chunk["SG_UF"].astype(str).str.strip().str.upper().eq(uf) & names.isin(matching_names)
+
+
 def _resolve_municipality_context(settings: Settings) -> tuple[str, str, str]:
     with session_scope(settings) as session:
         row = session.execute(
@@ -280,7 +312,7 @@ def _resolve_required_columns(columns: list[str], aliases: dict[str, tuple[str,
 
 def _extract_section_rows_from_zip(
     *,
-    zip_bytes: bytes,
+    zip_source: bytes | BinaryIO,
     municipality_name: str,
     uf: str,
     requested_year: int,
@@ -293,7 +325,7 @@ def _extract_section_rows_from_zip(
     rows_filtered = 0
     outlier_year_rows_rewritten = 0
 
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+    with _open_zip_archive(zip_source) as archive:
         csv_files = [name for name in archive.namelist() if name.lower().endswith(".csv")]
         if not csv_files:
             raise ValueError("Zip payload has no CSV file.")
@@ -310,16 +342,13 @@ def _extract_section_rows_from_zip(
                 wrapper,
                 sep=";",
                 usecols=list(column_mapping.values()),
-                chunksize=200_000,
+                chunksize=_CSV_CHUNK_SIZE,
                 low_memory=False,
             )
             for chunk in chunks:
                 chunk = chunk.rename(columns={actual: canonical for canonical, actual in column_mapping.items()})
                 rows_scanned += len(chunk)
-                filtered = chunk[
-                    chunk["SG_UF"].astype(str).str.strip().str.upper().eq(uf)
-                    & chunk["NM_MUNICIPIO"].astype(str).map(_normalize_text).eq(target_name)
-                ]
+                filtered = chunk[_municipality_mask(chunk, uf=uf, target_name=target_name)]
                 if filtered.empty:
                     continue
 
@@ -413,7 +442,7 @@ def _extract_section_rows_from_zip(
 
 def _extract_local_voting_metadata_from_zip(
     *,
-    zip_bytes: bytes,
+    zip_source: bytes | BinaryIO,
     municipality_name: str,
     uf: str,
     requested_year: int,
@@ -425,7 +454,7 @@ def _extract_local_voting_metadata_from_zip(
     rows_filtered = 0
     outlier_year_rows_rewritten = 0
 
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+    with _open_zip_archive(zip_source) as archive:
         csv_files = [name for name in archive.namelist() if name.lower().endswith(".csv")]
         if not csv_files:
             raise ValueError("Zip payload has no CSV file.")
@@ -442,16 +471,13 @@ def _extract_local_voting_metadata_from_zip(
                 wrapper,
                 sep=";",
                 usecols=list(column_mapping.values()),
-                chunksize=200_000,
+                chunksize=_CSV_CHUNK_SIZE,
                 low_memory=False,
             )
             for chunk in chunks:
                 chunk = chunk.rename(columns={actual: canonical for canonical, actual in column_mapping.items()})
                 rows_scanned += len(chunk)
-                filtered = chunk[
-                    chunk["SG_UF"].astype(str).str.strip().str.upper().eq(uf)
-                    & chunk["NM_MUNICIPIO"].astype(str).map(_normalize_text).eq(target_name)
-                ]
+                filtered = chunk[_municipality_mask(chunk, uf=uf, target_name=target_name)]
                 if filtered.empty:
                     continue
                 filtered = filtered.copy()
@@ -505,7 +531,7 @@ def _extract_local_voting_metadata_from_zip(
 
 def _extract_rows_from_zip(
     *,
-    zip_bytes: bytes,
+    zip_source: bytes | BinaryIO,
     municipality_name: str,
     uf: str,
     requested_year: int,
@@ -519,7 +545,7 @@ def _extract_rows_from_zip(
     outlier_year_rows_rewritten = 0
     column_mapping: dict[str, str] = {}
 
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+    with _open_zip_archive(zip_source) as archive:
         csv_files = [name for name in archive.namelist() if name.lower().endswith(".csv")]
         if not csv_files:
             raise ValueError("Zip payload has no CSV file.")
@@ -536,16 +562,13 @@ def _extract_rows_from_zip(
                 wrapper,
                 sep=";",
                 usecols=list(column_mapping.values()),
-                chunksize=200_000,
+                chunksize=_CSV_CHUNK_SIZE,
                 low_memory=False,
             )
             for chunk in chunks:
                 chunk = chunk.rename(columns={actual: canonical for canonical, actual in column_mapping.items()})
                 rows_scanned += len(chunk)
-                filtered = chunk[
-                    chunk["SG_UF"].astype(str).str.strip().str.upper().eq(uf)
-                    & chunk["NM_MUNICIPIO"].astype(str).map(_normalize_text).eq(target_name)
-                ]
+                filtered = chunk[_municipality_mask(chunk, uf=uf, target_name=target_name)]
                 if filtered.empty:
                     continue
 
@@ -653,17 +676,54 @@ def _extract_rows_from_zip(
     return municipality_rows, zone_rows, info
 
 
-def _upsert_electoral_zone(
+_TERRITORY_CENTROID_SQL = """
+    COALESCE(
+        (SELECT ST_Centroid(district.geometry)
+         FROM silver.dim_territory district
+         WHERE district.level = 'district'
+           AND district.ibge_geocode = (CAST(:ibge_geocode AS TEXT) || '05')
+         LIMIT 1),
+        CASE WHEN parent.geometry IS NULL THEN NULL ELSE ST_Centroid(parent.geometry) END
+    )
+"""
+
+_ELECTORAL_TERRITORY_CONFLICT_SQL = """
+    ON CONFLICT (level, ibge_geocode, tse_zone, tse_section, municipality_ibge_code)
+    DO UPDATE SET
+        parent_territory_id = EXCLUDED.parent_territory_id,
+        canonical_key = EXCLUDED.canonical_key,
+        source_entity_id = EXCLUDED.source_entity_id,
+        name = EXCLUDED.name,
+        normalized_name = EXCLUDED.normalized_name,
+        uf = EXCLUDED.uf,
+        geometry = CASE
+            WHEN COALESCE(silver.dim_territory.metadata, '{}'::jsonb) ? 'geocode_source'
+                THEN silver.dim_territory.geometry
+            ELSE COALESCE(EXCLUDED.geometry, silver.dim_territory.geometry)
+        END,
+        metadata = COALESCE(silver.dim_territory.metadata, '{}'::jsonb) || EXCLUDED.metadata,
+        updated_at = NOW()
+"""
+
+# Rows per INSERT ... SELECT FROM unnest(...) statement; keeps bind arrays reasonably sized.
+_FACT_BATCH_SIZE = 50_000
+
+
+def _upsert_electoral_zones(
     *,
     session: Any,
     municipality_territory_id: str,
     municipality_ibge_code: str,
     uf: str,
-    zone_code: str,
-) -> str:
-    row = session.execute(
+    zone_codes: list[str],
+) -> dict[str, str]:
+    """Upsert every electoral zone in one statement and return ``{zone_code: territory_id}``."""
+    if not zone_codes:
+        return {}
+    zone_names = [f"Zona {zone_code}" for zone_code in zone_codes]
+    rows = session.execute(
         text(
-            """
+            f"""
             INSERT INTO silver.dim_territory (
                 level,
                 parent_territory_id,
@@ -680,64 +740,46 @@ def _upsert_electoral_zone(
                 geometry,
                 metadata
             )
-            VALUES (
+            SELECT
                 CAST('electoral_zone' AS silver.territory_level),
-                CAST(:parent_territory_id AS uuid),
-                :canonical_key,
+                parent.territory_id,
+                z.canonical_key,
                 'TSE',
-                :source_entity_id,
+                z.source_entity_id,
                 :ibge_geocode,
-                :tse_zone,
+                z.tse_zone,
                 '',
-                :name,
-                :normalized_name,
+                z.name,
+                z.normalized_name,
                 :uf,
                 :municipality_ibge_code,
-                COALESCE(
-                    (SELECT ST_Centroid(geometry)
-                     FROM silver.dim_territory
-                     WHERE level = 'district'
-                       AND ibge_geocode = (:ibge_geocode || '05')
-                     LIMIT 1),
-                    (SELECT
-                        CASE
-                            WHEN geometry IS NULL THEN NULL
-                            ELSE ST_Centroid(geometry)
-                        END
-                    FROM silver.dim_territory
-                    WHERE territory_id = CAST(:parent_territory_id AS uuid)
-                    LIMIT 1)
-                ),
+                {_TERRITORY_CENTROID_SQL},
                 CAST(:metadata AS jsonb)
-            )
-            ON CONFLICT (level, ibge_geocode, tse_zone, tse_section, municipality_ibge_code)
-            DO UPDATE SET
-                parent_territory_id = EXCLUDED.parent_territory_id,
-                canonical_key = EXCLUDED.canonical_key,
-                source_entity_id = EXCLUDED.source_entity_id,
-                name = EXCLUDED.name,
-                normalized_name = EXCLUDED.normalized_name,
-                uf = EXCLUDED.uf,
-                geometry = CASE
-                    WHEN COALESCE(silver.dim_territory.metadata, '{}'::jsonb) ? 'geocode_source'
-                        THEN silver.dim_territory.geometry
-                    ELSE COALESCE(EXCLUDED.geometry, silver.dim_territory.geometry)
-                END,
-                metadata = COALESCE(silver.dim_territory.metadata, '{}'::jsonb) || EXCLUDED.metadata,
-                updated_at = NOW()
-            RETURNING territory_id::text
+            FROM unnest(
+                CAST(:tse_zones AS TEXT[]),
+                CAST(:canonical_keys AS TEXT[]),
+                CAST(:source_entity_ids AS TEXT[]),
+                CAST(:names AS TEXT[]),
+                CAST(:normalized_names AS TEXT[])
+            ) AS z(tse_zone, canonical_key, source_entity_id, name, normalized_name)
+            LEFT JOIN silver.dim_territory parent
+                ON parent.territory_id = CAST(:parent_territory_id AS uuid)
+            {_ELECTORAL_TERRITORY_CONFLICT_SQL}
+            RETURNING tse_zone, territory_id::text
             """
         ),
         {
             "parent_territory_id": municipality_territory_id,
-            "canonical_key": f"electoral_zone:tse:{municipality_ibge_code}:{zone_code}",
-            "source_entity_id": f"{uf}-{municipality_ibge_code}-{zone_code}",
             "ibge_geocode": municipality_ibge_code,
-            "tse_zone": zone_code,
-            "name": f"Zona {zone_code}",
-            "normalized_name": _normalize_text(f"Zona {zone_code}"),
             "uf": uf,
             "municipality_ibge_code": municipality_ibge_code,
+            "tse_zones": zone_codes,
+            "canonical_keys": [
+                f"electoral_zone:tse:{municipality_ibge_code}:{zone_code}" for zone_code in zone_codes
+            ],
+            "source_entity_ids": [f"{uf}-{municipality_ibge_code}-{zone_code}" for zone_code in zone_codes],
+            "names": zone_names,
+            "normalized_names": [_normalize_text(name) for name in zone_names],
             "metadata": json.dumps(
                 {
                     "official_status": "proxy",
@@ -747,30 +789,20 @@ def _upsert_electoral_zone(
                 }
             ),
         },
-    ).first()
-    if row is None:
-        raise RuntimeError(f"Could not upsert electoral zone {zone_code}.")
-    return str(row[0])
+    ).all()
+    return {str(row[0]): str(row[1]) for row in rows}
 
 
-def _upsert_electoral_section(
+def _build_section_metadata(
     *,
-    session: Any,
-    zone_territory_id: str,
-    municipality_name: str,
-    municipality_ibge_code: str,
-    uf: str,
-    zone_code: str,
-    section_code: str,
-    polling_place_name: str | None = None,
-    polling_place_code: str | None = None,
-    voters_section: int | None = None,
-) -> str:
+    polling_place_name: Any = None,
+    polling_place_code: Any = None,
+    voters_section: Any = None,
+) -> dict[str, Any]:
     polling_place_name = _safe_optional_text(polling_place_name)
     polling_place_code = _safe_optional_text(polling_place_code)
     voters_section = _safe_optional_int(voters_section)
 
-    section_name = f"Secao eleitoral {section_code} (zona {zone_code}) - {municipality_name}"
     metadata: dict[str, Any] = {
         "official_status": "proxy",
         "proxy_method": "Secao projetada no centroide do distrito-sede (IBGE geocode+05), com fallback para centroide da zona.",
@@ -783,10 +815,57 @@ def _upsert_electoral_section(
         metadata["polling_place_code"] = polling_place_code
     if voters_section is not None:
         metadata["voters_section"] = voters_section
+    return metadata
+
 
-    row = session.execute(
+def _upsert_electoral_sections(
+    *,
+    session: Any,
+    zone_territory_ids: dict[str, str],
+    municipality_name: str,
+    municipality_ibge_code: str,
+    uf: str,
+    sections: list[dict[str, Any]],
+) -> dict[tuple[str, str], str]:
+    """Upsert every electoral section in one statement.
+
+    ``sections`` holds one item per ``(tse_zone, tse_section)`` with optional polling place
+    fields; the result maps that key to the section territory id.
+    """
+    if not sections:
+        return {}
+    parent_ids: list[str] = []
+    zones: list[str] = []
+    section_codes: list[str] = []
+    canonical_keys: list[str] = []
+    source_entity_ids: list[str] = []
+    names: list[str] = []
+    normalized_names: list[str] = []
+    metadata_payloads: list[str] = []
+    for item in sections:
+        zone_code = str(item["tse_zone"])
+        section_code = str(item["tse_section"])
+        section_name = f"Secao eleitoral {section_code} (zona {zone_code}) - {municipality_name}"
+        parent_ids.append(zone_territory_ids[zone_code])
+        zones.append(zone_code)
+        section_codes.append(section_code)
+        canonical_keys.append(f"electoral_section:tse:{municipality_ibge_code}:{zone_code}:{section_code}")
+        source_entity_ids.append(f"{uf}-{municipality_ibge_code}-{zone_code}-{section_code}")
+        names.append(section_name)
+        normalized_names.append(_normalize_text(section_name))
+        metadata_payloads.append(
+            json.dumps(
+                _build_section_metadata(
+                    polling_place_name=item.get("local_votacao"),
+                    polling_place_code=item.get("nr_local_votacao"),
+                    voters_section=item.get("voters_section"),
+                )
+            )
+        )
+
+    rows = session.execute(
         text(
-            """
+            f"""
             INSERT INTO silver.dim_territory (
                 level,
                 parent_territory_id,
@@ -803,71 +882,120 @@ def _upsert_electoral_section(
                 geometry,
                 metadata
             )
-            VALUES (
+            SELECT
                 CAST('electoral_section' AS silver.territory_level),
-                CAST(:parent_territory_id AS uuid),
-                :canonical_key,
+                s.parent_territory_id,
+                s.canonical_key,
                 'TSE',
-                :source_entity_id,
+                s.source_entity_id,
                 :ibge_geocode,
-                :tse_zone,
-                :tse_section,
-                :name,
-                :normalized_name,
+                s.tse_zone,
+                s.tse_section,
+                s.name,
+                s.normalized_name,
                 :uf,
                 :municipality_ibge_code,
-                COALESCE(
-                    (SELECT ST_Centroid(geometry)
-                     FROM silver.dim_territory
-                     WHERE level = 'district'
-                       AND ibge_geocode = (:ibge_geocode || '05')
-                     LIMIT 1),
-                    (SELECT
-                        CASE
-                            WHEN geometry IS NULL THEN NULL
-                            ELSE ST_Centroid(geometry)
-                        END
-                    FROM silver.dim_territory
-                    WHERE territory_id = CAST(:parent_territory_id AS uuid)
-                    LIMIT 1)
-                ),
-                CAST(:metadata AS jsonb)
+                {_TERRITORY_CENTROID_SQL},
+                s.metadata
+            FROM unnest(
+                CAST(:parent_territory_ids AS UUID[]),
+                CAST(:tse_zones AS TEXT[]),
+                CAST(:tse_sections AS TEXT[]),
+                CAST(:canonical_keys AS TEXT[]),
+                CAST(:source_entity_ids AS TEXT[]),
+                CAST(:names AS TEXT[]),
+                CAST(:normalized_names AS TEXT[]),
+                CAST(:metadata AS JSONB[])
+            ) AS s(
+                parent_territory_id,
+                tse_zone,
+                tse_section,
+                canonical_key,
+                source_entity_id,
+                name,
+                normalized_name,
+                metadata
             )
-            ON CONFLICT (level, ibge_geocode, tse_zone, tse_section, municipality_ibge_code)
-            DO UPDATE SET
-                parent_territory_id = EXCLUDED.parent_territory_id,
-                canonical_key = EXCLUDED.canonical_key,
-                source_entity_id = EXCLUDED.source_entity_id,
-                name = EXCLUDED.name,
-                normalized_name = EXCLUDED.normalized_name,
-                uf = EXCLUDED.uf,
-                geometry = CASE
-                    WHEN COALESCE(silver.dim_territory.metadata, '{}'::jsonb) ? 'geocode_source'
-                        THEN silver.dim_territory.geometry
-                    ELSE COALESCE(EXCLUDED.geometry, silver.dim_territory.geometry)
-                END,
-                metadata = COALESCE(silver.dim_territory.metadata, '{}'::jsonb) || EXCLUDED.metadata,
-                updated_at = NOW()
-            RETURNING territory_id::text
+            LEFT JOIN silver.dim_territory parent
+                ON parent.territory_id = s.parent_territory_id
+            {_ELECTORAL_TERRITORY_CONFLICT_SQL}
+            RETURNING tse_zone, tse_section, territory_id::text
             """
         ),
         {
-            "parent_territory_id": zone_territory_id,
-            "canonical_key": f"electoral_section:tse:{municipality_ibge_code}:{zone_code}:{section_code}",
-            "source_entity_id": f"{uf}-{municipality_ibge_code}-{zone_code}-{section_code}",
             "ibge_geocode": municipality_ibge_code,
-            "tse_zone": zone_code,
-            "tse_section": section_code,
-            "name": section_name,
-            "normalized_name": _normalize_text(section_name),
             "uf": uf,
             "municipality_ibge_code": municipality_ibge_code,
-            "metadata": json.dumps(metadata),
+            "parent_territory_ids": parent_ids,
+            "tse_zones": zones,
+            "tse_sections": section_codes,
+            "canonical_keys": canonical_keys,
+            "source_entity_ids": source_entity_ids,
+            "names": names,
+            "normalized_names": normalized_names,
+            "metadata": metadata_payloads,
         },
-    ).first()
-    if row is None:
-        raise RuntimeError(f"Could not upsert electoral section {section_code} (zone {zone_code}).")
-    return str(row[0])
+    ).all()
+    return {(str(row[0]), str(row[1])): str(row[2]) for row in rows}
+
+
+def _bulk_upsert_electorate_facts(session: Any, rows: list[dict[str, Any]]) -> int:
+    """Upsert ``silver.fact_electorate`` rows with one ``unnest`` statement per batch."""
+    deduplicated: dict[tuple[str, int, str, str, str], int] = {}
+    for row in rows:
+        key = (
+            str(row["territory_id"]),
+            int(row["reference_year"]),
+            row["sex"],
+            row["age_range"],
+            row["education"],
+        )
+        deduplicated[key] = int(row["voters"])
+    items = list(deduplicated.items())
+
+    for start in range(0, len(items), _FACT_BATCH_SIZE):
+        batch = items[start : start + _FACT_BATCH_SIZE]
+        session.execute(
+            text(
+                """
+                INSERT INTO silver.fact_electorate (
+                    territory_id,
+                    reference_year,
+                    sex,
+                    age_range,
+                    education,
+                    voters
+                )
+                SELECT territory_id, reference_year, sex, age_range, education, voters
+                FROM unnest(
+                    CAST(:territory_ids AS UUID[]),
+                    CAST(:reference_years AS INTEGER[]),
+                    CAST(:sexes AS TEXT[]),
+                    CAST(:age_ranges AS TEXT[]),
+                    CAST(:educations AS TEXT[]),
+                    CAST(:voters AS INTEGER[])
+                ) AS f(territory_id, reference_year, sex, age_range, education, voters)
+                ON CONFLICT (
+                    territory_id,
+                    reference_year,
+                    sex,
+                    age_range,
+                    education
+                )
+                DO UPDATE SET
+                    voters = EXCLUDED.voters
+                """
+            ),
+            {
+                "territory_ids": [key[0] for key, _ in batch],
+                "reference_years": [key[1] for key, _ in batch],
+                "sexes": [key[2] for key, _ in batch],
+                "age_ranges": [key[3] for key, _ in batch],
+                "educations": [key[4] for key, _ in batch],
+                "voters": [voters for _, voters in batch],
+            },
+        )
+    return len(items)
 
 
 def run(
@@ -892,6 +1020,7 @@ def run(
         timeout_seconds=timeout_seconds,
         max_retries=max_retries,
     )
+    downloads = ExitStack()
     try:
         reference_year = int(reference_period)
     except ValueError:
@@ -937,14 +1066,10 @@ def run(
         if not resource_url:
             raise RuntimeError("Selected TSE resource has empty URL.")
 
-        zip_bytes, _ = client.download_bytes(
-            resource_url,
-            expected_content_types=["zip", "octet-stream", "application/octet-stream"],
-            min_bytes=1024,
-        )
+        zip_file = _download_zip_to_spool(client, resource_url, downloads)
 
         parsed_rows_municipality, parsed_rows_zone, parse_info = _extract_rows_from_zip(
-            zip_bytes=zip_bytes,
+            zip_source=zip_file,
             municipality_name=municipality_name,
             uf=uf,
             requested_year=reference_year,
@@ -956,17 +1081,18 @@ def run(
         if section_resource is not None:
             section_resource_url = str(section_resource.get("url", "")).strip()
             if section_resource_url:
-                section_zip_bytes, _ = client.download_bytes(
-                    section_resource_url,
-                    expected_content_types=["zip", "octet-stream", "application/octet-stream"],
-                    min_bytes=1024,
-                )
-                parsed_rows_section, section_parse_info = _extract_section_rows_from_zip(
-                    zip_bytes=section_zip_bytes,
-                    municipality_name=municipality_name,
-                    uf=uf,
-                    requested_year=reference_year,
-                )
+                with ExitStack() as section_download:
+                    section_zip_file = _download_zip_to_spool(
+                        client,
+                        section_resource_url,
+                        section_download,
+                    )
+                    parsed_rows_section, section_parse_info = _extract_section_rows_from_zip(
+                        zip_source=section_zip_file,
+                        municipality_name=municipality_name,
+                        uf=uf,
+                        requested_year=reference_year,
+                    )
         else:
             warnings.append(
                 f"No section-level electorate resource found for UF={uf} and year={reference_year}."
@@ -978,17 +1104,20 @@ def run(
         if local_voting_resource is not None:
             local_voting_resource_url = str(local_voting_resource.get("url", "")).strip()
             if local_voting_resource_url:
-                local_voting_zip_bytes, _ = client.download_bytes(
-                    local_voting_resource_url,
-                    expected_content_types=["zip", "octet-stream", "application/octet-stream"],
-                    min_bytes=1024,
-                )
-                local_voting_section_metadata, local_voting_info = _extract_local_voting_metadata_from_zip(
-                    zip_bytes=local_voting_zip_bytes,
-                    municipality_name=municipality_name,
-                    uf=uf,
-                    requested_year=reference_year,
-                )
+                with ExitStack() as local_voting_download:
+                    local_voting_zip_file = _download_zip_to_spool(
+                        client,
+                        local_voting_resource_url,
+                        local_voting_download,
+                    )
+                    local_voting_section_metadata, local_voting_info = (
+                        _extract_local_voting_metadata_from_zip(
+                            zip_source=local_voting_zip_file,
+                            municipality_name=municipality_name,
+                            uf=uf,
+                            requested_year=reference_year,
+                        )
+                    )
 
         if parsed_rows_section and local_voting_section_metadata:
             for row in parsed_rows_section:
@@ -1053,64 +1182,50 @@ def run(
         section_rows_written = 0
         if parsed_rows_municipality or parsed_rows_zone or parsed_rows_section:
             with session_scope(settings) as session:
-                zone_territory_ids: dict[str, str] = {}
                 zone_codes = {
                     str(item["tse_zone"]) for item in parsed_rows_zone
                 } | {
                     str(item["tse_zone"]) for item in parsed_rows_section
                 }
-                for zone_code in sorted(zone_codes):
-                    zone_territory_ids[zone_code] = _upsert_electoral_zone(
-                        session=session,
-                        municipality_territory_id=territory_id,
-                        municipality_ibge_code=settings.municipality_ibge_code,
-                        uf=uf,
-                        zone_code=zone_code,
-                    )
+                zone_territory_ids = _upsert_electoral_zones(
+                    session=session,
+                    municipality_territory_id=territory_id,
+                    municipality_ibge_code=settings.municipality_ibge_code,
+                    uf=uf,
+                    zone_codes=sorted(zone_codes),
+                )
 
-                for row in parsed_rows_municipality:
-                    session.execute(
-                        text(
-                            """
-                            INSERT INTO silver.fact_electorate (
-                                territory_id,
-                                reference_year,
-                                sex,
-                                age_range,
-                                education,
-                                voters
-                            )
-                            VALUES (
-                                CAST(:territory_id AS uuid),
-                                :reference_year,
-                                :sex,
-                                :age_range,
-                                :education,
-                                :voters
-                            )
-                            ON CONFLICT (
-                                territory_id,
-                                reference_year,
-                                sex,
-                                age_range,
-                                education
-                            )
-                            DO UPDATE SET
-                                voters = EXCLUDED.voters
-                            """
-                        ),
-                        {
-                            "territory_id": territory_id,
-                            "reference_year": row["reference_year"],
-                            "sex": row["sex"],
-                            "age_range": row["age_range"],
-                            "education": row["education"],
-                            "voters": row["voters"],
-                        },
-                    )
-                    rows_written += 1
-                    municipality_rows_written += 1
+                sections: dict[tuple[str, str], dict[str, Any]] = {}
+                for section_row in parsed_rows_section:
+                    section_key = (str(section_row["tse_zone"]), str(section_row["tse_section"]))
+                    if section_key in sections:
+                        continue
+                    if section_key[0] not in zone_territory_ids:
+                        warnings.append(
+                            "Skipped electorate section row because zone territory could not be resolved: "
+                            f"zone={section_key[0]} section={section_key[1]}."
+                        )
+                        continue
+                    sections[section_key] = {
+                        "tse_zone": section_key[0],
+                        "tse_section": section_key[1],
+                        "local_votacao": section_row.get("local_votacao"),
+                        "nr_local_votacao": section_row.get("nr_local_votacao"),
+                        "voters_section": section_row.get("voters_section"),
+                    }
+                section_territory_ids = _upsert_electoral_sections(
+                    session=session,
+                    zone_territory_ids=zone_territory_ids,
+                    municipality_name=municipality_name,
+                    municipality_ibge_code=settings.municipality_ibge_code,
+                    uf=uf,
+                    sections=list(sections.values()),
+                )
 
+                municipality_facts = [
+                    {**row, "territory_id": territory_id} for row in parsed_rows_municipality
+                ]
+                zone_facts: list[dict[str, Any]] = []
                 for row in parsed_rows_zone:
                     zone_id = zone_territory_ids.get(str(row["tse_zone"]))
                     if zone_id is None:
@@ -1118,115 +1233,20 @@ def run(
                             f"Skipped electorate row because zone territory could not be resolved: {row['tse_zone']}."
                         )
                         continue
-                    session.execute(
-                        text(
-                            """
-                            INSERT INTO silver.fact_electorate (
-                                territory_id,
-                                reference_year,
-                                sex,
-                                age_range,
-                                education,
-                                voters
-                            )
-                            VALUES (
-                                CAST(:territory_id AS uuid),
-                                :reference_year,
-                                :sex,
-                                :age_range,
-                                :education,
-                                :voters
-                            )
-                            ON CONFLICT (
-                                territory_id,
-                                reference_year,
-                                sex,
-                                age_range,
-                                education
-                            )
-                            DO UPDATE SET
-                                voters = EXCLUDED.voters
-                            """
-                        ),
-                        {
-                            "territory_id": zone_id,
-                            "reference_year": row["reference_year"],
-                            "sex": row["sex"],
-                            "age_range": row["age_range"],
-                            "education": row["education"],
-                            "voters": row["voters"],
-                        },
-                    )
-                    rows_written += 1
-                    zone_rows_written += 1
-
-                section_territory_ids: dict[tuple[str, str], str] = {}
+                    zone_facts.append({**row, "territory_id": zone_id})
+                section_facts: list[dict[str, Any]] = []
                 for section_row in parsed_rows_section:
-                    section_key = (str(section_row["tse_zone"]), str(section_row["tse_section"]))
-                    section_territory_id = section_territory_ids.get(section_key)
-                    if section_territory_id is None:
-                        zone_id = zone_territory_ids.get(section_key[0])
-                        if zone_id is None:
-                            warnings.append(
-                                "Skipped electorate section row because zone territory could not be resolved: "
-                                f"zone={section_key[0]} section={section_key[1]}."
-                            )
-                            continue
-                        section_territory_id = _upsert_electoral_section(
-                            session=session,
-                            zone_territory_id=zone_id,
-                            municipality_name=municipality_name,
-                            municipality_ibge_code=settings.municipality_ibge_code,
-                            uf=uf,
-                            zone_code=section_key[0],
-                            section_code=section_key[1],
-                            polling_place_name=section_row.get("local_votacao"),
-                            polling_place_code=section_row.get("nr_local_votacao"),
-                            voters_section=section_row.get("voters_section"),
-                        )
-                        section_territory_ids[section_key] = section_territory_id
-
-                    session.execute(
-                        text(
-                            """
-                            INSERT INTO silver.fact_electorate (
-                                territory_id,
-                                reference_year,
-                                sex,
-                                age_range,
-                                education,
-                                voters
-                            )
-                            VALUES (
-                                CAST(:territory_id AS uuid),
-                                :reference_year,
-                                :sex,
-                                :age_range,
-                                :education,
-                                :voters
-                            )
-                            ON CONFLICT (
-                                territory_id,
-                                reference_year,
-                                sex,
-                                age_range,
-                                education
-                            )
-                            DO UPDATE SET
-                                voters = EXCLUDED.voters
-                            """
-                        ),
-                        {
-                            "territory_id": section_territory_id,
-                            "reference_year": section_row["reference_year"],
-                            "sex": section_row["sex"],
-                            "age_range": section_row["age_range"],
-                            "education": section_row["education"],
-                            "voters": section_row["voters"],
-                        },
+                    section_id = section_territory_ids.get(
+                        (str(section_row["tse_zone"]), str(section_row["tse_section"]))
                     )
-                    rows_written += 1
-                    section_rows_written += 1
+                    if section_id is None:
+                        continue
+                    section_facts.append({**section_row, "territory_id": section_id})
+
+                municipality_rows_written = _bulk_upsert_electorate_facts(session, municipality_facts)
+                zone_rows_written = _bulk_upsert_electorate_facts(session, zone_facts)
+                section_rows_written = _bulk_upsert_electorate_facts(session, section_facts)
+                rows_written = municipality_rows_written + zone_rows_written + section_rows_written
 
         checks = [
             {
@@ -1259,12 +1279,12 @@ def run(
                 "details": f"{section_rows_written} section rows upserted into silver.fact_electorate.",
             },
         ]
-        artifact = persist_raw_bytes(
+        artifact = persist_raw_stream(
             settings=settings,
             source=SOURCE,
             dataset=DATASET_NAME,
             reference_period=reference_period,
-            raw_bytes=zip_bytes,
+            raw_stream=zip_file,
             extension=".zip",
             uri=resource_url,
             territory_scope="municipality",
@@ -1382,4 +1402,5 @@ def run(
             "errors": [str(exc)],
         }
     finally:
+        downloads.close()
         client.close()
@@ -10,14 +10,15 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-import pandas as pd
 import yaml
 from sqlalchemy import text
 
 from app.db import session_scope
 from app.logging import get_logger
 from app.settings import Settings, get_settings
+from app.tile_cache import invalidate_tile_cache
 from pipelines.common.bronze_store import artifact_to_dict, persist_raw_bytes
+from pipelines.common.delimited_reader import read_delimited
 from pipelines.common.http_client import HttpClient
 from pipelines.common.observability import replace_pipeline_checks_from_dicts, upsert_pipeline_run
 
@@ -133,21 +134,6 @@ def _extract_from_zip(raw_bytes: bytes) -> tuple[bytes, str]:
         return archive.read(selected), Path(selected).suffix.casefold()
 
 
-def _parse_tabular_bytes(raw_bytes: bytes) -> pd.DataFrame:
-    for encoding in ("utf-8", "latin1"):
-        for sep in (";", ",", "\t", "|"):
-            try:
-                return pd.read_csv(
-                    io.BytesIO(raw_bytes),
-                    encoding=encoding,
-                    sep=sep,
-                    low_memory=False,
-                )
-            except Exception:
-                continue
-    raise ValueError("Could not parse CSV/TXT with supported encodings and delimiters.")
-
-
 def _parse_payload_bytes(raw_bytes: bytes, *, suffix: str) -> tuple[Any, bytes, str]:
     normalized_suffix = suffix.casefold()
     if normalized_suffix == ".zip":
@@ -157,7 +143,7 @@ def _parse_payload_bytes(raw_bytes: bytes, *, suffix: str) -> tuple[Any, bytes,
         payload = json.loads(raw_bytes.decode("utf-8"))
         return payload, raw_bytes, normalized_suffix
     if normalized_suffix in {".csv", ".txt"}:
-        dataframe = _parse_tabular_bytes(raw_bytes)
+        dataframe = read_delimited(raw_bytes, dialect_key=(SOURCE, DATASET_NAME))
         return {"rows": dataframe.to_dict(orient="records")}, raw_bytes, normalized_suffix
     raise ValueError(f"Unsupported suffix for roads payload: {suffix}")
 
@@ -650,6 +636,8 @@ def run(
             }
 
         rows_written = _replace_road_rows(settings, rows)
+        if rows_written > 0:
+            invalidate_tile_cache(settings, reason=JOB_NAME)
         checks = [
             {
                 "name": "urban_roads_source_resolved",
@@ -119,7 +119,11 @@ def test_source_schema_contracts_sql_has_required_objects() -> None:
 
 def test_priority_drivers_mart_sql_has_required_objects() -> None:
     priority_sql = Path("db/sql/015_priority_drivers_mart.sql").read_text(encoding="utf-8")
-    assert "CREATE OR REPLACE VIEW gold.mart_priority_drivers AS" in priority_sql
+    assert "CREATE OR REPLACE VIEW gold.v_priority_drivers_compute AS" in priority_sql
+    assert "CREATE TABLE IF NOT EXISTS gold.mart_priority_drivers" in priority_sql
+    assert "idx_mart_priority_drivers_rank" in priority_sql
+    assert "CREATE OR REPLACE FUNCTION gold.refresh_mart_priority_drivers" in priority_sql
+    assert "coverage_pct" in priority_sql
     assert "FROM silver.fact_indicator fi" in priority_sql
     assert "JOIN silver.dim_territory dt" in priority_sql
     assert "FROM ops.v_strategic_score_version_active" in priority_sql
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Generator
 from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
 
+from app.api import routes_map
 from app.api.deps import get_db
 from app.api.main import app
 
 
+@pytest.fixture(autouse=True)
+def _disable_tile_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Tile contract tests assert on the SQL path, so they must never hit a warm cache.
+    monkeypatch.setattr(routes_map, "get_tile_cache", lambda: None)
+
+
 class _FailingSession:
     def execute(self, *_args: Any, **_kwargs: Any) -> Any:
         raise RuntimeError("forced-db-error")
@@ -40,6 +49,10 @@ class _MappingsResult:
     def first(self) -> dict[str, Any] | None:
         return self._rows[0] if self._rows else None
 
+    def one(self) -> dict[str, Any]:
+        assert len(self._rows) == 1
+        return self._rows[0]
+
 
 class _ScalarResult:
     def __init__(self, value: Any) -> None:
@@ -52,6 +65,14 @@ class _ScalarResult:
 class _UrbanSession:
     def execute(self, statement: Any, *_args: Any, **_kwargs: Any) -> _MappingsResult | _ScalarResult:
         sql = str(statement)
+        result = self._result_for(sql)
+        if "AS items_json" in sql and isinstance(result, _MappingsResult):
+            # Pass-through routes: Postgres aggregates the rows into one JSON array.
+            rows = result.all()
+            return _MappingsResult([{"item_count": len(rows), "items_json": json.dumps(rows)}])
+        return result
+
+    def _result_for(self, sql: str) -> _MappingsResult | _ScalarResult:
         if "SELECT MAX(reference_period)::text" in sql and "map.v_environment_risk_aggregation" in sql:
             return _ScalarResult("2025")
         if "FROM map.v_environment_risk_aggregation v" in sql:
@@ -76,7 +97,7 @@ class _UrbanSession:
                         "transport_stops_per_km2": 0.38,
                         "uses_proxy_allocation": False,
                         "allocation_method": "spatial_exposure_proxy",
-                        "geometry_json": '{"type":"Polygon","coordinates":[[[-43.62,-18.26],[-43.59,-18.26],[-43.59,-18.23],[-43.62,-18.23],[-43.62,-18.26]]]}',
+                        "geometry": {"type":"Polygon","coordinates":[[[-43.62,-18.26],[-43.59,-18.26],[-43.59,-18.23],[-43.62,-18.23],[-43.62,-18.26]]]},
                     }
                 ]
             )
@@ -89,7 +110,7 @@ class _UrbanSession:
                         "name": "Rua da Quitanda",
                         "road_class": "residential",
                         "length_m": 123.4,
-                        "geometry_json": '{"type":"LineString","coordinates":[[-43.601,-18.244],[-43.600,-18.243]]}',
+                        "geometry": {"type":"LineString","coordinates":[[-43.601,-18.244],[-43.600,-18.243]]},
                     }
                 ]
             )
@@ -141,7 +162,7 @@ class _UrbanSession:
                         "name": "UBS Centro",
                         "category": "health",
                         "subcategory": "primary_care",
-                        "geometry_json": '{"type":"Point","coordinates":[-43.6005,-18.2438]}',
+                        "geometry": {"type":"Point","coordinates":[-43.6005,-18.2438]},
                     }
                 ]
             )
@@ -155,7 +176,7 @@ class _UrbanSession:
                         "mode": "bus",
                         "operator": "Municipal",
                         "is_accessible": True,
-                        "geometry_json": '{"type":"Point","coordinates":[-43.6020,-18.2429]}',
+                        "geometry": {"type":"Point","coordinates":[-43.6020,-18.2429]},
                     }
                 ]
             )
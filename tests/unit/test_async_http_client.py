@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+
+from pipelines.common.async_http_client import AsyncHttpClient, AsyncHttpClientLimits
+from pipelines.common.http_cache import HttpResponseCache
+from pipelines.common.http_client import HttpClientConfig
+
+
+def _client(transport: httpx.AsyncBaseTransport, **kwargs) -> AsyncHttpClient:  # noqa: ANN003
+    return AsyncHttpClient(
+        HttpClientConfig(timeout_seconds=5, max_retries=1, backoff_seconds=0),
+        transport=transport,
+        **kwargs,
+    )
+
+
+def test_get_json_revalidates_cached_response_with_etag(tmp_path: Path) -> None:
+    seen_headers: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/json", "etag": '"v1"'},
+            content=b'[{"V": "10"}]',
+        )
+
+    cache = HttpResponseCache(tmp_path)
+
+    async def _fetch_twice() -> tuple[object, object, dict[str, int]]:
+        async with _client(httpx.MockTransport(_handler), cache=cache) as first:
+            first_payload = await first.get_json("https://example.test/values")
+        async with _client(httpx.MockTransport(_handler), cache=cache) as second:
+            second_payload = await second.get_json("https://example.test/values")
+            return first_payload, second_payload, second.stats
+
+    first_payload, second_payload, stats = asyncio.run(_fetch_twice())
+
+    assert first_payload == second_payload == [{"V": "10"}]
+    assert seen_headers == [None, '"v1"']
+    assert stats["not_modified"] == 1
+
+
+def test_requests_are_capped_per_host() -> None:
+    active = {"example.test": 0, "other.test": 0}
+    peak = {"example.test": 0, "other.test": 0}
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        active[host] += 1
+        peak[host] = max(peak[host], active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        return httpx.Response(200, headers={"content-type": "application/json"}, content=b"{}")
+
+    async def _fetch_all() -> None:
+        limits = AsyncHttpClientLimits(max_connections=10, host_concurrency=2)
+        async with _client(httpx.MockTransport(_handler), limits=limits) as client:
+            await asyncio.gather(
+                *(client.get_json(f"https://example.test/{index}") for index in range(6)),
+                *(client.get_json(f"https://other.test/{index}") for index in range(2)),
+            )
+
+    asyncio.run(_fetch_all())
+
+    assert peak == {"example.test": 2, "other.test": 2}
+
+
+def test_download_bytes_retries_transient_errors() -> None:
+    calls = {"count": 0}
+
+    def _handler(_request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, headers={"content-type": "text/csv"}, content=b"a;b\n1;2\n")
+
+    async def _download() -> tuple[bytes, str]:
+        async with _client(httpx.MockTransport(_handler)) as client:
+            return await client.download_bytes(
+                "https://example.test/file.csv",
+                expected_content_types=["csv"],
+            )
+
+    payload, content_type = asyncio.run(_download())
+
+    assert payload == b"a;b\n1;2\n"
+    assert content_type == "text/csv"
+    assert calls["count"] == 2
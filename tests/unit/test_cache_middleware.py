@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from app.api import cache_middleware
 from app.api.main import app
-from app.api.cache_middleware import _match_cache_rule
+from app.api.cache_middleware import CacheHeaderMiddleware, _compute_etag, _match_cache_rule
+from app.data_version import DataVersionTracker
 
 
 def test_map_layers_has_cache_control_header() -> None:
@@ -84,3 +88,68 @@ def test_post_request_not_cached() -> None:
     )
     # It will likely return 405, but should not have cache headers
     assert "cache-control" not in response.headers
+
+
+def test_data_version_etag_answers_if_none_match_without_running_handler(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = {"count": 0}
+    versions = {"territory": 1, "indicators": 3}
+    local_app = FastAPI()
+    local_app.add_middleware(CacheHeaderMiddleware)
+
+    @local_app.get("/v1/geo/choropleth")
+    def _choropleth(metric: str | None = None) -> dict:
+        calls["count"] += 1
+        return {"type": "FeatureCollection", "metric": metric, "features": []}
+
+    tracker = DataVersionTracker(loader=lambda: dict(versions), poll_seconds=0)
+    monkeypatch.setattr(cache_middleware, "get_data_version_tracker", lambda: tracker)
+    client = TestClient(local_app)
+
+    first = client.get("/v1/geo/choropleth?metric=MTE_NOVO_CAGED_SALDO_TOTAL")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"dv-')
+    assert first.headers["cache-control"] == "public, max-age=600"
+
+    revalidated = client.get(
+        "/v1/geo/choropleth?metric=MTE_NOVO_CAGED_SALDO_TOTAL",
+        headers={"If-None-Match": etag},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert calls["count"] == 1
+
+    versions["indicators"] = 4
+    refreshed = client.get(
+        "/v1/geo/choropleth?metric=MTE_NOVO_CAGED_SALDO_TOTAL",
+        headers={"If-None-Match": etag},
+    )
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert calls["count"] == 2
+
+
+def test_data_version_route_falls_back_to_body_etag_without_versions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    local_app = FastAPI()
+    local_app.add_middleware(CacheHeaderMiddleware)
+
+    @local_app.get("/v1/geo/choropleth")
+    def _choropleth() -> dict:
+        return {"type": "FeatureCollection", "features": []}
+
+    def _unavailable() -> dict[str, int]:
+        raise RuntimeError("database unavailable")
+
+    tracker = DataVersionTracker(loader=_unavailable, poll_seconds=0)
+    monkeypatch.setattr(cache_middleware, "get_data_version_tracker", lambda: tracker)
+    client = TestClient(local_app)
+
+    first = client.get("/v1/geo/choropleth")
+    second = client.get("/v1/geo/choropleth", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.headers["etag"] == _compute_etag(first.content)
+    assert second.status_code == 304
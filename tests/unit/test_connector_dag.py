@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from orchestration.connector_dag import (
+    MVP_CONNECTOR_DAG,
+    ConnectorNode,
+    run_connector_dag,
+    validate_connector_dag,
+)
+
+
+def test_mvp_connector_dag_is_valid_and_ends_with_dbt_and_quality() -> None:
+    ordered = validate_connector_dag(MVP_CONNECTOR_DAG)
+    names = [node.job_name for node in ordered]
+
+    assert names.index("ibge_admin_fetch") < names.index("ibge_geometries_fetch")
+    assert names.index("ibge_geometries_fetch") < names.index("sidra_indicators_fetch")
+    assert names[-2:] == ["dbt_build", "quality_suite"]
+    dbt_node = next(node for node in MVP_CONNECTOR_DAG if node.job_name == "dbt_build")
+    assert set(dbt_node.depends_on) == set(names[:-2])
+
+
+def test_validate_connector_dag_rejects_cycles_and_unknown_dependencies() -> None:
+    with pytest.raises(ValueError, match="cycle"):
+        validate_connector_dag(
+            [ConnectorNode("a", "run_a", "h", ("b",)), ConnectorNode("b", "run_b", "h", ("a",))]
+        )
+    with pytest.raises(ValueError, match="unknown"):
+        validate_connector_dag([ConnectorNode("a", "run_a", "h", ("missing",))])
+
+
+def test_run_connector_dag_respects_dependencies_and_host_limits() -> None:
+    lock = threading.Lock()
+    active_by_host: dict[str, int] = {}
+    peak_by_host: dict[str, int] = {}
+    finished: list[str] = []
+    started: dict[str, list[str]] = {}
+
+    def _runner(job: str, host: str):
+        def _run(**kwargs: Any) -> dict[str, Any]:
+            with lock:
+                started[job] = list(finished)
+                active_by_host[host] = active_by_host.get(host, 0) + 1
+                peak_by_host[host] = max(peak_by_host.get(host, 0), active_by_host[host])
+            time.sleep(0.02)
+            with lock:
+                active_by_host[host] -= 1
+                finished.append(job)
+            return {"job": job, "status": "success", "kwargs": kwargs}
+
+        return _run
+
+    nodes = [
+        ConnectorNode("root", "root", "ibge"),
+        ConnectorNode("a1", "a1", "slow", ("root",)),
+        ConnectorNode("a2", "a2", "slow", ("root",)),
+        ConnectorNode("a3", "a3", "slow", ("root",)),
+        ConnectorNode("b1", "b1", "fast", ("root",)),
+        ConnectorNode("b2", "b2", "fast", ("root",)),
+        ConnectorNode("sink", "sink", "internal", ("a1", "a2", "a3", "b1", "b2")),
+    ]
+    runners = {node.runner: _runner(node.job_name, node.host) for node in nodes}
+
+    result = run_connector_dag(
+        nodes,
+        resolve_runner=runners.__getitem__,
+        common_kwargs={"reference_period": "2024"},
+        max_workers=4,
+        host_concurrency=2,
+        host_limits={"slow": 1},
+    )
+
+    assert list(result) == ["root", "a1", "a2", "a3", "b1", "b2", "sink"]
+    assert result["sink"]["kwargs"] == {"reference_period": "2024"}
+    assert started["a1"] == ["root"]
+    assert set(started["sink"]) == {"root", "a1", "a2", "a3", "b1", "b2"}
+    assert peak_by_host["slow"] == 1
+    assert peak_by_host["fast"] == 2
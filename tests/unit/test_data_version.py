@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from app.data_version import (
+    DataVersionTracker,
+    data_domain_for_job,
+    data_version_etag,
+    data_version_token,
+)
+from pipelines.common.observability import upsert_pipeline_run
+
+
+class _Savepoint:
+    def __enter__(self) -> "_Savepoint":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        return None
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def execute(self, statement: Any, _params: Any = None) -> None:
+        self.statements.append(str(statement))
+
+    def begin_nested(self) -> _Savepoint:
+        return _Savepoint()
+
+
+def test_data_domain_for_job_groups_connectors() -> None:
+    assert data_domain_for_job("ibge_geometries_fetch") == "territory"
+    assert data_domain_for_job("tse_results_fetch") == "electorate"
+    assert data_domain_for_job("urban_roads_fetch") == "urban"
+    assert data_domain_for_job("dbt_build") == "marts"
+    assert data_domain_for_job("sidra_indicators_fetch") == "indicators"
+    assert data_domain_for_job("quality_suite") is None
+
+
+def test_data_version_token_and_etag_only_depend_on_relevant_inputs() -> None:
+    token = data_version_token({"electorate": 2, "indicators": 5}, ("electorate",))
+    assert token == data_version_token({"electorate": 2, "indicators": 9}, ("electorate",))
+    assert token != data_version_token({"electorate": 3}, ("electorate",))
+
+    etag = data_version_etag("/v1/electorate/summary", [("year", "2024"), ("level", "")], token)
+    assert etag == data_version_etag("/v1/electorate/summary", [("year", "2024")], token)
+    assert etag != data_version_etag("/v1/electorate/summary", [("year", "2022")], token)
+
+
+def test_data_version_tracker_polls_and_reports_unavailable_versions() -> None:
+    calls = {"count": 0}
+
+    def _loader() -> dict[str, int]:
+        calls["count"] += 1
+        if calls["count"] > 1:
+            raise RuntimeError("database unavailable")
+        return {"indicators": 1}
+
+    tracker = DataVersionTracker(loader=_loader, poll_seconds=60)
+    assert tracker.snapshot() == {"indicators": 1}
+    assert tracker.snapshot() == {"indicators": 1}
+    assert calls["count"] == 1
+
+    failing = DataVersionTracker(loader=_loader, poll_seconds=0)
+    assert failing.snapshot() is None
+
+
+def test_upsert_pipeline_run_bumps_data_version_only_for_successful_loads() -> None:
+    started_at = datetime(2026, 1, 1, tzinfo=UTC)
+    common = {
+        "run_id": "00000000-0000-0000-0000-000000000001",
+        "job_name": "tse_results_fetch",
+        "started_at_utc": started_at,
+        "finished_at_utc": started_at,
+    }
+
+    loaded = _RecordingSession()
+    upsert_pipeline_run(session=loaded, status="success", rows_loaded=10, **common)
+    assert any("ops.data_versions" in statement for statement in loaded.statements)
+
+    for status, rows_loaded in (("success", 0), ("failed", 10)):
+        session = _RecordingSession()
+        upsert_pipeline_run(session=session, status=status, rows_loaded=rows_loaded, **common)
+        assert not any("ops.data_versions" in statement for statement in session.statements)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import shutil
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -136,3 +137,164 @@ def test_run_persists_failed_check_when_execution_fails(monkeypatch) -> None:
     assert checks
     assert checks[0]["name"] == "dbt_build_execution"
     assert checks[0]["status"] == "fail"
+
+
+def test_decide_priority_refresh_mode_is_full_without_previous_refresh() -> None:
+    assert dbt_build._decide_priority_refresh_mode(None, force=False) == "full"
+    state = {"last_refreshed_at": None}
+    assert dbt_build._decide_priority_refresh_mode(state, force=False) == "full"
+
+
+def test_decide_priority_refresh_mode_is_incremental_for_same_score_version() -> None:
+    state = {
+        "last_refreshed_at": datetime(2026, 1, 2, tzinfo=UTC),
+        "score_version": "v1.0.0",
+        "config_version": "1.0.0",
+        "active_score_version": "v1.0.0",
+        "active_config_version": "1.0.0",
+        "active_updated_at_utc": datetime(2026, 1, 1, tzinfo=UTC),
+    }
+    assert dbt_build._decide_priority_refresh_mode(state, force=False) == "incremental"
+    assert dbt_build._decide_priority_refresh_mode(state, force=True) == "full"
+
+
+def test_decide_priority_refresh_mode_is_full_when_score_config_changes() -> None:
+    state = {
+        "last_refreshed_at": datetime(2026, 1, 2, tzinfo=UTC),
+        "score_version": "v1.0.0",
+        "config_version": "1.0.0",
+        "active_score_version": "v1.1.0",
+        "active_config_version": "1.1.0",
+        "active_updated_at_utc": datetime(2026, 1, 1, tzinfo=UTC),
+    }
+    assert dbt_build._decide_priority_refresh_mode(state, force=False) == "full"
+
+    state.update(
+        active_score_version="v1.0.0",
+        active_config_version="1.0.0",
+        active_updated_at_utc=datetime(2026, 1, 3, tzinfo=UTC),
+    )
+    assert dbt_build._decide_priority_refresh_mode(state, force=False) == "full"
+
+
+def test_decide_priority_refresh_mode_is_full_when_territories_change() -> None:
+    state = {
+        "last_refreshed_at": datetime(2026, 1, 2, tzinfo=UTC),
+        "score_version": "v1.0.0",
+        "config_version": "1.0.0",
+        "active_score_version": "v1.0.0",
+        "active_config_version": "1.0.0",
+        "active_updated_at_utc": datetime(2026, 1, 1, tzinfo=UTC),
+        "territory_updated_at_utc": datetime(2026, 1, 1, tzinfo=UTC),
+    }
+    assert dbt_build._decide_priority_refresh_mode(state, force=False) == "incremental"
+
+    # A renamed or added territory changes tiebreaks and coverage in every period.
+    state["territory_updated_at_utc"] = datetime(2026, 1, 3, tzinfo=UTC)
+    assert dbt_build._decide_priority_refresh_mode(state, force=False) == "full"
+
+
+class _IndicatorChangeSession:
+    def __init__(
+        self,
+        *,
+        last_refreshed_at: datetime | None,
+        touched: list[str],
+        territory_updated_at: datetime | None = None,
+    ) -> None:
+        self.last_refreshed_at = last_refreshed_at
+        self.territory_updated_at = territory_updated_at
+        self.touched = touched
+        self.touched_sql: list[str] = []
+        self.refresh_params: list[dict[str, Any]] = []
+
+    def execute(self, statement: Any, params: dict[str, Any] | None = None) -> Any:
+        sql = str(statement)
+        session = self
+
+        class _Result:
+            def scalar_one(self) -> Any:
+                session.refresh_params.append(params or {})
+                return 7
+
+            def mappings(self) -> Any:
+                return self
+
+            def one(self) -> dict[str, Any]:
+                assert "MAX(refreshed_at_utc)" in sql
+                return {
+                    "last_refreshed_at": session.last_refreshed_at,
+                    "territory_updated_at_utc": session.territory_updated_at,
+                }
+
+            def scalars(self) -> Any:
+                return self
+
+            def all(self) -> list[str]:
+                assert "FROM gold.indicator_period_change" in sql
+                session.touched_sql.append(sql)
+                return session.touched
+
+        return _Result()
+
+
+def _patch_session_scope(monkeypatch, session: _IndicatorChangeSession) -> None:
+    class _SessionScope:
+        def __enter__(self) -> _IndicatorChangeSession:
+            return session
+
+        def __exit__(self, _exc_type, _exc, _tb) -> bool:
+            return False
+
+    monkeypatch.setattr(dbt_build, "session_scope", lambda _settings: _SessionScope())
+
+
+def test_refresh_indicator_change_table_is_full_on_first_run(monkeypatch) -> None:
+    session = _IndicatorChangeSession(last_refreshed_at=None, touched=["2025"])
+    _patch_session_scope(monkeypatch, session)
+
+    result = dbt_build._refresh_indicator_change_table(settings=object(), force=False)
+
+    assert result == {
+        "model": "indicator_period_change",
+        "mode": "full",
+        "periods": [],
+        "row_count": 7,
+    }
+    assert session.refresh_params == [{"periods": None}]
+
+
+def test_refresh_indicator_change_table_only_refreshes_touched_periods(monkeypatch) -> None:
+    session = _IndicatorChangeSession(
+        last_refreshed_at=datetime(2026, 1, 2, tzinfo=UTC),
+        touched=["2024"],
+    )
+    _patch_session_scope(monkeypatch, session)
+
+    result = dbt_build._refresh_indicator_change_table(settings=object(), force=False)
+
+    assert result["mode"] == "incremental"
+    assert result["periods"] == ["2024"]
+    assert session.refresh_params == [{"periods": ["2024"]}]
+    # Monthly periods never get rows, so they must not count as touched.
+    assert "fi.reference_period ~ '^[0-9]{4}$'" in session.touched_sql[0]
+
+    session.touched = []
+    skipped = dbt_build._refresh_indicator_change_table(settings=object(), force=False)
+    assert skipped["mode"] == "skipped"
+    assert len(session.refresh_params) == 1
+
+
+def test_refresh_indicator_change_table_is_full_when_territories_change(monkeypatch) -> None:
+    session = _IndicatorChangeSession(
+        last_refreshed_at=datetime(2026, 1, 2, tzinfo=UTC),
+        territory_updated_at=datetime(2026, 1, 3, tzinfo=UTC),
+        touched=["2024"],
+    )
+    _patch_session_scope(monkeypatch, session)
+
+    result = dbt_build._refresh_indicator_change_table(settings=object(), force=False)
+
+    assert result["mode"] == "full"
+    assert session.touched_sql == []
+    assert session.refresh_params == [{"periods": None}]
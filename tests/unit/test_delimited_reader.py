@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from pipelines.common import delimited_reader
+from pipelines.common.delimited_reader import (
+    DelimitedDialect,
+    forget_dialects,
+    read_delimited,
+    remembered_dialect,
+    sniff_dialect,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_dialects():
+    forget_dialects()
+    yield
+    forget_dialects()
+
+
+@pytest.fixture()
+def parse_calls(monkeypatch) -> list[DelimitedDialect]:
+    calls: list[DelimitedDialect] = []
+    original = delimited_reader._parse
+
+    def _counting_parse(raw_bytes: bytes, dialect: DelimitedDialect) -> pd.DataFrame:
+        calls.append(dialect)
+        return original(raw_bytes, dialect)
+
+    monkeypatch.setattr(delimited_reader, "_parse", _counting_parse)
+    return calls
+
+
+def test_semicolon_latin1_with_decimal_commas_is_parsed_once(parse_calls) -> None:
+    raw_bytes = (
+        "codigo_ibge;município;cobertura;população\n"
+        "3121605;Diamantina;87,5;47825\n"
+        "3106200;Belo Horizonte;99,1;2315560\n"
+    ).encode("latin1")
+
+    dataframe = read_delimited(raw_bytes)
+
+    assert parse_calls == [DelimitedDialect("latin1", ";", skiprows=0, columns=4)]
+    assert list(dataframe.columns) == ["codigo_ibge", "município", "cobertura", "população"]
+    assert dataframe.loc[0, "cobertura"] == "87,5"
+
+
+def test_sniff_skips_narrow_preamble_rows() -> None:
+    raw_bytes = (
+        "REGIAO:;SE\n"
+        "UF:;MG\n"
+        "ESTACAO:;DIAMANTINA\n"
+        "\n"
+        "Data;Hora UTC;PRECIPITACAO TOTAL (mm);TEMPERATURA (C);UMIDADE (%)\n"
+        "2025/01/01;0000 UTC;0,2;21,4;88\n"
+        "2025/01/01;0100 UTC;0;21,0;90\n"
+    ).encode("utf-8")
+
+    best = sniff_dialect(raw_bytes)[0]
+    dataframe = read_delimited(raw_bytes)
+
+    assert best == DelimitedDialect("utf-8", ";", skiprows=4, columns=5)
+    assert list(dataframe.columns)[:2] == ["Data", "Hora UTC"]
+    assert len(dataframe) == 2
+
+
+def test_quoted_separators_and_comma_dialect() -> None:
+    raw_bytes = (
+        b'name,amenity,address\n"Posto A",clinic,"Rua X, 10"\n"Escola B",school,"Rua Y, 2"\n'
+    )
+
+    dataframe = read_delimited(raw_bytes)
+
+    assert list(dataframe.columns) == ["name", "amenity", "address"]
+    assert dataframe.loc[0, "address"] == "Rua X, 10"
+
+
+def test_invalid_utf8_beyond_the_sample_falls_back_to_next_encoding(parse_calls) -> None:
+    rows = "".join(f"{index};Municipio {index};{index}\n" for index in range(200))
+    raw_bytes = ("codigo;nome;valor\n" + rows).encode("utf-8")
+    raw_bytes += "9999;São João;1\n".encode("latin1")
+
+    dataframe = read_delimited(raw_bytes, sample_bytes=256)
+
+    assert [dialect.encoding for dialect in parse_calls] == ["utf-8", "latin1"]
+    assert dataframe.iloc[-1]["nome"] == "São João"
+
+
+def test_dialect_is_remembered_per_source_and_dataset(monkeypatch, parse_calls) -> None:
+    key = ("SNIS", "snis_sanitation_catalog")
+    first = b"municipio|agua|esgoto\nDiamantina|98.1|71.0\n"
+    read_delimited(first, dialect_key=key)
+    assert remembered_dialect(key) == DelimitedDialect("utf-8", "|", skiprows=0, columns=3)
+
+    def _no_sniff(*_args, **_kwargs):
+        raise AssertionError("remembered dialect should skip detection")
+
+    monkeypatch.setattr(delimited_reader, "sniff_dialect", _no_sniff)
+    second = read_delimited(b"municipio|agua|esgoto\nSerro|91.4|55.2\n", dialect_key=key)
+    assert second.loc[0, "municipio"] == "Serro"
+
+    # A file that no longer fits the remembered dialect is detected again.
+    monkeypatch.undo()
+    changed = read_delimited(b"municipio;agua\nSerro;91,4\n", dialect_key=key)
+    assert list(changed.columns) == ["municipio", "agua"]
+    assert remembered_dialect(key) == DelimitedDialect("utf-8", ";", skiprows=0, columns=2)
+
+
+def test_read_delimited_raises_value_error_when_nothing_parses() -> None:
+    with pytest.raises(ValueError, match="Could not parse CSV/TXT"):
+        read_delimited(b"")
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import io
+import json
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import routes_exports
+from app.api.main import app
+from app.fact_export import (
+    EXPORT_DATASETS,
+    FactExportStream,
+    build_export_query,
+    encode_csv,
+    encode_ndjson,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+project_root_str = str(PROJECT_ROOT)
+if project_root_str not in sys.path:
+    sys.path.insert(0, project_root_str)
+
+from scripts import export_silver_facts  # noqa: E402
+
+_FACT_ID_1 = "00000000-0000-0000-0000-000000000001"
+_FACT_ID_2 = "00000000-0000-0000-0000-000000000002"
+_FACT_ID_3 = "00000000-0000-0000-0000-000000000003"
+
+
+def _indicator_row(fact_id: str, value: float) -> dict[str, Any]:
+    return {
+        "fact_id": fact_id,
+        "territory_id": "3121605",
+        "territory_level": "municipality",
+        "source": "DATASUS",
+        "dataset": "datasus_health",
+        "indicator_code": "DATASUS_APS_COBERTURA",
+        "indicator_name": "Cobertura APS",
+        "unit": "%",
+        "category": None,
+        "value": value,
+        "reference_period": "2024",
+        "updated_at": datetime(2026, 2, 11, 13, 0, tzinfo=UTC),
+    }
+
+
+class _FakeResult:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self._rows = rows
+        self.closed = False
+        self.partition_sizes: list[int] = []
+
+    def mappings(self) -> _FakeResult:
+        return self
+
+    def partitions(self, size: int):
+        self.partition_sizes.append(size)
+        for start in range(0, len(self._rows), size):
+            yield self._rows[start : start + size]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeConnection:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.result = _FakeResult(rows)
+        self.execution_options_seen: dict[str, Any] = {}
+        self.statements: list[tuple[str, dict[str, Any]]] = []
+        self.closed = False
+
+    def execution_options(self, **options: Any) -> _FakeConnection:
+        self.execution_options_seen.update(options)
+        return self
+
+    def execute(self, statement: Any, params: dict[str, Any]) -> _FakeResult:
+        self.statements.append((str(statement), params))
+        return self.result
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_build_export_query_binds_filters_resume_key_and_limit() -> None:
+    sql, params = build_export_query(
+        EXPORT_DATASETS["fact_indicator"],
+        filters={"period": "2024", "level": "municipality"},
+        after=_FACT_ID_1,
+        limit=500,
+    )
+
+    assert "dt.level::text = CAST(:level AS TEXT)" in sql
+    assert "fi.reference_period = CAST(:period AS TEXT)" in sql
+    assert "fi.fact_id > CAST(:after AS UUID)" in sql
+    assert sql.rstrip().endswith("ORDER BY fi.fact_id LIMIT :limit")
+    assert params == {"period": "2024", "level": "municipality", "after": _FACT_ID_1, "limit": 500}
+
+
+def test_build_export_query_rejects_unsupported_filter_and_bad_resume_key() -> None:
+    with pytest.raises(ValueError, match="Unsupported filter"):
+        build_export_query(
+            EXPORT_DATASETS["fact_electorate"], filters={"office": "x"}, after=None, limit=None
+        )
+    with pytest.raises(ValueError):
+        build_export_query(
+            EXPORT_DATASETS["fact_indicator"], filters={}, after="not-a-uuid", limit=None
+        )
+    with pytest.raises(ValueError, match="'period' for fact_electorate must be an integer"):
+        build_export_query(
+            EXPORT_DATASETS["fact_electorate"],
+            filters={"period": "2024-01"},
+            after=None,
+            limit=None,
+        )
+
+
+def test_build_export_query_binds_integer_filters_as_int() -> None:
+    _, params = build_export_query(
+        EXPORT_DATASETS["fact_electorate"], filters={"period": "2024"}, after=None, limit=None
+    )
+
+    assert params == {"period": 2024}
+
+
+def test_encoders_emit_one_chunk_per_batch() -> None:
+    batches = [
+        [{"fact_id": _FACT_ID_1, "at": datetime(2026, 1, 1, tzinfo=UTC)}],
+        [{"fact_id": _FACT_ID_2, "at": None}],
+    ]
+
+    ndjson_chunks = list(encode_ndjson(batches))
+    assert len(ndjson_chunks) == 2
+    assert json.loads(ndjson_chunks[0]) == {
+        "fact_id": _FACT_ID_1,
+        "at": "2026-01-01T00:00:00+00:00",
+    }
+
+    csv_chunks = list(encode_csv(batches, ["fact_id", "at"]))
+    assert csv_chunks[0].decode() == f"fact_id,at\n{_FACT_ID_1},2026-01-01T00:00:00+00:00\n"
+    assert csv_chunks[1].decode() == f"{_FACT_ID_2},\n"
+    assert b"fact_id,at" not in b"".join(encode_csv(batches, ["fact_id", "at"], header=False))
+
+
+def test_fact_export_stream_uses_server_side_cursor_and_closes_connection() -> None:
+    connection = _FakeConnection([_indicator_row(_FACT_ID_1, 1.0), _indicator_row(_FACT_ID_2, 2.0)])
+
+    stream = FactExportStream(
+        connection,  # type: ignore[arg-type]
+        EXPORT_DATASETS["fact_indicator"],
+        export_format="ndjson",
+        batch_size=1,
+    )
+    assert connection.statements, "query must run before the first chunk is requested"
+    chunks = list(stream)
+
+    assert connection.execution_options_seen == {"yield_per": 1}
+    assert connection.result.partition_sizes == [1]
+    assert len(chunks) == 2
+    assert stream.rows_written == 2
+    assert connection.result.closed and connection.closed
+
+
+def test_fact_export_stream_writes_parquet_row_groups() -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    connection = _FakeConnection(
+        [_indicator_row(fact_id, 1.5) for fact_id in (_FACT_ID_1, _FACT_ID_2, _FACT_ID_3)]
+    )
+
+    stream = FactExportStream(
+        connection,  # type: ignore[arg-type]
+        EXPORT_DATASETS["fact_indicator"],
+        export_format="parquet",
+        batch_size=2,
+    )
+    parquet_file = pq.ParquetFile(io.BytesIO(b"".join(stream)))
+
+    assert parquet_file.metadata.num_rows == 3
+    assert parquet_file.num_row_groups == 2
+    assert parquet_file.schema_arrow.names == EXPORT_DATASETS["fact_indicator"].column_names
+
+
+def test_export_route_streams_csv_and_validates_request(monkeypatch) -> None:
+    connection = _FakeConnection([_indicator_row(_FACT_ID_1, 10.0)])
+
+    class _Engine:
+        def connect(self) -> _FakeConnection:
+            return connection
+
+    monkeypatch.setattr(routes_exports, "get_engine", lambda: _Engine())
+    client = TestClient(app, raise_server_exceptions=False)
+
+    response = client.get(
+        "/v1/exports/fact_indicator?format=csv&period=2024&level=municipio&limit=10"
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="fact_indicator.csv"' in response.headers["content-disposition"]
+    lines = response.text.splitlines()
+    assert lines[0].startswith("fact_id,territory_id,territory_level")
+    assert lines[1].startswith(_FACT_ID_1)
+    _, params = connection.statements[0]
+    assert params == {"period": "2024", "level": "municipality", "limit": 10}
+
+    assert client.get("/v1/exports/fact_unknown").status_code == 404
+    assert client.get("/v1/exports/fact_indicator?year=2024").status_code == 422
+    assert client.get("/v1/exports/fact_electorate?period=2024-01").status_code == 422
+    assert client.get("/v1/exports/fact_indicator?format=xlsx").status_code == 422
+
+
+def test_export_script_resume_drops_partial_line_and_returns_last_fact_id(tmp_path) -> None:
+    ndjson_path = tmp_path / "facts.ndjson"
+    ndjson_path.write_text(
+        json.dumps({"fact_id": _FACT_ID_1})
+        + "\n"
+        + json.dumps({"fact_id": _FACT_ID_2})
+        + '\n{"fact_id": "0000',
+        encoding="utf-8",
+    )
+    assert export_silver_facts._last_exported_fact_id(ndjson_path, "ndjson") == _FACT_ID_2
+    assert ndjson_path.read_text(encoding="utf-8").endswith("\n")
+
+    csv_path = tmp_path / "facts.csv"
+    csv_path.write_text(f"fact_id,value\n{_FACT_ID_3},1.0\n", encoding="utf-8")
+    assert export_silver_facts._last_exported_fact_id(csv_path, "csv") == _FACT_ID_3
+
+    header_only = tmp_path / "header.csv"
+    header_only.write_text("fact_id,value\n", encoding="utf-8")
+    assert export_silver_facts._last_exported_fact_id(header_only, "csv") is None
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+from pipelines.common.fact_indicator_loader import (
+    FactIndicatorLoadResult,
+    bulk_upsert_fact_indicators,
+)
+
+
+class _MappingsResult:
+    def __init__(self, row: dict[str, Any]) -> None:
+        self._row = row
+
+    def mappings(self) -> _MappingsResult:
+        return self
+
+    def one(self) -> dict[str, Any]:
+        return self._row
+
+
+class _Copy:
+    def __init__(self, sink: list[tuple[Any, ...]]) -> None:
+        self._sink = sink
+
+    def __enter__(self) -> _Copy:
+        return self
+
+    def __exit__(self, *_args: Any) -> bool:
+        return False
+
+    def write_row(self, row: tuple[Any, ...]) -> None:
+        self._sink.append(row)
+
+
+class _Cursor:
+    def __init__(self, driver: _DriverConnection) -> None:
+        self._driver = driver
+
+    def __enter__(self) -> _Cursor:
+        return self
+
+    def __exit__(self, *_args: Any) -> bool:
+        return False
+
+    def copy(self, statement: str) -> _Copy:
+        self._driver.copy_statements.append(statement)
+        return _Copy(self._driver.copied_rows)
+
+
+class _DriverConnection:
+    def __init__(self) -> None:
+        self.copy_statements: list[str] = []
+        self.copied_rows: list[tuple[Any, ...]] = []
+
+    def cursor(self) -> _Cursor:
+        return _Cursor(self)
+
+
+class _PoolConnection:
+    def __init__(self, driver_connection: Any) -> None:
+        self.driver_connection = driver_connection
+
+
+class _Connection:
+    def __init__(self, driver_connection: Any) -> None:
+        self.connection = _PoolConnection(driver_connection)
+
+
+class _FakeSession:
+    def __init__(self, driver_connection: Any, merge_counts: dict[str, int]) -> None:
+        self._connection = _Connection(driver_connection)
+        self._merge_counts = merge_counts
+        self.statements: list[str] = []
+        self.executemany_params: list[list[dict[str, Any]]] = []
+
+    def connection(self) -> _Connection:
+        return self._connection
+
+    def execute(self, statement: Any, params: Any = None) -> Any:
+        sql = str(statement)
+        self.statements.append(sql)
+        if isinstance(params, list):
+            self.executemany_params.append(params)
+        if "INSERT INTO silver.fact_indicator" in sql:
+            return _MappingsResult(self._merge_counts)
+        return None
+
+
+def _row(indicator_code: str, value: Decimal) -> dict[str, Any]:
+    return {
+        "territory_id": "7b0f3f52-7a0e-4d8c-9a53-3d9c1f0a2b11",
+        "source": "SIDRA",
+        "dataset": "sidra_6579",
+        "indicator_code": indicator_code,
+        "indicator_name": "Populacao estimada",
+        "unit": "pessoas",
+        "category": "demografia",
+        "value": value,
+        "reference_period": "2024",
+    }
+
+
+def test_bulk_upsert_streams_rows_with_copy_and_merges_once() -> None:
+    driver = _DriverConnection()
+    session = _FakeSession(driver, {"staged_rows": 2, "inserted_rows": 1, "updated_rows": 1})
+
+    result = bulk_upsert_fact_indicators(
+        session,
+        [_row("POP", Decimal("100")), _row("POP_URB", Decimal("80.5"))],
+    )
+
+    assert result == FactIndicatorLoadResult(staged=2, inserted=1, updated=1)
+    assert result.unchanged == 0
+    assert len(driver.copy_statements) == 1
+    assert driver.copy_statements[0].startswith("COPY _stage_fact_indicator (load_seq, territory_id")
+    assert [row[0] for row in driver.copied_rows] == [0, 1]
+    assert driver.copied_rows[1][8] == "80.5"
+    merges = [sql for sql in session.statements if "INSERT INTO silver.fact_indicator" in sql]
+    assert len(merges) == 1
+    assert "ON CONFLICT" in merges[0]
+    assert "DISTINCT ON" in merges[0]
+    assert "RETURNING (xmax = 0) AS inserted" in merges[0]
+
+
+def test_bulk_upsert_falls_back_to_executemany_without_copy_support() -> None:
+    session = _FakeSession(object(), {"staged_rows": 1, "inserted_rows": 0, "updated_rows": 0})
+
+    result = bulk_upsert_fact_indicators(session, [_row("POP", Decimal("100"))])
+
+    assert result.unchanged == 1
+    assert result.rows_written == 1
+    assert len(session.executemany_params) == 1
+    assert session.executemany_params[0][0]["value"] == "100"
+    assert session.executemany_params[0][0]["load_seq"] == 0
+
+
+def test_bulk_upsert_skips_database_for_empty_input() -> None:
+    session = _FakeSession(_DriverConnection(), {})
+
+    result = bulk_upsert_fact_indicators(session, [])
+
+    assert result.as_dict() == {"staged": 0, "inserted": 0, "updated": 0, "unchanged": 0}
+    assert session.statements == []
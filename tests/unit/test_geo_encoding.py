@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db
+from app.api.geo_encoding import build_topology, geometry_json_sql
+from app.api.main import app
+
+_LEFT = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 2], [0, 2], [0, 0]]]}
+_RIGHT = {"type": "Polygon", "coordinates": [[[1, 0], [2, 0], [2, 2], [1, 2], [1, 0]]]}
+
+
+def _decode_arcs(topology: dict[str, Any]) -> list[list[tuple[int, int]]]:
+    arcs = []
+    for encoded in topology["arcs"]:
+        x = y = 0
+        points = []
+        for dx, dy in encoded:
+            x += dx
+            y += dy
+            points.append((x, y))
+        arcs.append(points)
+    return arcs
+
+
+def _decode_ring(arcs: list[list[tuple[int, int]]], refs: list[int]) -> list[tuple[int, int]]:
+    ring: list[tuple[int, int]] = []
+    for ref in refs:
+        arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+        ring.extend(arc if not ring else arc[1:])
+    return ring
+
+
+def _same_ring(left: list[tuple[int, int]], right: list[tuple[int, int]]) -> bool:
+    left, right = left[:-1], right[:-1]
+    start = right.index(left[0])
+    return right[start:] + right[:start] == left
+
+
+def test_build_topology_stores_shared_border_once() -> None:
+    topology = build_topology([("a", _LEFT), ("b", _RIGHT)], quantization=3)
+
+    assert topology["type"] == "Topology"
+    assert topology["transform"] == {"scale": [1.0, 1.0], "translate": [0.0, 0.0]}
+    geometries = topology["objects"]["territories"]["geometries"]
+    assert [geometry["id"] for geometry in geometries] == ["a", "b"]
+    # Two outer borders plus the shared x=1 edge, referenced reversed by one side.
+    assert len(topology["arcs"]) == 3
+    left_refs, right_refs = geometries[0]["arcs"][0], geometries[1]["arcs"][0]
+    assert any(ref < 0 for ref in left_refs + right_refs)
+    assert {ref if ref >= 0 else ~ref for ref in left_refs} & {
+        ref if ref >= 0 else ~ref for ref in right_refs
+    }
+
+    arcs = _decode_arcs(topology)
+    assert _same_ring([(0, 0), (1, 0), (1, 2), (0, 2), (0, 0)], _decode_ring(arcs, left_refs))
+    assert _same_ring([(1, 0), (2, 0), (2, 2), (1, 2), (1, 0)], _decode_ring(arcs, right_refs))
+
+
+def test_build_topology_shares_enclave_ring_and_keeps_points_and_nulls() -> None:
+    outer = [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]
+    hole = [[1, 1], [1, 3], [3, 3], [3, 1], [1, 1]]
+    topology = build_topology(
+        [
+            ("ring", {"type": "Polygon", "coordinates": [outer, hole]}),
+            ("enclave", {"type": "MultiPolygon", "coordinates": [[hole[::-1]]]}),
+            ("place", {"type": "Point", "coordinates": [2, 2]}),
+            ("empty", None),
+        ],
+        quantization=5,
+    )
+
+    ring, enclave, place, empty = topology["objects"]["territories"]["geometries"]
+    assert len(topology["arcs"]) == 2
+    assert ring["arcs"] == [[0], [1]]
+    assert enclave["arcs"] == [[[~1]]]
+    assert place == {"type": "Point", "coordinates": [2, 2], "id": "place"}
+    assert empty == {"type": None, "id": "empty"}
+
+
+def test_geometry_json_sql_uses_zoom_band_geometry_for_pyramid_levels() -> None:
+    plain = geometry_json_sql(level="municipality", zoom=None)
+    assert plain == "ST_AsGeoJSON(dt.geometry, :geometry_precision)::json AS geometry"
+
+    simplified = geometry_json_sql(level="district", zoom=10)
+    assert "map.territory_tile_geometry ttg" in simplified
+    assert "band.max_zoom > :zoom" in simplified
+    assert "ST_Transform(ttg.geom_3857, 4326)" in simplified
+
+    assert geometry_json_sql(level="electoral_section", zoom=10) == plain
+
+
+class _ChoroplethSession:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, dict[str, Any]]] = []
+
+    def execute(self, statement: Any, params: dict[str, Any]) -> _ChoroplethSession:
+        self.statements.append((str(statement), params))
+        return self
+
+    def scalar_one(self) -> int:
+        return 2
+
+    def mappings(self) -> _ChoroplethSession:
+        return self
+
+    def all(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "territory_id": "00000000-0000-0000-0000-00000000000a",
+                "territory_name": "A",
+                "level": "district",
+                "metric": "POP",
+                "reference_period": "2024",
+                "value": 1.0,
+                "geometry": _LEFT,
+            },
+            {
+                "territory_id": "00000000-0000-0000-0000-00000000000b",
+                "territory_name": "B",
+                "level": "district",
+                "metric": "POP",
+                "reference_period": "2024",
+                "value": 2.0,
+                "geometry": _RIGHT,
+            },
+        ]
+
+
+def test_choropleth_topojson_moves_geometries_into_topology() -> None:
+    session = _ChoroplethSession()
+
+    def _db() -> Generator[_ChoroplethSession, None, None]:
+        yield session
+
+    app.dependency_overrides[get_db] = _db
+    client = TestClient(app, raise_server_exceptions=False)
+    try:
+        response = client.get(
+            "/v1/geo/choropleth?metric=POP&period=2024&level=distrito"
+            "&format=topojson&precision=4&zoom=10"
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [item["geometry"] for item in payload["items"]] == [None, None]
+    geometries = payload["topology"]["objects"]["territories"]["geometries"]
+    assert [geometry["id"] for geometry in geometries] == [
+        item["territory_id"] for item in payload["items"]
+    ]
+    assert len(payload["topology"]["arcs"]) == 3
+
+    rows_sql, params = session.statements[-1]
+    assert "ST_AsGeoJSON(COALESCE(" in rows_sql
+    assert params["geometry_precision"] == 4
+    assert params["zoom"] == 10
+
+
+def test_choropleth_defaults_to_geojson_without_topology() -> None:
+    session = _ChoroplethSession()
+
+    def _db() -> Generator[_ChoroplethSession, None, None]:
+        yield session
+
+    app.dependency_overrides[get_db] = _db
+    client = TestClient(app, raise_server_exceptions=False)
+    try:
+        response = client.get("/v1/geo/choropleth?metric=POP&period=2024&level=municipio")
+        invalid = client.get("/v1/geo/choropleth?metric=POP&period=2024&format=kml")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["topology"] is None
+    assert payload["items"][0]["geometry"] == _LEFT
+    assert session.statements[-1][1]["geometry_precision"] == 6
+    assert invalid.status_code == 422
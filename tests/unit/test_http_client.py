@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import io
+
+import httpx
+import pytest
+
+from pipelines.common.http_client import HttpClient, HttpClientConfig, HttpValidators
+
+
+def _client_with_handler(handler, *, max_retries: int = 1) -> HttpClient:  # noqa: ANN001
+    client = HttpClient(HttpClientConfig(timeout_seconds=5, max_retries=max_retries, backoff_seconds=0))
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_download_to_file_streams_body_and_rewinds_destination() -> None:
+    calls = {"count": 0}
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, headers={"content-type": "application/zip"}, content=b"x" * 2048)
+
+    client = _client_with_handler(_handler)
+    destination = io.BytesIO(b"stale")
+
+    size, content_type = client.download_to_file(
+        "https://example.test/file.zip",
+        destination,
+        expected_content_types=["zip"],
+        min_bytes=1024,
+    )
+
+    assert size == 2048
+    assert content_type == "application/zip"
+    assert destination.tell() == 0
+    assert destination.read() == b"x" * 2048
+    assert calls["count"] == 2
+
+
+def test_download_to_file_rejects_unexpected_content_type() -> None:
+    client = _client_with_handler(
+        lambda _request: httpx.Response(200, headers={"content-type": "text/html"}, content=b"<html>")
+    )
+
+    with pytest.raises(ValueError, match="Unexpected content-type"):
+        client.download_to_file("https://example.test/file.zip", io.BytesIO(), expected_content_types=["zip"])
+
+
+def test_download_bytes_if_modified_replays_validators_and_returns_none_on_304() -> None:
+    seen_headers: list[httpx.Headers] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(
+            200,
+            headers={
+                "content-type": "text/csv",
+                "etag": '"v1"',
+                "last-modified": "Tue, 01 Sep 2026",
+            },
+            content=b"a;b\n1;2\n",
+        )
+
+    client = _client_with_handler(_handler)
+
+    payload, content_type, validators = client.download_bytes_if_modified("https://example.test/a.csv")
+    assert payload == b"a;b\n1;2\n"
+    assert content_type == "text/csv"
+    assert validators == HttpValidators(etag='"v1"', last_modified="Tue, 01 Sep 2026")
+
+    payload, _content_type, replayed = client.download_bytes_if_modified(
+        "https://example.test/a.csv",
+        validators=validators,
+    )
+    assert payload is None
+    assert replayed == validators
+    assert seen_headers[1]["if-modified-since"] == "Tue, 01 Sep 2026"
+    assert len(seen_headers) == 2
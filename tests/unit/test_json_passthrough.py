@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Generator
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db
+from app.api.json_passthrough import json_items_sql, json_passthrough_response
+from app.api.main import app
+from app.api.territory_levels import external_level_sql
+
+
+def test_json_items_sql_aggregates_rows_in_explicit_order() -> None:
+    sql = json_items_sql(
+        "SELECT 1 AS road_id ORDER BY road_id LIMIT :limit",
+        order_by="features.road_id",
+    )
+
+    assert "json_agg(to_json(features) ORDER BY features.road_id)" in sql
+    assert "'[]'::json" in sql
+    assert "SELECT 1 AS road_id ORDER BY road_id LIMIT :limit" in sql
+    assert sql.rstrip().endswith(") AS features")
+
+
+def test_json_passthrough_response_splices_items_verbatim() -> None:
+    items_json = '[{"name": "Rua São João", "geometry": {"type": "Point", "coordinates": [1, 2]}}]'
+
+    response = json_passthrough_response(
+        {"generated_at_utc": datetime(2026, 10, 17, 12, 0, tzinfo=UTC), "count": 1},
+        items_json,
+    )
+
+    assert response.media_type == "application/json"
+    body = response.body.decode("utf-8")
+    assert body.endswith(f'"items":{items_json}}}')
+    assert json.loads(body) == {
+        "generated_at_utc": "2026-10-17T12:00:00+00:00",
+        "count": 1,
+        "items": json.loads(items_json),
+    }
+    assert json.loads(json_passthrough_response({}, "[]").body) == {"items": []}
+
+
+def test_external_level_sql_maps_internal_levels() -> None:
+    sql = external_level_sql("dt.level::text")
+
+    assert sql.startswith("CASE (dt.level::text) ")
+    assert "WHEN 'municipality' THEN 'municipio'" in sql
+    assert "WHEN 'electoral_section' THEN 'secao_eleitoral'" in sql
+    assert sql.endswith("ELSE (dt.level::text) END")
+
+
+_ITEMS_JSON = (
+    '[{"territory_id": "3121605", "territory_name": "Diamantina", "territory_level": "municipio", '
+    '"metric": "voters", "value": 12500, "year": 2024, '
+    '"geometry": {"type": "Point", "coordinates": [-43.6, -18.24]}, '
+    '"polling_place_name": null, "polling_place_code": null, '
+    '"section_count": null, "sections": null}]'
+)
+
+
+class _Result:
+    def __init__(self, rows: list[dict[str, Any]] | None = None, scalar: Any = None) -> None:
+        self._rows = rows or []
+        self._scalar = scalar
+
+    def mappings(self) -> _Result:
+        return self
+
+    def one(self) -> dict[str, Any]:
+        return self._rows[0]
+
+    def all(self) -> list[dict[str, Any]]:
+        return self._rows
+
+    def scalar_one(self) -> Any:
+        return self._scalar
+
+    def scalar_one_or_none(self) -> Any:
+        return self._scalar
+
+
+class _ElectorateMapPassthroughSession:
+    def __init__(self) -> None:
+        self.items_params: dict[str, Any] | None = None
+
+    def execute(self, statement: Any, params: dict[str, Any] | None = None) -> _Result:
+        sql = str(statement).lower()
+        if "as items_json" in sql:
+            self.items_params = params
+            return _Result([{"item_count": 1, "items_json": _ITEMS_JSON}])
+        if "select max(fe.reference_year)" in sql:
+            return _Result(scalar=2024)
+        raise AssertionError(f"Unexpected SQL in electorate map passthrough test: {sql}")
+
+
+def test_electorate_map_geojson_passes_database_json_through() -> None:
+    session = _ElectorateMapPassthroughSession()
+
+    def _db() -> Generator[_ElectorateMapPassthroughSession, None, None]:
+        yield session
+
+    app.dependency_overrides[get_db] = _db
+    client = TestClient(app, raise_server_exceptions=False)
+    try:
+        response = client.get("/v1/electorate/map?metric=voters&level=municipio&precision=5")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.text.endswith(f'"items":{_ITEMS_JSON}}}')
+    payload = response.json()
+    assert payload["level"] == "municipio"
+    assert payload["year"] == 2024
+    assert payload["topology"] is None
+    assert payload["metadata"]["source_name"] == "silver.fact_electorate"
+    assert session.items_params is not None
+    assert session.items_params["metric"] == "voters"
+    assert session.items_params["item_year"] == 2024
+    assert session.items_params["geometry_precision"] == 5
@@ -2,10 +2,26 @@
 from __future__ import annotations
 
 import math
+from pathlib import Path
+from uuid import uuid4
 
 import pytest
 
-from app.api.routes_map import _tile_to_bbox, _LAYER_TO_LEVEL, _tolerance_for_zoom, _TILE_METRICS
+from app.api.routes_map import (
+    _LAYER_TO_LEVEL,
+    _build_tile_query,
+    _tile_to_bbox,
+    _tolerance_for_zoom,
+    _zoom_band_for_zoom,
+)
+from app.settings import Settings
+from app.tile_cache import (
+    TileCache,
+    bump_tile_data_version,
+    invalidate_tile_cache,
+    read_tile_data_version,
+    tile_etag,
+)
 
 
 class TestTileToBbox:
@@ -92,6 +108,38 @@ class TestMultiLevelTolerance:
             prev = current
 
 
+class TestTileGeometryPyramid:
+    """Territory layers read pre-simplified EPSG:3857 geometries per zoom band."""
+
+    def test_zoom_band_matches_tolerance_band(self) -> None:
+        assert _zoom_band_for_zoom(0) == 5
+        assert _zoom_band_for_zoom(8) == 9
+        assert _zoom_band_for_zoom(14) == 15
+        assert _zoom_band_for_zoom(22) == 99
+
+    def test_census_sector_tiles_only_clip_and_encode(self) -> None:
+        sql, params = _build_tile_query("territory_census_sector", 14, 6000, 9000)
+        sql_text = str(sql)
+
+        assert "map.territory_tile_geometry" in sql_text
+        assert "ST_Transform" not in sql_text
+        assert "ST_MakeValid" not in sql_text
+        assert "ST_SimplifyPreserveTopology" not in sql_text
+        assert params["level"] == "census_sector"
+        assert params["zoom_band"] == 15
+
+    def test_layer_specific_name_and_filter_are_kept(self) -> None:
+        sql, _params = _build_tile_query("territory_neighborhood_proxy", 13, 0, 0)
+        assert "bairro_nome" in str(sql)
+
+    def test_electoral_layers_keep_live_geometry_query(self) -> None:
+        sql, _params = _build_tile_query("territory_electoral_zone", 10, 0, 0)
+        sql_text = str(sql)
+
+        assert "map.territory_tile_geometry" not in sql_text
+        assert "ST_SimplifyPreserveTopology" in sql_text
+
+
 class TestMvtEndpointValidation:
     """Test that invalid layer returns 404 (no DB needed)."""
 
@@ -268,3 +316,129 @@ class TestMvtEndpointValidation:
             assert payload["items"][0]["readiness_status"] in {"pass", "warn", "fail", "pending"}
         finally:
             app.dependency_overrides.pop(get_db, None)
+
+
+def _local_cache_root() -> Path:
+    path = Path("tests/_tmp") / str(uuid4()) / "tiles"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class TestTileCache:
+    """LRU + disk tile cache keyed by data version."""
+
+    def test_memory_hit_after_put(self) -> None:
+        cache = TileCache(root=_local_cache_root(), max_items=8)
+        assert cache.get("territory_district", 10, 1, 2) is None
+
+        stored = cache.put("territory_district", 10, 1, 2, b"tile-bytes")
+        cached = cache.get("territory_district", 10, 1, 2)
+
+        assert cached is not None
+        assert cached.content == b"tile-bytes"
+        assert cached.etag == stored.etag == tile_etag(b"tile-bytes")
+        assert cached.source == "memory"
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["stores"] == 1
+
+    def test_disk_store_survives_new_process_cache(self) -> None:
+        root = _local_cache_root()
+        TileCache(root=root).put("urban_roads", 14, 100, 200, b"roads")
+
+        fresh = TileCache(root=root)
+        cached = fresh.get("urban_roads", 14, 100, 200)
+
+        assert cached is not None
+        assert cached.source == "disk"
+        assert cached.content == b"roads"
+        assert fresh.stats()["disk_hits"] == 1
+
+    def test_lru_evicts_oldest_entry(self) -> None:
+        cache = TileCache(root=_local_cache_root(), max_items=2, disk_enabled=False)
+        cache.put("territory_municipality", 5, 0, 0, b"a")
+        cache.put("territory_municipality", 5, 0, 1, b"b")
+        assert cache.get("territory_municipality", 5, 0, 0) is not None
+        cache.put("territory_municipality", 5, 0, 2, b"c")
+
+        assert cache.get("territory_municipality", 5, 0, 1) is None
+        assert cache.get("territory_municipality", 5, 0, 0) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_empty_tiles_are_cached(self) -> None:
+        cache = TileCache(root=_local_cache_root())
+        cache.put("territory_census_sector", 16, 5, 5, b"")
+
+        cached = TileCache(root=cache.root).get("territory_census_sector", 16, 5, 5)
+        assert cached is not None
+        assert cached.content == b""
+
+    def test_data_version_bump_invalidates_memory_and_disk(self) -> None:
+        root = _local_cache_root()
+        cache = TileCache(root=root)
+        cache.put("urban_pois", 15, 10, 20, b"old")
+
+        version = bump_tile_data_version(root, reason="urban_pois_fetch")
+
+        assert read_tile_data_version(root) == version
+        assert cache.get("urban_pois", 15, 10, 20) is None
+        assert cache.stats()["data_version"] == version
+        assert cache.stats()["invalidations"] >= 1
+        assert not (root / "initial").exists()
+
+    def test_invalidate_tile_cache_uses_settings_root(self) -> None:
+        data_root = _local_cache_root().parent
+        settings = Settings(
+            data_root=data_root,
+            database_url="postgresql+psycopg://x:y@localhost:5432/test",
+        )
+
+        version = invalidate_tile_cache(settings, reason="ibge_geometries_fetch")
+
+        assert version is not None
+        assert read_tile_data_version(settings.tile_cache_root) == version
+
+
+class TestMvtEndpointCache:
+    def test_second_request_is_served_from_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from collections.abc import Generator
+        from fastapi.testclient import TestClient
+        from app.api import routes_map
+        from app.api.deps import get_db
+        from app.api.main import app
+
+        class _FakeExecution:
+            def scalar(self) -> bytes:
+                return b"\x1a\x02mvt"
+
+        class _FakeSession:
+            calls = 0
+
+            def execute(self, _statement, _params=None) -> _FakeExecution:
+                _FakeSession.calls += 1
+                return _FakeExecution()
+
+        def _fake_db() -> Generator[object, None, None]:
+            yield _FakeSession()
+
+        cache = TileCache(root=_local_cache_root())
+        monkeypatch.setattr(routes_map, "get_tile_cache", lambda: cache)
+        app.dependency_overrides[get_db] = _fake_db
+        try:
+            client = TestClient(app)
+            first = client.get("/v1/map/tiles/territory_district/10/380/566.mvt")
+            second = client.get("/v1/map/tiles/territory_district/10/380/566.mvt")
+            metrics = client.get("/v1/map/tiles/metrics").json()
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+
+        assert first.status_code == 200
+        assert first.headers["x-tile-cache"] == "miss"
+        assert second.status_code == 200
+        assert second.headers["x-tile-cache"] == "hit-memory"
+        assert second.content == first.content
+        assert second.headers["etag"] == first.headers["etag"]
+        assert _FakeSession.calls == 1
+        assert metrics["cache"]["hits"] == 1
+        assert metrics["cache"]["misses"] == 1
@@ -61,12 +61,15 @@ def test_sidra_connector_dry_run_uses_catalog_and_http_client(monkeypatch) -> No
     ]
 
     class _FakeHttpClient:
-        def get_json(self, _url: str):
-            return [{"D2N": "2024", "V": "49493"}]
+        async def __aenter__(self):
+            return self
 
-        def close(self) -> None:
+        async def __aexit__(self, *_exc) -> None:
             return None
 
+        async def get_json(self, _url: str):
+            return [{"D2N": "2024", "V": "49493"}]
+
     monkeypatch.setattr(sidra_indicators, "_load_indicators_catalog", lambda: catalog)
     monkeypatch.setattr(
         sidra_indicators,
@@ -74,7 +77,7 @@ def test_sidra_connector_dry_run_uses_catalog_and_http_client(monkeypatch) -> No
         lambda _settings: ("00000000-0000-0000-0000-000000000000", "3121605"),
     )
     monkeypatch.setattr(
-        sidra_indicators.HttpClient,
+        sidra_indicators.AsyncHttpClient,
         "from_settings",
         lambda *args, **kwargs: _FakeHttpClient(),
     )
@@ -742,6 +742,68 @@ def test_pipeline_runs_endpoint_prefers_run_status_over_status() -> None:
     app.dependency_overrides.clear()
 
 
+class _KeysetPipelineRunsSession(_PipelineRunsSession):
+    def __init__(self) -> None:
+        super().__init__()
+        self.statements: list[str] = []
+
+    def execute(self, *_args: Any, **_kwargs: Any) -> _CountResult | _RowsResult:
+        sql = str(_args[0]) if _args else ""
+        self.statements.append(sql)
+        if sql.startswith("EXPLAIN"):
+            # Stands in for the COUNT(*) call of the parent session.
+            self._execute_calls += 1
+            return _CountResult([{"Plan": {"Plan Rows": 250000}}])
+        return super().execute(*_args, **_kwargs)
+
+
+def test_pipeline_runs_endpoint_supports_keyset_cursor_with_estimated_total() -> None:
+    session = _KeysetPipelineRunsSession()
+
+    def _db() -> Generator[_KeysetPipelineRunsSession, None, None]:
+        yield session
+
+    app.dependency_overrides[get_db] = _db
+    client = TestClient(app, raise_server_exceptions=False)
+
+    first = client.get("/v1/ops/pipeline-runs?page_size=1")
+    assert first.status_code == 200
+    first_payload = first.json()
+    assert first_payload["total"] == 1
+    assert first_payload["total_estimated"] is False
+    cursor = first_payload["next_cursor"]
+    assert cursor
+
+    session.statements.clear()
+    session._execute_calls = 0
+    second = client.get(f"/v1/ops/pipeline-runs?page_size=1&page=50&cursor={cursor}")
+
+    assert second.status_code == 200
+    second_payload = second.json()
+    assert second_payload["total"] == 250000
+    assert second_payload["total_estimated"] is True
+    assert session.statements[0].startswith("EXPLAIN (FORMAT JSON) SELECT 1")
+    assert "COUNT(*)" not in "".join(session.statements)
+    assert session.last_params is not None
+    assert session.last_params["offset"] == 0
+    assert session.last_params["cursor_started_at"] == datetime(2026, 2, 10, 10, 0, tzinfo=UTC)
+    assert session.last_params["cursor_run_id"] == "11111111-1111-1111-1111-111111111111"
+    app.dependency_overrides.clear()
+
+
+def test_pipeline_runs_endpoint_rejects_foreign_or_malformed_cursor() -> None:
+    app.dependency_overrides[get_db] = _frontend_events_list_db
+    client = TestClient(app, raise_server_exceptions=False)
+    events_cursor = client.get("/v1/ops/frontend-events?page_size=1").json()["next_cursor"]
+    assert events_cursor
+
+    app.dependency_overrides[get_db] = _runs_db
+    assert client.get(f"/v1/ops/pipeline-runs?cursor={events_cursor}").status_code == 422
+    assert client.get("/v1/ops/pipeline-runs?cursor=not-a-cursor").status_code == 422
+    assert client.get("/v1/ops/pipeline-runs?total_mode=approximate").status_code == 422
+    app.dependency_overrides.clear()
+
+
 def test_pipeline_checks_endpoint_returns_paginated_payload() -> None:
     app.dependency_overrides[get_db] = _checks_db
     client = TestClient(app, raise_server_exceptions=False)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.utils import (
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    next_page_cursor,
+    resolve_total_mode,
+)
+
+
+def test_cursor_round_trip_restores_typed_values() -> None:
+    started_at = datetime(2026, 2, 10, 10, 0, 0, 123456, tzinfo=UTC)
+    token = encode_cursor("pipeline_runs", [started_at, "11111111-1111-1111-1111-111111111111"])
+
+    assert "=" not in token
+    assert decode_cursor(token, kind="pipeline_runs", fields=(datetime, UUID)) == [
+        started_at,
+        "11111111-1111-1111-1111-111111111111",
+    ]
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not-base64!",
+        encode_cursor("frontend_events", [datetime(2026, 1, 1, tzinfo=UTC), 1]),
+        encode_cursor("pipeline_runs", ["yesterday", "11111111-1111-1111-1111-111111111111"]),
+        encode_cursor("pipeline_runs", [datetime(2026, 1, 1, tzinfo=UTC)]),
+    ],
+)
+def test_decode_cursor_rejects_malformed_or_foreign_tokens(token: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(token, kind="pipeline_runs", fields=(datetime, UUID))
+    assert exc_info.value.status_code == 422
+
+
+def test_next_page_cursor_only_for_full_pages() -> None:
+    rows = [{"event_timestamp_utc": datetime(2026, 1, 1, tzinfo=UTC), "event_id": 7}]
+    keys = ("event_timestamp_utc", "event_id")
+
+    assert next_page_cursor("frontend_events", rows, page_size=2, keys=keys) is None
+    token = next_page_cursor("frontend_events", rows, page_size=1, keys=keys)
+    assert token is not None
+    assert decode_cursor(token, kind="frontend_events", fields=(datetime, int)) == [
+        datetime(2026, 1, 1, tzinfo=UTC),
+        7,
+    ]
+
+
+def test_resolve_total_mode_defaults_by_pagination_style() -> None:
+    assert resolve_total_mode(None, None) == "exact"
+    assert resolve_total_mode(None, "abc") == "estimated"
+    assert resolve_total_mode("exact", "abc") == "exact"
+
+
+class _ScalarResult:
+    def __init__(self, value: object) -> None:
+        self._value = value
+
+    def scalar_one(self) -> object:
+        return self._value
+
+
+class _CountSession:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def execute(self, statement: object, _params: dict[str, object]) -> _ScalarResult:
+        sql = str(statement)
+        self.statements.append(sql)
+        if sql.startswith("EXPLAIN"):
+            return _ScalarResult('[{"Plan": {"Plan Rows": 1234.0}}]')
+        return _ScalarResult(42)
+
+
+def test_count_rows_uses_exact_count_or_planner_estimate() -> None:
+    session = _CountSession()
+    from_where = "FROM ops.frontend_events fe WHERE fe.severity = :severity"
+
+    assert count_rows(session, from_where, {"severity": "error"}, mode="exact") == 42  # type: ignore[arg-type]
+    assert count_rows(session, from_where, {"severity": "error"}, mode="estimated") == 1234  # type: ignore[arg-type]
+    assert session.statements == [
+        f"SELECT COUNT(*) {from_where}",
+        f"EXPLAIN (FORMAT JSON) SELECT 1 {from_where}",
+    ]
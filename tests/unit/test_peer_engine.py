@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Generator
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db
+from app.api.main import app
+from app.api.peer_engine import PeerMatrixCache, build_peer_matrix
+
+
+def _score_row(territory_id: str, name: str, code: str, score: float) -> dict[str, Any]:
+    return {
+        "territory_id": territory_id,
+        "territory_name": name,
+        "territory_level": "municipality",
+        "indicator_code": code,
+        "score": score,
+        "updated_at": datetime(2026, 2, 11, 12, 0, tzinfo=UTC),
+    }
+
+
+def _reference_peers(rows: list[dict[str, Any]], territory_id: str, limit: int) -> list[tuple]:
+    by_territory: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        bucket = by_territory.setdefault(
+            row["territory_id"],
+            {"name": row["territory_name"], "scores": {}},
+        )
+        bucket["scores"][row["indicator_code"]] = row["score"]
+    target = by_territory[territory_id]["scores"]
+    items = []
+    for candidate_id, candidate in by_territory.items():
+        if candidate_id == territory_id:
+            continue
+        shared = sorted(set(target) & set(candidate["scores"]))
+        if not shared:
+            continue
+        mae = sum(abs(target[code] - candidate["scores"][code]) for code in shared) / len(shared)
+        similarity = round(max(0.0, 100.0 - mae), 2)
+        items.append((len(shared), similarity, candidate["name"], candidate_id))
+    items.sort(reverse=True)
+    return [(item[3], item[0], item[1]) for item in items[:limit]]
+
+
+def test_top_peers_matches_rule_based_reference_with_sparse_scores() -> None:
+    rng = random.Random(7)
+    codes = [f"IND_{idx}" for idx in range(12)]
+    rows = [
+        _score_row(f"t{tid}", f"Territory {tid:03d}", code, round(rng.uniform(0, 100), 2))
+        for tid in range(60)
+        for code in codes
+        if rng.random() > 0.3
+    ]
+    matrix = build_peer_matrix(rows)
+
+    for territory_id in ("t0", "t17", "t42"):
+        result = matrix.top_peers(territory_id, limit=8)
+        actual = [
+            (item.territory_id, item.shared_indicators, item.similarity_score)
+            for item in result.items
+        ]
+        assert actual == _reference_peers(rows, territory_id, 8)
+
+
+def test_top_peers_many_skips_unknown_territories() -> None:
+    matrix = build_peer_matrix(
+        [
+            _score_row("a", "A", "X", 10.0),
+            _score_row("b", "B", "X", 20.0),
+            _score_row("c", "C", "Y", 30.0),
+        ]
+    )
+
+    results = matrix.top_peers_many(["a", "missing", "c"], limit=5)
+
+    assert [result.territory_id for result in results] == ["a", "c"]
+    assert [item.territory_id for item in results[0].items] == ["b"]
+    assert results[0].items[0].similarity_score == 90.0
+    assert results[1].items == []
+    assert results[1].updated_at is None
+
+
+def test_peer_matrix_cache_reuses_matrix_per_data_version() -> None:
+    cache = PeerMatrixCache(max_items=2)
+    loads = {"count": 0}
+
+    def _load() -> list[dict[str, Any]]:
+        loads["count"] += 1
+        return [_score_row("a", "A", "X", 10.0)]
+
+    common = {"level": "municipality", "period": "2025", "load_rows": _load}
+    first = cache.get_or_build(data_version="v1", **common)
+    again = cache.get_or_build(data_version="v1", **common)
+    cache.get_or_build(data_version="v2", **common)
+    cache.get_or_build(data_version=None, **common)
+
+    assert first is again
+    assert loads["count"] == 3
+
+
+class _RowsResult:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self._rows = rows
+
+    def mappings(self) -> _RowsResult:
+        return self
+
+    def all(self) -> list[dict[str, Any]]:
+        return self._rows
+
+
+class _PeersBatchSession:
+    def __init__(self) -> None:
+        self.score_queries = 0
+
+    def execute(self, statement: Any, params: dict[str, Any] | None = None) -> _RowsResult:
+        sql = str(statement)
+        if "ANY(:territory_ids)" in sql:
+            known = {"3121605": "Diamantina", "3106200": "Belo Horizonte"}
+            return _RowsResult(
+                [
+                    {
+                        "territory_id": tid,
+                        "territory_name": known[tid],
+                        "territory_level": "municipality",
+                    }
+                    for tid in (params or {})["territory_ids"]
+                    if tid in known
+                ]
+            )
+        if "FROM scored" in sql:
+            self.score_queries += 1
+            return _RowsResult(
+                [
+                    _score_row("3121605", "Diamantina", "X", 80.0),
+                    _score_row("3106200", "Belo Horizonte", "X", 78.0),
+                    _score_row("3120904", "Curvelo", "X", 50.0),
+                ]
+            )
+        raise AssertionError(f"Unexpected SQL in peers batch test: {sql}")
+
+
+def test_territory_peers_batch_endpoint_builds_one_matrix_per_level() -> None:
+    session = _PeersBatchSession()
+
+    def _db() -> Generator[_PeersBatchSession, None, None]:
+        yield session
+
+    app.dependency_overrides[get_db] = _db
+    try:
+        client = TestClient(app, raise_server_exceptions=False)
+        response = client.post(
+            "/v1/territory/peers/batch",
+            json={"territory_ids": ["3121605", "3106200", "9999999"], "period": "2031", "limit": 1},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [item["territory_id"] for item in payload["results"]] == ["3121605", "3106200"]
+    assert payload["results"][0]["items"][0]["territory_name"] == "Belo Horizonte"
+    assert payload["results"][0]["items"][0]["similarity_score"] == 98.0
+    assert payload["missing_territory_ids"] == ["9999999"]
+    assert session.score_queries == 1
+
+
+@pytest.mark.parametrize("territory_ids", [[], [f"t{idx}" for idx in range(101)]])
+def test_territory_peers_batch_rejects_invalid_sizes(territory_ids: list[str]) -> None:
+    client = TestClient(app)
+    response = client.post("/v1/territory/peers/batch", json={"territory_ids": territory_ids})
+
+    assert response.status_code == 422
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, TimeoutError
+
+from app import perf_metrics
+from app.api.main import app
+from app.perf_metrics import (
+    InstrumentedQueuePool,
+    LatencyHistogram,
+    PerfRegistry,
+    instrument_engine,
+)
+
+
+@pytest.fixture()
+def registry(monkeypatch) -> PerfRegistry:
+    fresh = PerfRegistry()
+    monkeypatch.setattr(perf_metrics, "get_perf_registry", lambda: fresh)
+    return fresh
+
+
+def _sqlite_engine(tmp_path: Path, **pool_options):
+    return create_engine(
+        f"sqlite:///{(tmp_path / 'perf.db').as_posix()}",
+        poolclass=InstrumentedQueuePool,
+        **pool_options,
+    )
+
+
+def test_latency_histogram_estimates_quantiles_from_buckets() -> None:
+    histogram = LatencyHistogram()
+    for elapsed_ms in [3.0] * 90 + [40.0] * 9 + [700.0]:
+        histogram.observe(elapsed_ms)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["max_ms"] == 700.0
+    assert 2.5 <= snapshot["p50_ms"] <= 5.0
+    assert 25.0 <= snapshot["p95_ms"] <= 50.0
+    assert snapshot["p99_ms"] <= 50.0
+    assert histogram.quantile(1.0) == 700.0
+    assert LatencyHistogram().snapshot()["p99_ms"] == 0.0
+
+
+def test_engine_events_time_statements_by_call_site(tmp_path, monkeypatch, registry) -> None:
+    # Attribute statements to this test file instead of modules under src/.
+    monkeypatch.setattr(perf_metrics, "_SOURCE_ROOT", Path(__file__).resolve().parent.parent)
+    engine = instrument_engine(_sqlite_engine(tmp_path))
+    instrument_engine(engine)
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE facts (value INTEGER)"))
+        conn.execute(text("INSERT INTO facts VALUES (1), (2), (3)"))
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+
+    statements = {item["sql"]: item for item in registry.snapshot()["statements"]}
+    insert = statements["INSERT INTO facts VALUES (1), (2), (3)"]
+    assert insert["site"].startswith("unit/test_perf_metrics.py:")
+    assert insert["site"].endswith(" test_engine_events_time_statements_by_call_site")
+    assert insert["count"] == 1
+    assert insert["rows"] == 3
+    assert statements["SELECT * FROM missing_table"]["errors"] == 1
+    engine.dispose()
+
+
+def test_instrumented_pool_counts_waits_and_timeouts(tmp_path, registry) -> None:
+    engine = _sqlite_engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.05)
+
+    held = engine.connect()
+    assert perf_metrics.pool_connection_gauges()["checked_out"] >= 1
+    with pytest.raises(TimeoutError):
+        engine.connect()
+    held.close()
+
+    pool = registry.snapshot()["pool"]
+    assert pool["checkouts"] == 2
+    assert pool["waits"] == 1
+    assert pool["timeouts"] == 1
+    assert pool["wait"]["max_ms"] >= 40
+    # ``dispose()`` recreates the pool through the constructor; the limit survives.
+    engine.dispose()
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.max_overflow_limit == 0
+
+
+def test_statement_call_site_caches_per_code_object(monkeypatch) -> None:
+    monkeypatch.setattr(perf_metrics, "_SOURCE_ROOT", Path(__file__).resolve().parent.parent)
+
+    def _issue_statement() -> str:
+        return perf_metrics.statement_call_site()
+
+    first = _issue_statement()
+    second = _issue_statement()
+
+    assert first == second
+    assert first.startswith("unit/test_perf_metrics.py:")
+    assert first.endswith(" _issue_statement")
+    assert perf_metrics._CALL_SITE_CACHE[_issue_statement.__code__] == (
+        "unit/test_perf_metrics.py",
+        "_issue_statement",
+    )
+
+
+def test_render_prometheus_emits_cumulative_buckets_and_escaped_labels() -> None:
+    registry = PerfRegistry()
+    registry.observe_request("GET", '/v1/a"b', 200, 3.0)
+    registry.observe_request("GET", '/v1/a"b', 500, 30.0)
+    registry.observe_tile("territory_municipality", 12.0, 2048, cache_hit=True)
+
+    body = registry.render_prometheus()
+
+    assert "# TYPE tip_http_request_duration_seconds histogram" in body
+    label = 'method="GET",route="/v1/a\\"b"'
+    assert f'tip_http_request_duration_seconds_bucket{{{label},le="0.005"}} 1' in body
+    assert f'tip_http_request_duration_seconds_bucket{{{label},le="+Inf"}} 2' in body
+    assert f"tip_http_request_duration_seconds_count{{{label}}} 2" in body
+    assert f'tip_http_requests_total{{{label},status="500"}} 1' in body
+    assert 'tip_map_tile_bytes_total{layer="territory_municipality"} 2048' in body
+    assert "tip_db_pool_checkout_timeouts_total 0" in body
+    assert body.endswith("\n")
+
+
+def test_middleware_labels_requests_with_route_template() -> None:
+    perf_metrics.get_perf_registry().reset()
+    client = TestClient(app, raise_server_exceptions=False)
+
+    client.get("/v1/map/layers/unknown_layer/metadata")
+    client.get("/v1/map/layers/other_layer/metadata")
+    client.get("/v1/does-not-exist")
+    payload = client.get("/v1/ops/perf").json()
+    metrics = client.get("/v1/ops/metrics")
+
+    requests = {item["route"]: item for item in payload["requests"]}
+    metadata = requests["/v1/map/layers/{layer_id}/metadata"]
+    assert metadata["count"] == 2
+    assert metadata["statuses"] == {"404": 2}
+    assert requests["<unmatched>"]["statuses"] == {"404": 1}
+    assert {"query", "tiles", "single_flight"} <= set(payload["caches"])
+    assert any(flight["name"] == "map_tiles" for flight in payload["caches"]["single_flight"])
+    assert metrics.status_code == 200
+    assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "tip_http_request_duration_seconds_bucket" in metrics.text
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Generator
 from datetime import UTC, datetime
 from typing import Any
@@ -31,6 +32,13 @@ class _RowsResult:
         return self._rows[0]
 
 
+def _json_items(result: _RowsResult) -> _RowsResult:
+    # Pass-through routes get their items from Postgres as one JSON array;
+    # fakes dispatch on the wrapped row SELECT and aggregate its rows here.
+    rows = result.all()
+    return _RowsResult([{"item_count": len(rows), "items_json": json.dumps(rows)}])
+
+
 class _ScalarResult:
     def __init__(self, value: Any) -> None:
         self._value = value
@@ -47,10 +55,24 @@ class _QgSession:
         params = _kwargs.get("params")
         if params is None and len(_args) >= 2 and isinstance(_args[1], dict):
             params = _args[1]
+        sql = str(_args[0]).lower() if _args else ""
+
+        # _fetch_period_trends: precomputed year-over-year trend lookup
+        if "from gold.indicator_period_change" in sql:
+            return _RowsResult(
+                [
+                    {
+                        "territory_id": "3121605",
+                        "indicator_code": "DATASUS_APS_COBERTURA",
+                        "reference_period": "2025",
+                        "trend": "up",
+                    }
+                ]
+            )
+
         if isinstance(params, dict):
             self.last_params = params
 
-        sql = str(_args[0]).lower() if _args else ""
         if "avg(fi.value)" in sql:
             return _RowsResult(
                 [
@@ -168,10 +190,6 @@ class _QgSession:
                 ]
             )
 
-        # _fetch_previous_values: return empty so trend defaults to stable
-        if "fi.reference_period = cast(:period as text)" in sql and "fi.indicator_code" in sql and "fi.value" in sql:
-            return _RowsResult([])
-
         raise AssertionError(f"Unexpected SQL in QG test: {sql}")
 
 
@@ -542,6 +560,11 @@ class _ElectorateSummaryHistoryFallbackSession:
 class _ElectorateMapSession:
     def execute(self, *_args: Any, **_kwargs: Any) -> _ScalarResult | _RowsResult:
         sql = str(_args[0]).lower() if _args else ""
+        if "as items_json" in sql:
+            return _json_items(self._result_for(sql.split("as items_json", 1)[1]))
+        return self._result_for(sql)
+
+    def _result_for(self, sql: str) -> _ScalarResult | _RowsResult:
 
         if "select max(fe.reference_year)" in sql:
             return _ScalarResult(2024)
@@ -551,8 +574,10 @@ class _ElectorateMapSession:
                     {
                         "territory_id": "3121605",
                         "territory_name": "Diamantina",
-                        "territory_level": "municipality",
+                        "territory_level": "municipio",
+                        "metric": "voters",
                         "value": 12500.0,
+                        "year": 2024,
                         "geometry": {"type": "Polygon", "coordinates": []},
                     }
                 ]
@@ -567,8 +592,10 @@ class _ElectorateMapSession:
                     {
                         "territory_id": "3121605",
                         "territory_name": "Diamantina",
-                        "territory_level": "municipality",
+                        "territory_level": "municipio",
+                        "metric": "abstention_rate",
                         "value": 18.0,
+                        "year": 2024,
                         "geometry": {"type": "Polygon", "coordinates": []},
                     }
                 ]
@@ -588,6 +615,11 @@ class _ElectorateSummaryOutlierYearSession:
 class _ElectorateOutlierFallbackSession:
     def execute(self, *_args: Any, **_kwargs: Any) -> _ScalarResult | _RowsResult:
         sql = str(_args[0]).lower() if _args else ""
+        if "as items_json" in sql:
+            return _json_items(self._result_for(sql.split("as items_json", 1)[1]))
+        return self._result_for(sql)
+
+    def _result_for(self, sql: str) -> _ScalarResult | _RowsResult:
 
         if "from silver.fact_electorate fe" in sql and "count(*)" in sql and "fe.reference_year = :year" in sql:
             return _ScalarResult(0)
@@ -623,8 +655,10 @@ class _ElectorateOutlierFallbackSession:
                     {
                         "territory_id": "3121605",
                         "territory_name": "Diamantina",
-                        "territory_level": "municipality",
+                        "territory_level": "municipio",
+                        "metric": "voters",
                         "value": 12500.0,
+                        "year": 2024,
                         "geometry": None,
                     }
                 ]
@@ -1277,6 +1311,8 @@ def test_priority_list_accepts_level_alias_and_builds_rationale() -> None:
     assert payload["items"][0]["evidence"]["updated_at"] is not None
     assert payload["items"][0]["explainability"]["trail_id"]
     assert payload["items"][0]["explainability"]["coverage"]["coverage_pct"] == 100.0
+    assert payload["items"][0]["trend"] == "up"
+    assert payload["items"][1]["trend"] == "stable"
     app.dependency_overrides.clear()
 
 
@@ -1335,6 +1371,7 @@ def test_insights_highlights_filters_by_severity() -> None:
     assert payload["items"][0]["evidence"]["updated_at"] is not None
     assert payload["items"][0]["explainability"]["trail_id"]
     assert payload["items"][0]["deep_link"].startswith("/insights?")
+    assert payload["items"][0]["trend"] == "up"
     app.dependency_overrides.clear()
 
 
@@ -1399,6 +1436,68 @@ def test_scenarios_simulate_returns_not_found_for_unknown_indicator() -> None:
     app.dependency_overrides.clear()
 
 
+def test_scenarios_simulate_batch_matches_single_simulations() -> None:
+    app.dependency_overrides[get_db] = _qg_db
+    client = TestClient(app, raise_server_exceptions=False)
+    common = {"territory_id": "3121605", "period": "2025", "level": "municipio"}
+
+    batch = client.post(
+        "/v1/scenarios/simulate/batch",
+        json={
+            **common,
+            "indicator_code": "DATASUS_APS_COBERTURA",
+            "adjustment_range": {"start": -20, "stop": 20, "step": 10},
+            "items": [
+                {
+                    "territory_id": "3121605",
+                    "indicator_code": "INDICADOR_INEXISTENTE",
+                    "adjustment_percent": 5,
+                }
+            ],
+        },
+    )
+    singles = [
+        client.post(
+            "/v1/scenarios/simulate",
+            json={
+                **common,
+                "indicator_code": "DATASUS_APS_COBERTURA",
+                "adjustment_percent": adjustment,
+            },
+        ).json()
+        for adjustment in (-20, -10, 0, 10, 20)
+    ]
+
+    assert batch.status_code == 200
+    payload = batch.json()
+    assert payload["level"] == "municipio"
+    assert payload["items"] == singles
+    assert payload["errors"] == [
+        {
+            "territory_id": "3121605",
+            "indicator_code": "INDICADOR_INEXISTENTE",
+            "adjustment_percent": 5.0,
+            "detail": "Indicator not found for selected territory",
+        }
+    ]
+    app.dependency_overrides.clear()
+
+
+def test_scenarios_simulate_batch_requires_scenarios() -> None:
+    app.dependency_overrides[get_db] = _qg_db
+    client = TestClient(app, raise_server_exceptions=False)
+
+    empty = client.post("/v1/scenarios/simulate/batch", json={"period": "2025"})
+    range_without_territory = client.post(
+        "/v1/scenarios/simulate/batch",
+        json={"adjustment_range": {"start": 0, "stop": 10, "step": 5}},
+    )
+
+    assert empty.status_code == 422
+    assert range_without_territory.status_code == 422
+    app.dependency_overrides.clear()
+
+
 def test_briefs_generate_returns_summary_and_evidences() -> None:
     app.dependency_overrides[get_db] = _qg_db
     client = TestClient(app, raise_server_exceptions=False)
@@ -1577,6 +1676,23 @@ def test_electorate_map_returns_values_for_rate_metric() -> None:
     app.dependency_overrides.clear()
 
 
+def test_electorate_map_topojson_moves_geometries_into_topology() -> None:
+    def _db() -> Generator[_ElectorateMapSession, None, None]:
+        yield _ElectorateMapSession()
+
+    app.dependency_overrides[get_db] = _db
+    client = TestClient(app, raise_server_exceptions=False)
+
+    response = client.get("/v1/electorate/map?metric=voters&level=municipio&format=topojson&zoom=8")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["items"][0]["geometry"] is None
+    geometries = payload["topology"]["objects"]["territories"]["geometries"]
+    assert [geometry["id"] for geometry in geometries] == ["3121605"]
+    app.dependency_overrides.clear()
+
+
 def test_electorate_summary_uses_outlier_storage_year_when_requested_year_is_valid() -> None:
     def _db() -> Generator[_ElectorateOutlierFallbackSession, None, None]:
         yield _ElectorateOutlierFallbackSession()
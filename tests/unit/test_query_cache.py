@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import cache_middleware
+from app.api.cache_middleware import CacheHeaderMiddleware
+from app.data_version import DataVersionTracker
+from app.query_cache import QueryResultCache, result_cache_key
+
+
+def test_result_cache_key_normalizes_parameter_order_and_empty_values() -> None:
+    first = result_cache_key(
+        "/v1/priority/list",
+        [("period", "2025"), ("level", "municipality")],
+        "v1",
+    )
+    second = result_cache_key(
+        "/v1/priority/list",
+        [("level", "municipality"), ("domain", ""), ("period", "2025")],
+        "v1",
+    )
+
+    assert first == second
+    assert first != result_cache_key("/v1/priority/list", [("period", "2025")], "v1")
+    assert first != result_cache_key(
+        "/v1/priority/list",
+        [("period", "2025"), ("level", "municipality")],
+        "v2",
+    )
+
+
+def test_query_result_cache_evicts_lru_and_resets_on_version_change() -> None:
+    versions = ["v1"]
+    cache = QueryResultCache(
+        max_items=2,
+        version_loader=lambda: versions[0],
+        version_poll_seconds=0,
+    )
+
+    version = cache.current_version()
+    assert version == "v1"
+    cache.put("a", b"{}", media_type="application/json", version=version)
+    cache.put("b", b"{}", media_type="application/json", version=version)
+    assert cache.get("a", version=version) is not None
+    cache.put("c", b"{}", media_type="application/json", version=version)
+
+    assert cache.get("b", version=version) is None
+    assert cache.get("a", version=version) is not None
+    assert cache.stats()["evictions"] == 1
+
+    versions[0] = "v2"
+    assert cache.current_version() == "v2"
+    assert cache.stats()["memory_items"] == 0
+
+
+def test_query_result_cache_expires_entries_and_shares_disk_between_instances(
+    tmp_path: Path,
+) -> None:
+    writer = QueryResultCache(ttl_seconds=60, disk_root=tmp_path, version_loader=lambda: "v1")
+    reader = QueryResultCache(ttl_seconds=60, disk_root=tmp_path, version_loader=lambda: "v1")
+    writer.put("key", b'{"ok":true}', media_type="application/json", version="v1")
+
+    shared = reader.get("key", version="v1")
+    assert shared is not None
+    assert shared.source == "disk"
+    assert shared.body == b'{"ok":true}'
+
+    expired = QueryResultCache(ttl_seconds=0, disk_root=tmp_path, version_loader=lambda: "v1")
+    assert expired.get("key", version="v1") is None
+
+
+def test_query_result_cache_bypasses_when_version_cannot_be_read() -> None:
+    def _broken_loader() -> str:
+        raise RuntimeError("database unavailable")
+
+    cache = QueryResultCache(version_loader=_broken_loader, version_poll_seconds=60)
+
+    assert cache.current_version() is None
+    assert cache.current_version() is None
+    assert cache.stats()["version_errors"] == 1
+
+
+def test_cache_middleware_serves_repeat_reads_from_result_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = {"count": 0}
+    app = FastAPI()
+    app.add_middleware(CacheHeaderMiddleware)
+
+    @app.get("/v1/kpis/overview")
+    def _overview(period: str | None = None) -> dict:
+        calls["count"] += 1
+        return {"period": period, "calls": calls["count"]}
+
+    tracker = DataVersionTracker(loader=lambda: {"indicators": 1})
+    cache = QueryResultCache(version_loader=tracker.global_token)
+    monkeypatch.setattr(cache_middleware, "get_data_version_tracker", lambda: tracker)
+    monkeypatch.setattr(cache_middleware, "get_query_cache", lambda: cache)
+    client = TestClient(app)
+
+    first = client.get("/v1/kpis/overview?period=2025")
+    second = client.get("/v1/kpis/overview?period=2025")
+    other = client.get("/v1/kpis/overview?period=2024")
+
+    assert first.headers["x-query-cache"] == "miss"
+    assert second.headers["x-query-cache"] == "hit-memory"
+    assert second.json() == first.json() == {"period": "2025", "calls": 1}
+    assert second.headers["etag"] == first.headers["etag"]
+    assert other.json()["calls"] == 2
+    assert calls["count"] == 2
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import numpy as np
+
+from app.api.routes_qg import _build_scenario_peers, _simulated_ranks
+
+
+def _row(territory_id: str, name: str, value: float) -> dict[str, Any]:
+    return {
+        "territory_id": territory_id,
+        "territory_name": name,
+        "indicator_code": "IND",
+        "value": value,
+    }
+
+
+def _reference_rank(peer_rows: list[dict[str, Any]], territory_id: str, simulated: float) -> int:
+    simulated_rows = [
+        (
+            str(row["territory_id"]),
+            simulated if row["territory_id"] == territory_id else row["value"],
+        )
+        for row in peer_rows
+    ]
+    simulated_rows.sort(key=lambda item: abs(item[1]), reverse=True)
+    keys = [key for key, _value in simulated_rows]
+    return keys.index(territory_id) + 1
+
+
+def test_simulated_ranks_match_stable_resort_including_ties() -> None:
+    rng = random.Random(11)
+    # Few distinct magnitudes (and mixed signs) force many ties.
+    rows = [
+        _row(
+            f"t{idx}",
+            f"Territory {idx:02d}",
+            rng.choice([-1, 1]) * rng.choice([5.0, 10.0, 20.0]),
+        )
+        for idx in range(25)
+    ]
+    peers = _build_scenario_peers(rows, "IND")
+    assert peers is not None
+
+    adjustments = [-95, -50, -10, 0, 10, 50, 100, 300]
+    for territory_id in ("t0", "t7", "t19"):
+        base_rank = peers.rank_by_territory[territory_id]
+        base_value = float(peers.peer_rows[base_rank - 1]["value"])
+        simulated_values = [round(base_value * (1 + adj / 100.0), 6) for adj in adjustments]
+        simulated_values += [-base_value, 10.0, -20.0]
+
+        ranks = _simulated_ranks(
+            peers,
+            base_rank=base_rank,
+            base_abs=abs(base_value),
+            simulated_values=np.array(simulated_values),
+        )
+
+        assert ranks.tolist() == [
+            _reference_rank(peers.peer_rows, territory_id, value) for value in simulated_values
+        ]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+project_root_str = str(PROJECT_ROOT)
+if project_root_str not in sys.path:
+    sys.path.insert(0, project_root_str)
+
+from app.tile_archive import archive_path, read_archive_metadata, read_archive_tile  # noqa: E402
+from app.tile_cache import TileCache, bump_tile_data_version, read_tile_data_version  # noqa: E402
+from scripts import seed_map_tiles  # noqa: E402
+
+_DIAMANTINA_BBOX = (-43.95, -18.45, -43.35, -17.85)
+
+
+def _local_test_dir() -> Path:
+    path = Path("tests/_tmp") / str(uuid4())
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def test_tile_range_for_bbox_covers_municipality() -> None:
+    x_min, x_max, y_min, y_max = seed_map_tiles._tile_range_for_bbox(_DIAMANTINA_BBOX, 10)
+
+    assert x_min <= x_max
+    assert y_min <= y_max
+    assert (x_min, y_min) == seed_map_tiles._lonlat_to_tile(-43.95, -17.85, 10)
+    assert (x_max, y_max) == seed_map_tiles._lonlat_to_tile(-43.35, -18.45, 10)
+
+
+def test_layer_zooms_respect_layer_visibility_range() -> None:
+    assert seed_map_tiles._layer_zooms(
+        "territory_district", 8, 14, ignore_layer_zoom=False
+    ) == [9, 10, 11]
+    assert seed_map_tiles._layer_zooms(
+        "territory_district", 8, 10, ignore_layer_zoom=True
+    ) == [8, 9, 10]
+
+
+def test_seed_layer_writes_archive_served_by_tile_cache() -> None:
+    base = _local_test_dir()
+    cache_root = base / "tiles"
+    archive_root = base / "archives"
+    version = bump_tile_data_version(cache_root)
+    tiles = list(seed_map_tiles._plan_tiles(_DIAMANTINA_BBOX, [9, 10]))
+    rendered: list[tuple[int, int, int]] = []
+
+    def _render(
+        layer: str,
+        chunk: list[tuple[int, int, int]],
+    ) -> list[tuple[tuple[int, int, int], bytes]]:
+        assert layer == "territory_district"
+        rendered.extend(chunk)
+        return [(tile, b"" if tile[0] == 9 else f"{tile}".encode()) for tile in chunk]
+
+    result = seed_map_tiles.seed_layer(
+        layer="territory_district",
+        tiles=tiles,
+        output_path=archive_path(archive_root, "territory_district"),
+        data_version=version,
+        bbox=_DIAMANTINA_BBOX,
+        render_chunk=_render,
+        workers=3,
+    )
+
+    assert sorted(rendered) == sorted(tiles)
+    assert result["tiles"] == len(tiles)
+    assert result["empty_tiles"] == sum(1 for tile in tiles if tile[0] == 9)
+    metadata = read_archive_metadata(archive_path(archive_root, "territory_district"))
+    assert metadata["data_version"] == version
+    assert metadata["minzoom"] == "9"
+    assert metadata["maxzoom"] == "10"
+
+    z, x, y = next(tile for tile in tiles if tile[0] == 10)
+    cache = TileCache(root=cache_root, disk_enabled=False, archive_root=archive_root)
+    cached = cache.get("territory_district", z, x, y)
+    assert cached is not None
+    assert cached.source == "archive"
+    assert cached.content == f"{(z, x, y)}".encode()
+
+
+def test_archive_is_ignored_after_data_version_bump() -> None:
+    base = _local_test_dir()
+    cache_root = base / "tiles"
+    archive_root = base / "archives"
+    seed_map_tiles.seed_layer(
+        layer="urban_roads",
+        tiles=[(14, 6190, 9150)],
+        output_path=archive_path(archive_root, "urban_roads"),
+        data_version=read_tile_data_version(cache_root),
+        bbox=_DIAMANTINA_BBOX,
+        render_chunk=lambda _layer, chunk: [(tile, b"road") for tile in chunk],
+        workers=1,
+    )
+    path = archive_path(archive_root, "urban_roads")
+    assert read_archive_tile(path, 14, 6190, 9150, data_version="initial") == b"road"
+
+    new_version = bump_tile_data_version(cache_root)
+
+    assert read_archive_tile(path, 14, 6190, 9150, data_version=new_version) is None
+    cache = TileCache(root=cache_root, disk_enabled=False, archive_root=archive_root)
+    assert cache.get("urban_roads", 14, 6190, 9150) is None
+
+
+def test_main_rejects_unknown_layer(capsys) -> None:
+    exit_code = seed_map_tiles.main(["--layers", "nope", "--dry-run"])
+
+    assert exit_code == 2
+    assert "Unknown tile layers" in capsys.readouterr().err
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.single_flight import SingleFlight
+
+
+def test_concurrent_identical_calls_share_one_execution() -> None:
+    flight = SingleFlight("test")
+    started = threading.Event()
+    release = threading.Event()
+    calls = {"count": 0}
+
+    def _slow_query() -> list[int]:
+        calls["count"] += 1
+        started.set()
+        release.wait(timeout=5)
+        return [1, 2, 3]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(flight.do, "priority", _slow_query)
+        assert started.wait(timeout=5)
+        followers = [pool.submit(flight.do, "priority", _slow_query) for _ in range(3)]
+        while flight.stats()["coalesced"] < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [leader.result(timeout=5), *(f.result(timeout=5) for f in followers)]
+
+    assert calls["count"] == 1
+    assert results == [[1, 2, 3]] * 4
+    assert flight.stats() == {
+        "name": "test",
+        "in_flight": 0,
+        "executions": 1,
+        "coalesced": 3,
+        "errors": 0,
+    }
+
+
+def test_errors_propagate_and_next_call_runs_again() -> None:
+    flight = SingleFlight("test")
+
+    def _broken() -> int:
+        raise RuntimeError("pool timeout")
+
+    with pytest.raises(RuntimeError, match="pool timeout"):
+        flight.do("tile", _broken)
+
+    assert flight.do("tile", lambda: 42) == 42
+    assert flight.stats()["executions"] == 2
+    assert flight.stats()["errors"] == 1
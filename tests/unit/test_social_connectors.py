@@ -99,10 +99,12 @@ def test_social_connectors_dry_run_uses_resolved_dataset(
 
 
 def test_social_connector_aggregation_supports_avg_and_sum() -> None:
-    municipality_rows = [
-        {"familias_total": "100", "taxa_pobreza": "20"},
-        {"familias_total": "140", "taxa_pobreza": "30"},
-    ]
+    municipality_rows = pd.DataFrame(
+        [
+            {"familias_total": "100", "taxa_pobreza": "20"},
+            {"familias_total": "140", "taxa_pobreza": "30"},
+        ]
+    )
     definition = cecad_social_protection._DEFINITION  # noqa: SLF001
     metric_values, indicator_rows = social_tabular_connector._build_metrics_output(  # noqa: SLF001
         definition,
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import io
+import tempfile
 import zipfile
 
 import pytest
 
+from pipelines import tse_electorate
 from pipelines.tse_electorate import (
+    _bulk_upsert_electorate_facts,
     _extract_local_voting_metadata_from_zip,
     _extract_rows_from_zip,
     _extract_section_rows_from_zip,
@@ -13,11 +16,12 @@ from pipelines.tse_electorate import (
     _pick_electorate_resource,
     _pick_electorate_section_resource,
     _pick_local_voting_resource,
-    _safe_optional_int,
-    _safe_optional_text,
-    _resolve_electorate_package,
     _resolve_electorate_columns,
+    _resolve_electorate_package,
     _safe_dimension,
+    _safe_optional_int,
+    _safe_optional_text,
+    _upsert_electoral_sections,
 )
 
 
@@ -170,7 +174,7 @@ def test_extract_rows_from_zip_aggregates_municipality_and_zone_rows() -> None:
         archive.writestr("perfil_eleitorado_2024.csv", csv_content.encode("latin1"))
 
     municipality_rows, zone_rows, info = _extract_rows_from_zip(
-        zip_bytes=payload.getvalue(),
+        zip_source=payload.getvalue(),
         municipality_name="Diamantina",
         uf="MG",
         requested_year=2024,
@@ -182,6 +186,30 @@ def test_extract_rows_from_zip_aggregates_municipality_and_zone_rows() -> None:
     assert info["has_zone_column"] is True
 
 
+def test_extract_rows_from_zip_reads_spooled_file_and_matches_accented_names() -> None:
+    csv_content = (
+        "ANO_ELEICAO;NR_ZONA;SG_UF;NM_MUNICIPIO;DS_GENERO;DS_FAIXA_ETARIA;"
+        "DS_GRAU_ESCOLARIDADE;QT_ELEITORES_PERFIL\n"
+        "2024;10;ES;IBIRAÇU;MASCULINO;25-29;SUPERIOR COMPLETO;10\n"
+        "2024;10;ES;Ibiracu;FEMININO;25-29;SUPERIOR COMPLETO;4\n"
+        "2024;10;MG;IBIRAÇU;FEMININO;25-29;SUPERIOR COMPLETO;99\n"
+    )
+    spool = tempfile.SpooledTemporaryFile(max_size=64)
+    with zipfile.ZipFile(spool, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("perfil_eleitorado_2024.csv", csv_content.encode("latin1"))
+
+    with spool:
+        municipality_rows, zone_rows, info = _extract_rows_from_zip(
+            zip_source=spool,
+            municipality_name="Ibiraçu",
+            uf="ES",
+            requested_year=2024,
+        )
+    assert sum(row["voters"] for row in municipality_rows) == 14
+    assert len(zone_rows) == 2
+    assert info["rows_filtered"] == 2
+
+
 def test_extract_rows_from_zip_works_when_zone_column_is_missing() -> None:
     csv_content = (
         "ANO_ELEICAO;SG_UF;NM_MUNICIPIO;DS_GENERO;DS_FAIXA_ETARIA;DS_GRAU_INSTRUCAO;QT_ELEITORES\n"
@@ -192,7 +220,7 @@ def test_extract_rows_from_zip_works_when_zone_column_is_missing() -> None:
         archive.writestr("perfil_eleitorado_2024.csv", csv_content.encode("latin1"))
 
     municipality_rows, zone_rows, info = _extract_rows_from_zip(
-        zip_bytes=payload.getvalue(),
+        zip_source=payload.getvalue(),
         municipality_name="Diamantina",
         uf="MG",
         requested_year=2024,
@@ -213,7 +241,7 @@ def test_extract_rows_from_zip_rewrites_outlier_year_to_requested_year() -> None
         archive.writestr("perfil_eleitorado_9999.csv", csv_content.encode("latin1"))
 
     municipality_rows, zone_rows, info = _extract_rows_from_zip(
-        zip_bytes=payload.getvalue(),
+        zip_source=payload.getvalue(),
         municipality_name="Diamantina",
         uf="MG",
         requested_year=2024,
@@ -240,7 +268,7 @@ def test_extract_section_rows_from_zip_aggregates_and_keeps_section_local_info()
         archive.writestr("perfil_eleitor_secao_2024_MG.csv", csv_content.encode("latin1"))
 
     section_rows, info = _extract_section_rows_from_zip(
-        zip_bytes=payload.getvalue(),
+        zip_source=payload.getvalue(),
         municipality_name="Diamantina",
         uf="MG",
         requested_year=2024,
@@ -266,7 +294,7 @@ def test_extract_local_voting_metadata_from_zip_builds_section_index() -> None:
         archive.writestr("eleitorado_local_votacao_2024.csv", csv_content.encode("latin1"))
 
     section_metadata, info = _extract_local_voting_metadata_from_zip(
-        zip_bytes=payload.getvalue(),
+        zip_source=payload.getvalue(),
         municipality_name="Diamantina",
         uf="MG",
         requested_year=2024,
@@ -279,3 +307,67 @@ def test_extract_local_voting_metadata_from_zip_builds_section_index() -> None:
     assert section_metadata[key]["local_votacao"] == "Escola A"
     assert section_metadata[key]["voters_section"] == 250
     assert info["rows_aggregated_section"] == 2
+
+
+class _RecordingSession:
+    def __init__(self, returned_rows: list[tuple[str, ...]] | None = None) -> None:
+        self.calls: list[tuple[str, dict]] = []
+        self._returned_rows = returned_rows or []
+
+    def execute(self, statement, params=None):  # noqa: ANN001
+        self.calls.append((str(statement), params))
+        return self
+
+    def all(self) -> list[tuple[str, ...]]:
+        return self._returned_rows
+
+
+def test_bulk_upsert_electorate_facts_dedupes_and_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tse_electorate, "_FACT_BATCH_SIZE", 2)
+    session = _RecordingSession()
+    base = {"reference_year": 2024, "sex": "F", "age_range": "25-29", "education": "MEDIO"}
+    rows = [
+        {**base, "territory_id": "t1", "voters": 3},
+        {**base, "territory_id": "t1", "voters": 7},
+        {**base, "territory_id": "t2", "voters": 1},
+        {**base, "territory_id": "t3", "voters": 2},
+    ]
+
+    written = _bulk_upsert_electorate_facts(session, rows)
+
+    assert written == 3
+    assert len(session.calls) == 2
+    sql, params = session.calls[0]
+    assert "FROM unnest(" in sql
+    assert "ON CONFLICT" in sql
+    assert params["territory_ids"] == ["t1", "t2"]
+    assert params["voters"] == [7, 1]
+
+
+def test_upsert_electoral_sections_resolves_all_sections_in_one_statement() -> None:
+    session = _RecordingSession(returned_rows=[("145", "1", "sec-1"), ("145", "2", "sec-2")])
+
+    resolved = _upsert_electoral_sections(
+        session=session,
+        zone_territory_ids={"145": "zone-145"},
+        municipality_name="Diamantina",
+        municipality_ibge_code="3121605",
+        uf="MG",
+        sections=[
+            {
+                "tse_zone": "145",
+                "tse_section": "1",
+                "local_votacao": "Escola A",
+                "voters_section": 300,
+            },
+            {"tse_zone": "145", "tse_section": "2", "local_votacao": float("nan")},
+        ],
+    )
+
+    assert resolved == {("145", "1"): "sec-1", ("145", "2"): "sec-2"}
+    assert len(session.calls) == 1
+    _sql, params = session.calls[0]
+    assert params["parent_territory_ids"] == ["zone-145", "zone-145"]
+    assert params["canonical_keys"][0] == "electoral_section:tse:3121605:145:1"
+    assert '"polling_place_name": "Escola A"' in params["metadata"][0]
+    assert "polling_place_name" not in params["metadata"][1]